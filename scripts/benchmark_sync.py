@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Sync benchmark for Advanced Memory.
+
+Generates a synthetic vault and times cold sync, scan, no-op resync, 1%
+modified, bulk move and bulk delete against in-memory and file-backed SQLite.
+Results are printed as a table and can be written as JSON to compare releases:
+
+    uv run python scripts/benchmark_sync.py --notes 5000 --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+
+from advanced_memory.sync.benchmark import ENGINES, SCENARIOS, VaultSpec, run_benchmark
+
+
+def parse_args() -> argparse.Namespace:
+    defaults = VaultSpec()
+    parser = argparse.ArgumentParser(description="Benchmark syncing a synthetic vault")
+    parser.add_argument("--notes", type=int, default=defaults.notes)
+    parser.add_argument("--observations", type=int, default=defaults.observations)
+    parser.add_argument("--links", type=float, default=defaults.links, help="wikilinks per note")
+    parser.add_argument("--frontmatter-fields", type=int, default=defaults.frontmatter_fields)
+    parser.add_argument(
+        "--attachment-ratio", type=float, default=defaults.attachment_ratio,
+        help="binary attachments per note",
+    )
+    parser.add_argument("--folders", type=int, default=defaults.folders)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--engine", action="append", choices=list(ENGINES), dest="engines")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, dest="scenarios")
+    parser.add_argument("--work-dir", type=Path, help="where to generate vaults (default: temp)")
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    parser.add_argument("--verbose", action="store_true", help="keep sync logging")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    if not args.verbose:
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+    spec = VaultSpec(
+        notes=args.notes,
+        observations=args.observations,
+        links=args.links,
+        frontmatter_fields=args.frontmatter_fields,
+        attachment_ratio=args.attachment_ratio,
+        folders=args.folders,
+        seed=args.seed,
+    )
+    engines = args.engines or list(ENGINES)
+    scenarios = args.scenarios or list(SCENARIOS)
+
+    if args.work_dir:
+        results = await run_benchmark(args.work_dir, spec, engines, scenarios)
+    else:
+        with tempfile.TemporaryDirectory(prefix="advanced-memory-bench-") as work_dir:
+            results = await run_benchmark(Path(work_dir), spec, engines, scenarios)
+
+    print(f"{'engine':<8} {'scenario':<10} {'seconds':>10} {'changes':>8}")
+    for result in results["results"]:
+        print(
+            f"{result['engine']:<8} {result['scenario']:<10} "
+            f"{result['seconds']:>10.3f} {result.get('changes', 0):>8}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+"""add entity file stat columns
+
+Revision ID: a1f3c9d2e4b7
+Revises: 647e7a75e2cd
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1f3c9d2e4b7"
+down_revision: Union[str, None] = "647e7a75e2cd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store size/mtime_ns/inode next to the checksum so unchanged files are not re-hashed."""
+    with op.batch_alter_table("entity", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("size", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("mtime_ns", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("inode", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("entity", schema=None) as batch_op:
+        batch_op.drop_column("inode")
+        batch_op.drop_column("mtime_ns")
+        batch_op.drop_column("size")
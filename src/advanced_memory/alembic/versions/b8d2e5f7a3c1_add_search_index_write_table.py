@@ -0,0 +1,33 @@
+"""add search_index_write table logging index writes made during a reindex
+
+Revision ID: b8d2e5f7a3c1
+Revises: f3a8d6c1b2e9
+Create Date: 2026-10-17 00:12:44.208164
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d2e5f7a3c1"
+down_revision: Union[str, None] = "f3a8d6c1b2e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Writes to the live search index, by any process, while a reindex builds its shadow index."""
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS search_index_write (
+        project_id INTEGER NOT NULL,
+        entity_id INTEGER,
+        permalink TEXT
+    )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS search_index_write")
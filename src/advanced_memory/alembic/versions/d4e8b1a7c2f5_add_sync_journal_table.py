@@ -0,0 +1,50 @@
+"""add sync journal table
+
+Revision ID: d4e8b1a7c2f5
+Revises: a1f3c9d2e4b7
+Create Date: 2026-10-16 20:04:12.561930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e8b1a7c2f5"
+down_revision: Union[str, None] = "a1f3c9d2e4b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Journal of pending sync changes so an interrupted sync can resume."""
+    op.create_table(
+        "sync_journal",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("file_path", sa.String(), nullable=False),
+        sa.Column("new_path", sa.String(), nullable=True),
+        sa.Column("checksum", sa.String(), nullable=True),
+        sa.Column("done", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["project.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    with op.batch_alter_table("sync_journal", schema=None) as batch_op:
+        batch_op.create_index(
+            "uix_sync_journal_change",
+            ["project_id", "action", "file_path"],
+            unique=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sync_journal", schema=None) as batch_op:
+        batch_op.drop_index("uix_sync_journal_change")
+
+    op.drop_table("sync_journal")
@@ -0,0 +1,62 @@
+"""add trigram search_fuzzy index
+
+Revision ID: e7b2c4f1a9d3
+Revises: d4e8b1a7c2f5
+Create Date: 2026-10-16 20:58:31.402117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.exc import OperationalError
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b2c4f1a9d3"
+down_revision: Union[str, None] = "d4e8b1a7c2f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Trigram index of search titles and paths, filled from the existing search_index.
+
+    Trigrams stored in content_stems by older versions are dropped the next
+    time an entity is reindexed.
+    """
+    try:
+        op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_fuzzy USING fts5(
+            title,
+            path,
+            tokenize='trigram'
+        )
+        """)
+    except OperationalError:
+        # SQLite older than 3.34 has no trigram tokenizer
+        op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_fuzzy USING fts5(
+            title,
+            path,
+            tokenize='unicode61 tokenchars 0x2F'
+        )
+        """)
+
+    has_search_index = op.get_bind().execute(
+        sa.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'")
+    ).first()
+    if has_search_index:
+        op.execute("""
+        INSERT INTO search_fuzzy (rowid, title, path)
+        SELECT
+            rowid,
+            title,
+            CASE WHEN type = 'entity' THEN coalesce(permalink, '') || ' ' || file_path END
+        FROM search_index
+        """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS search_fuzzy")
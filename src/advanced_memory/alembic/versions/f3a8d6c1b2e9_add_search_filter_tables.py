@@ -0,0 +1,88 @@
+"""add search_filter tables for structured search filters
+
+Revision ID: f3a8d6c1b2e9
+Revises: e7b2c4f1a9d3
+Create Date: 2026-10-16 22:41:07.519304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a8d6c1b2e9"
+down_revision: Union[str, None] = "e7b2c4f1a9d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Indexed entity_type, dates and tags of search_index rows, filled from the existing index.
+
+    Entity rows indexed by older versions have no tags in their metadata, they
+    get them the next time the entity is reindexed.
+    """
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS search_filter (
+        rowid INTEGER PRIMARY KEY,
+        project_id INTEGER NOT NULL,
+        type TEXT,
+        entity_type TEXT,
+        category TEXT,
+        created_at TEXT,
+        updated_at TEXT
+    )
+    """)
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS search_filter_tag (
+        rowid INTEGER NOT NULL,
+        project_id INTEGER NOT NULL,
+        tag TEXT NOT NULL,
+        PRIMARY KEY (rowid, tag)
+    )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_search_filter_entity_type "
+        "ON search_filter (project_id, entity_type, created_at)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_search_filter_created_at "
+        "ON search_filter (project_id, created_at)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_search_filter_tag_tag ON search_filter_tag (project_id, tag)"
+    )
+
+    has_search_index = op.get_bind().execute(
+        sa.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'")
+    ).first()
+    if has_search_index:
+        op.execute("""
+        INSERT INTO search_filter (
+            rowid, project_id, type, entity_type, category, created_at, updated_at
+        )
+        SELECT
+            rowid,
+            project_id,
+            type,
+            json_extract(metadata, '$.entity_type'),
+            category,
+            datetime(created_at),
+            datetime(updated_at)
+        FROM search_index
+        """)
+        op.execute("""
+        INSERT INTO search_filter_tag (rowid, project_id, tag)
+        SELECT DISTINCT row_key, project_id, tags.atom
+        FROM (SELECT rowid AS row_key, project_id, metadata FROM search_index) AS rows,
+            json_each(rows.metadata, '$.tags') AS tags
+        WHERE tags.atom IS NOT NULL
+        """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS search_filter_tag")
+    op.execute("DROP TABLE IF EXISTS search_filter")
@@ -7,8 +7,8 @@ from fastapi import FastAPI, HTTPException
 from fastapi.exception_handlers import http_exception_handler
 from loguru import logger
 
-from basic_memory import __version__ as version
-from basic_memory import db
+from advanced_memory import __version__ as version
+from advanced_memory import db
 from advanced_memory.api.routers import (
     directory_router,
     importer_router,
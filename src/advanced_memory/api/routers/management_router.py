@@ -1,6 +1,7 @@
 """Management router for basic-memory API."""
 
 import asyncio
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Request
 from loguru import logger
@@ -27,6 +28,20 @@ async def get_watch_status(request: Request) -> WatchStatusResponse:
     )
 
 
+@router.get("/watch/state")
+async def get_watch_state() -> Optional[Dict[str, Any]]:
+    """Get the full state of the watch service running in this process.
+
+    The same data the service writes to its status file, read from memory.
+    None if no watch service was started in this process.
+    """
+    # needed because of circular imports from sync -> app
+    from advanced_memory.sync.watch_service import get_watch_state
+
+    state = get_watch_state()
+    return state.model_dump(mode="json") if state is not None else None
+
+
 @router.post("/watch/start", response_model=WatchStatusResponse)
 async def start_watch_service(
     request: Request, project_repository: ProjectRepositoryDep, sync_service: SyncServiceDep
@@ -19,6 +19,7 @@ from advanced_memory.deps import (
 from advanced_memory.repository.search_repository import SearchIndexRow
 from advanced_memory.schemas.memory import normalize_memory_url
 from advanced_memory.schemas.search import SearchQuery, SearchItemType
+from advanced_memory.sync.sync_scheduler import sync_scheduler
 from advanced_memory.models.knowledge import Entity as EntityModel
 from datetime import datetime
 
@@ -54,6 +55,9 @@ async def get_resource_content(
     """Get resource content by identifier: name or permalink."""
     logger.debug(f"Getting content for: {identifier}")
 
+    # if the project is still syncing, sync the file first
+    await sync_scheduler.sync_identifier(config.name, identifier)
+
     # Find single entity by permalink
     entity = await link_resolver.resolve_link(identifier)
     results = [entity] if entity else []
@@ -164,7 +168,8 @@ async def write_resource(
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write content to file
-        checksum = await file_service.write_file(full_path, content_str)
+        # the entity and search index are updated below, the watcher can skip the write
+        checksum = await file_service.write_file(full_path, content_str, record=True)
 
         # Get file info
         file_stats = file_service.file_stats(full_path)
@@ -1,10 +1,15 @@
 """Router for search operations."""
 
-from fastapi import APIRouter, BackgroundTasks
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 
 from advanced_memory.api.routers.utils import to_search_results
-from advanced_memory.schemas.search import SearchQuery, SearchResponse
-from advanced_memory.deps import SearchServiceDep, EntityServiceDep
+from advanced_memory.repository.search_repository import SearchCursor
+from advanced_memory.schemas.search import SearchFacets, SearchQuery, SearchResponse
+from advanced_memory.deps import ProjectConfigDep, SearchServiceDep, EntityServiceDep
+from advanced_memory.services.search_cache import search_cache
+from advanced_memory.sync.sync_scheduler import sync_scheduler
 
 router = APIRouter(prefix="/search", tags=["search"])
 
@@ -12,25 +17,85 @@ router = APIRouter(prefix="/search", tags=["search"])
 @router.post("/", response_model=SearchResponse)
 async def search(
     query: SearchQuery,
+    config: ProjectConfigDep,
     search_service: SearchServiceDep,
     entity_service: EntityServiceDep,
     page: int = 1,
     page_size: int = 10,
+    cursor: Optional[str] = None,
+    include_counts: bool = False,
 ):
-    """Search across all knowledge and documents."""
+    """Search across all knowledge and documents.
+
+    Pages can be requested by number, or by the next_cursor of the previous
+    page, which stays as fast on deep pages. include_counts adds the total
+    number of results and counts per type.
+    """
     limit = page_size
     offset = (page - 1) * page_size
-    results = await search_service.search(query, limit=limit, offset=offset)
-    search_results = await to_search_results(entity_service, results)
+    try:
+        search_cursor = SearchCursor.decode(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    # hydrated results are cached too
+    cacheable = search_service.is_cacheable(query)
+    key = search_service.cache_key("results", query, limit, offset, cursor=search_cursor)
+    generation = search_service.generation()
+    cached = search_cache.get(key, generation) if cacheable else None
+
+    if cached is None:
+        # a note looked up by permalink or title may be waiting for the
+        # initial sync under another path, see SyncService.sync_identifier
+        if sync_scheduler.is_syncing(config.name):
+            for identifier in (query.permalink, query.title):
+                if identifier:
+                    await sync_scheduler.sync_identifier(config.name, identifier)
+
+        results = await search_service.search(
+            query, limit=limit, offset=offset, cursor=search_cursor
+        )
+
+        # results whose files are still waiting for the initial sync are synced
+        # now, then searched again so they are current
+        if sync_scheduler.is_syncing(config.name):
+            paths = [result.file_path for result in results if result.file_path]
+            if await sync_scheduler.sync_now(config.name, paths):
+                results = await search_service.search(
+                    query, limit=limit, offset=offset, cursor=search_cursor
+                )
+        next_cursor = (
+            SearchCursor.after(results[-1]).encode() if results and len(results) == limit else None
+        )
+        search_results = await to_search_results(entity_service, results)
+        cached = (search_results, next_cursor)
+        if cacheable:
+            search_cache.put(key, generation, cached, size=len(search_results))
+    search_results, next_cursor = cached
+
+    total, facets = None, None
+    if include_counts:
+        counts = await search_service.count(query)
+        total = counts.total
+        facets = SearchFacets(item_types=counts.item_types, entity_types=counts.entity_types)
+
     return SearchResponse(
-        results=search_results,
+        results=list(search_results),
         current_page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
+        total=total,
+        facets=facets,
     )
 
 
 @router.post("/reindex")
-async def reindex(background_tasks: BackgroundTasks, search_service: SearchServiceDep):
-    """Recreate and populate the search index."""
-    await search_service.reindex_all(background_tasks=background_tasks)
+async def reindex(
+    background_tasks: BackgroundTasks, config: ProjectConfigDep, search_service: SearchServiceDep
+):
+    """Rebuild the search index in the background, search keeps working meanwhile."""
+    if not await search_service.reindex_all(
+        background_tasks=background_tasks, project_name=config.name
+    ):
+        return {"status": "ok", "message": "Reindex already running"}
     return {"status": "ok", "message": "Reindex initiated"}
@@ -12,7 +12,7 @@ def version_callback(value: bool) -> None:
         import advanced_memory
 
         config = get_project_config()
-        typer.echo(f"Basic Memory version: {basic_memory.__version__}")
+        typer.echo(f"Basic Memory version: {advanced_memory.__version__}")
         typer.echo(f"Current project: {config.project}")
         typer.echo(f"Project path: {config.home}")
         raise typer.Exit()
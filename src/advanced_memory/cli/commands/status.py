@@ -9,7 +9,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.tree import Tree
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.cli.app import app
 from advanced_memory.cli.commands.sync import get_sync_service
 from advanced_memory.config import ConfigManager, get_project_config
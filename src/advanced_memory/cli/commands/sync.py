@@ -11,7 +11,7 @@ from loguru import logger
 from rich.console import Console
 from rich.tree import Tree
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.cli.app import app
 from advanced_memory.config import ConfigManager, get_project_config
 from advanced_memory.markdown import EntityParser
@@ -21,6 +21,7 @@ from advanced_memory.repository import (
     EntityRepository,
     ObservationRepository,
     RelationRepository,
+    SyncJournalRepository,
     ProjectRepository,
 )
 from advanced_memory.repository.search_repository import SearchRepository
@@ -28,6 +29,7 @@ from advanced_memory.services import EntityService, FileService
 from advanced_memory.services.link_resolver import LinkResolver
 from advanced_memory.services.search_service import SearchService
 from advanced_memory.sync import SyncService
+from advanced_memory.sync.lease import ProjectLease, default_lease_dir
 from advanced_memory.sync.sync_service import SyncReport
 
 console = Console()
@@ -57,6 +59,7 @@ async def get_sync_service(project: Project) -> SyncService:  # pragma: no cover
     observation_repository = ObservationRepository(session_maker, project_id=project.id)
     relation_repository = RelationRepository(session_maker, project_id=project.id)
     search_repository = SearchRepository(session_maker, project_id=project.id)
+    journal_repository = SyncJournalRepository(session_maker, project_id=project.id)
 
     # Initialize services
     search_service = SearchService(search_repository, entity_repository, file_service)
@@ -81,6 +84,7 @@ async def get_sync_service(project: Project) -> SyncService:  # pragma: no cover
         relation_repository=relation_repository,
         search_service=search_service,
         file_service=file_service,
+        journal_repository=journal_repository,
     )
 
     return sync_service
@@ -159,7 +163,7 @@ def display_detailed_sync_results(knowledge: SyncReport):
         console.print(knowledge_tree)
 
 
-async def run_sync(verbose: bool = False):
+async def run_sync(verbose: bool = False, verify_checksums: bool = False):
     """Run sync operation."""
     app_config = ConfigManager().config
     config = get_project_config()
@@ -183,10 +187,33 @@ async def run_sync(verbose: bool = False):
         directory=str(config.home),
     )
 
-    sync_service = await get_sync_service(project)
+    # a watcher in another process (the MCP server, the API) syncs the project itself
+    lease = ProjectLease(project.path, default_lease_dir(), app_config.watch_lease_seconds)
+    if not await asyncio.to_thread(lease.acquire):
+        holder = await asyncio.to_thread(lease.read)
+        console.print(
+            f"[yellow]Project {project.name} is watched and synced by "
+            f"{holder.describe() if holder else 'another process'}, skipping sync[/yellow]"
+        )
+        return
+
+    async def hold_lease():
+        while True:
+            await asyncio.sleep(app_config.watch_lease_seconds / 3)
+            if not await asyncio.to_thread(lease.acquire):  # pragma: no cover
+                logger.warning(f"Lost the lease on syncing project {project.name}")
+
+    heartbeat = asyncio.create_task(hold_lease())
+    try:
+        sync_service = await get_sync_service(project)
 
-    logger.info("Running one-time sync")
-    knowledge_changes = await sync_service.sync(config.home, project_name=project.name)
+        logger.info("Running one-time sync")
+        knowledge_changes = await sync_service.sync(
+            config.home, project_name=project.name, verify_checksums=verify_checksums
+        )
+    finally:
+        heartbeat.cancel()
+        await asyncio.to_thread(lease.release)
 
     # Log results
     duration_ms = int((time.time() - start_time) * 1000)
@@ -285,6 +312,11 @@ def sync(
         "-v",
         help="Show detailed sync information.",
     ),
+    checksum: bool = typer.Option(
+        False,
+        "--checksum",
+        help="Re-hash every file instead of skipping files with unchanged size/mtime.",
+    ),
 ) -> None:
     """Sync knowledge files with the database."""
     config = get_project_config()
@@ -295,7 +327,7 @@ def sync(
         typer.echo(f"Project path: {config.home}")
 
         # Run sync
-        asyncio.run(run_sync(verbose=verbose))
+        asyncio.run(run_sync(verbose=verbose, verify_checksums=checksum))
 
     except Exception as e:  # pragma: no cover
         if not isinstance(e, typer.Exit):
@@ -70,6 +70,35 @@ class AdvancedMemoryConfig(BaseSettings):
         default=1000, description="Milliseconds to wait after changes before syncing", gt=0
     )
 
+    watch_queue_limit: int = Field(
+        default=1000,
+        description="Files with pending changes per project above which the watcher runs a full sync instead. default (1000)",
+        gt=0,
+    )
+
+    watch_concurrency: int = Field(
+        default=2,
+        description="Projects whose changes the watcher syncs at the same time. default (2)",
+        ge=1,
+    )
+
+    watch_backend: Literal["native", "poll"] = Field(
+        default="native",
+        description="How the watcher detects changes: 'native' filesystem events, or 'poll' to compare file stats periodically, for network mounts and cloud-synced folders. default (native)",
+    )
+
+    watch_poll_interval: float = Field(
+        default=5.0,
+        description="Seconds between polls with the 'poll' watch backend. default (5)",
+        gt=0,
+    )
+
+    watch_lease_seconds: int = Field(
+        default=30,
+        description="Seconds a process's claim on watching and syncing a project lasts unless renewed, it is renewed every third of that. Other processes serve the project read-only meanwhile. default (30)",
+        gt=0,
+    )
+
     # update permalinks on move
     update_permalinks_on_move: bool = Field(
         default=False,
@@ -81,6 +110,23 @@ class AdvancedMemoryConfig(BaseSettings):
         description="Whether to sync changes in real time. default (True)",
     )
 
+    sync_workers: int = Field(
+        default=0,
+        description="Workers used to hash and parse files in parallel during sync. 0 uses one per CPU, 1 disables parallelism. default (0)",
+        ge=0,
+    )
+
+    sync_stat_fast_path: bool = Field(
+        default=True,
+        description="Skip re-hashing files whose size, mtime and inode are unchanged since the last sync. default (True)",
+    )
+
+    sync_batch_size: int = Field(
+        default=100,
+        description="Number of new or modified files written per database transaction during a full sync. 1 writes each file in its own transactions. default (100)",
+        ge=1,
+    )
+
     # API connection configuration
     api_url: Optional[str] = Field(
         default=None,
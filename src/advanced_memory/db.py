@@ -1,15 +1,16 @@
 import asyncio
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from enum import Enum, auto
 from pathlib import Path
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, Tuple
 
 from advanced_memory.config import AdvancedMemoryConfig, ConfigManager
 from alembic import command
 from alembic.config import Config
 
 from loguru import logger
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -25,6 +26,14 @@ _engine: Optional[AsyncEngine] = None
 _session_maker: Optional[async_sessionmaker[AsyncSession]] = None
 _migrations_completed: bool = False
 
+# How long a connection waits for another one's write lock before failing
+SQLITE_BUSY_TIMEOUT_MS = 30_000
+
+# Session of the batch_session() active in the current context, if any
+_batch_session: ContextVar[
+    Optional[Tuple[async_sessionmaker[AsyncSession], AsyncSession]]
+] = ContextVar("batch_session", default=None)
+
 
 class DatabaseType(Enum):
     """Types of supported databases."""
@@ -42,6 +51,33 @@ class DatabaseType(Enum):
         return f"sqlite+aiosqlite:///{db_path}"  # pragma: no cover
 
 
+@asynccontextmanager
+async def batch_session(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Run all scoped_session() work in this context as a single transaction.
+
+    Repository calls made inside the block share one session and one commit.
+    Any exception rolls back everything done in the batch. Nested batches
+    join the outer one.
+
+    Args:
+        session_maker: Session maker the repositories use
+    """
+    batch = _batch_session.get()
+    if batch is not None and batch[0] is session_maker:
+        yield batch[1]
+        return
+
+    async with scoped_session(session_maker) as session:
+        token = _batch_session.set((session_maker, session))
+        try:
+            yield session
+        finally:
+            _batch_session.reset(token)
+
+
 def get_scoped_session_factory(
     session_maker: async_sessionmaker[AsyncSession],
 ) -> async_scoped_session:
@@ -56,9 +92,21 @@ async def scoped_session(
     """
     Get a scoped session with proper lifecycle management.
 
+    Inside batch_session() the batch's session is reused instead: the work is
+    flushed but only committed (or rolled back) when the batch ends.
+
     Args:
         session_maker: Session maker to create scoped sessions from
     """
+    batch = _batch_session.get()
+    if batch is not None and batch[0] is session_maker:
+        session = batch[1]
+        yield session
+        await session.flush()
+        # detach loaded objects, as closing a standalone session would
+        session.expunge_all()
+        return
+
     factory = get_scoped_session_factory(session_maker)
     session = factory()
     try:
@@ -80,6 +128,18 @@ def _create_engine_and_session(
     db_url = DatabaseType.get_db_url(db_path, db_type)
     logger.debug(f"Creating engine for db_url: {db_url}")
     engine = create_async_engine(db_url, connect_args={"check_same_thread": False})
+    if db_type == DatabaseType.FILESYSTEM:  # pragma: no cover
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            # the sync, the watcher, the API and other processes write at the
+            # same time: with WAL readers don't block the writer, and writers
+            # wait for each other instead of failing with "database is locked"
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.close()
+
     session_maker = async_sessionmaker(engine, expire_on_commit=False)
     return engine, session_maker
 
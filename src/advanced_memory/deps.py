@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import (
 )
 import pathlib
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.config import ProjectConfig, AdvancedMemoryConfig, ConfigManager
 from advanced_memory.importers import (
     ChatGPTImporter,
@@ -26,6 +26,7 @@ from advanced_memory.repository.observation_repository import ObservationReposit
 from advanced_memory.repository.project_repository import ProjectRepository
 from advanced_memory.repository.relation_repository import RelationRepository
 from advanced_memory.repository.search_repository import SearchRepository
+from advanced_memory.repository.sync_journal_repository import SyncJournalRepository
 from advanced_memory.services import EntityService, ProjectService
 from advanced_memory.services.context_service import ContextService
 from advanced_memory.services.directory_service import DirectoryService
@@ -193,6 +194,19 @@ async def get_relation_repository(
 RelationRepositoryDep = Annotated[RelationRepository, Depends(get_relation_repository)]
 
 
+async def get_sync_journal_repository(
+    session_maker: SessionMakerDep,
+    project_id: ProjectIdDep,
+) -> SyncJournalRepository:
+    """Create a SyncJournalRepository instance for the current project."""
+    return SyncJournalRepository(session_maker, project_id=project_id)
+
+
+SyncJournalRepositoryDep = Annotated[
+    SyncJournalRepository, Depends(get_sync_journal_repository)
+]
+
+
 async def get_search_repository(
     session_maker: SessionMakerDep,
     project_id: ProjectIdDep,
@@ -304,6 +318,7 @@ async def get_sync_service(
     relation_repository: RelationRepositoryDep,
     search_service: SearchServiceDep,
     file_service: FileServiceDep,
+    journal_repository: SyncJournalRepositoryDep,
 ) -> SyncService:  # pragma: no cover
     """
 
@@ -317,6 +332,7 @@ async def get_sync_service(
         relation_repository=relation_repository,
         search_service=search_service,
         file_service=file_service,
+        journal_repository=journal_repository,
     )
 
 
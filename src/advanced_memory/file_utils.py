@@ -1,8 +1,12 @@
 """Utilities for file operations."""
 
 import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 from loguru import logger
@@ -28,6 +32,49 @@ class ParseError(FileError):
     pass
 
 
+# Files modified this recently may still change within the same mtime tick
+# (2s on FAT/SMB), so their stat is not trusted as a change fingerprint.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class FileStat:
+    """Cheap change-detection fingerprint of a file taken from os.stat().
+
+    If size, mtime_ns and inode all match a previously recorded value, the file
+    content is assumed to be unchanged and does not need to be re-hashed.
+    """
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, stat: os.stat_result) -> "FileStat":
+        # SQLite integers are signed 64 bit, keep inode values in range
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino % (1 << 63))
+
+    @classmethod
+    def from_path(cls, path: FilePath) -> "FileStat":
+        return cls.from_stat(os.stat(path))
+
+    def is_racy(self, now_ns: Optional[int] = None) -> bool:
+        """Check if the file was modified too recently for its stat to be trusted."""
+        now_ns = now_ns if now_ns is not None else time.time_ns()
+        return now_ns - self.mtime_ns < RACY_MTIME_WINDOW_NS
+
+    def to_columns(self) -> Dict[str, Optional[int]]:
+        """Entity column values for this stat.
+
+        Racy stats are stored without mtime so the file is always re-hashed on the next scan.
+        """
+        return {
+            "size": self.size,
+            "mtime_ns": None if self.is_racy() else self.mtime_ns,
+            "inode": self.inode,
+        }
+
+
 async def compute_checksum(content: Union[str, bytes]) -> str:
     """
     Compute SHA-256 checksum of content.
@@ -41,6 +88,11 @@ async def compute_checksum(content: Union[str, bytes]) -> str:
     Raises:
         FileError: If checksum computation fails
     """
+    return compute_checksum_sync(content)
+
+
+def compute_checksum_sync(content: Union[str, bytes]) -> str:
+    """Compute SHA-256 checksum of content without awaiting, for use in worker threads."""
     try:
         if isinstance(content, str):
             content = content.encode()
@@ -50,6 +102,52 @@ async def compute_checksum(content: Union[str, bytes]) -> str:
         raise FileError(f"Failed to compute checksum: {e}")
 
 
+class WriteRegistry:
+    """Short-lived record of the files this process wrote, with their checksums.
+
+    The watch service consults it to drop the change events caused by the
+    server's own writes: a file whose content still matches what was written
+    was already synced by the writer and does not need to be synced again.
+    """
+
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        # normalized absolute path -> (checksum, expiry), oldest first
+        self._writes: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    @staticmethod
+    def _key(path: FilePath) -> str:
+        return os.path.normpath(os.path.abspath(path))
+
+    def _expire(self, now: float) -> None:
+        while self._writes:
+            _, (_, expires) = next(iter(self._writes.items()))
+            if expires > now:
+                break
+            self._writes.popitem(last=False)
+
+    def record(self, path: FilePath, checksum: str) -> None:
+        """Record that path was just written with content of the given checksum."""
+        now = time.monotonic()
+        self._expire(now)
+        key = self._key(path)
+        self._writes.pop(key, None)
+        self._writes[key] = (checksum, now + self.ttl)
+
+    def get(self, path: FilePath) -> Optional[str]:
+        """Checksum of the recent write to path, if any."""
+        self._expire(time.monotonic())
+        entry = self._writes.get(self._key(path))
+        return entry[0] if entry else None
+
+    def clear(self) -> None:
+        self._writes.clear()
+
+
+# Files written by this process, see WriteRegistry
+recent_writes = WriteRegistry()
+
+
 async def ensure_directory(path: FilePath) -> None:
     """
     Ensure directory exists, creating if necessary.
@@ -69,13 +167,15 @@ async def ensure_directory(path: FilePath) -> None:
         raise FileWriteError(f"Failed to create directory {path}: {e}")
 
 
-async def write_file_atomic(path: FilePath, content: str) -> None:
+async def write_file_atomic(path: FilePath, content: str, record: bool = False) -> None:
     """
     Write file with atomic operation using temporary file.
 
     Args:
         path: Target file path (Path or string)
         content: Content to write
+        record: Record the write in recent_writes, so the watch service skips
+            it. Only for writers that update the database themselves.
 
     Raises:
         FileWriteError: If write operation fails
@@ -87,6 +187,8 @@ async def write_file_atomic(path: FilePath, content: str) -> None:
     try:
         temp_path.write_text(content, encoding="utf-8")
         temp_path.replace(path_obj)
+        if record:
+            recent_writes.record(path_obj, compute_checksum_sync(content))
         logger.debug("Wrote file atomically", path=str(path_obj), content_length=len(content))
     except Exception as e:  # pragma: no cover
         temp_path.unlink(missing_ok=True)
@@ -192,7 +294,34 @@ def remove_frontmatter(content: str) -> str:
     return parts[2].strip()
 
 
-async def update_frontmatter(path: FilePath, updates: Dict[str, Any]) -> str:
+def apply_frontmatter_updates(content: str, updates: Dict[str, Any]) -> str:
+    """Return content with frontmatter fields updated, leaving the body untouched.
+
+    Creates a frontmatter section if none exists.
+
+    Args:
+        content: Markdown content, with or without frontmatter
+        updates: Dict of frontmatter fields to update
+
+    Returns:
+        Content with the updated frontmatter
+
+    Raises:
+        ParseError: If frontmatter parsing fails
+    """
+    current_fm = {}
+    if has_frontmatter(content):
+        current_fm = parse_frontmatter(content)
+        content = remove_frontmatter(content)
+
+    new_fm = {**current_fm, **updates}
+    yaml_fm = yaml.dump(new_fm, sort_keys=False, allow_unicode=True)
+    return f"---\n{yaml_fm}---\n\n{content.strip()}"
+
+
+async def update_frontmatter(
+    path: FilePath, updates: Dict[str, Any], record: bool = False
+) -> str:
     """Update frontmatter fields in a file while preserving all content.
 
     Only modifies the frontmatter section, leaving all content untouched.
@@ -202,6 +331,7 @@ async def update_frontmatter(path: FilePath, updates: Dict[str, Any]) -> str:
     Args:
         path: Path to markdown file (Path or string)
         updates: Dict of frontmatter fields to update
+        record: Record the write in recent_writes, see write_file_atomic
 
     Returns:
         Checksum of updated file
@@ -217,22 +347,12 @@ async def update_frontmatter(path: FilePath, updates: Dict[str, Any]) -> str:
         # Read current content
         content = path_obj.read_text(encoding="utf-8")
 
-        # Parse current frontmatter
-        current_fm = {}
-        if has_frontmatter(content):
-            current_fm = parse_frontmatter(content)
-            content = remove_frontmatter(content)
-
-        # Update frontmatter
-        new_fm = {**current_fm, **updates}
-
         # Write new file with updated frontmatter
-        yaml_fm = yaml.dump(new_fm, sort_keys=False, allow_unicode=True)
-        final_content = f"---\n{yaml_fm}---\n\n{content.strip()}"
+        final_content = apply_frontmatter_updates(content, updates)
 
         logger.debug("Updating frontmatter", path=str(path_obj), update_keys=list(updates.keys()))
 
-        await write_file_atomic(path_obj, final_content)
+        await write_file_atomic(path_obj, final_content, record=record)
         return await compute_checksum(final_content)
 
     except Exception as e:  # pragma: no cover
@@ -112,6 +112,10 @@ class EntityParser:
         return self.base_path / path
 
     async def parse_file_content(self, absolute_path, file_content):
+        return self.parse_file_content_sync(absolute_path, file_content)
+
+    def parse_file_content_sync(self, absolute_path: Path, file_content: str) -> EntityMarkdown:
+        """Parse file content without awaiting, so it can run in a worker process."""
         # Use resilient parsing that handles malformed YAML gracefully
         try:
             metadata = parse_frontmatter(file_content)
@@ -6,7 +6,7 @@ import frontmatter
 from frontmatter import Post
 from loguru import logger
 
-from basic_memory import file_utils
+from advanced_memory import file_utils
 from advanced_memory.markdown.entity_parser import EntityParser
 from advanced_memory.markdown.schemas import EntityMarkdown, Observation, Relation
 
@@ -41,6 +41,8 @@ PARAMETERS:
 - search_type (str, default="text"): Search scope (text, metadata, combined, file, path)
 - page (int, default=1): Result page for pagination
 - page_size (int, default=10): Results per page (max 100)
+- cursor (str, optional): next_cursor of the previous notes page, for deep paging
+- include_counts (bool, default=False): Add total and per-type counts to notes search
 - max_results (int, default=20): Maximum number of results to return
 - case_sensitive (bool, default=False): Whether search should be case-sensitive
 - include_content (bool, default=False): Include content previews in results
@@ -49,7 +51,7 @@ PARAMETERS:
 - after_date (str, optional): Date filter (ISO format or relative like "7d")
 - file_type (str, optional): File type filter for external searches
 - notebook_filter (str, optional): Filter results to specific notebook
-- tag_filter (str, optional): Filter results by tag name
+- tag_filter (str, optional): Filter results by tag name, for notes and Evernote searches
 - project (str, optional): Project scope for notes search
 
 USAGE EXAMPLES:
@@ -81,6 +83,8 @@ async def adn_search(
     notebook_filter: Optional[str] = None,
     tag_filter: Optional[str] = None,
     project: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_counts: bool = False,
 ) -> str:
     """Comprehensive search management for Advanced Memory knowledge base.
 
@@ -108,6 +112,8 @@ async def adn_search(
         notebook_filter: Filter results to specific notebook
         tag_filter: Filter results by tag name
         project: Optional project name
+        cursor: next_cursor of the previous page of a notes search
+        include_counts: Add the total hit count and counts per type to a notes search
 
     Returns:
         Operation-specific result with search details and match counts
@@ -129,7 +135,18 @@ async def adn_search(
 
     # Route to appropriate operation
     if operation == "notes":
-        return await _notes_search(query, page, page_size, types, entity_types, after_date, project)
+        return await _notes_search(
+            query,
+            page,
+            page_size,
+            types,
+            entity_types,
+            after_date,
+            project,
+            cursor,
+            include_counts,
+            tag_filter,
+        )
     elif operation == "obsidian":
         return await _obsidian_search(query, source_path, search_type, max_results, include_content)
     elif operation == "joplin":
@@ -142,10 +159,13 @@ async def adn_search(
         return f"# Error\n\nInvalid operation '{operation}'. Supported operations: notes, obsidian, joplin, notion, evernote"
 
 
-async def _notes_search(query: str, page: int, page_size: int, types: Optional[List[str]], entity_types: Optional[List[str]], after_date: Optional[str], project: Optional[str]) -> str:
+async def _notes_search(query: str, page: int, page_size: int, types: Optional[List[str]], entity_types: Optional[List[str]], after_date: Optional[str], project: Optional[str], cursor: Optional[str], include_counts: bool, tag_filter: Optional[str]) -> str:
     """Handle Advanced Memory notes search operation."""
-    from advanced_memory.mcp.tools.search_notes import search_notes
-    return await search_notes(query, page, page_size, "text", types, entity_types, after_date, project)
+    from advanced_memory.mcp.tools.search import search_notes
+    tags = [tag_filter] if tag_filter else None
+    return await search_notes.fn(  # pyright: ignore [reportFunctionMemberAccess]
+        query, page, page_size, "text", types, entity_types, after_date, project, cursor, include_counts, tags
+    )
 
 
 async def _obsidian_search(query: str, source_path: Optional[str], search_type: str, max_results: int, include_content: bool) -> str:
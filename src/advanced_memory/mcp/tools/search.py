@@ -229,10 +229,14 @@ PARAMETERS:
 - query (str, REQUIRED): Search terms with boolean operators and phrases
 - page (int, default=1): Result page for pagination
 - page_size (int, default=10): Results per page (max 100)
+- cursor (str, optional): next_cursor of the previous page, faster than page numbers on deep pages
+- include_counts (bool, default=False): Add the total hit count and counts per type
 - search_type (str, default="text"): Search mode (text/title/permalink/entity)
 - types (List[str], optional): Content type filters
 - entity_types (List[str], optional): Entity category filters
 - after_date (str, optional): Date filter (ISO format or relative like "7d")
+- tags (List[str], optional): Only notes and observations with any of these tags
+- snippet_tokens (int, default=32): Length of each result's content passage around the match (max 64)
 - project (str, optional): Project scope (defaults to active project)
 
 QUERY SYNTAX:
@@ -247,11 +251,15 @@ Basic search: search_notes("machine learning")
 Phrase search: search_notes("\"project planning\" meeting")
 Filtered search: search_notes("urgent", entity_types=["task"])
 Date filter: search_notes("meeting", after_date="2024-01-01")
+Tag filter: search_notes("meeting", tags=["decision"])
 Project scope: search_notes("design", project="work-project")
 Pagination: search_notes("important", page=2, page_size=50)
+Next page by cursor: search_notes("important", cursor=previous.next_cursor)
+Result counts: search_notes("important", include_counts=True)
 
 RETURNS:
-SearchResponse object with results, metadata, and pagination info.
+SearchResponse object with results, metadata, and pagination info: next_cursor
+for the following page, plus total and facets when include_counts is set.
 
 SEARCH OPTIMIZATION:
 - Pre-indexed full-text search for speed
@@ -272,6 +280,10 @@ async def search_notes(
     entity_types: Optional[List[str]] = None,
     after_date: Optional[str] = None,
     project: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_counts: bool = False,
+    tags: Optional[List[str]] = None,
+    snippet_tokens: int = 32,
 ) -> SearchResponse | str:
     """Search across all content in the knowledge base with comprehensive syntax support.
 
@@ -324,6 +336,13 @@ async def search_notes(
         entity_types: Optional list of entity types to filter by (e.g., ["entity", "observation"])
         after_date: Optional date filter for recent content (e.g., "1 week", "2d", "2024-01-01")
         project: Optional project name to search in. If not provided, uses current active project.
+        cursor: The next_cursor of the previous page, to get the page after it. Stays fast
+            on deep pages, unlike page numbers; page is ignored when a cursor is given.
+        include_counts: Add the total number of results and counts per item type
+            and entity type (total, facets)
+        tags: Optional list of tags, only results with any of them are returned
+        snippet_tokens: Tokens of each result's content passage, taken around the best
+            match of a text search (1 to 64, default 32)
 
     Returns:
         SearchResponse with results and pagination info, or helpful error guidance if search fails
@@ -374,6 +393,11 @@ async def search_notes(
         # Search in specific project
         results = await search_notes("meeting notes", project="work-project")
 
+        # Page through all results, with the total count on the first page
+        results = await search_notes("meeting", include_counts=True)
+        while results.next_cursor:
+            results = await search_notes("meeting", cursor=results.next_cursor)
+
         # Complex search with multiple filters
         results = await search_notes(
             query="(bug OR issue) AND NOT resolved",
@@ -382,7 +406,7 @@ async def search_notes(
         )
     """
     # Create a SearchQuery object based on the parameters
-    search_query = SearchQuery()
+    search_query = SearchQuery(snippet_tokens=snippet_tokens)
 
     # Set the appropriate search field based on search_type
     if search_type == "text":
@@ -403,18 +427,24 @@ async def search_notes(
         search_query.types = types
     if after_date:
         search_query.after_date = after_date
+    if tags:
+        search_query.tags = tags
 
     active_project = get_active_project(project)
     project_url = active_project.project_url
 
     logger.info(f"Searching for {search_query}")
 
+    params = {"page": page, "page_size": page_size, "include_counts": include_counts}
+    if cursor:
+        params["cursor"] = cursor
+
     try:
         response = await call_post(
             client,
             f"{project_url}/search/",
             json=search_query.model_dump(),
-            params={"page": page, "page_size": page_size},
+            params=params,
         )
         result = SearchResponse.model_validate(response.json())
 
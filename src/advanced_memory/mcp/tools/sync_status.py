@@ -56,6 +56,14 @@ def _get_all_projects_status() -> list[str]:
 
                 status_lines.append(f"- {status_icon} **{project_name}**: {status_text}")
 
+                # A search index rebuild in progress, search keeps working during it
+                reindex_status = sync_status_tracker.get_reindex_status(project_name)
+                if reindex_status and reindex_status.status.value == "syncing":
+                    status_lines.append(
+                        f"  - [INDEX] Rebuilding search index "
+                        f"({reindex_status.files_processed}/{reindex_status.files_total} notes)"
+                    )
+
     except Exception as e:
         logger.debug(f"Could not get project config for comprehensive status: {e}")
 
@@ -4,6 +4,7 @@ import advanced_memory
 from advanced_memory.models.base import Base
 from advanced_memory.models.knowledge import Entity, Observation, Relation
 from advanced_memory.models.project import Project
+from advanced_memory.models.sync import SyncJournalEntry
 
 __all__ = [
     "Base",
@@ -11,5 +12,6 @@ __all__ = [
     "Observation",
     "Relation",
     "Project",
+    "SyncJournalEntry",
     "basic_memory",
 ]
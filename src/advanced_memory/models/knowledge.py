@@ -71,6 +71,10 @@ class Entity(Base):
     file_path: Mapped[str] = mapped_column(String, index=True)
     # checksum of file
     checksum: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    # stat fingerprint recorded with the checksum, lets sync skip re-hashing unchanged files
+    size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    mtime_ns: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    inode: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Metadata and tracking
     created_at: Mapped[datetime] = mapped_column(DateTime)
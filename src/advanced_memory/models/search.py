@@ -2,14 +2,15 @@
 
 from sqlalchemy import DDL
 
-# Define FTS5 virtual table creation
-CREATE_SEARCH_INDEX = DDL("""
-CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+# Define FTS5 virtual table creation, {table} is search_index or a shadow table
+# a new index is built in (see SearchService.reindex_all)
+SEARCH_INDEX_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5(
     -- Core entity fields
     id UNINDEXED,          -- Row ID
     title,                 -- Title for searching
-    content_stems,         -- Main searchable content split into stems
-    content_snippet,       -- File content snippet for display
+    content_stems,         -- Title, path variants and tags split into stems
+    content_snippet,       -- Note or observation text, snippets are cut from it
     permalink,             -- Stable identifier (now indexed for path search)
     file_path UNINDEXED,   -- Physical location
     type UNINDEXED,        -- entity/relation/observation
@@ -35,4 +36,86 @@ CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
     tokenize='unicode61 tokenchars 0x2F',  -- Hex code for /
     prefix='1,2,3,4'                    -- Support longer prefixes for paths
 );
-""")
+"""
+
+CREATE_SEARCH_INDEX = DDL(SEARCH_INDEX_TABLE.format(table="search_index"))
+
+# Trigram index of search_index titles and paths, for fuzzy matching. Each row
+# has the rowid of the search_index row it indexes. Substring and typo-tolerant
+# matching lives here so content_stems only holds real words.
+SEARCH_FUZZY_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5(
+    title,                 -- Title of the search_index row
+    path,                  -- Permalink and file path, for entities
+    tokenize='trigram'
+);
+"""
+
+CREATE_SEARCH_FUZZY_INDEX = DDL(SEARCH_FUZZY_TABLE.format(table="search_fuzzy"))
+
+# Same table for SQLite builds older than 3.34, which lack the trigram
+# tokenizer: fuzzy matching then falls back to whole words.
+SEARCH_FUZZY_TABLE_WITHOUT_TRIGRAMS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5(
+    title,
+    path,
+    tokenize='unicode61 tokenchars 0x2F'
+);
+"""
+
+CREATE_SEARCH_FUZZY_INDEX_WITHOUT_TRIGRAMS = DDL(
+    SEARCH_FUZZY_TABLE_WITHOUT_TRIGRAMS.format(table="search_fuzzy")
+)
+
+# Structured filters of search_index rows, in a regular table whose indexes
+# searches can use: FTS5 columns can't be indexed. Keyed by the rowid of the
+# search_index row, dates normalized with datetime() so they compare as text.
+SEARCH_FILTER_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    rowid INTEGER PRIMARY KEY,   -- rowid of the search_index row
+    project_id INTEGER NOT NULL,
+    type TEXT,                   -- entity/relation/observation
+    entity_type TEXT,            -- metadata entity_type, entity rows only
+    category TEXT,               -- observation category
+    created_at TEXT,
+    updated_at TEXT
+);
+"""
+
+# Tags of search_index rows, one row per tag
+SEARCH_FILTER_TAG_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    rowid INTEGER NOT NULL,      -- rowid of the search_index row
+    project_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (rowid, tag)
+);
+"""
+
+# Indexes of the filter tables, one statement each
+SEARCH_FILTER_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_search_filter_entity_type "
+    "ON search_filter (project_id, entity_type, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_search_filter_created_at "
+    "ON search_filter (project_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_search_filter_tag_tag ON search_filter_tag (project_id, tag)",
+]
+
+CREATE_SEARCH_FILTER_TABLES = [
+    DDL(SEARCH_FILTER_TABLE.format(table="search_filter")),
+    DDL(SEARCH_FILTER_TAG_TABLE.format(table="search_filter_tag")),
+    *(DDL(statement) for statement in SEARCH_FILTER_INDEXES),
+]
+
+# Live index writes made, by any process, while a reindex builds the shadow
+# index. Only logged while search_index_shadow exists; the swap copies the rows
+# they name over (see SearchRepository.swap_shadow_index).
+SEARCH_INDEX_WRITE_TABLE = """
+CREATE TABLE IF NOT EXISTS search_index_write (
+    project_id INTEGER NOT NULL,
+    entity_id INTEGER,           -- the rows of this entity were written
+    permalink TEXT               -- or the row with this permalink
+);
+"""
+
+CREATE_SEARCH_INDEX_WRITE_TABLE = DDL(SEARCH_INDEX_WRITE_TABLE)
@@ -0,0 +1,41 @@
+"""Sync journal model."""
+
+from typing import Optional
+
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from advanced_memory.models.base import Base
+
+
+class SyncJournalEntry(Base):
+    """A file change planned by a sync that has not finished yet.
+
+    The changes found by a scan are journaled before they are applied and each
+    entry is marked done as its transaction commits. A sync that is interrupted
+    leaves its pending entries behind, so the next sync can resume from them
+    instead of redoing the whole report. The journal is cleared when a sync
+    completes.
+    """
+
+    __tablename__ = "sync_journal"
+    __table_args__ = (
+        Index("uix_sync_journal_change", "project_id", "action", "file_path", unique=True),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("project.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # new, modified, deleted or moved
+    action: Mapped[str] = mapped_column(String)
+    file_path: Mapped[str] = mapped_column(String)
+
+    # destination of a move
+    new_path: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    checksum: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    done: Mapped[bool] = mapped_column(Boolean, default=False)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"SyncJournalEntry(action='{self.action}', file_path='{self.file_path}', done={self.done})"
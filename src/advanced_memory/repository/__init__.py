@@ -2,10 +2,12 @@ from .entity_repository import EntityRepository
 from .observation_repository import ObservationRepository
 from .project_repository import ProjectRepository
 from .relation_repository import RelationRepository
+from .sync_journal_repository import SyncJournalRepository
 
 __all__ = [
     "EntityRepository",
     "ObservationRepository",
     "ProjectRepository",
     "RelationRepository",
+    "SyncJournalRepository",
 ]
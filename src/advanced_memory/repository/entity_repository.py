@@ -1,19 +1,128 @@
 """Repository for managing entities in the knowledge graph."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
 from pathlib import Path
-from typing import List, Optional, Sequence, Union
-
-from sqlalchemy import select
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
+
+from sqlalchemy import Row, Table, bindparam, event, func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import ORMExecuteState, Session, selectinload
 from sqlalchemy.orm.interfaces import LoaderOption
 
-from basic_memory import db
+from advanced_memory import db
+from advanced_memory.file_utils import FileStat
 from advanced_memory.models.knowledge import Entity, Observation, Relation
 from advanced_memory.repository.repository import Repository
 
 
+# Columns needed to decide whether a file changed on disk
+FILE_STATE_COLUMNS = (Entity.file_path, Entity.checksum, Entity.size, Entity.mtime_ns, Entity.inode)
+
+# Keep IN (...) lists well below SQLite's bound parameter limit
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+class EntityGenerations:
+    """Write generation of each project's entities in this process.
+
+    Every ORM write to a project's entities starts a new generation, at flush
+    and again at commit, so anything built from an older generation (like a
+    kept LinkIndex) is known to be stale. Writes made inside follow() are
+    attributed to the caller, to tell its own writes from everybody else's.
+    """
+
+    def __init__(self):
+        self._counter = count(1)
+        self._epoch = 0
+        self._generations: Dict[int, int] = {}
+        # generation reached by the follower of each project in this context
+        self._followed: ContextVar[Optional[Dict[int, int]]] = ContextVar(
+            "followed_entity_generations", default=None
+        )
+
+    def get(self, project_id: int) -> int:
+        return max(self._epoch, self._generations.get(project_id, 0))
+
+    def bump(self, project_id: int) -> None:
+        previous = self.get(project_id)
+        self._generations[project_id] = next(self._counter)
+        self._advance_followed({project_id: previous})
+
+    def bump_all(self) -> None:
+        """Start a new generation for every project, e.g. after a bulk statement."""
+        followed = self._followed.get() or {}
+        previous = {project_id: self.get(project_id) for project_id in followed}
+        self._epoch = next(self._counter)
+        self._advance_followed(previous)
+
+    def _advance_followed(self, previous: Dict[int, int]) -> None:
+        followed = self._followed.get()
+        if followed is None:
+            return
+        for project_id, generation in previous.items():
+            # a follower that missed a write elsewhere stays behind for good
+            if followed.get(project_id) == generation:
+                followed[project_id] = self.get(project_id)
+
+    @contextmanager
+    def follow(self, project_id: int) -> Iterator[Dict[int, int]]:
+        """Attribute the writes made in this context to the caller.
+
+        Yields a dict whose project_id entry starts at the current generation
+        and keeps up with it only while every write to the project's entities
+        is made from this context.
+        """
+        followed = {project_id: self.get(project_id)}
+        token = self._followed.set(followed)
+        try:
+            yield followed
+        finally:
+            self._followed.reset(token)
+
+
+# Generations of the entities written by this process
+entity_generations = EntityGenerations()
+
+
+def _bump_on_commit(session: Session, bump: Any) -> None:
+    """Bump now and again once the write is committed, see IndexGenerations.bump_on_write."""
+    bump()
+    event.listen(session, "after_commit", lambda _: bump(), once=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_entity_writes(session: Session, flush_context: Any) -> None:
+    project_ids = {
+        obj.project_id
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, Entity)
+    }
+    for project_id in project_ids:
+        _bump_on_commit(session, lambda project_id=project_id: entity_generations.bump(project_id))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_entity_writes(state: ORMExecuteState) -> None:
+    # insert/update/delete statements don't say which projects they touch
+    mapper = state.bind_mapper
+    if not state.is_select and mapper is not None and mapper.class_ is Entity:
+        _bump_on_commit(state.session, entity_generations.bump_all)
+
+
 class EntityRepository(Repository[Entity]):
     """Repository for Entity model.
 
@@ -62,6 +171,36 @@ class EntityRepository(Repository[Entity]):
         )
         return await self.find_one(query)
 
+    async def get_by_title_ignore_case(self, title: str) -> Sequence[Entity]:
+        """Get entities whose title matches ignoring case, lowest id first.
+
+        Args:
+            title: Title of the entity to find
+        """
+        query = (
+            self.select()
+            .where(func.lower(Entity.title) == title.lower())
+            .order_by(Entity.id)
+            .options(*self.get_load_options())
+        )
+        result = await self.execute_query(query)
+        return list(result.scalars().all())
+
+    async def get_by_file_path_ignore_case(self, file_path: Union[Path, str]) -> Optional[Entity]:
+        """Get the entity whose file_path matches ignoring case, lowest id first.
+
+        Args:
+            file_path: Path to the entity file (will be converted to string internally)
+        """
+        query = (
+            self.select()
+            .where(func.lower(Entity.file_path) == str(file_path).lower())
+            .order_by(Entity.id)
+            .limit(1)
+            .options(*self.get_load_options())
+        )
+        return await self.find_one(query)
+
     async def delete_by_file_path(self, file_path: Union[Path, str]) -> bool:
         """Delete entity with the provided file_path.
 
@@ -70,6 +209,107 @@ class EntityRepository(Repository[Entity]):
         """
         return await self.delete_by_fields(file_path=str(file_path))
 
+    async def stream_rows(self, *columns: Any, chunk_size: int = 1000) -> AsyncIterator[Row]:
+        """Stream selected entity columns as plain rows.
+
+        No ORM objects are built and no relationships are loaded, so memory stays
+        flat even for very large projects.
+
+        Args:
+            columns: Entity columns to select
+            chunk_size: Rows fetched from the database at a time
+        """
+        query = self._add_project_filter(select(*columns)).execution_options(
+            yield_per=chunk_size
+        )
+        async with db.scoped_session(self.session_maker) as session:
+            result = await session.stream(query)
+            async for partition in result.partitions():
+                for row in partition:
+                    yield row
+
+    async def stream_chunks(self, chunk_size: int = 100) -> AsyncIterator[List[Entity]]:
+        """Stream entities in id order, chunk_size at a time, loaded for search indexing.
+
+        Each chunk is a separate query starting after the last id seen, so no
+        read stays open while the caller works on a chunk and only one chunk
+        is in memory at a time. Observations and outgoing relations are loaded.
+        """
+        after_id = 0
+        while True:
+            query = (
+                self.select()
+                .where(Entity.id > after_id)
+                .order_by(Entity.id)
+                .limit(chunk_size)
+                .options(
+                    selectinload(Entity.observations).selectinload(Observation.entity),
+                    selectinload(Entity.outgoing_relations).selectinload(Relation.from_entity),
+                    selectinload(Entity.outgoing_relations).selectinload(Relation.to_entity),
+                )
+            )
+            result = await self.execute_query(query, use_query_options=False)
+            entities = list(result.scalars().all())
+            if not entities:
+                return
+            yield entities
+            after_id = entities[-1].id
+
+    async def stream_file_states(self) -> AsyncIterator[Row]:
+        """Stream (file_path, checksum, size, mtime_ns, inode) rows for every entity."""
+        async for row in self.stream_rows(*FILE_STATE_COLUMNS):
+            yield row
+
+    async def get_file_states(self, file_paths: Iterable[str]) -> Dict[str, Row]:
+        """Get (file_path, checksum, size, mtime_ns, inode) rows for the given paths.
+
+        Args:
+            file_paths: Paths to look up, paths without an entity are left out
+
+        Returns:
+            Dict mapping file_path to its row
+        """
+        file_paths = list(file_paths)
+        states: Dict[str, Row] = {}
+        for i in range(0, len(file_paths), IN_CLAUSE_CHUNK_SIZE):
+            query = self._add_project_filter(select(*FILE_STATE_COLUMNS)).where(
+                Entity.file_path.in_(file_paths[i : i + IN_CLAUSE_CHUNK_SIZE])
+            )
+            result = await self.execute_query(query, use_query_options=False)
+            states.update((row.file_path, row) for row in result.all())
+        return states
+
+    async def update_file_stats(self, stats: Dict[str, FileStat]) -> None:
+        """Record stat fingerprints for files whose content has not changed.
+
+        Uses a single executemany UPDATE so refreshing thousands of files is one transaction.
+
+        Args:
+            stats: Mapping of file_path to the FileStat observed on disk
+        """
+        if not stats:
+            return
+
+        table = cast(Table, Entity.__table__)
+        query = (
+            update(table)
+            .where(
+                table.c.file_path == bindparam("b_file_path"),
+                table.c.project_id == self.project_id,
+            )
+            .values(
+                size=bindparam("b_size"),
+                mtime_ns=bindparam("b_mtime_ns"),
+                inode=bindparam("b_inode"),
+            )
+        )
+        params = [
+            {"b_file_path": file_path, **{f"b_{k}": v for k, v in stat.to_columns().items()}}
+            for file_path, stat in stats.items()
+        ]
+        async with db.scoped_session(self.session_maker) as session:
+            await session.execute(query, params)
+
     def get_load_options(self) -> List[LoaderOption]:
         """Get SQLAlchemy loader options for eager loading relationships."""
         return [
@@ -156,9 +396,11 @@ class EntityRepository(Repository[Entity]):
 
             # No existing entity with same file_path, try insert
             try:
-                # Simple insert for new entity
-                session.add(entity)
-                await session.flush()
+                # Simple insert for new entity, in a savepoint so a conflict only
+                # undoes this insert and not the rest of the transaction
+                async with session.begin_nested():
+                    session.add(entity)
+                    await session.flush()
 
                 # Return with relationships loaded
                 query = (
@@ -176,7 +418,6 @@ class EntityRepository(Repository[Entity]):
 
             except IntegrityError:
                 # Could be either file_path or permalink conflict
-                await session.rollback()
 
                 # Check if it's a file_path conflict (race condition)
                 existing_by_path_check = await session.execute(
@@ -6,7 +6,7 @@ from typing import Optional, Sequence, Union
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.models.project import Project
 from advanced_memory.repository.repository import Repository
 
@@ -1,14 +1,14 @@
 """Repository for managing Relation objects."""
 
-from sqlalchemy import and_, delete
-from typing import Sequence, List, Optional
+from sqlalchemy import Row, Table, and_, bindparam, delete, update
+from typing import Any, Dict, Sequence, List, Optional, cast
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import selectinload, aliased
 from sqlalchemy.orm.interfaces import LoaderOption
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.models import Relation, Entity
 from advanced_memory.repository.repository import Repository
 
@@ -73,5 +73,38 @@ class RelationRepository(Repository[Relation]):
         result = await self.execute_query(query)
         return result.scalars().all()
 
+    async def find_unresolved_relation_rows(self) -> Sequence[Row]:
+        """Find (id, from_id, to_name) of unresolved relations, without loading models."""
+        query = select(Relation.id, Relation.from_id, Relation.to_name).filter(
+            Relation.to_id.is_(None)
+        )
+        result = await self.execute_query(query, use_query_options=False)
+        return result.all()
+
+    async def update_targets(self, targets: List[Dict[str, Any]]) -> None:
+        """Point relations at resolved targets with a single executemany UPDATE.
+
+        Updates that would duplicate an existing relation are skipped (UPDATE OR
+        IGNORE), leaving that relation unresolved.
+
+        Args:
+            targets: Dicts with the relation id, to_id and to_name
+        """
+        if not targets:
+            return
+
+        table = cast(Table, Relation.__table__)
+        query = (
+            update(table)
+            .prefix_with("OR IGNORE")
+            .where(table.c.id == bindparam("b_id"))
+            .values(to_id=bindparam("b_to_id"), to_name=bindparam("b_to_name"))
+        )
+        params = [
+            {"b_id": t["id"], "b_to_id": t["to_id"], "b_to_name": t["to_name"]} for t in targets
+        ]
+        async with db.scoped_session(self.session_maker) as session:
+            await session.execute(query, params)
+
     def get_load_options(self) -> List[LoaderOption]:
         return [selectinload(Relation.from_entity), selectinload(Relation.to_entity)]
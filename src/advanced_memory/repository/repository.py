@@ -1,6 +1,6 @@
 """Base repository implementation."""
 
-from typing import Type, Optional, Any, Sequence, TypeVar, List, Dict
+from typing import Type, Optional, Any, Sequence, TypeVar, List, Dict, cast
 
 from loguru import logger
 from sqlalchemy import (
@@ -11,14 +11,16 @@ from sqlalchemy import (
     inspect,
     Result,
     Column,
+    CursorResult,
     and_,
     delete,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 from sqlalchemy.orm.interfaces import LoaderOption
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.models import Base
 
 T = TypeVar("T", bound=Base)
@@ -121,6 +123,28 @@ class Repository[T: Base]:
                 )
             return found
 
+    async def insert_many(self, rows: List[Dict[str, Any]], ignore_conflicts: bool = False) -> None:
+        """
+        Insert plain rows with a single executemany statement.
+
+        Unlike add_all, no models are built or loaded back, which makes this the
+        cheap path for bulk writes whose results are not needed.
+        :param rows: column values for each row
+        :param ignore_conflicts: skip rows that violate a unique constraint
+        """
+        if not rows:
+            return
+
+        if self.has_project_id and self.project_id is not None:
+            rows = [{"project_id": self.project_id, **row} for row in rows]
+
+        query = sqlite_insert(self.Model)
+        if ignore_conflicts:
+            query = query.on_conflict_do_nothing()
+
+        async with db.scoped_session(self.session_maker) as session:
+            await session.execute(query, rows)
+
     async def add_all(self, models: List[T]) -> Sequence[T]:
         """
         Add a list of models to the repository. This will also add related objects
@@ -310,7 +334,8 @@ class Repository[T: Base]:
                 conditions.append(getattr(self.Model, "project_id") == self.project_id)
 
             query = delete(self.Model).where(and_(*conditions))
-            result = await session.execute(query)
+            # a DELETE returns a cursor result, which has the rowcount
+            result = cast(CursorResult, await session.execute(query))
             logger.debug(f"Deleted {result.rowcount} records")
             return result.rowcount
 
@@ -325,7 +350,7 @@ class Repository[T: Base]:
                 conditions.append(getattr(self.Model, "project_id") == self.project_id)
 
             query = delete(self.Model).where(and_(*conditions))
-            result = await session.execute(query)
+            result = cast(CursorResult, await session.execute(query))
             deleted = result.rowcount > 0
             logger.debug(f"Deleted {result.rowcount} records")
             return deleted
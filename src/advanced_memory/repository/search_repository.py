@@ -1,21 +1,233 @@
 """Repository for search operations."""
 
+import base64
 import json
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import count, islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from loguru import logger
-from sqlalchemy import Executable, Result, text
+from sqlalchemy import Executable, Result, event, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from basic_memory import db
-from advanced_memory.models.search import CREATE_SEARCH_INDEX
+from advanced_memory import db
+from advanced_memory.models.search import (
+    CREATE_SEARCH_FILTER_TABLES,
+    CREATE_SEARCH_FUZZY_INDEX,
+    CREATE_SEARCH_FUZZY_INDEX_WITHOUT_TRIGRAMS,
+    CREATE_SEARCH_INDEX,
+    CREATE_SEARCH_INDEX_WRITE_TABLE,
+    SEARCH_FILTER_INDEXES,
+    SEARCH_FILTER_TABLE,
+    SEARCH_FILTER_TAG_TABLE,
+    SEARCH_FUZZY_TABLE,
+    SEARCH_FUZZY_TABLE_WITHOUT_TRIGRAMS,
+    SEARCH_INDEX_TABLE,
+)
 from advanced_memory.schemas.search import SearchItemType
 from advanced_memory.utils import sanitize_filename
 
+# The live index tables, and the shadow tables reindex_all builds a new index in
+LIVE_TABLES = {
+    "index_table": "search_index",
+    "fuzzy_table": "search_fuzzy",
+    "filter_table": "search_filter",
+    "tag_table": "search_filter_tag",
+}
+SHADOW_TABLES = {
+    "index_table": "search_index_shadow",
+    "fuzzy_table": "search_fuzzy_shadow",
+    "filter_table": "search_filter_shadow",
+    "tag_table": "search_filter_tag_shadow",
+}
+
+# Copies search_index rows matching a condition into the fuzzy index, under the same rowid
+INSERT_FUZZY_ROWS = """
+    INSERT INTO {fuzzy_table} (rowid, title, path)
+    SELECT
+        rowid,
+        title,
+        CASE WHEN type = 'entity' THEN coalesce(permalink, '') || ' ' || file_path END
+    FROM {index_table}
+    WHERE {condition}
+"""
+
+# Removes the fuzzy index rows of the search_index rows matching a condition
+DELETE_FUZZY_ROWS = """
+    DELETE FROM {fuzzy_table} WHERE rowid IN (SELECT rowid FROM {index_table} WHERE {condition})
+"""
+
+# Copies the filter columns of search_index rows matching a condition into the filter table
+INSERT_FILTER_ROWS = """
+    INSERT INTO {filter_table} (
+        rowid, project_id, type, entity_type, category, created_at, updated_at
+    )
+    SELECT
+        rowid,
+        project_id,
+        type,
+        json_extract(metadata, '$.entity_type'),
+        category,
+        datetime(created_at),
+        datetime(updated_at)
+    FROM {index_table}
+    WHERE {condition}
+"""
+
+DELETE_FILTER_ROWS = """
+    DELETE FROM {filter_table} WHERE rowid IN (SELECT rowid FROM {index_table} WHERE {condition})
+"""
+
+# Copies the metadata tags of search_index rows matching a condition into the tag table
+INSERT_TAG_ROWS = """
+    INSERT INTO {tag_table} (rowid, project_id, tag)
+    SELECT DISTINCT row_key, project_id, tags.atom
+    FROM (
+        SELECT rowid AS row_key, project_id, metadata FROM {index_table} WHERE {condition}
+    ) AS rows, json_each(rows.metadata, '$.tags') AS tags
+    WHERE tags.atom IS NOT NULL
+"""
+
+DELETE_TAG_ROWS = """
+    DELETE FROM {tag_table} WHERE rowid IN (SELECT rowid FROM {index_table} WHERE {condition})
+"""
+
+# Statements keeping the tables keyed by search_index rowid in step with it.
+# Deletes run before the search_index rows go, inserts after the rows are added.
+INSERT_COMPANION_ROWS = [INSERT_FUZZY_ROWS, INSERT_FILTER_ROWS, INSERT_TAG_ROWS]
+DELETE_COMPANION_ROWS = [DELETE_FUZZY_ROWS, DELETE_FILTER_ROWS, DELETE_TAG_ROWS]
+
+INDEX_COLUMNS = """
+    id, title, content_stems, content_snippet, permalink, file_path, type, metadata,
+    from_id, to_id, relation_type,
+    entity_id, category,
+    created_at, updated_at,
+    project_id
+"""
+
+INSERT_ROWS = """
+    INSERT INTO {index_table} (
+        id, title, content_stems, content_snippet, permalink, file_path, type, metadata,
+        from_id, to_id, relation_type,
+        entity_id, category,
+        created_at, updated_at,
+        project_id
+    ) VALUES (
+        :id, :title, :content_stems, :content_snippet, :permalink, :file_path, :type, :metadata,
+        :from_id, :to_id, :relation_type,
+        :entity_id, :category,
+        :created_at, :updated_at,
+        :project_id
+    )
+"""
+
+# Logs a write to the live index, only while a reindex builds the shadow index
+LOG_INDEX_WRITE = f"""
+    INSERT INTO search_index_write (project_id, entity_id, permalink)
+    SELECT :project_id, :entity_id, :permalink
+    WHERE EXISTS (
+        SELECT 1 FROM sqlite_master
+        WHERE type = 'table' AND name = '{SHADOW_TABLES["index_table"]}'
+    )
+"""
+
+# Rows of other projects are copied into the shadow index this many rowids at a
+# time, each range in its own short transaction
+SHADOW_COPY_RANGE = 5000
+
+# Fuzzy terms shorter than a trigram can't match anything
+MIN_FUZZY_TERM_LENGTH = 3
+
+# Columns of search_index returned by searches, content_snippet is cut to a snippet
+SEARCH_COLUMNS = """
+    project_id,
+    id,
+    title,
+    permalink,
+    file_path,
+    type,
+    metadata,
+    from_id,
+    to_id,
+    relation_type,
+    entity_id,
+    category,
+    created_at,
+    updated_at
+"""
+
+# Tokens in a result's snippet by default, FTS5 allows at most 64
+SNIPPET_TOKENS = 32
+
+# Snippet of a row matched by a full-text condition: the passage of the
+# note's text in content_snippet (column 3) with the most matches, matched
+# terms between the highlight markers. Its start if only other columns match.
+MATCHED_SNIPPET = (
+    "snippet(search_index, 3, :highlight_start, :highlight_end, '...', :snippet_tokens)"
+)
+
+# Snippet of other rows, the start of the text. snippet() needs a MATCH, so
+# enough characters are read here and cut to snippet_tokens in leading_snippet.
+LEADING_SNIPPET = "substr(content_snippet, 1, :snippet_tokens * 64)"
+
+# A token of the unicode61 tokenizer with / as a token character
+SNIPPET_TOKEN = re.compile(r"[\w/]+")
+
+# Relations have no content of their own, only their title is indexed
+SNIPPET_COLUMN = "CASE WHEN type = 'relation' THEN NULL ELSE {snippet} END AS content_snippet"
+
+
+def leading_snippet(text: Optional[str], tokens: int) -> Optional[str]:
+    """The start of text up to its tokens-th token, as snippet() cuts it without matches."""
+    if not text:
+        return text
+    ends = [match.end() for match in islice(SNIPPET_TOKEN.finditer(text), tokens + 1)]
+    if len(ends) <= tokens:
+        return text
+    return text[: ends[tokens - 1]] + "..."
+
+
+class IndexGenerations:
+    """Write generation of each project's search index in this process.
+
+    Every write to a project's index starts a new generation, so results
+    computed in an older generation are known to be stale (see SearchCache).
+    """
+
+    def __init__(self):
+        self._counter = count(1)
+        self._epoch = 0
+        self._generations: Dict[int, int] = {}
+
+    def get(self, project_id: int) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(project_id, 0)
+
+    def bump(self, project_id: int) -> None:
+        self._generations[project_id] = next(self._counter)
+
+    def bump_all(self) -> None:
+        """Start a new generation for every project, e.g. when the index is dropped."""
+        self._epoch = next(self._counter)
+
+    def bump_on_write(self, session: AsyncSession, project_id: int) -> None:
+        """Bump a project's generation for a write made in session, now and at commit.
+
+        A search running before the commit reads the old rows. Bumping again
+        once they are committed keeps its results from outliving the write.
+        """
+        self.bump(project_id)
+        event.listen(
+            session.sync_session, "after_commit", lambda _: self.bump(project_id), once=True
+        )
+
+
+# Generations of the search indexes written by this process
+index_generations = IndexGenerations()
+
 
 @dataclass
 class SearchIndexRow:
@@ -39,13 +251,16 @@ class SearchIndexRow:
     # Type-specific fields
     title: Optional[str] = None  # entity
     content_stems: Optional[str] = None  # entity, observation
-    content_snippet: Optional[str] = None  # entity, observation
+    content_snippet: Optional[str] = None  # entity, observation, a snippet in results
     entity_id: Optional[int] = None  # observations
     category: Optional[str] = None  # observations
     from_id: Optional[int] = None  # relations
     to_id: Optional[int] = None  # relations
     relation_type: Optional[str] = None  # relations
 
+    # rowid in search_index, assigned in result to page by cursor
+    row_key: Optional[int] = None
+
     @property
     def content(self):
         return self.content_snippet
@@ -92,6 +307,83 @@ class SearchIndexRow:
         }
 
 
+@dataclass(frozen=True)
+class SearchCursor:
+    """Position after a search result, to continue a search from it.
+
+    Results are ordered by score, by updated_at (most recent first) when the
+    search filters by date, then by rowid: the cursor holds these keys of
+    the last result of a page. Encoded, it's an opaque url-safe string.
+    """
+
+    score: float
+    row_key: int
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def after(cls, row: SearchIndexRow) -> "SearchCursor":
+        """Cursor continuing after a result row."""
+        if row.row_key is None or row.score is None:
+            raise ValueError("Search row has no position to continue from")
+        # as stored in search_index, rows read back from it already hold the string
+        updated_at = str(row.updated_at) if row.updated_at is not None else None
+        return cls(score=row.score, row_key=row.row_key, updated_at=updated_at)
+
+    def encode(self) -> str:
+        payload = json.dumps([self.score, self.row_key, self.updated_at])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "SearchCursor":
+        """Cursor from its encoded form.
+
+        Raises:
+            ValueError: If value is not a cursor
+        """
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            score, row_key, updated_at = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(score=float(score), row_key=int(row_key), updated_at=updated_at)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid search cursor: {value}") from e
+
+    def condition(self, by_date: bool) -> str:
+        """Condition on the score and row_key of results after the cursor."""
+        if by_date:
+            return (
+                "(score > :cursor_score OR (score = :cursor_score AND ("
+                "updated_at < :cursor_updated_at OR "
+                "(updated_at = :cursor_updated_at AND row_key > :cursor_row_key))))"
+            )
+        return "(score, row_key) > (:cursor_score, :cursor_row_key)"
+
+    def params(self) -> Dict[str, Any]:
+        return {
+            "cursor_score": self.score,
+            "cursor_row_key": self.row_key,
+            "cursor_updated_at": self.updated_at,
+        }
+
+
+@dataclass
+class SearchCounts:
+    """Number of results of a search, in total and per type."""
+
+    total: int = 0
+    # entity, observation, relation
+    item_types: Dict[str, int] = field(default_factory=dict)
+    # entity_type of entity results: note, person, ...
+    entity_types: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, rows: Iterable[Any]) -> None:
+        """Add (type, entity_type, hits) rows."""
+        for item_type, entity_type, hits in rows:
+            self.total += hits
+            self.item_types[item_type] = self.item_types.get(item_type, 0) + hits
+            if entity_type is not None:
+                self.entity_types[entity_type] = self.entity_types.get(entity_type, 0) + hits
+
+
 class SearchRepository:
     """Repository for search index operations."""
 
@@ -117,11 +409,46 @@ class SearchRepository:
         try:
             async with db.scoped_session(self.session_maker) as session:
                 await session.execute(CREATE_SEARCH_INDEX)
-                await session.commit()
+                index_generations.bump_on_write(session, self.project_id)
         except Exception as e:  # pragma: no cover
             logger.error(f"Error initializing search index: {e}")
             raise e
 
+        try:
+            async with db.scoped_session(self.session_maker) as session:
+                await session.execute(CREATE_SEARCH_FUZZY_INDEX)
+        except OperationalError as e:  # pragma: no cover
+            logger.warning(f"Trigram tokenizer unavailable, fuzzy search matches words: {e}")
+            async with db.scoped_session(self.session_maker) as session:
+                await session.execute(CREATE_SEARCH_FUZZY_INDEX_WITHOUT_TRIGRAMS)
+
+        async with db.scoped_session(self.session_maker) as session:
+            for statement in CREATE_SEARCH_FILTER_TABLES:
+                await session.execute(statement)
+            await session.execute(CREATE_SEARCH_INDEX_WRITE_TABLE)
+
+    async def _insert_companion_rows(
+        self,
+        session: AsyncSession,
+        condition: str,
+        params: Any,
+        tables: Dict[str, str] = LIVE_TABLES,
+    ) -> None:
+        # index the search_index rows matching condition in the fuzzy and filter tables
+        for statement in INSERT_COMPANION_ROWS:
+            await session.execute(text(statement.format(condition=condition, **tables)), params)
+
+    async def _delete_companion_rows(
+        self,
+        session: AsyncSession,
+        condition: str,
+        params: Any,
+        tables: Dict[str, str] = LIVE_TABLES,
+    ) -> None:
+        # remove the search_index rows matching condition from the fuzzy and filter tables
+        for statement in DELETE_COMPANION_ROWS:
+            await session.execute(text(statement.format(condition=condition, **tables)), params)
+
     def _prepare_boolean_query(self, query: str) -> str:
         """Prepare a Boolean query by quoting individual terms while preserving operators.
 
@@ -358,7 +685,26 @@ class SearchRepository:
         # For non-Boolean queries, use the single term preparation logic
         return self._prepare_single_term(term, is_prefix)
 
-    async def search(
+    def _prepare_fuzzy_term(self, term: str) -> Optional[str]:
+        """Prepare search text for the fuzzy (trigram) index.
+
+        Each word must match as a substring of the title or path, in any
+        order. Boolean queries are not matched fuzzily.
+
+        Returns:
+            The FTS5 query, or None if the text has no word long enough to match
+        """
+        boolean_operators = [" AND ", " OR ", " NOT "]
+        if any(op in f" {term} " for op in boolean_operators):
+            return None
+
+        words = {word.strip('"*()') for word in term.split()}
+        words = sorted(word for word in words if len(word) >= MIN_FUZZY_TERM_LENGTH)
+        if not words:
+            return None
+        return " AND ".join('"{}"'.format(word.replace('"', '""')) for word in words)
+
+    def _filter_conditions(
         self,
         search_text: Optional[str] = None,
         permalink: Optional[str] = None,
@@ -367,13 +713,18 @@ class SearchRepository:
         types: Optional[List[str]] = None,
         after_date: Optional[datetime] = None,
         search_item_types: Optional[List[SearchItemType]] = None,
-        limit: int = 10,
-        offset: int = 0,
-    ) -> List[SearchIndexRow]:
-        """Search across all indexed content with fuzzy matching."""
+        tags: Optional[List[str]] = None,
+    ) -> Tuple[List[str], Dict[str, Any], Optional[str], Optional[str]]:
+        """Conditions on search_index rows selected by a search.
+
+        Returns:
+            The conditions and their params, the text condition among them
+            and the fuzzy term for the text, if the search has text
+        """
         conditions = []
-        params = {}
-        order_by_clause = ""
+        params: Dict[str, Any] = {}
+        text_condition = None
+        fuzzy_text = None
 
         # Handle text search for title and content
         if search_text:
@@ -384,8 +735,12 @@ class SearchRepository:
             else:
                 # Use _prepare_search_term to handle both Boolean and non-Boolean queries
                 processed_text = self._prepare_search_term(search_text.strip())
-                params["text"] = processed_text
-                conditions.append("(title MATCH :text OR content_stems MATCH :text)")
+                # a single MATCH over all text columns, so snippet() sees the
+                # content matches of rows whose title or path matches as well
+                params["text"] = f"{{title content_stems content_snippet}} : ({processed_text})"
+                text_condition = "search_index MATCH :text"
+                conditions.append(text_condition)
+                fuzzy_text = self._prepare_fuzzy_term(search_text.strip())
 
         # Handle title match search
         if title:
@@ -428,51 +783,125 @@ class SearchRepository:
             type_list = ", ".join(f"'{t.value}'" for t in search_item_types)
             conditions.append(f"type IN ({type_list})")
 
-        # Handle type filter
+        # Handle type and date filters through the indexed filter table, its dates
+        # are normalized with datetime() for proper comparison
+        structured_filters = []
         if types:
-            type_list = ", ".join(f"'{t}'" for t in types)
-            conditions.append(f"json_extract(metadata, '$.entity_type') IN ({type_list})")
-
-        # Handle date filter using datetime() for proper comparison
+            for i, entity_type in enumerate(types):
+                params[f"entity_type_{i}"] = entity_type
+            type_list = ", ".join(f":entity_type_{i}" for i in range(len(types)))
+            structured_filters.append(f"entity_type IN ({type_list})")
         if after_date:
             params["after_date"] = after_date
-            conditions.append("datetime(created_at) > datetime(:after_date)")
+            structured_filters.append("created_at > datetime(:after_date)")
+        rowid_filters = []
+        if structured_filters:
+            rowid_filters.append(
+                "rowid IN (SELECT rowid FROM search_filter "
+                f"WHERE project_id = :project_id AND {' AND '.join(structured_filters)})"
+            )
+
+        # Handle tag filter, rows with any of the tags
+        if tags:
+            for i, tag in enumerate(tags):
+                params[f"tag_{i}"] = tag
+            tag_list = ", ".join(f":tag_{i}" for i in range(len(tags)))
+            rowid_filters.append(
+                "rowid IN (SELECT rowid FROM search_filter_tag "
+                f"WHERE project_id = :project_id AND tag IN ({tag_list}))"
+            )
 
-            # order by most recent first
-            order_by_clause = ", updated_at DESC"
+        # Without full-text conditions the filtered rows are looked up by rowid. With
+        # them FTS5 must drive the query, + keeps the planner from using rowids then.
+        rowid_prefix = "+" if any("MATCH" in condition for condition in conditions) else ""
+        conditions.extend(f"{rowid_prefix}search_index.{condition}" for condition in rowid_filters)
 
         # Always filter by project_id
         params["project_id"] = self.project_id
         conditions.append("project_id = :project_id")
 
+        return conditions, params, text_condition, fuzzy_text
+
+    @staticmethod
+    def _fuzzy_filters(conditions: List[str], text_condition: Optional[str]) -> Optional[List[str]]:
+        """Conditions a fuzzy search is filtered by, None if it can't be.
+
+        The fuzzy index can't be joined with MATCH filters on search_index columns.
+        """
+        filter_conditions = [c for c in conditions if c != text_condition]
+        if any("MATCH" in condition for condition in filter_conditions):
+            return None
+        return filter_conditions
+
+    async def search(
+        self,
+        search_text: Optional[str] = None,
+        permalink: Optional[str] = None,
+        permalink_match: Optional[str] = None,
+        title: Optional[str] = None,
+        types: Optional[List[str]] = None,
+        after_date: Optional[datetime] = None,
+        search_item_types: Optional[List[SearchItemType]] = None,
+        tags: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[SearchCursor] = None,
+        snippet_tokens: int = SNIPPET_TOKENS,
+        highlight: bool = False,
+    ) -> List[SearchIndexRow]:
+        """Search across all indexed content with fuzzy matching.
+
+        Text is matched against words and word prefixes first. When that
+        finds fewer than limit results, the page is filled up with substring
+        matches of titles and paths from the trigram index.
+
+        The content_snippet of each result is cut from the note's text by
+        FTS5: the snippet_tokens tokens around the best match, matched terms
+        in ** if highlight is set. Results of searches without a full-text
+        condition, and fuzzy matches, get its first snippet_tokens tokens.
+
+        Results are ordered by score, then by rowid. A cursor built from the
+        last row of a page (see SearchCursor.after) continues after it; offset
+        is ignored then, so deep pages cost no more than the first one.
+        """
+        conditions, params, text_condition, fuzzy_text = self._filter_conditions(
+            search_text,
+            permalink,
+            permalink_match,
+            title,
+            types,
+            after_date,
+            search_item_types,
+            tags,
+        )
+        # order by most recent first among equal scores when filtering by date
+        order_by_clause = ", updated_at DESC" if after_date else ""
+
         # set limit on search query
         params["limit"] = limit
-        params["offset"] = offset
+        params["offset"] = 0 if cursor else offset
+
+        params["snippet_tokens"] = snippet_tokens
+        params["highlight_start"], params["highlight_end"] = ("**", "**") if highlight else ("", "")
+        matched = any("MATCH" in condition for condition in conditions)
+        snippet = MATCHED_SNIPPET if matched else LEADING_SNIPPET
 
         # Build WHERE clause
         where_clause = " AND ".join(conditions) if conditions else "1=1"
+        keyset_clause = ""
+        if cursor:
+            keyset_clause = f"AND {cursor.condition(bool(after_date))}"
+            params.update(cursor.params())
 
         sql = f"""
             SELECT 
-                project_id,
-                id, 
-                title, 
-                permalink,
-                file_path,
-                type,
-                metadata,
-                from_id,
-                to_id,
-                relation_type,
-                entity_id,
-                content_snippet,
-                category,
-                created_at,
-                updated_at,
+                {SEARCH_COLUMNS},
+                {SNIPPET_COLUMN.format(snippet=snippet)},
+                search_index.rowid as row_key,
                 bm25(search_index) as score
             FROM search_index 
-            WHERE {where_clause}
-            ORDER BY score ASC {order_by_clause}
+            WHERE {where_clause} {keyset_clause}
+            ORDER BY score ASC {order_by_clause}, row_key ASC
             LIMIT :limit
             OFFSET :offset
         """
@@ -481,7 +910,7 @@ class SearchRepository:
         try:
             async with db.scoped_session(self.session_maker) as session:
                 result = await session.execute(text(sql), params)
-                rows = result.fetchall()
+                rows = list(result.fetchall())
         except Exception as e:
             # Handle FTS5 syntax errors and provide user-friendly feedback
             if "fts5: syntax error" in str(e).lower():  # pragma: no cover
@@ -493,6 +922,20 @@ class SearchRepository:
                 logger.error(f"Database error during search: {e}")
                 raise
 
+        # snippet() cut the snippets of the rows found so far, the rest are cut here
+        cut_by_fts = len(rows) if matched else 0
+        filter_conditions = self._fuzzy_filters(conditions, text_condition)
+        if fuzzy_text and len(rows) < limit and filter_conditions is not None:
+            rows += await self._search_fuzzy(
+                fuzzy_text,
+                where_clause,
+                filter_conditions,
+                order_by_clause,
+                params,
+                exact_found=len(rows),
+                keyset_clause=keyset_clause,
+            )
+
         results = [
             SearchIndexRow(
                 project_id=self.project_id,
@@ -507,12 +950,17 @@ class SearchRepository:
                 to_id=row.to_id,
                 relation_type=row.relation_type,
                 entity_id=row.entity_id,
-                content_snippet=row.content_snippet,
+                content_snippet=(
+                    row.content_snippet
+                    if i < cut_by_fts
+                    else leading_snippet(row.content_snippet, snippet_tokens)
+                ),
                 category=row.category,
                 created_at=row.created_at,
                 updated_at=row.updated_at,
+                row_key=row.row_key,
             )
-            for row in rows
+            for i, row in enumerate(rows)
         ]
 
         logger.trace(f"Found {len(results)} search results")
@@ -523,65 +971,432 @@ class SearchRepository:
 
         return results
 
+    async def _search_fuzzy(
+        self,
+        fuzzy_text: str,
+        exact_where: str,
+        filter_conditions: List[str],
+        order_by_clause: str,
+        params: Dict[str, Any],
+        exact_found: int,
+        keyset_clause: str = "",
+    ) -> List[Any]:
+        """Fill up a page of text search results from the fuzzy index.
+
+        Fuzzy matches rank after all exact matches, so they continue the
+        results where the exact matches end. Rows that match exactly are left
+        out. Their score is positive, worse than any exact match's bm25 score.
+
+        Args:
+            exact_where: Conditions of the exact search
+            filter_conditions: The same without the text condition
+            exact_found: Exact matches found on this page
+            keyset_clause: Condition on score and row_key of a cursor, if paging by cursor
+        """
+        params = dict(params, fuzzy_text=fuzzy_text, fuzzy_limit=params["limit"] - exact_found)
+        where_clause = " AND ".join(
+            [
+                *filter_conditions,
+                f"search_index.rowid NOT IN (SELECT rowid FROM search_index WHERE {exact_where})",
+            ]
+        )
+        try:
+            async with db.scoped_session(self.session_maker) as session:
+                if exact_found or not params["offset"]:
+                    # the exact matches end on this page, or the cursor skips what was shown
+                    params["fuzzy_offset"] = 0
+                else:
+                    # past the exact matches, skip the fuzzy ones shown on the pages before
+                    result = await session.execute(
+                        text(f"SELECT count(*) FROM search_index WHERE {exact_where}"), params
+                    )
+                    params["fuzzy_offset"] = params["offset"] - result.scalar_one()
+
+                result = await session.execute(
+                    text(f"""
+                        SELECT
+                            {SEARCH_COLUMNS},
+                            {SNIPPET_COLUMN.format(snippet=LEADING_SNIPPET)},
+                            search_index.rowid as row_key,
+                            1.0 / (1.0 - fuzzy.fuzzy_rank) as score
+                        FROM search_index
+                        JOIN (
+                            SELECT rowid AS fuzzy_rowid, rank AS fuzzy_rank
+                            FROM search_fuzzy
+                            WHERE search_fuzzy MATCH :fuzzy_text
+                        ) AS fuzzy ON search_index.rowid = fuzzy.fuzzy_rowid
+                        WHERE {where_clause} {keyset_clause}
+                        ORDER BY score ASC {order_by_clause}, row_key ASC
+                        LIMIT :fuzzy_limit
+                        OFFSET :fuzzy_offset
+                    """),
+                    params,
+                )
+                return list(result.fetchall())
+        except OperationalError as e:  # pragma: no cover
+            logger.warning(f"Fuzzy search failed for {fuzzy_text}, error: {e}")
+            return []
+
+    async def count(
+        self,
+        search_text: Optional[str] = None,
+        permalink: Optional[str] = None,
+        permalink_match: Optional[str] = None,
+        title: Optional[str] = None,
+        types: Optional[List[str]] = None,
+        after_date: Optional[datetime] = None,
+        search_item_types: Optional[List[SearchItemType]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> SearchCounts:
+        """Count the results of a search, in total and per type.
+
+        Takes the same filters as search. Rows are only counted, never scored
+        or sorted, in one grouped query (plus one for fuzzy matches).
+        """
+        conditions, params, text_condition, fuzzy_text = self._filter_conditions(
+            search_text,
+            permalink,
+            permalink_match,
+            title,
+            types,
+            after_date,
+            search_item_types,
+            tags,
+        )
+        where_clause = " AND ".join(conditions)
+        grouped = """
+            SELECT type, json_extract(metadata, '$.entity_type') AS entity_type, count(*) AS hits
+            FROM search_index
+            {join}
+            WHERE {where_clause}
+            GROUP BY type, entity_type
+        """
+
+        counts = SearchCounts()
+        try:
+            async with db.scoped_session(self.session_maker) as session:
+                result = await session.execute(
+                    text(grouped.format(join="", where_clause=where_clause)), params
+                )
+                counts.add(result.fetchall())
+
+                filter_conditions = self._fuzzy_filters(conditions, text_condition)
+                if fuzzy_text and filter_conditions is not None:
+                    fuzzy_where = " AND ".join(
+                        [
+                            *filter_conditions,
+                            "search_index.rowid NOT IN "
+                            f"(SELECT rowid FROM search_index WHERE {where_clause})",
+                        ]
+                    )
+                    try:
+                        result = await session.execute(
+                            text(
+                                grouped.format(
+                                    join="""
+                                        JOIN (
+                                            SELECT rowid AS fuzzy_rowid
+                                            FROM search_fuzzy
+                                            WHERE search_fuzzy MATCH :fuzzy_text
+                                        ) AS fuzzy ON search_index.rowid = fuzzy.fuzzy_rowid
+                                    """,
+                                    where_clause=fuzzy_where,
+                                )
+                            ),
+                            dict(params, fuzzy_text=fuzzy_text),
+                        )
+                        counts.add(result.fetchall())
+                    except OperationalError as e:  # pragma: no cover
+                        logger.warning(f"Fuzzy count failed for {fuzzy_text}, error: {e}")
+        except Exception as e:
+            if "fts5: syntax error" in str(e).lower():  # pragma: no cover
+                logger.warning(f"FTS5 syntax error for search term: {search_text}, error: {e}")
+                return SearchCounts()
+            logger.error(f"Database error during search count: {e}")
+            raise
+        return counts
+
     async def index_item(
         self,
         search_index_row: SearchIndexRow,
     ):
         """Index or update a single item."""
+        await self.index_items([search_index_row])
+
+    async def index_items(
+        self, search_index_rows: List[SearchIndexRow], entity_id: Optional[int] = None
+    ):
+        """Index or update several items in one transaction.
+
+        Existing rows with the same permalinks are replaced. Deletes and inserts
+        are each issued as a single executemany statement.
+
+        Args:
+            search_index_rows: Rows to index
+            entity_id: Replace all rows of this entity instead, with a single
+                delete by entity_id. Used to reindex an entity with its
+                observations and relations.
+        """
+        if not search_index_rows and entity_id is None:
+            return
+
+        # A later row replaces an earlier one with the same permalink, as with index_item
+        by_permalink: Dict[Any, SearchIndexRow] = {}
+        for position, row in enumerate(search_index_rows):
+            by_permalink[row.permalink if row.permalink is not None else position] = row
+        search_index_rows = list(by_permalink.values())
+
+        entity_condition = "entity_id = :entity_id AND project_id = :project_id"
+        entity_params = {"entity_id": entity_id, "project_id": self.project_id}
+        permalink_params = [
+            {"permalink": row.permalink, "project_id": self.project_id}
+            for row in search_index_rows
+        ]
+
         async with db.scoped_session(self.session_maker) as session:
-            # Delete existing record if any
-            await session.execute(
-                text("DELETE FROM search_index WHERE permalink = :permalink"),
-                {"permalink": search_index_row.permalink},
-            )
+            index_generations.bump_on_write(session, self.project_id)
+            if entity_id is not None:
+                await self._log_writes(session, entity_ids=[entity_id])
+            else:
+                await self._log_writes(
+                    session,
+                    entity_ids=[
+                        row.entity_id
+                        for row in search_index_rows
+                        if row.permalink is None and row.entity_id is not None
+                    ],
+                    permalinks=[row.permalink for row in search_index_rows if row.permalink],
+                )
+
+            # Delete existing records if any, from the tables keyed by rowid first
+            if entity_id is not None:
+                await self._delete_companion_rows(session, entity_condition, entity_params)
+                await session.execute(
+                    text(f"DELETE FROM search_index WHERE {entity_condition}"), entity_params
+                )
+                if not search_index_rows:
+                    return
+            else:
+                await self._delete_companion_rows(
+                    session, "permalink = :permalink", permalink_params
+                )
+                await session.execute(
+                    text("DELETE FROM search_index WHERE permalink = :permalink"),
+                    permalink_params,
+                )
 
             # Prepare data for insert with project_id
-            insert_data = search_index_row.to_insert()
-            insert_data["project_id"] = self.project_id
+            insert_data = [
+                {**row.to_insert(), "project_id": self.project_id} for row in search_index_rows
+            ]
 
-            # Insert new record
-            await session.execute(
-                text("""
-                    INSERT INTO search_index (
-                        id, title, content_stems, content_snippet, permalink, file_path, type, metadata,
-                        from_id, to_id, relation_type,
-                        entity_id, category,
-                        created_at, updated_at,
-                        project_id
-                    ) VALUES (
-                        :id, :title, :content_stems, :content_snippet, :permalink, :file_path, :type, :metadata,
-                        :from_id, :to_id, :relation_type,
-                        :entity_id, :category,
-                        :created_at, :updated_at,
-                        :project_id
-                    )
-                """),
-                insert_data,
-            )
-            logger.debug(f"indexed row {search_index_row}")
-            await session.commit()
+            # Insert new records
+            await session.execute(text(INSERT_ROWS.format(**LIVE_TABLES)), insert_data)
+
+            # Index the new rows for fuzzy matching and filtering
+            if entity_id is not None:
+                await self._insert_companion_rows(session, entity_condition, entity_params)
+            else:
+                await self._insert_companion_rows(
+                    session,
+                    "permalink = :permalink AND project_id = :project_id",
+                    permalink_params,
+                )
+            logger.debug(f"indexed {len(search_index_rows)} rows")
 
     async def delete_by_entity_id(self, entity_id: int):
         """Delete an item from the search index by entity_id."""
+        condition = "entity_id = :entity_id AND project_id = :project_id"
+        params = {"entity_id": entity_id, "project_id": self.project_id}
         async with db.scoped_session(self.session_maker) as session:
-            await session.execute(
-                text(
-                    "DELETE FROM search_index WHERE entity_id = :entity_id AND project_id = :project_id"
-                ),
-                {"entity_id": entity_id, "project_id": self.project_id},
-            )
-            await session.commit()
+            index_generations.bump_on_write(session, self.project_id)
+            await self._log_writes(session, entity_ids=[entity_id])
+            await self._delete_companion_rows(session, condition, params)
+            await session.execute(text(f"DELETE FROM search_index WHERE {condition}"), params)
 
     async def delete_by_permalink(self, permalink: str):
         """Delete an item from the search index."""
+        condition = "permalink = :permalink AND project_id = :project_id"
+        params = {"permalink": permalink, "project_id": self.project_id}
+        async with db.scoped_session(self.session_maker) as session:
+            index_generations.bump_on_write(session, self.project_id)
+            await self._log_writes(session, permalinks=[permalink])
+            await self._delete_companion_rows(session, condition, params)
+            await session.execute(text(f"DELETE FROM search_index WHERE {condition}"), params)
+
+    async def _log_writes(
+        self, session: AsyncSession, entity_ids: Iterable[int] = (), permalinks: Iterable[str] = ()
+    ) -> None:
+        # in the write's transaction, so a reindex in any process sees it at the swap
+        params = [
+            {"project_id": self.project_id, "entity_id": entity_id, "permalink": None}
+            for entity_id in entity_ids
+        ] + [
+            {"project_id": self.project_id, "entity_id": None, "permalink": permalink}
+            for permalink in permalinks
+        ]
+        if params:
+            await session.execute(text(LOG_INDEX_WRITE), params)
+
+    async def create_shadow_index(self) -> None:
+        """Create empty shadow tables to build a new index in.
+
+        Leftovers of a build that was interrupted are dropped first.
+        """
+        await self.drop_shadow_index()
         async with db.scoped_session(self.session_maker) as session:
             await session.execute(
-                text(
-                    "DELETE FROM search_index WHERE permalink = :permalink AND project_id = :project_id"
-                ),
-                {"permalink": permalink, "project_id": self.project_id},
+                text(SEARCH_INDEX_TABLE.format(table=SHADOW_TABLES["index_table"]))
             )
-            await session.commit()
+        try:
+            async with db.scoped_session(self.session_maker) as session:
+                await session.execute(
+                    text(SEARCH_FUZZY_TABLE.format(table=SHADOW_TABLES["fuzzy_table"]))
+                )
+        except OperationalError:  # pragma: no cover
+            async with db.scoped_session(self.session_maker) as session:
+                await session.execute(
+                    text(
+                        SEARCH_FUZZY_TABLE_WITHOUT_TRIGRAMS.format(
+                            table=SHADOW_TABLES["fuzzy_table"]
+                        )
+                    )
+                )
+        # the filter tables get their indexes when swapped in, see swap_shadow_index
+        async with db.scoped_session(self.session_maker) as session:
+            await session.execute(
+                text(SEARCH_FILTER_TABLE.format(table=SHADOW_TABLES["filter_table"]))
+            )
+            await session.execute(
+                text(SEARCH_FILTER_TAG_TABLE.format(table=SHADOW_TABLES["tag_table"]))
+            )
+
+    async def drop_shadow_index(self) -> None:
+        """Drop the shadow tables, discarding a build and the writes it logged."""
+        async with db.scoped_session(self.session_maker) as session:
+            for table in SHADOW_TABLES.values():
+                await session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            await session.execute(text("DELETE FROM search_index_write"))
+
+    async def _last_shadow_rowid(self, session: AsyncSession) -> int:
+        result = await session.execute(
+            text(f"SELECT rowid FROM {SHADOW_TABLES['index_table']} ORDER BY rowid DESC LIMIT 1")
+        )
+        return result.scalar() or 0
+
+    async def _index_new_shadow_rows(self, session: AsyncSession, after_rowid: int) -> None:
+        # shadow rows above after_rowid were just inserted, index them for fuzzy matching
+        # and filtering
+        await self._insert_companion_rows(
+            session, "rowid > :after_rowid", {"after_rowid": after_rowid}, SHADOW_TABLES
+        )
+
+    async def _copy_live_rows(
+        self, session: AsyncSession, condition: str, params: Dict[str, Any]
+    ) -> None:
+        # copy the live rows matching condition into the shadow index
+        after_rowid = await self._last_shadow_rowid(session)
+        await session.execute(
+            text(f"""
+                INSERT INTO {SHADOW_TABLES["index_table"]} ({INDEX_COLUMNS})
+                SELECT {INDEX_COLUMNS} FROM search_index WHERE {condition}
+            """),
+            params,
+        )
+        await self._index_new_shadow_rows(session, after_rowid)
+
+    async def _delete_shadow_rows(
+        self, session: AsyncSession, condition: str, params: Dict[str, Any]
+    ) -> None:
+        await self._delete_companion_rows(session, condition, params, SHADOW_TABLES)
+        await session.execute(
+            text(f"DELETE FROM {SHADOW_TABLES['index_table']} WHERE {condition}"), params
+        )
+
+    async def copy_other_projects_to_shadow(self, rowid_range: int = SHADOW_COPY_RANGE) -> None:
+        """Copy the live rows of every other project into the shadow index.
+
+        Rows are copied by ranges of rowids, each range in its own transaction,
+        so writers are never held up for long.
+        """
+        async with db.scoped_session(self.session_maker) as session:
+            result = await session.execute(
+                text("SELECT rowid FROM search_index ORDER BY rowid DESC LIMIT 1")
+            )
+            last_rowid = result.scalar() or 0
+
+        for low in range(0, last_rowid, rowid_range):
+            async with db.scoped_session(self.session_maker) as session:
+                await self._copy_live_rows(
+                    session,
+                    "rowid > :low AND rowid <= :high AND project_id != :project_id",
+                    {"low": low, "high": low + rowid_range, "project_id": self.project_id},
+                )
+
+    async def insert_shadow_rows(self, search_index_rows: List[SearchIndexRow]) -> None:
+        """Add rows to the shadow index in one transaction.
+
+        Unlike index_items nothing is replaced: the rows are only appended.
+        """
+        if not search_index_rows:
+            return
+        insert_data = [
+            {**row.to_insert(), "project_id": self.project_id} for row in search_index_rows
+        ]
+        async with db.scoped_session(self.session_maker) as session:
+            after_rowid = await self._last_shadow_rowid(session)
+            await session.execute(text(INSERT_ROWS.format(**SHADOW_TABLES)), insert_data)
+            await self._index_new_shadow_rows(session, after_rowid)
+
+    async def swap_shadow_index(self) -> None:
+        """Make the shadow index the live one, in a single transaction.
+
+        Rows written to the live index while the shadow was built, by this
+        process or another (see LOG_INDEX_WRITE), are copied over first, and
+        rows of this project's entities deleted meanwhile are removed. The live
+        tables are then dropped and the shadow tables renamed in their place,
+        so searches see either the old index or the complete new one.
+        """
+        async with db.scoped_session(self.session_maker) as session:
+            # the first write takes the database's write lock: from here on
+            # writes by other connections wait for the swap to commit, and
+            # the write log is complete
+            await self._delete_shadow_rows(
+                session,
+                "project_id = :project_id AND entity_id NOT IN "
+                "(SELECT id FROM entity WHERE project_id = :project_id)",
+                {"project_id": self.project_id},
+            )
+
+            result = await session.execute(
+                text("SELECT DISTINCT project_id, entity_id, permalink FROM search_index_write")
+            )
+            written: Dict[Tuple[str, int], List[Any]] = {}
+            for project_id, entity_id, permalink in result.fetchall():
+                if entity_id is not None:
+                    written.setdefault(("entity_id", project_id), []).append(entity_id)
+                if permalink is not None:
+                    written.setdefault(("permalink", project_id), []).append(permalink)
+            for (column, project_id), values in written.items():
+                condition = (
+                    f"{column} IN (SELECT value FROM json_each(:values)) "
+                    "AND project_id = :project_id"
+                )
+                params = {"values": json.dumps(values), "project_id": project_id}
+                await self._delete_shadow_rows(session, condition, params)
+                await self._copy_live_rows(session, condition, params)
+            await session.execute(text("DELETE FROM search_index_write"))
+
+            for live_table in LIVE_TABLES.values():
+                await session.execute(text(f"DROP TABLE IF EXISTS {live_table}"))
+            for table in LIVE_TABLES:
+                await session.execute(
+                    text(f"ALTER TABLE {SHADOW_TABLES[table]} RENAME TO {LIVE_TABLES[table]}")
+                )
+            # index names can't follow a rename, the filter indexes are created here
+            for statement in SEARCH_FILTER_INDEXES:
+                await session.execute(text(statement))
+            logger.info(f"Swapped in the rebuilt search index of project {self.project_id}")
 
     async def execute_query(
         self,
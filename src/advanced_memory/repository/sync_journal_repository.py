@@ -0,0 +1,73 @@
+"""Repository for the sync journal."""
+
+from typing import Any, Dict, Iterable, List, Sequence, cast
+
+from sqlalchemy import Table, and_, bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from advanced_memory import db
+from advanced_memory.models import SyncJournalEntry
+from advanced_memory.repository.repository import Repository
+
+
+class SyncJournalRepository(Repository[SyncJournalEntry]):
+    """Repository for the pending changes of an in-progress sync."""
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], project_id: int):
+        """Initialize with session maker and project_id filter.
+
+        Args:
+            session_maker: SQLAlchemy session maker
+            project_id: Project ID to filter all operations by
+        """
+        super().__init__(session_maker, SyncJournalEntry, project_id=project_id)
+
+    async def start(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the journal with the changes of a new sync.
+
+        Args:
+            entries: Dicts with action, file_path and optionally new_path and checksum
+        """
+        async with db.batch_session(self.session_maker):
+            await self.clear()
+            await self.insert_many([{"done": False, **entry} for entry in entries])
+
+    async def find_pending(self) -> Sequence[SyncJournalEntry]:
+        """Find the entries of an interrupted sync that were not applied yet."""
+        query = (
+            select(SyncJournalEntry)
+            .filter(SyncJournalEntry.done.is_(False))
+            .order_by(SyncJournalEntry.id)
+        )
+        query = self._add_project_filter(query)
+        result = await self.execute_query(query)
+        return result.scalars().all()
+
+    async def mark_done(self, action: str, file_paths: Iterable[str]) -> None:
+        """Mark entries as applied with a single executemany UPDATE.
+
+        Call inside the transaction that applied them, so the checkpoint commits
+        together with the changes.
+        """
+        params = [{"b_path": path} for path in file_paths]
+        if not params:
+            return
+
+        table = cast(Table, SyncJournalEntry.__table__)
+        query = (
+            update(table)
+            .where(
+                and_(
+                    table.c.project_id == self.project_id,
+                    table.c.action == action,
+                    table.c.file_path == bindparam("b_path"),
+                )
+            )
+            .values(done=True)
+        )
+        async with db.scoped_session(self.session_maker) as session:
+            await session.execute(query, params)
+
+    async def clear(self) -> None:
+        """Remove all entries of this project, e.g. once a sync completes."""
+        await self.delete_by_fields()
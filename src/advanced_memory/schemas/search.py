@@ -6,10 +6,10 @@ The search system supports three primary modes:
 3. Full-text search across content
 """
 
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Union
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from advanced_memory.schemas.base import Permalink
 
@@ -34,6 +34,7 @@ class SearchQuery(BaseModel):
     - types: Limit to specific item types
     - entity_types: Limit to specific entity types
     - after_date: Only items after date
+    - tags: Only items with any of these tags
 
     Boolean search examples:
     - "python AND flask" - Find items with both terms
@@ -52,6 +53,11 @@ class SearchQuery(BaseModel):
     types: Optional[List[str]] = None  # Filter by type
     entity_types: Optional[List[SearchItemType]] = None  # Filter by entity type
     after_date: Optional[Union[datetime, str]] = None  # Time-based filter
+    tags: Optional[List[str]] = None  # Filter by tag, any of them
+
+    # Result snippets: tokens around the best match, and whether matches are marked with **
+    snippet_tokens: int = Field(default=32, ge=1, le=64)
+    highlight: bool = False
 
     @field_validator("after_date")
     @classmethod
@@ -70,6 +76,7 @@ class SearchQuery(BaseModel):
             and self.after_date is None
             and self.types is None
             and self.entity_types is None
+            and self.tags is None
         )
 
     def has_boolean_operators(self) -> bool:
@@ -104,9 +111,23 @@ class SearchResult(BaseModel):
     relation_type: Optional[str] = None  # For relations
 
 
+class SearchFacets(BaseModel):
+    """Number of search results per type."""
+
+    item_types: Dict[str, int]  # entity, observation, relation
+    entity_types: Dict[str, int]  # entity_type of entity results: note, person, ...
+
+
 class SearchResponse(BaseModel):
     """Wrapper for search results."""
 
     results: List[SearchResult]
     current_page: int
     page_size: int
+
+    # Pass as cursor to get the next page, None on the last page
+    next_cursor: Optional[str] = None
+
+    # Only when counts are requested
+    total: Optional[int] = None
+    facets: Optional[SearchFacets] = None
@@ -5,6 +5,7 @@ import logging
 import os
 from typing import Dict, List, Optional
 
+from advanced_memory.models import Entity
 from advanced_memory.repository import EntityRepository
 from advanced_memory.schemas.directory import DirectoryNode
 
@@ -25,8 +26,19 @@ class DirectoryService:
     async def get_directory_tree(self) -> DirectoryNode:
         """Build a hierarchical directory tree from indexed files."""
 
-        # Get all files from DB (flat list)
-        entity_rows = await self.entity_repository.find_all()
+        # Get all files from DB (flat list), only the columns the tree needs
+        entity_rows = [
+            row
+            async for row in self.entity_repository.stream_rows(
+                Entity.id,
+                Entity.file_path,
+                Entity.title,
+                Entity.permalink,
+                Entity.entity_type,
+                Entity.content_type,
+                Entity.updated_at,
+            )
+        ]
 
         # Create a root directory node
         root_node = DirectoryNode(name="Root", directory_path="/", type="directory")
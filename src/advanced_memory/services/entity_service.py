@@ -6,7 +6,6 @@ from typing import List, Optional, Sequence, Tuple, Union
 import frontmatter
 import yaml
 from loguru import logger
-from sqlalchemy.exc import IntegrityError
 
 from advanced_memory.config import ProjectConfig, AdvancedMemoryConfig
 from advanced_memory.file_utils import has_frontmatter, parse_frontmatter, remove_frontmatter
@@ -14,7 +13,6 @@ from advanced_memory.markdown import EntityMarkdown
 from advanced_memory.markdown.entity_parser import EntityParser
 from advanced_memory.markdown.utils import entity_model_from_markdown, schema_to_markdown
 from advanced_memory.models import Entity as EntityModel
-from advanced_memory.models import Observation, Relation
 from advanced_memory.repository import ObservationRepository, RelationRepository
 from advanced_memory.repository.entity_repository import EntityRepository
 from advanced_memory.schemas import Entity as EntitySchema
@@ -151,7 +149,7 @@ class EntityService(BaseService[EntityModel]):
 
         # write file
         final_content = frontmatter.dumps(post, sort_keys=False)
-        checksum = await self.file_service.write_file(file_path, final_content)
+        checksum = await self.file_service.write_file(file_path, final_content, record=True)
 
         # parse entity from file
         entity_markdown = await self.entity_parser.parse_file(file_path)
@@ -228,7 +226,7 @@ class EntityService(BaseService[EntityModel]):
 
         # write file
         final_content = frontmatter.dumps(merged_post, sort_keys=False)
-        checksum = await self.file_service.write_file(file_path, final_content)
+        checksum = await self.file_service.write_file(file_path, final_content, record=True)
 
         # parse entity from file
         entity_markdown = await self.entity_parser.parse_file(file_path)
@@ -335,16 +333,16 @@ class EntityService(BaseService[EntityModel]):
 
         # add new observations
         observations = [
-            Observation(
-                entity_id=db_entity.id,
-                content=obs.content,
-                category=obs.category,
-                context=obs.context,
-                tags=obs.tags,
-            )
+            {
+                "entity_id": db_entity.id,
+                "content": obs.content,
+                "category": obs.category,
+                "context": obs.context,
+                "tags": obs.tags,
+            }
             for obs in markdown.observations
         ]
-        await self.observation_repository.add_all(observations)
+        await self.observation_repository.insert_many(observations)
 
         # update values from markdown
         db_entity = entity_model_from_markdown(file_path, markdown, db_entity)
@@ -368,37 +366,37 @@ class EntityService(BaseService[EntityModel]):
 
         db_entity = await self.repository.get_by_file_path(path)
 
+        # keep the link index (if a sync is using one) current before resolving against it
+        self.link_resolver.index_entity(db_entity)
+
         # Clear existing relations first
         await self.relation_repository.delete_outgoing_relations_from_entity(db_entity.id)
 
+        # Resolve all targets in one pass
+        targets = await self.link_resolver.resolve_links(rel.target for rel in markdown.relations)
+
         # Process each relation
+        relations = []
         for rel in markdown.relations:
-            # Resolve the target permalink
-            target_entity = await self.link_resolver.resolve_link(
-                rel.target,
-            )
+            target_entity = targets[rel.target]
 
             # if the target is found, store the id
             target_id = target_entity.id if target_entity else None
             # if the target is found, store the title, otherwise add the target for a "forward link"
             target_name = target_entity.title if target_entity else rel.target
 
-            # Create the relation
-            relation = Relation(
-                from_id=db_entity.id,
-                to_id=target_id,
-                to_name=target_name,
-                relation_type=rel.type,
-                context=rel.context,
+            relations.append(
+                {
+                    "from_id": db_entity.id,
+                    "to_id": target_id,
+                    "to_name": target_name,
+                    "relation_type": rel.type,
+                    "context": rel.context,
+                }
             )
-            try:
-                await self.relation_repository.add(relation)
-            except IntegrityError:
-                # Unique constraint violation - relation already exists
-                logger.debug(
-                    f"Skipping duplicate relation {rel.type} from {db_entity.permalink} target: {rel.target}"
-                )
-                continue
+
+        # Create the relations, skipping duplicates (unique constraint violations)
+        await self.relation_repository.insert_many(relations, ignore_conflicts=True)
 
         return await self.repository.get_by_file_path(path)
 
@@ -445,7 +443,7 @@ class EntityService(BaseService[EntityModel]):
         )
 
         # Write the updated content back to the file
-        checksum = await self.file_service.write_file(file_path, new_content)
+        checksum = await self.file_service.write_file(file_path, new_content, record=True)
 
         # Parse the updated file to get new observations/relations
         entity_markdown = await self.entity_parser.parse_file(file_path)
@@ -689,7 +687,7 @@ class EntityService(BaseService[EntityModel]):
 
                 # Update frontmatter with new permalink
                 await self.file_service.update_frontmatter(
-                    destination_path, {"permalink": new_permalink}
+                    destination_path, {"permalink": new_permalink}, record=True
                 )
 
                 updates["permalink"] = new_permalink
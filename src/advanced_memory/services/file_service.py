@@ -1,5 +1,6 @@
 """Service for file operations with checksum tracking and safety features."""
 
+import asyncio
 import mimetypes
 import shutil
 import time
@@ -72,6 +73,33 @@ class FileService:
         markdown = await self.markdown_processor.read_file(file_path)
         return markdown.content or ""
 
+    async def read_entity_contents(self, entities: List[EntityModel]) -> List[Optional[str]]:
+        """Get the content of several entities, as read_entity_content does.
+
+        Files are read in worker threads, all at once, so slow disks and
+        network mounts are waited on in parallel.
+
+        Returns:
+            The content of each entity, None for files that can't be read
+        """
+
+        def read_content(entity: EntityModel) -> Optional[str]:
+            try:
+                file_content = self.get_entity_path(entity).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Could not read {entity.file_path} to index it: {e}")
+                return None
+            try:
+                return file_utils.remove_frontmatter(file_content)
+            except file_utils.ParseError:
+                return file_content
+
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(read_content, entity) for entity in entities)
+            )
+        )
+
     async def delete_entity_file(self, entity: EntityModel, force: bool = False) -> bool:
         """Safely delete an entity's file from the filesystem.
 
@@ -114,7 +142,9 @@ class FileService:
             logger.error("Failed to check file existence", path=str(path), error=str(e))
             raise FileOperationError(f"Failed to check file existence: {e}")
 
-    async def write_file(self, path: FilePath, content: str, overwrite: bool = True) -> str:
+    async def write_file(
+        self, path: FilePath, content: str, overwrite: bool = True, record: bool = False
+    ) -> str:
         """Safely write content to file and return checksum.
 
         Handles both absolute and relative paths. Relative paths are resolved
@@ -124,6 +154,8 @@ class FileService:
             path: Where to write (Path or string)
             content: Content to write
             overwrite: If False, raise error if file exists
+            record: Record the write so the watch service skips it, for
+                callers that update the database themselves
 
         Returns:
             Checksum of written content
@@ -160,7 +192,7 @@ class FileService:
             )
 
             # Use atomic write to prevent partial writes
-            await file_utils.write_file_atomic(full_path, content)
+            await file_utils.write_file_atomic(full_path, content, record=record)
 
             # Compute and return checksum
             checksum = await file_utils.compute_checksum(content)
@@ -290,13 +322,16 @@ class FileService:
             logger.error(error_msg, exc_info=True)
             raise FileOperationError(error_msg) from e
 
-    async def update_frontmatter(self, path: FilePath, updates: Dict[str, Any]) -> str:
+    async def update_frontmatter(
+        self, path: FilePath, updates: Dict[str, Any], record: bool = False
+    ) -> str:
         """
         Update frontmatter fields in a file while preserving all content.
 
         Args:
             path: Path to the file (Path or string)
             updates: Dictionary of frontmatter fields to update
+            record: Record the write so the watch service skips it, see write_file
 
         Returns:
             Checksum of updated file
@@ -304,7 +339,7 @@ class FileService:
         # Convert string to Path if needed
         path_obj = self.base_path / path if isinstance(path, str) else path
         full_path = path_obj if path_obj.is_absolute() else self.base_path / path_obj
-        return await file_utils.update_frontmatter(full_path, updates)
+        return await file_utils.update_frontmatter(full_path, updates, record=record)
 
     async def compute_checksum(self, path: FilePath) -> str:
         """Compute checksum for a file.
@@ -318,6 +353,13 @@ class FileService:
         Raises:
             FileError: If checksum computation fails
         """
+        return self.compute_checksum_sync(path)
+
+    def compute_checksum_sync(self, path: FilePath) -> str:
+        """Compute checksum for a file without awaiting.
+
+        Blocking variant of compute_checksum, safe to run in a worker thread.
+        """
         # Convert string to Path if needed
         path_obj = self.base_path / path if isinstance(path, str) else path
         full_path = path_obj if path_obj.is_absolute() else self.base_path / path_obj
@@ -329,7 +371,7 @@ class FileService:
             else:
                 # read bytes
                 content = full_path.read_bytes()
-            return await file_utils.compute_checksum(content)
+            return file_utils.compute_checksum_sync(content)
 
         except Exception as e:  # pragma: no cover
             logger.error("Failed to compute checksum", path=str(full_path), error=str(e))
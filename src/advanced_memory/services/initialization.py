@@ -6,13 +6,18 @@ to ensure consistent application startup across all entry points.
 
 import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from loguru import logger
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.config import AdvancedMemoryConfig
+from advanced_memory.models import Project
 from advanced_memory.repository import ProjectRepository
 
+if TYPE_CHECKING:  # pragma: no cover
+    from advanced_memory.sync import WatchService
+
 
 async def initialize_database(app_config: AdvancedMemoryConfig) -> None:
     """Initialize database with migrations handled automatically by get_or_create_db.
@@ -68,11 +73,52 @@ async def reconcile_projects_with_config(app_config: AdvancedMemoryConfig):
         logger.info("Continuing with initialization despite synchronization error")
 
 
+async def sync_projects(
+    projects: Sequence[Project], watch_service: Optional["WatchService"] = None
+) -> None:
+    """Sync projects one after the other through the background sync scheduler.
+
+    Args:
+        projects: Projects to sync
+        watch_service: Watch service running meanwhile. Its sync services are
+            used, so the sync and the watcher share each project's write lock.
+    """
+    # avoid circular imports
+    from advanced_memory.services.sync_status_service import sync_status_tracker
+    from advanced_memory.sync.sync_scheduler import sync_scheduler
+
+    for project in projects:
+        logger.info(f"Starting sync for project: {project.name}")
+        if watch_service is not None:
+            sync_service = await watch_service.get_sync_service(project)
+        else:
+            from advanced_memory.cli.commands.sync import get_sync_service
+
+            sync_service = await get_sync_service(project)
+        sync_dir = Path(project.path)
+
+        try:
+            await sync_scheduler.sync(project.name, sync_service, sync_dir)
+            logger.info(f"Sync completed successfully for project: {project.name}")
+
+            # Mark project as watching for changes after successful sync
+            sync_status_tracker.start_project_watch(project.name)
+            logger.info(f"Project {project.name} is now watching for changes")
+        except Exception as e:  # pragma: no cover
+            logger.error(f"Error syncing project {project.name}: {e}")
+            # Mark sync as failed for this project
+            sync_status_tracker.fail_project_sync(project.name, str(e))
+            # Continue with other projects even if one fails
+
+
 async def initialize_file_sync(
     app_config: AdvancedMemoryConfig,
 ):
     """Initialize file synchronization services. This function starts the watch service and does not return
 
+    Projects are synced in the background while the watch service runs, so
+    startup does not wait for a full sync.
+
     Args:
         app_config: The Basic Memory project configuration
 
@@ -101,33 +147,15 @@ async def initialize_file_sync(
     # Get active projects
     active_projects = await project_repository.get_active_projects()
 
-    # First, sync all projects sequentially
-    for project in active_projects:
-        # avoid circular imports
-        from advanced_memory.cli.commands.sync import get_sync_service
-
-        logger.info(f"Starting sync for project: {project.name}")
-        sync_service = await get_sync_service(project)
-        sync_dir = Path(project.path)
-
-        try:
-            await sync_service.sync(sync_dir, project_name=project.name)
-            logger.info(f"Sync completed successfully for project: {project.name}")
-
-            # Mark project as watching for changes after successful sync
-            from advanced_memory.services.sync_status_service import sync_status_tracker
-
-            sync_status_tracker.start_project_watch(project.name)
-            logger.info(f"Project {project.name} is now watching for changes")
-        except Exception as e:  # pragma: no cover
-            logger.error(f"Error syncing project {project.name}: {e}")
-            # Mark sync as failed for this project
-            from advanced_memory.services.sync_status_service import sync_status_tracker
+    # Projects another process is already watching are left to it
+    owned_projects = await watch_service.acquire_leases(active_projects)
 
-            sync_status_tracker.fail_project_sync(project.name, str(e))
-            # Continue with other projects even if one fails
+    # Sync all projects sequentially in the background, with the watcher's sync
+    # services. Queries are served meanwhile, files they read are synced on
+    # demand (see SyncScheduler).
+    sync_task = asyncio.create_task(sync_projects(owned_projects, watch_service))
 
-    # Then start the watch service in the background
+    # Start the watch service right away
     logger.info("Starting watch service for all projects")
     # run the watch service
     try:
@@ -135,6 +163,8 @@ async def initialize_file_sync(
         logger.info("Watch service started")
     except Exception as e:  # pragma: no cover
         logger.error(f"Error starting watch service: {e}")
+    finally:
+        sync_task.cancel()
 
     return None
 
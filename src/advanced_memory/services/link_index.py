@@ -0,0 +1,116 @@
+"""In-memory index of link targets used to resolve wikilinks in bulk."""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from loguru import logger
+
+from advanced_memory.models import Entity
+from advanced_memory.repository.entity_repository import EntityRepository
+
+
+@dataclass(frozen=True, slots=True)
+class LinkTarget:
+    """The parts of an entity needed to store a resolved relation."""
+
+    id: int
+    title: str
+    permalink: Optional[str]
+    file_path: str
+
+
+class LinkIndex:
+    """Lookup of entities by permalink, title and file path for one project.
+
+    Mirrors the exact-match steps of LinkResolver.resolve_link without a query
+    per step, and adds a case-insensitive title match. When several entities
+    share a key the lowest id wins, like the first row of the equivalent query.
+
+    The index is built once from plain column rows and then kept up to date
+    with add() and remove() as entities change.
+    """
+
+    def __init__(self):
+        self.by_permalink: Dict[str, Set[int]] = {}
+        self.by_title: Dict[str, Set[int]] = {}
+        self.by_title_lower: Dict[str, Set[int]] = {}
+        self.by_file_path: Dict[str, Set[int]] = {}
+        self.by_file_path_lower: Dict[str, Set[int]] = {}
+        self.targets: Dict[int, LinkTarget] = {}
+
+    @classmethod
+    async def build(cls, entity_repository: EntityRepository) -> "LinkIndex":
+        """Build the index for the repository's project in one pass."""
+        index = cls()
+        async for row in entity_repository.stream_rows(
+            Entity.id, Entity.title, Entity.permalink, Entity.file_path
+        ):
+            index.add(LinkTarget(row.id, row.title, row.permalink, row.file_path))
+        logger.debug(f"Built link index with {len(index)} entities")
+        return index
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def _keys(self, target: LinkTarget) -> Iterable[Tuple[Dict[str, Set[int]], str]]:
+        if target.permalink:
+            yield self.by_permalink, target.permalink
+        if target.title:
+            yield self.by_title, target.title
+            yield self.by_title_lower, target.title.lower()
+        if target.file_path:
+            yield self.by_file_path, target.file_path
+            yield self.by_file_path_lower, target.file_path.lower()
+
+    def add(self, target: LinkTarget) -> None:
+        """Add an entity, replacing what was indexed for it before."""
+        self.remove(target.id)
+        self.targets[target.id] = target
+        for mapping, key in self._keys(target):
+            mapping.setdefault(key, set()).add(target.id)
+
+    def add_entity(self, entity: Entity) -> None:
+        self.add(LinkTarget(entity.id, entity.title, entity.permalink, entity.file_path))
+
+    def remove(self, entity_id: int) -> None:
+        """Remove an entity if it is indexed."""
+        target = self.targets.pop(entity_id, None)
+        if target is None:
+            return
+        for mapping, key in self._keys(target):
+            ids = mapping.get(key)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del mapping[key]
+
+    def _lookup(self, mapping: Dict[str, Set[int]], key: str) -> Optional[LinkTarget]:
+        ids = mapping.get(key)
+        return self.targets[min(ids)] if ids else None
+
+    def resolve(self, clean_text: str, ignore_title_case: bool = True) -> Optional[LinkTarget]:
+        """Find the entity an already-normalized link points to.
+
+        Order: permalink, title, file path, file path with .md (exact, then
+        ignoring case), and title ignoring case unless ignore_title_case is False.
+        """
+        target = (
+            self._lookup(self.by_permalink, clean_text)
+            or self._lookup(self.by_title, clean_text)
+            or self._lookup(self.by_file_path, clean_text)
+        )
+        if target:
+            return target
+
+        if not clean_text.endswith(".md") and "/" in clean_text:
+            file_path_with_md = os.path.normpath(f"{clean_text}.md")
+            target = self._lookup(self.by_file_path, file_path_with_md) or self._lookup(
+                self.by_file_path_lower, file_path_with_md.lower()
+            )
+            if target:
+                return target
+
+        if ignore_title_case:
+            return self._lookup(self.by_title_lower, clean_text.lower())
+        return None
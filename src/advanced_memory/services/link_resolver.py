@@ -1,12 +1,15 @@
 """Service for resolving markdown links to permalinks."""
 
-from typing import Optional, Tuple
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
 
 from loguru import logger
 
 from advanced_memory.models import Entity
-from advanced_memory.repository.entity_repository import EntityRepository
+from advanced_memory.repository.entity_repository import EntityRepository, entity_generations
 from advanced_memory.schemas.search import SearchQuery, SearchItemType
+from advanced_memory.services.link_index import LinkIndex, LinkTarget
 from advanced_memory.services.search_service import SearchService
 
 
@@ -18,13 +21,121 @@ class LinkResolver:
     2. Try exact title match
     3. Try exact file path match
     4. Try file path with .md extension (for folder/title patterns)
-    5. Fall back to search for fuzzy matching
+    5. Try title ignoring case
+    6. Fall back to search for fuzzy matching
+
+    While a LinkIndex is active (see indexed()), steps 1-5 are answered from
+    memory instead of the database.
+
+    Long-lived resolvers (like the watch service's) can set keep_index so the
+    index survives between indexed() blocks. It is rebuilt only when the
+    entities were written behind its back, which the entity write generations
+    tell without a query (see EntityGenerations).
     """
 
     def __init__(self, entity_repository: EntityRepository, search_service: SearchService):
         """Initialize with repositories."""
         self.entity_repository = entity_repository
         self.search_service = search_service
+        self.link_index: Optional[LinkIndex] = None
+        self.keep_index = False
+        # index kept between indexed() blocks, and the entity generation it matches
+        self._kept_index: Optional[LinkIndex] = None
+        self._kept_generation: Optional[int] = None
+        # generations followed by the active kept index, see EntityGenerations.follow
+        self._followed: Optional[Dict[int, int]] = None
+
+    @asynccontextmanager
+    async def indexed(self) -> AsyncIterator[LinkIndex]:
+        """Resolve links from an in-memory LinkIndex for the duration of the block.
+
+        Reuses the active index if there is one. Entities written while the
+        index is active must be passed to index_entity() to keep it current.
+        """
+        if self.link_index is not None:
+            yield self.link_index
+            return
+
+        if not self.keep_index:
+            self.link_index = await LinkIndex.build(self.entity_repository)
+            try:
+                yield self.link_index
+            finally:
+                self.link_index = None
+            return
+
+        project_id = self.entity_repository.project_id
+        assert project_id is not None
+        # read before building, so writes made while building leave it stale
+        generation = entity_generations.get(project_id)
+        if self._kept_index is None or generation != self._kept_generation:
+            self._kept_index = await LinkIndex.build(self.entity_repository)
+            self._kept_generation = generation
+        self.link_index = self._kept_index
+        kept = False
+        try:
+            with entity_generations.follow(project_id) as followed:
+                followed[project_id] = generation
+                self._followed = followed
+                yield self.link_index
+            # our own writes are in the index already, writes made elsewhere
+            # in the meantime left followed behind the current generation
+            self._kept_generation = followed[project_id]
+            self._kept_index = self.link_index
+            kept = True
+        finally:
+            self._followed = None
+            if not kept:
+                # the block failed part way, the index may not match the database
+                self._kept_index = None
+            self.link_index = None
+
+    async def refresh_index(self) -> None:
+        """Rebuild the active index, e.g. after a rolled back transaction."""
+        if self.link_index is not None:
+            if self._followed is not None:
+                project_id = self.entity_repository.project_id
+                assert project_id is not None
+                self._followed[project_id] = entity_generations.get(project_id)
+            self.link_index = await LinkIndex.build(self.entity_repository)
+
+    def index_entity(self, entity: Entity) -> None:
+        """Record a created or updated entity in the active index, if any."""
+        if self.link_index is not None:
+            self.link_index.add_entity(entity)
+
+    def remove_from_index(self, entity_id: int) -> None:
+        """Drop a deleted entity from the active index, if any."""
+        if self.link_index is not None:
+            self.link_index.remove(entity_id)
+
+    async def resolve_links(self, link_texts: Iterable[str]) -> Dict[str, Optional[LinkTarget]]:
+        """Resolve many links at once.
+
+        Each distinct link is resolved once. Exact matches come from the active
+        index; links it cannot answer (or all links, without an index) go
+        through resolve_link, including its search fallback.
+
+        Returns:
+            Dict mapping each link text to its target, or None if unresolved
+        """
+        resolved: Dict[str, Optional[LinkTarget]] = {}
+        for link_text in link_texts:
+            if link_text in resolved:
+                continue
+
+            target = None
+            if self.link_index is not None:
+                clean_text, _ = self._normalize_link_text(link_text)
+                target = self.link_index.resolve(clean_text)
+
+            if target is None:
+                entity = await self.resolve_link(link_text)
+                if entity is not None:
+                    target = LinkTarget(entity.id, entity.title, entity.permalink, entity.file_path)
+
+            resolved[link_text] = target
+        return resolved
 
     async def resolve_link(
         self, link_text: str, use_search: bool = True, strict: bool = False
@@ -41,6 +152,15 @@ class LinkResolver:
         # Clean link text and extract any alias
         clean_text, alias = self._normalize_link_text(link_text)
 
+        # 1-5. Answer exact matches from the in-memory index when one is active
+        if self.link_index is not None:
+            target = self.link_index.resolve(clean_text, ignore_title_case=not strict)
+            if target is not None:
+                entity = await self.entity_repository.find_by_id(target.id)
+                if entity:
+                    return entity
+            return await self._resolve_fuzzy(clean_text, use_search, strict)
+
         # 1. Try exact permalink match first (most efficient)
         entity = await self.entity_repository.get_by_permalink(clean_text)
         if entity:
@@ -66,7 +186,6 @@ class LinkResolver:
             # Don't normalize the case, just add .md extension
             file_path_with_md = f"{clean_text}.md"
             # Only normalize path separators for cross-platform compatibility
-            import os
             file_path_with_md = os.path.normpath(file_path_with_md)
             logger.debug(f"Trying to find entity with normalized path: {file_path_with_md}")
             found_path_md = await self.entity_repository.get_by_file_path(file_path_with_md)
@@ -75,19 +194,33 @@ class LinkResolver:
                 return found_path_md
             else:
                 logger.debug(f"No entity found with path: {file_path_with_md}")
-                # Try case-insensitive search by looking up all entities and matching file paths
+                # Try case-insensitive path match
                 # This handles cases where the input case doesn't match the stored case
-                all_entities = await self.entity_repository.find_all()
-                for entity in all_entities:
-                    if entity.file_path and entity.file_path.lower() == file_path_with_md.lower():
-                        logger.debug(f"Found entity with case-insensitive path match: {entity.file_path}")
-                        return entity
+                entity = await self.entity_repository.get_by_file_path_ignore_case(
+                    file_path_with_md
+                )
+                if entity:
+                    logger.debug(f"Found entity with case-insensitive path match: {entity.file_path}")
+                    return entity
+
+        return await self._resolve_fuzzy(clean_text, use_search, strict)
 
+    async def _resolve_fuzzy(
+        self, clean_text: str, use_search: bool, strict: bool
+    ) -> Optional[Entity]:
+        """Resolve a link with no exact match: title ignoring case, then search."""
         # In strict mode, don't try fuzzy search - return None if no exact match found
         if strict:
             return None
 
-        # 5. Fall back to search for fuzzy matching (only if not in strict mode)
+        # Try title ignoring case (already covered by the index when one is active)
+        if self.link_index is None:
+            found = await self.entity_repository.get_by_title_ignore_case(clean_text)
+            if found:
+                logger.debug(f"Found case-insensitive title match: {found[0].title}")
+                return found[0]
+
+        # 6. Fall back to search for fuzzy matching (only if not in strict mode)
         if use_search and "*" not in clean_text:
             results = await self.search_service.search(
                 query=SearchQuery(text=clean_text, entity_types=[SearchItemType.ENTITY]),
@@ -694,10 +694,16 @@ class ProjectService:
         db_size = db_path.stat().st_size if db_path.exists() else 0
         db_size_readable = f"{db_size / (1024 * 1024):.2f} MB"
 
-        # Get watch service status if available
+        # avoid circular imports
+        from advanced_memory.sync.watch_service import get_watch_state
+
+        # Get watch service status if available, from memory when it runs in this process
         watch_status = None
+        watch_state = get_watch_state()
         watch_status_path = Path.home() / ".basic-memory" / WATCH_STATUS_JSON
-        if watch_status_path.exists():
+        if watch_state is not None:
+            watch_status = watch_state.model_dump(mode="json")
+        elif watch_status_path.exists():
             try:
                 watch_status = json.loads(watch_status_path.read_text(encoding="utf-8"))
             except Exception:  # pragma: no cover
@@ -0,0 +1,73 @@
+"""Cache of search results, invalidated by writes to the search index.
+
+Agents tend to repeat the same searches within a session. SearchCache keeps
+recent results in memory, least recently used first out. Each entry records
+the generation of its project's search index when the search started (see
+IndexGenerations in the search repository); any write to the project's index
+starts a new generation, so an entry is used only while nothing it depends
+on has changed.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# Writes by other processes sharing the database don't reach this process's
+# generations, entries are dropped after this many seconds to bound staleness.
+MAX_AGE = 30.0
+
+# Results longer than this are not cached, to keep memory bounded
+MAX_CACHED_ROWS = 500
+
+
+class SearchCache:
+    """Bounded LRU cache of search results stamped with an index generation.
+
+    Args:
+        max_entries: Results kept at most, 0 disables the cache
+        max_age: Seconds an entry stays usable
+    """
+
+    def __init__(self, max_entries: int = 256, max_age: float = MAX_AGE):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        # key -> (generation, stored at, value)
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, generation: Hashable) -> Optional[Any]:
+        """Get cached results, if they were stored in this generation."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry_generation, stored_at, value = entry
+            if entry_generation == generation and time.monotonic() - stored_at < self.max_age:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, generation: Hashable, value: Any, size: int = 0) -> None:
+        """Cache results computed in generation, the one current when the search started.
+
+        Args:
+            size: Number of rows in value, larger results than MAX_CACHED_ROWS are skipped
+        """
+        if self.max_entries <= 0 or size > MAX_CACHED_ROWS:
+            return
+        self._entries[key] = (generation, time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Results of searches in this process, shared by the per-request search services
+search_cache = SearchCache()
@@ -1,19 +1,33 @@
 """Service for search operations."""
 
 import ast
+import asyncio
 from datetime import datetime
-from typing import List, Optional, Set
+from typing import Hashable, List, Optional, Set, Tuple
 
 from dateparser import parse
 from fastapi import BackgroundTasks
 from loguru import logger
-from sqlalchemy import text
 
 from advanced_memory.models import Entity
 from advanced_memory.repository import EntityRepository
-from advanced_memory.repository.search_repository import SearchRepository, SearchIndexRow
+from advanced_memory.repository.search_repository import (
+    SearchCounts,
+    SearchCursor,
+    SearchIndexRow,
+    SearchRepository,
+    index_generations,
+)
 from advanced_memory.schemas.search import SearchQuery, SearchItemType
 from advanced_memory.services import FileService
+from advanced_memory.services.search_cache import search_cache
+from advanced_memory.services.sync_status_service import sync_status_tracker
+
+# Entities read and indexed at a time by reindex_all
+REINDEX_CHUNK_SIZE = 100
+
+# One reindex at a time per process: each one rebuilds the index of every project
+_reindex_lock = asyncio.Lock()
 
 
 class SearchService:
@@ -39,29 +53,101 @@ class SearchService:
         """Create FTS5 virtual table if it doesn't exist."""
         await self.repository.init_search_index()
 
-    async def reindex_all(self, background_tasks: Optional[BackgroundTasks] = None) -> None:
-        """Reindex all content from database."""
+    async def reindex_all(
+        self,
+        background_tasks: Optional[BackgroundTasks] = None,
+        project_name: Optional[str] = None,
+        chunk_size: int = REINDEX_CHUNK_SIZE,
+    ) -> bool:
+        """Rebuild this project's search index from the database and its files.
+
+        The new index is built in shadow tables while the current one keeps
+        serving searches: the rows of the other projects are copied over, then
+        this project's entities are streamed in chunks, the files of a chunk
+        read in parallel. The shadow tables then replace the live ones in a
+        single transaction.
+
+        Args:
+            background_tasks: Run the rebuild as a background task if provided
+            project_name: Name progress is reported under in sync_status_tracker
+            chunk_size: Entities read and indexed at a time
+
+        Returns:
+            False if a rebuild is already running, nothing is done then
+        """
+        if _reindex_lock.locked():
+            logger.info("Reindex already running, not starting another one")
+            return False
+        if background_tasks:
+            background_tasks.add_task(
+                self.reindex_all, project_name=project_name, chunk_size=chunk_size
+            )
+            return True
 
-        logger.info("Starting full reindex")
-        # Clear and recreate search index
-        await self.repository.execute_query(text("DROP TABLE IF EXISTS search_index"), params={})
-        await self.init_search_index()
+        async with _reindex_lock:
+            name = project_name or str(self.repository.project_id)
+            logger.info(f"Starting full reindex of project {name}")
+            sync_status_tracker.start_reindex(name, await self.entity_repository.count())
+            await self.init_search_index()
 
-        # Reindex all entities
-        logger.debug("Indexing entities")
-        entities = await self.entity_repository.find_all()
-        for entity in entities:
-            await self.index_entity(entity, background_tasks)
+            try:
+                await self.repository.create_shadow_index()
+                await self.repository.copy_other_projects_to_shadow()
+
+                indexed = 0
+                async for entities in self.entity_repository.stream_chunks(chunk_size):
+                    await self.repository.insert_shadow_rows(await self._build_rows(entities))
+                    indexed += len(entities)
+                    sync_status_tracker.update_reindex(name, indexed)
+
+                await self.repository.swap_shadow_index()
+            except Exception as e:
+                logger.error(f"Reindex of project {name} failed, keeping the current index: {e}")
+                sync_status_tracker.fail_reindex(name, str(e))
+                await self.repository.drop_shadow_index()
+                raise
+
+            # every project's rows were replaced
+            index_generations.bump_all()
+            sync_status_tracker.complete_reindex(name)
+            logger.info(f"Reindex of project {name} complete, {indexed} entities indexed")
+            return True
+
+    async def _build_rows(self, entities: List[Entity]) -> List[SearchIndexRow]:
+        """Search index rows of entities, their markdown files read in parallel."""
+        markdown_entities = [entity for entity in entities if entity.is_markdown]
+        contents = dict(
+            zip(
+                (entity.id for entity in markdown_entities),
+                await self.file_service.read_entity_contents(markdown_entities),
+                strict=True,
+            )
+        )
 
-        logger.info("Reindex complete")
+        rows: List[SearchIndexRow] = []
+        for entity in entities:
+            if entity.is_markdown:
+                rows += self._markdown_rows(entity, contents[entity.id] or "")
+            else:
+                rows += self._file_rows(entity)
+        return rows
 
-    async def search(self, query: SearchQuery, limit=10, offset=0) -> List[SearchIndexRow]:
+    async def search(
+        self,
+        query: SearchQuery,
+        limit=10,
+        offset=0,
+        cursor: Optional[SearchCursor] = None,
+    ) -> List[SearchIndexRow]:
         """Search across all indexed content.
 
         Supports three modes:
         1. Exact permalink: finds direct matches for a specific path
         2. Pattern match: handles * wildcards in paths
         3. Text search: full-text search across title/content
+
+        A cursor continues the search after the last result of a previous page,
+        offset is ignored then.
         """
         if query.no_criteria():
             logger.debug("no criteria passed to query")
@@ -69,15 +155,15 @@ class SearchService:
 
         logger.trace(f"Searching with query: {query}")
 
-        after_date = (
-            (
-                query.after_date
-                if isinstance(query.after_date, datetime)
-                else parse(query.after_date)
-            )
-            if query.after_date
-            else None
-        )
+        after_date = self._parse_after_date(query)
+
+        # repeated searches are served from the cache until the index changes
+        cacheable = self.is_cacheable(query)
+        key = self.cache_key("rows", query, limit, offset, after_date, cursor)
+        generation = self.generation()
+        cached = search_cache.get(key, generation) if cacheable else None
+        if cached is not None:
+            return list(cached)
 
         # search
         results = await self.repository.search(
@@ -88,21 +174,122 @@ class SearchService:
             types=query.types,
             search_item_types=query.entity_types,
             after_date=after_date,
+            tags=query.tags,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            snippet_tokens=query.snippet_tokens,
+            highlight=query.highlight,
         )
 
+        if cacheable:
+            search_cache.put(key, generation, tuple(results), size=len(results))
         return results
 
+    async def count(self, query: SearchQuery) -> SearchCounts:
+        """Count the results of a search, in total and per item and entity type."""
+        if query.no_criteria():
+            return SearchCounts()
+
+        after_date = self._parse_after_date(query)
+        cacheable = self.is_cacheable(query)
+        key = self.cache_key("counts", query, 0, 0, after_date)
+        generation = self.generation()
+        cached = search_cache.get(key, generation) if cacheable else None
+        if cached is not None:
+            return cached
+
+        counts = await self.repository.count(
+            search_text=query.text,
+            permalink=query.permalink,
+            permalink_match=query.permalink_match,
+            title=query.title,
+            types=query.types,
+            search_item_types=query.entity_types,
+            after_date=after_date,
+            tags=query.tags,
+        )
+        if cacheable:
+            search_cache.put(key, generation, counts)
+        return counts
+
+    @staticmethod
+    def _parse_after_date(query: SearchQuery) -> Optional[datetime]:
+        return (
+            (
+                query.after_date
+                if isinstance(query.after_date, datetime)
+                else parse(query.after_date)
+            )
+            if query.after_date
+            else None
+        )
+
+    @staticmethod
+    def is_cacheable(query: SearchQuery) -> bool:
+        """Whether results of the query can be cached.
+
+        A relative after_date like "1 week" moves with the clock, so its
+        results would be keyed by a date no later search asks for again.
+        """
+        if query.after_date is None or isinstance(query.after_date, datetime):
+            return True
+        try:
+            datetime.fromisoformat(query.after_date)
+        except ValueError:
+            return False
+        return True
+
+    def generation(self) -> Tuple[int, int]:
+        """Current write generation of this project's search index."""
+        return index_generations.get(self.repository.project_id)
+
+    def cache_key(
+        self,
+        kind: str,
+        query: SearchQuery,
+        limit: int,
+        offset: int,
+        after_date: Optional[datetime] = None,
+        cursor: Optional[SearchCursor] = None,
+    ) -> Hashable:
+        """Key of a search in the result cache.
+
+        Args:
+            kind: What is cached, so callers can cache derived results next to the rows
+            after_date: The query's after_date, parsed
+            cursor: Position the search continues from
+        """
+        return (
+            kind,
+            self.repository.project_id,
+            query.text.strip() if query.text else None,
+            query.permalink,
+            query.permalink_match,
+            query.title,
+            tuple(query.types or ()),
+            tuple(item_type.value for item_type in query.entity_types or ()),
+            after_date.isoformat() if after_date else query.after_date,
+            tuple(query.tags or ()),
+            query.snippet_tokens,
+            query.highlight,
+            limit,
+            offset,
+            cursor,
+        )
+
     @staticmethod
     def _generate_variants(text: str) -> Set[str]:
-        """Generate text variants for better fuzzy matching.
+        """Generate text variants for better matching.
 
         Creates variations of the text to improve match chances:
         - Original form
         - Lowercase form
         - Path segments (for permalinks)
         - Common word boundaries
+
+        Substring and fuzzy matches come from the trigram index (search_fuzzy)
+        instead of trigrams stored here.
         """
         variants = {text, text.lower()}
 
@@ -113,9 +300,6 @@ class SearchService:
         # Add word boundaries
         variants.update(w.strip() for w in text.lower().split() if w.strip())
 
-        # Add trigrams for fuzzy matching
-        variants.update(text[i : i + 3].lower() for i in range(len(text) - 2))
-
         return variants
 
     def _extract_entity_tags(self, entity: Entity) -> List[str]:
@@ -154,22 +338,29 @@ class SearchService:
         self,
         entity: Entity,
         background_tasks: Optional[BackgroundTasks] = None,
+        content: Optional[str] = None,
     ) -> None:
+        """Index an entity.
+
+        Args:
+            entity: Entity to index
+            background_tasks: Run indexing as a background task if provided
+            content: Markdown content without frontmatter, if the caller already has it.
+                Read from the entity's file if omitted.
+        """
         if background_tasks:
-            background_tasks.add_task(self.index_entity_data, entity)
+            background_tasks.add_task(self.index_entity_data, entity, content)
         else:
-            await self.index_entity_data(entity)
+            await self.index_entity_data(entity, content)
 
     async def index_entity_data(
         self,
         entity: Entity,
+        content: Optional[str] = None,
     ) -> None:
-        # delete all search index data associated with entity
-        await self.repository.delete_by_entity_id(entity_id=entity.id)
-
-        # reindex
+        # replaces all search index data associated with entity
         await self.index_entity_markdown(
-            entity
+            entity, content
         ) if entity.is_markdown else await self.index_entity_file(entity)
 
     async def index_entity_file(
@@ -177,7 +368,10 @@ class SearchService:
         entity: Entity,
     ) -> None:
         # Index entity file with no content
-        await self.repository.index_item(
+        await self.repository.index_items(self._file_rows(entity), entity_id=entity.id)
+
+    def _file_rows(self, entity: Entity) -> List[SearchIndexRow]:
+        return [
             SearchIndexRow(
                 id=entity.id,
                 entity_id=entity.id,
@@ -191,11 +385,12 @@ class SearchService:
                 updated_at=entity.updated_at,
                 project_id=entity.project_id,
             )
-        )
+        ]
 
     async def index_entity_markdown(
         self,
         entity: Entity,
+        content: Optional[str] = None,
     ) -> None:
         """Index an entity and all its observations and relations.
 
@@ -218,16 +413,23 @@ class SearchService:
         Each type gets its own row in the search index with appropriate metadata.
         The project_id is automatically added by the repository when indexing.
         """
+        if content is None:
+            content = await self.file_service.read_entity_content(entity)
+
+        # Entity, observation and relation rows replace the entity's previous rows
+        # in one transaction: one delete by entity_id, then one executemany insert
+        await self.repository.index_items(
+            self._markdown_rows(entity, content), entity_id=entity.id
+        )
 
-        content_stems = []
-        content_snippet = ""
-        title_variants = self._generate_variants(entity.title)
-        content_stems.extend(title_variants)
+    def _markdown_rows(self, entity: Entity, content: str) -> List[SearchIndexRow]:
+        """Rows of an entity, its observations and its outgoing relations.
 
-        content = await self.file_service.read_entity_content(entity)
-        if content:
-            content_stems.append(content)
-            content_snippet = f"{content[:250]}"
+        The note's text is stored whole in content_snippet, searches match it
+        and cut their snippets from it. content_stems holds the variants of
+        title and paths and the tags, which match but never show in a snippet.
+        """
+        content_stems = list(self._generate_variants(entity.title))
 
         if entity.permalink:
             content_stems.extend(self._generate_variants(entity.permalink))
@@ -241,19 +443,22 @@ class SearchService:
 
         entity_content_stems = "\n".join(p for p in content_stems if p and p.strip())
 
+        rows = []
+
         # Index entity
-        await self.repository.index_item(
+        rows.append(
             SearchIndexRow(
                 id=entity.id,
                 type=SearchItemType.ENTITY.value,
                 title=entity.title,
                 content_stems=entity_content_stems,
-                content_snippet=content_snippet,
+                content_snippet=content,
                 permalink=entity.permalink,
                 file_path=entity.file_path,
                 entity_id=entity.id,
                 metadata={
                     "entity_type": entity.entity_type,
+                    "tags": entity_tags,
                 },
                 created_at=entity.created_at,
                 updated_at=entity.updated_at,
@@ -264,10 +469,9 @@ class SearchService:
         # Index each observation with permalink
         for obs in entity.observations:
             # Index with parent entity's file path since that's where it's defined
-            obs_content_stems = "\n".join(
-                p for p in self._generate_variants(obs.content) if p and p.strip()
-            )
-            await self.repository.index_item(
+            obs_variants = self._generate_variants(obs.content) - {obs.content}
+            obs_content_stems = "\n".join(p for p in sorted(obs_variants) if p and p.strip())
+            rows.append(
                 SearchIndexRow(
                     id=obs.id,
                     type=SearchItemType.OBSERVATION.value,
@@ -299,7 +503,7 @@ class SearchService:
             rel_content_stems = "\n".join(
                 p for p in self._generate_variants(relation_title) if p and p.strip()
             )
-            await self.repository.index_item(
+            rows.append(
                 SearchIndexRow(
                     id=rel.id,
                     title=relation_title,
@@ -317,6 +521,8 @@ class SearchService:
                 )
             )
 
+        return rows
+
     async def delete_by_permalink(self, permalink: str):
         """Delete an item from the search index."""
         await self.repository.delete_by_permalink(permalink)
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 
 class SyncStatus(Enum):
@@ -34,6 +34,10 @@ class SyncStatusTracker:
     def __init__(self):
         self._project_statuses: Dict[str, ProjectSyncStatus] = {}
         self._global_status: SyncStatus = SyncStatus.IDLE
+        # projects that serve queries while they sync
+        self._background: Set[str] = set()
+        # search index rebuilds, apart from syncs: search keeps working during them
+        self._reindex_statuses: Dict[str, ProjectSyncStatus] = {}
 
     def start_project_sync(self, project_name: str, files_total: int = 0) -> None:
         """Start tracking sync for a project."""
@@ -99,6 +103,49 @@ class SyncStatusTracker:
             )
             self._update_global_status()
 
+    def start_background_sync(self, project_name: str) -> None:
+        """Let a project serve queries while it syncs (see SyncScheduler)."""
+        self._background.add(project_name)
+
+    def end_background_sync(self, project_name: str) -> None:
+        """Stop treating a project's sync as a background sync."""
+        self._background.discard(project_name)
+
+    def start_reindex(self, project_name: str, entities_total: int = 0) -> None:
+        """Start tracking a rebuild of a project's search index.
+
+        Rebuilds don't count towards the global status or readiness, the old
+        index serves searches until the new one replaces it.
+        """
+        self._reindex_statuses[project_name] = ProjectSyncStatus(
+            project_name=project_name,
+            status=SyncStatus.SYNCING,
+            message="Rebuilding search index",
+            files_total=entities_total,
+            files_processed=0,
+        )
+
+    def update_reindex(self, project_name: str, entities_processed: int) -> None:
+        """Update how many entities a search index rebuild has indexed."""
+        if project_name in self._reindex_statuses:
+            self._reindex_statuses[project_name].files_processed = entities_processed
+
+    def complete_reindex(self, project_name: str) -> None:
+        """Mark a search index rebuild as completed."""
+        if project_name in self._reindex_statuses:
+            self._reindex_statuses[project_name].status = SyncStatus.COMPLETED
+            self._reindex_statuses[project_name].message = "Search index rebuilt"
+
+    def fail_reindex(self, project_name: str, error: str) -> None:
+        """Mark a search index rebuild as failed, the old index stays in use."""
+        if project_name in self._reindex_statuses:
+            self._reindex_statuses[project_name].status = SyncStatus.FAILED
+            self._reindex_statuses[project_name].error = error
+
+    def get_reindex_status(self, project_name: str) -> Optional[ProjectSyncStatus]:
+        """Get the status of the last search index rebuild of a project."""
+        return self._reindex_statuses.get(project_name)
+
     def _update_global_status(self) -> None:
         """Update global status based on project statuses."""
         if not self._project_statuses:  # pragma: no cover
@@ -128,8 +175,10 @@ class SyncStatusTracker:
 
     @property
     def is_ready(self) -> bool:  # pragma: no cover
-        """Check if system is ready (no sync in progress)."""
-        return self._global_status in (SyncStatus.IDLE, SyncStatus.COMPLETED)
+        """Check if system is ready (no sync in progress, or only background syncs)."""
+        if self._global_status in (SyncStatus.IDLE, SyncStatus.COMPLETED):
+            return True
+        return all(self.is_project_ready(name) for name in self._project_statuses)
 
     def is_project_ready(self, project_name: str) -> bool:
         """Check if a specific project is ready for operations.
@@ -138,14 +187,20 @@ class SyncStatusTracker:
             project_name: Name of the project to check
 
         Returns:
-            True if the project is ready (completed, watching, or not tracked),
-            False if the project is syncing, scanning, or failed
+            True if the project is ready (completed, watching, not tracked, or
+            syncing in the background), False if the project is syncing,
+            scanning, or failed
         """
         project_status = self._project_statuses.get(project_name)
         if not project_status:
             # Project not tracked = ready (likely hasn't been synced yet)
             return True
 
+        if project_status.status == SyncStatus.FAILED:
+            return False
+        if project_name in self._background:
+            return True
+
         return project_status.status in (SyncStatus.COMPLETED, SyncStatus.WATCHING, SyncStatus.IDLE)
 
     def get_project_status(self, project_name: str) -> Optional[ProjectSyncStatus]:
@@ -0,0 +1,303 @@
+"""Benchmarks for syncing a project, run against synthetic vaults.
+
+generate_vault() writes a reproducible vault of markdown notes (with
+frontmatter, observations and wikilinks) and binary attachments. run_benchmark()
+syncs it through a SyncService wired like the CLI, on an in-memory and/or a
+file-backed SQLite database, and times each scenario:
+
+- cold: first sync into an empty database
+- scan: scanning the unchanged vault against the database
+- noop: syncing the unchanged vault
+- modified: syncing after 1% of the notes changed
+- move: syncing after a whole folder was renamed
+- delete: syncing after a whole folder was removed
+
+Results are plain dicts so they can be written as JSON and compared across
+releases (see scripts/benchmark_sync.py).
+"""
+
+import platform
+import random
+import shutil
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from advanced_memory import __version__, db
+from advanced_memory.config import AdvancedMemoryConfig
+from advanced_memory.db import DatabaseType
+from advanced_memory.markdown import EntityParser
+from advanced_memory.markdown.markdown_processor import MarkdownProcessor
+from advanced_memory.models import Base
+from advanced_memory.repository import (
+    EntityRepository,
+    ObservationRepository,
+    ProjectRepository,
+    RelationRepository,
+    SyncJournalRepository,
+)
+from advanced_memory.repository.search_repository import SearchRepository
+from advanced_memory.services import EntityService, FileService
+from advanced_memory.services.link_resolver import LinkResolver
+from advanced_memory.services.search_service import SearchService
+from advanced_memory.sync.sync_service import SyncService
+
+SCENARIOS = ("cold", "scan", "noop", "modified", "move", "delete")
+ENGINES = {"memory": DatabaseType.MEMORY, "file": DatabaseType.FILESYSTEM}
+
+CATEGORIES = ("idea", "fact", "decision", "question", "tech")
+WORDS = (
+    "sync index vault note graph link memory search cache file folder project "
+    "entity relation observation schema query token batch stream journal"
+).split()
+
+
+@dataclass
+class VaultSpec:
+    """Shape of a synthetic vault.
+
+    Attributes:
+        notes: Number of markdown notes
+        observations: Observations per note
+        links: Wikilinks per note (may be fractional, it is an average)
+        frontmatter_fields: Extra frontmatter fields per note
+        attachment_ratio: Binary attachments per note
+        folders: Number of folders the notes are spread over
+        seed: Random seed, the same spec always produces the same vault
+    """
+
+    notes: int = 1000
+    observations: int = 5
+    links: float = 3.0
+    frontmatter_fields: int = 3
+    attachment_ratio: float = 0.05
+    folders: int = 20
+    seed: int = 0
+
+
+def _sentence(rng: random.Random, words: int = 8) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def note_title(index: int) -> str:
+    return f"Note {index:06d}"
+
+
+def note_path(index: int, spec: VaultSpec) -> str:
+    return f"folder-{index % max(spec.folders, 1):03d}/{note_title(index)}.md"
+
+
+def render_note(index: int, spec: VaultSpec, rng: random.Random, revision: int = 0) -> str:
+    """Render the markdown of one synthetic note."""
+    title = note_title(index)
+    lines = [
+        "---",
+        f"title: {title}",
+        "type: note",
+        f"permalink: notes/{title.lower().replace(' ', '-')}",
+    ]
+    lines += [f"field_{field}: {_sentence(rng, 4)}" for field in range(spec.frontmatter_fields)]
+    lines += ["---", "", f"# {title}", "", _sentence(rng, 30), "", "## Observations"]
+    lines += [
+        f"- [{rng.choice(CATEGORIES)}] {_sentence(rng)} #{rng.choice(WORDS)}"
+        for _ in range(spec.observations)
+    ]
+    if revision:
+        lines.append(f"- [note] revision {revision}")
+
+    link_count = int(spec.links) + (rng.random() < spec.links % 1)
+    if link_count:
+        lines += ["", "## Relations"]
+        lines += [
+            f"- relates_to [[{note_title(rng.randrange(spec.notes))}]]" for _ in range(link_count)
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def generate_vault(directory: Path, spec: VaultSpec) -> List[str]:
+    """Write a synthetic vault to directory.
+
+    Returns:
+        Paths of the generated notes, relative to directory
+    """
+    rng = random.Random(spec.seed)
+    paths = []
+    for index in range(spec.notes):
+        path = note_path(index, spec)
+        target = directory / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(render_note(index, spec, rng), encoding="utf-8")
+        paths.append(path)
+
+        if rng.random() < spec.attachment_ratio:
+            attachment = target.parent / f"attachment-{index:06d}.png"
+            attachment.write_bytes(rng.randbytes(rng.randint(1024, 16 * 1024)))
+    return paths
+
+
+def modify_notes(directory: Path, spec: VaultSpec, fraction: float = 0.01) -> int:
+    """Rewrite a fraction of the notes with an extra observation.
+
+    Returns:
+        Number of notes modified
+    """
+    rng = random.Random(spec.seed + 1)
+    count = max(1, int(spec.notes * fraction))
+    for index in rng.sample(range(spec.notes), min(count, spec.notes)):
+        path = directory / note_path(index, spec)
+        path.write_text(render_note(index, spec, rng, revision=1), encoding="utf-8")
+    return count
+
+
+async def create_sync_service(
+    project_path: Path,
+    session_maker,
+    app_config: AdvancedMemoryConfig,
+) -> SyncService:
+    """Create a project for project_path and a SyncService for it."""
+    project = await ProjectRepository(session_maker).create(
+        {"name": "benchmark", "path": str(project_path), "is_active": True, "is_default": True}
+    )
+
+    entity_parser = EntityParser(project_path)
+    markdown_processor = MarkdownProcessor(entity_parser)
+    file_service = FileService(project_path, markdown_processor)
+
+    entity_repository = EntityRepository(session_maker, project_id=project.id)
+    observation_repository = ObservationRepository(session_maker, project_id=project.id)
+    relation_repository = RelationRepository(session_maker, project_id=project.id)
+    search_repository = SearchRepository(session_maker, project_id=project.id)
+    journal_repository = SyncJournalRepository(session_maker, project_id=project.id)
+
+    search_service = SearchService(search_repository, entity_repository, file_service)
+    await search_service.init_search_index()
+    link_resolver = LinkResolver(entity_repository, search_service)
+
+    entity_service = EntityService(
+        entity_parser,
+        entity_repository,
+        observation_repository,
+        relation_repository,
+        file_service,
+        link_resolver,
+    )
+
+    return SyncService(
+        app_config=app_config,
+        entity_service=entity_service,
+        entity_parser=entity_parser,
+        entity_repository=entity_repository,
+        relation_repository=relation_repository,
+        search_service=search_service,
+        file_service=file_service,
+        journal_repository=journal_repository,
+    )
+
+
+def _result(scenario: str, engine: str, seconds: float, report=None) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"scenario": scenario, "engine": engine, "seconds": round(seconds, 4)}
+    if report is not None:
+        result.update(
+            changes=report.total,
+            new=len(report.new),
+            modified=len(report.modified),
+            deleted=len(report.deleted),
+            moves=len(report.moves),
+        )
+    return result
+
+
+async def run_scenarios(
+    project_path: Path,
+    sync_service: SyncService,
+    spec: VaultSpec,
+    engine: str,
+    scenarios: Sequence[str] = SCENARIOS,
+) -> List[Dict[str, Any]]:
+    """Run the scenarios in order against a generated vault.
+
+    The vault must not have been synced yet. Each scenario starts from the
+    state the previous ones left, cold sync always runs first.
+    """
+    results = []
+
+    async def timed_sync(scenario: str) -> None:
+        start = time.perf_counter()
+        report = await sync_service.sync(project_path, project_name="benchmark")
+        results.append(_result(scenario, engine, time.perf_counter() - start, report))
+
+    await timed_sync("cold")
+
+    if "scan" in scenarios:
+        start = time.perf_counter()
+        report = await sync_service.scan(project_path)
+        results.append(_result("scan", engine, time.perf_counter() - start, report))
+
+    if "noop" in scenarios:
+        await timed_sync("noop")
+
+    if "modified" in scenarios:
+        modify_notes(project_path, spec)
+        await timed_sync("modified")
+
+    folders = sorted(path for path in project_path.iterdir() if path.is_dir())
+    if "move" in scenarios and folders:
+        folders[0].rename(project_path / f"moved-{folders[0].name}")
+        await timed_sync("move")
+
+    if "delete" in scenarios and len(folders) > 1:
+        shutil.rmtree(folders[-1])
+        await timed_sync("delete")
+
+    return [result for result in results if result["scenario"] in scenarios]
+
+
+async def run_benchmark(
+    work_dir: Path,
+    spec: Optional[VaultSpec] = None,
+    engines: Sequence[str] = tuple(ENGINES),
+    scenarios: Sequence[str] = SCENARIOS,
+    app_config: Optional[AdvancedMemoryConfig] = None,
+) -> Dict[str, Any]:
+    """Generate a vault per engine in work_dir and time the scenarios.
+
+    Returns:
+        Machine-readable results: environment, vault spec and one entry per
+        scenario and engine
+    """
+    spec = spec or VaultSpec()
+    unknown = (set(scenarios) - set(SCENARIOS)) | (set(engines) - set(ENGINES))
+    if unknown:
+        raise ValueError(f"Unknown scenarios or engines: {sorted(unknown)}")
+
+    results: List[Dict[str, Any]] = []
+    for engine in engines:
+        engine_dir = work_dir / engine
+        if engine_dir.exists():
+            shutil.rmtree(engine_dir)
+        project_path = engine_dir / "vault"
+        project_path.mkdir(parents=True)
+        generate_vault(project_path, spec)
+
+        config = app_config or AdvancedMemoryConfig(
+            env="test", projects={"benchmark": str(project_path)}, default_project="benchmark"
+        )
+        async with db.engine_session_factory(
+            engine_dir / "benchmark.db", ENGINES[engine]
+        ) as (db_engine, session_maker):
+            async with db_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            sync_service = await create_sync_service(project_path, session_maker, config)
+            results += await run_scenarios(project_path, sync_service, spec, engine, scenarios)
+
+    return {
+        "version": __version__,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "spec": asdict(spec),
+        "results": results,
+    }
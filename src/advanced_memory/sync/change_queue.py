@@ -0,0 +1,104 @@
+"""Queue of file changes waiting to be synced by the watch service."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+
+from watchfiles import Change
+from watchfiles.main import FileChange
+
+
+class ChangeQueue:
+    """Pending changes of one project, coalesced per path.
+
+    Only the latest state of each path is kept, so a file saved ten times
+    while a batch is being synced is synced once. An added file that is then
+    modified stays added, since it is still new to the database.
+
+    The queue is bounded: when more than max_size paths are pending it drops
+    them and asks for a full scan instead, which is cheaper than syncing a
+    flood of individual events (a git checkout, an unzip).
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._changes: "OrderedDict[str, Change]" = OrderedDict()
+        self._full_scan = False
+        # monotonic time the oldest pending change was queued
+        self._since: Optional[float] = None
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    @property
+    def needs_full_scan(self) -> bool:
+        return self._full_scan
+
+    @property
+    def lag(self) -> float:
+        """Seconds the oldest pending change has been waiting."""
+        return time.monotonic() - self._since if self._since is not None else 0.0
+
+    def put(self, changes: Set[FileChange]) -> None:
+        """Queue changes, collapsing them with what is pending for the same paths."""
+        if not changes:
+            return
+        if self._since is None:
+            self._since = time.monotonic()
+
+        if not self._full_scan:
+            for change, path in changes:
+                previous = self._changes.pop(path, None)
+                if previous == Change.added and change == Change.modified:
+                    change = Change.added
+                self._changes[path] = change
+
+            if len(self._changes) > self.max_size:
+                # a full scan picks up everything that was pending
+                self._changes.clear()
+                self._full_scan = True
+        self._ready.set()
+
+    def request_full_scan(self) -> None:
+        """Ask for a full scan, e.g. when changes may have been missed."""
+        self._changes.clear()
+        self._full_scan = True
+        if self._since is None:
+            self._since = time.monotonic()
+        self._ready.set()
+
+    def take(self) -> Tuple[Set[FileChange], bool]:
+        """Take everything pending.
+
+        Returns:
+            (changes, full_scan): the coalesced changes, and whether a full scan
+            should be run instead of syncing them
+        """
+        changes = {(change, path) for path, change in self._changes.items()}
+        full_scan = self._full_scan
+        self._changes.clear()
+        self._full_scan = False
+        self._since = None
+        self._ready.clear()
+        return changes, full_scan
+
+    async def wait(self) -> bool:
+        """Wait until changes are pending.
+
+        Returns:
+            False once the queue is closed and drained
+        """
+        while not (self._changes or self._full_scan):
+            if self._closed:
+                return False
+            await self._ready.wait()
+            self._ready.clear()
+        return True
+
+    def close(self) -> None:
+        """Stop waiting for changes, pending ones can still be taken."""
+        self._closed = True
+        self._ready.set()
@@ -0,0 +1,137 @@
+"""Single-read file pipeline for sync.
+
+A SyncFile carries what has already been learned about a file (decoded text,
+checksum, parsed EntityMarkdown) from the scan through parsing, the database
+write and search indexing, so each file is read from disk and hashed once per
+sync instead of once per stage.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from advanced_memory.file_utils import FileStat, compute_checksum_sync
+from advanced_memory.markdown.entity_parser import EntityParser
+from advanced_memory.markdown.schemas import EntityMarkdown
+
+# Upper bound on file text kept in memory between the scan and the sync stage.
+# Files read once the budget is spent are re-read when they are synced.
+SCAN_CONTENT_BUDGET = 64 * 1024 * 1024
+
+
+def decode_text(data: bytes) -> str:
+    """Decode file bytes the same way Path.read_text(encoding="utf-8") does.
+
+    Newlines are normalized so checksums match the ones computed from read_text().
+    """
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+class ContentBudget:
+    """Thread-safe byte budget for file text retained between pipeline stages."""
+
+    def __init__(self, limit: int = SCAN_CONTENT_BUDGET):
+        self.remaining = limit
+        self._lock = threading.Lock()
+
+    def take(self, size: int) -> bool:
+        with self._lock:
+            if size > self.remaining:
+                return False
+            self.remaining -= size
+            return True
+
+
+@dataclass
+class SyncFile:
+    """A file moving through the sync pipeline: scan -> parse -> db -> index.
+
+    Attributes:
+        path: Path relative to the project directory
+        checksum: Checksum of the current file content
+        is_markdown: Whether the file is synced as markdown
+        text: Decoded markdown text, None if not kept in memory (or not markdown)
+        markdown: Parsed markdown, set once the file has been parsed
+        stat: Stat of the file taken when it was read, so it always matches checksum
+    """
+
+    path: str
+    checksum: str
+    is_markdown: bool
+    text: Optional[str] = None
+    markdown: Optional[EntityMarkdown] = None
+    stat: Optional[FileStat] = None
+
+    @classmethod
+    def read(
+        cls,
+        base_path: Path,
+        path: str,
+        is_markdown: bool,
+        budget: Optional[ContentBudget] = None,
+    ) -> "SyncFile":
+        """Read and hash a file once.
+
+        Markdown text is kept on the SyncFile for the later stages unless a budget
+        is given and exhausted. Non-markdown files only need their checksum.
+        """
+        with open(base_path / path, "rb") as f:
+            # stat before reading: a write racing with the read shows up as a stat change
+            stat = FileStat.from_stat(os.fstat(f.fileno()))
+            data = f.read()
+
+        if not is_markdown:
+            return cls(
+                path=path, checksum=compute_checksum_sync(data), is_markdown=False, stat=stat
+            )
+
+        text = decode_text(data)
+        keep = budget is None or budget.take(len(data))
+        return cls(
+            path=path,
+            checksum=compute_checksum_sync(text),
+            is_markdown=True,
+            text=text if keep else None,
+            stat=stat,
+        )
+
+    def is_current(self, base_path: Path) -> bool:
+        """Check that the file was not changed since it was read, by its stat."""
+        if self.stat is None:
+            return False
+        try:
+            return FileStat.from_path(base_path / self.path) == self.stat
+        except FileNotFoundError:
+            return False
+
+    def load_text(self, base_path: Path) -> str:
+        """The markdown text, read again from the file if it was not kept."""
+        if self.text is not None:
+            return self.text
+        with open(base_path / self.path, "rb") as f:
+            stat = FileStat.from_stat(os.fstat(f.fileno()))
+            text = decode_text(f.read())
+        self.replace_text(text, stat)
+        return text
+
+    def replace_text(self, text: str, stat: Optional[FileStat] = None) -> None:
+        """Record content written back to the file, e.g. after a frontmatter update."""
+        self.text = text
+        self.checksum = compute_checksum_sync(text)
+        self.stat = stat
+
+
+def parse_sync_file(base_path: Path, path: str, sync_file: Optional[SyncFile]) -> SyncFile:
+    """Parse a markdown file, reading it only if its text was not kept.
+
+    Module level so it can be pickled to a process pool.
+    """
+    if sync_file is None:
+        sync_file = SyncFile.read(base_path, path, is_markdown=True)
+    text = sync_file.load_text(base_path)
+
+    parser = EntityParser(base_path)
+    sync_file.markdown = parser.parse_file_content_sync(parser.get_file_path(path), text)
+    return sync_file
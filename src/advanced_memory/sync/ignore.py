@@ -0,0 +1,275 @@
+"""Decide which files of a project are synced and watched.
+
+Hidden files and directories and a set of common build/cache directories are
+always ignored. On top of that, .gitignore and .memoryignore files in the
+project (at any level) are honored with gitignore semantics: globs, ``**``,
+anchored patterns, directory-only patterns and ``!`` negation.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Common directories to ignore during file scanning, watching and sync
+IGNORE_PATTERNS = frozenset(
+    {
+        # Node.js
+        "node_modules",
+        # Build outputs
+        "dist", "build", "target", "out", ".next", ".nuxt",
+        # Python
+        "__pycache__", ".pytest_cache", ".tox", "venv", ".venv",
+        # Other package managers / build tools
+        "vendor", ".gradle", ".cargo", "coverage",
+        # IDE and editor files
+        ".vscode", ".idea",
+        # OS files
+        ".DS_Store", "Thumbs.db",
+    }
+)  # fmt: skip
+
+# Files with gitignore-style patterns, read in this order in every directory
+IGNORE_FILES = (".gitignore", ".memoryignore")
+
+
+def is_ignored_name(name: str) -> bool:
+    """Check the rules that apply to a file or directory name anywhere."""
+    return name.startswith(".") or name in IGNORE_PATTERNS
+
+
+@dataclass(frozen=True, slots=True)
+class IgnoreRule:
+    """A compiled line of an ignore file."""
+
+    # directory of the ignore file, relative to the project root ("" for the root)
+    base: str
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1 :]
+        return self.regex.match(rel_path) is not None
+
+
+def translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression body."""
+    i, n = 0, len(pattern)
+    out = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                at_start = i == 0 or pattern[i - 1] == "/"
+                if at_start and i + 2 == n:
+                    # trailing /** matches everything inside
+                    out.append(".*")
+                    i += 2
+                    continue
+                if at_start and pattern.startswith("/", i + 2):
+                    # **/ matches zero or more directories
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            # a ] right after the opening bracket (or its negation) is literal
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            end = pattern.find("]", j)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\").replace("[", "\\[")
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                if body.startswith("]") or body.startswith("^]"):
+                    body = body.replace("]", "\\]", 1)
+                out.append(f"[{body}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def compile_rule(line: str, base: str = "") -> Optional[IgnoreRule]:
+    """Compile one line of an ignore file, or None for blanks and comments."""
+    line = line.rstrip("\n\r")
+    if not line.endswith("\\ "):
+        line = line.rstrip()
+    if not line or line.startswith("#"):
+        return None
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    # a slash anywhere but the end anchors the pattern to the ignore file's directory
+    anchored = "/" in line
+    line = line.lstrip("/")
+    if not line:
+        return None
+
+    prefix = "" if anchored else "(?:.*/)?"
+    regex = re.compile(f"{prefix}{translate_glob(line)}\\Z")
+    return IgnoreRule(base=base, regex=regex, negate=negate, dir_only=dir_only)
+
+
+def parse_ignore_file(text: str, base: str = "") -> List[IgnoreRule]:
+    """Compile the lines of an ignore file found in the directory base."""
+    rules = []
+    for line in text.splitlines():
+        rule = compile_rule(line, base)
+        if rule is not None:
+            rules.append(rule)
+    return rules
+
+
+def _split(rel_path: str) -> Tuple[str, str]:
+    parent, _, name = rel_path.rpartition("/")
+    return parent, name
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+class IgnoreMatcher:
+    """Ignore decisions for one project directory.
+
+    Paths are relative to the project root. The rules in effect in each
+    directory, and whether each directory is ignored, are cached, so checking
+    a path costs a few dict lookups plus the rules for its last component.
+    Call invalidate() when an ignore file changes.
+    """
+
+    def __init__(self, root: Path, ignore_files: Sequence[str] = IGNORE_FILES):
+        self.root = Path(root)
+        self.ignore_files = tuple(ignore_files)
+        # relative dir -> rules from ignore files in it and its parents
+        self._rules: Dict[str, Tuple[IgnoreRule, ...]] = {}
+        # relative dir -> ignored, including by a parent
+        self._ignored_dirs: Dict[str, bool] = {}
+
+    def invalidate(self) -> None:
+        """Forget cached rules and decisions, e.g. after an ignore file changed."""
+        self._rules.clear()
+        self._ignored_dirs.clear()
+
+    def rules_for(
+        self, rel_dir: str, filenames: Optional[Iterable[str]] = None
+    ) -> Tuple[IgnoreRule, ...]:
+        """Rules in effect for entries of a directory.
+
+        Args:
+            rel_dir: Directory relative to the root ("" for the root)
+            filenames: Names in the directory if already listed, saves probing for ignore files
+        """
+        rules = self._rules.get(rel_dir)
+        if rules is not None:
+            return rules
+
+        rules = self.rules_for(_split(rel_dir)[0]) if rel_dir else ()
+        present = set(filenames) if filenames is not None else None
+        for name in self.ignore_files:
+            if present is not None and name not in present:
+                continue
+            try:
+                text = (self.root / rel_dir / name).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            rules += tuple(parse_ignore_file(text, rel_dir))
+
+        self._rules[rel_dir] = rules
+        return rules
+
+    @staticmethod
+    def _match(rel_path: str, is_dir: bool, rules: Tuple[IgnoreRule, ...]) -> bool:
+        # the last matching rule wins
+        for rule in reversed(rules):
+            if rule.matches(rel_path, is_dir):
+                return not rule.negate
+        return False
+
+    def _entry_ignored(self, rel_dir: str, name: str, is_dir: bool) -> bool:
+        """Check an entry of a directory that is itself not ignored."""
+        if is_ignored_name(name):
+            return True
+        rules = self.rules_for(rel_dir)
+        return bool(rules) and self._match(_join(rel_dir, name), is_dir, rules)
+
+    def is_dir_ignored(self, rel_dir: str) -> bool:
+        """Check whether a directory, or any directory above it, is ignored."""
+        if not rel_dir:
+            return False
+        ignored = self._ignored_dirs.get(rel_dir)
+        if ignored is None:
+            parent, name = _split(rel_dir)
+            ignored = self.is_dir_ignored(parent) or self._entry_ignored(parent, name, True)
+            self._ignored_dirs[rel_dir] = ignored
+        return ignored
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Check whether a path relative to the root is ignored."""
+        rel_path = rel_path.replace(os.sep, "/").strip("/")
+        if is_dir:
+            return self.is_dir_ignored(rel_path)
+        parent, name = _split(rel_path)
+        return self.is_dir_ignored(parent) or self._entry_ignored(parent, name, False)
+
+    def walk(self) -> Iterator[Tuple[str, List[str]]]:
+        """Walk the project like os.walk, without descending into ignored directories.
+
+        Yields:
+            (directory path, names of the files in it that are not ignored)
+        """
+        root = str(self.root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            if rel_dir == ".":
+                rel_dir = ""
+            kept_dirs, kept_files = self.filter_dir(rel_dir, dirnames, filenames)
+            # prune ignored subtrees in place
+            dirnames[:] = kept_dirs
+            yield dirpath, kept_files
+
+    def filter_dir(
+        self, rel_dir: str, dirnames: Iterable[str], filenames: Iterable[str]
+    ) -> Tuple[List[str], List[str]]:
+        """Drop the ignored entries of a directory that is itself not ignored.
+
+        Returns:
+            (names of the subdirectories to descend into, names of the files to keep)
+        """
+        filenames = list(filenames)
+        self.rules_for(rel_dir, filenames)
+
+        kept_dirs = []
+        for name in dirnames:
+            ignored = self._entry_ignored(rel_dir, name, True)
+            self._ignored_dirs[_join(rel_dir, name)] = ignored
+            if not ignored:
+                kept_dirs.append(name)
+        kept_files = [name for name in filenames if not self._entry_ignored(rel_dir, name, False)]
+        return kept_dirs, kept_files
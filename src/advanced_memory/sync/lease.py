@@ -0,0 +1,191 @@
+"""Leases that let one process at a time watch and sync a project.
+
+The MCP server, the API and the CLI can all run a watcher on the same projects
+and database. Without coordination each of them scans, hashes and writes the
+same files, and their transactions collide on SQLite's write lock.
+
+A lease is a small JSON file per project directory, shared by every process
+of the user. The process holding it watches and syncs the project and renews
+it (a heartbeat) well before it expires. Other processes leave the project
+alone, serving it read-only from the database; the holder's watcher sees the
+files they write like any other change. When the holder stops, it deletes the
+lease; when it dies, the lease expires and another process takes it over.
+Taking over a stale lease goes through a claim file created with O_EXCL, so
+of the processes finding the same stale lease only one takes it.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from advanced_memory.config import DATA_DIR_NAME
+
+
+def default_lease_dir() -> Path:
+    """Directory of the lease files shared by the processes of the user."""
+    return Path.home() / DATA_DIR_NAME / "leases"
+
+
+@dataclass
+class LeaseRecord:
+    owner: str
+    pid: int
+    host: str
+    expires_at: float  # seconds since the epoch
+
+    def describe(self) -> str:
+        return f"pid {self.pid} on {self.host}"
+
+
+def _pid_alive(pid: int) -> bool:
+    if sys.platform == "win32":  # pragma: no cover
+        # signal 0 would terminate the process on Windows, rely on expiry instead
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # pragma: no cover
+        return True
+    return True
+
+
+class ProjectLease:
+    """The lease on watching and syncing one project directory.
+
+    Args:
+        project_path: Directory of the project, the lease is per resolved path
+        lease_dir: Directory holding the lease files
+        ttl: Seconds a lease stays valid without being renewed
+    """
+
+    def __init__(self, project_path: str, lease_dir: Path, ttl: float):
+        key = hashlib.sha1(os.path.realpath(project_path).encode("utf-8")).hexdigest()[:16]
+        self.path = lease_dir / f"{key}.json"
+        self.ttl = ttl
+        self.host = socket.gethostname()
+        self.owner = f"{self.host}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.held = False
+
+    def read(self) -> Optional[LeaseRecord]:
+        """The current lease, None if nobody holds it."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return LeaseRecord(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError):
+            # being created right now, or garbage: held until it is old enough
+            try:
+                mtime = self.path.stat().st_mtime
+            except OSError:
+                return None
+            return LeaseRecord(owner="", pid=0, host="", expires_at=mtime + self.ttl)
+
+    def is_stale(self, record: LeaseRecord) -> bool:
+        """Whether a lease held by someone else can be taken over."""
+        if record.expires_at < time.time():
+            return True
+        # a process on this machine that is gone won't renew it
+        return record.host == self.host and record.pid > 0 and not _pid_alive(record.pid)
+
+    def _record(self) -> str:
+        record = LeaseRecord(
+            owner=self.owner, pid=os.getpid(), host=self.host, expires_at=time.time() + self.ttl
+        )
+        return json.dumps(asdict(record))
+
+    def _create(self) -> bool:
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self._record())
+        return True
+
+    def _replace(self) -> None:
+        temp_path = self.path.with_name(f"{self.path.stem}.{self.owner.replace(':', '-')}.tmp")
+        temp_path.write_text(self._record(), encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+    def _take_over(self, record: LeaseRecord) -> bool:
+        """Replace a stale lease, unless another process is taking it over too.
+
+        The claim file is named after the stale record, so it is created once
+        per takeover; whoever creates it checks the lease is still that record
+        before replacing it.
+        """
+        digest = hashlib.sha1(f"{record.owner}:{record.expires_at}".encode()).hexdigest()
+        claim_path = self.path.with_name(f"{self.path.stem}.{digest[:16]}.claim")
+        try:
+            fd = os.open(claim_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            # left behind by a process that died taking it over: retried on the next renewal
+            try:
+                if claim_path.stat().st_mtime + self.ttl < time.time():
+                    claim_path.unlink()
+            except OSError:  # pragma: no cover
+                pass
+            return False
+        os.close(fd)
+        try:
+            if self.read() != record:
+                # taken over, renewed or released since we read it
+                return False
+            logger.info(f"Taking over stale watch lease of {record.describe()}")
+            self._replace()
+            return True
+        finally:
+            try:
+                claim_path.unlink()
+            except OSError:  # pragma: no cover
+                pass
+
+    def acquire(self) -> bool:
+        """Take the lease if it is free or stale, or renew it if held.
+
+        Returns:
+            Whether this process holds the lease
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        record = self.read()
+        try:
+            if record is None:
+                if not self._create():
+                    # another process created it first
+                    self.held = False
+                    return False
+            elif record.owner == self.owner:
+                self._replace()
+            elif not self.is_stale(record) or not self._take_over(record):
+                self.held = False
+                return False
+        except OSError as e:
+            logger.warning(f"Could not write watch lease {self.path}: {e}")
+            self.held = False
+            return False
+
+        # written by another process since we read it
+        current = self.read()
+        self.held = current is not None and current.owner == self.owner
+        return self.held
+
+    def release(self) -> None:
+        """Give up the lease, if held."""
+        record = self.read()
+        if record is not None and record.owner == self.owner:
+            try:
+                self.path.unlink()
+            except OSError:  # pragma: no cover
+                pass
+        self.held = False
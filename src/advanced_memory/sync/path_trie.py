@@ -0,0 +1,67 @@
+"""Longest-prefix lookup of the directory a path lives in."""
+
+import os
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Node(Generic[T]):
+    __slots__ = ("children", "root", "value")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node[T]"] = {}
+        self.root: Optional[str] = None
+        self.value: Optional[T] = None
+
+
+def _parts(path: str) -> List[str]:
+    # a normalized absolute path splits into "" (or a drive) followed by its components
+    return os.path.normpath(path).rstrip(os.sep).split(os.sep)
+
+
+class PathTrie(Generic[T]):
+    """Map directories to values and find the innermost directory containing a path.
+
+    Lookups walk the path's components once, so they cost O(path depth)
+    however many directories are registered, and touch no filesystem.
+    """
+
+    def __init__(self):
+        self._root: _Node[T] = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, directory: str, value: T) -> None:
+        """Register a directory, given as an absolute path."""
+        directory = os.path.normpath(directory)
+        node = self._root
+        for part in _parts(directory):
+            node = node.children.setdefault(part, _Node())
+        if node.root is None:
+            self._size += 1
+        node.root = directory
+        node.value = value
+
+    def match(self, path: str) -> Optional[Tuple[str, T]]:
+        """Find the innermost registered directory that contains path.
+
+        The directory itself does not count as contained in itself.
+
+        Returns:
+            (directory, value), or None if no registered directory contains path
+        """
+        parts = _parts(path)
+        found: Optional[Tuple[str, T]] = None
+        node = self._root
+        # the last component can only be the path itself
+        for part in parts[:-1]:
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+            if node.root is not None:
+                found = (node.root, node.value)  # pyright: ignore [reportAssignmentType]
+        return found
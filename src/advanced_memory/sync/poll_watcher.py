@@ -0,0 +1,222 @@
+"""Polling watch backend, for filesystems where native change events are unreliable.
+
+Network mounts (SMB, NFS) and cloud-synced folders often deliver no or partial
+inotify/FSEvents notifications. Instead of relying on them, ManifestPoller
+periodically lists the project with os.scandir and compares each file's size,
+mtime and inode with a manifest of the previous listing. That costs one stat
+per file and no reads, where scan_directory() hashes every file.
+
+The manifest is persisted, so changes made while the watcher was not running
+are reported by its first poll. apoll() yields batches of changes shaped like
+the ones from watchfiles.awatch(): moves show up as a delete and an add in the
+same batch and are paired by the sync.
+"""
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+from watchfiles import Change
+from watchfiles.main import FileChange
+
+from advanced_memory.sync.ignore import IgnoreMatcher
+
+MANIFEST_VERSION = 1
+# directories listed at the same time; listing is I/O bound, more so on network mounts
+SCAN_WORKERS = 8
+
+
+class FileStat(NamedTuple):
+    size: int
+    mtime_ns: int
+    inode: int
+
+
+# path relative to the project root, with "/" separators -> stat
+Manifest = Dict[str, FileStat]
+
+
+def _scan_dir(
+    root: str, rel_dir: str, matcher: Optional[IgnoreMatcher]
+) -> Tuple[Manifest, List[str]]:
+    """List one directory.
+
+    Returns:
+        (stats of the files in it, relative paths of the subdirectories to list)
+    """
+    files: Dict[str, os.DirEntry] = {}
+    dirs: List[str] = []
+    try:
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files[entry.name] = entry
+                except OSError:
+                    continue
+    except OSError:
+        # removed since its parent was listed, or unreadable
+        return {}, []
+
+    if matcher is not None:
+        dirs, kept = matcher.filter_dir(rel_dir, dirs, files)
+    else:
+        kept = list(files)
+
+    prefix = f"{rel_dir}/" if rel_dir else ""
+    stats: Manifest = {}
+    for name in kept:
+        try:
+            st = files[name].stat()
+        except OSError:
+            continue
+        stats[prefix + name] = FileStat(st.st_size, st.st_mtime_ns, st.st_ino)
+    return stats, [prefix + name for name in dirs]
+
+
+def scan_tree(
+    root: str, matcher: Optional[IgnoreMatcher] = None, workers: int = SCAN_WORKERS
+) -> Manifest:
+    """Stat every file under root that is not ignored.
+
+    Directories are listed level by level, the directories of a level in
+    parallel threads.
+    """
+    manifest: Manifest = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        level = [""]
+        while level:
+            next_level: List[str] = []
+            for stats, dirs in pool.map(lambda rel_dir: _scan_dir(root, rel_dir, matcher), level):
+                manifest.update(stats)
+                next_level += dirs
+            level = next_level
+    return manifest
+
+
+def diff_manifests(root: str, old: Manifest, new: Manifest) -> Set[FileChange]:
+    """Changes that turn the old listing into the new one, with absolute paths."""
+
+    def absolute(rel_path: str) -> str:
+        return os.path.join(root, rel_path.replace("/", os.sep))
+
+    changes: Set[FileChange] = set()
+    for rel_path, stat in new.items():
+        previous = old.get(rel_path)
+        if previous is None:
+            changes.add((Change.added, absolute(rel_path)))
+        elif previous != stat:
+            changes.add((Change.modified, absolute(rel_path)))
+    for rel_path in old.keys() - new.keys():
+        changes.add((Change.deleted, absolute(rel_path)))
+    return changes
+
+
+def load_manifest(path: Path) -> Optional[Manifest]:
+    """Read a persisted manifest, None if there is none or it can't be used."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable watch manifest {path}: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return None
+    try:
+        return {rel_path: FileStat(*stat) for rel_path, stat in data["files"].items()}
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_manifest(path: Path, manifest: Manifest) -> None:
+    """Persist a manifest, replacing the previous one atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "files": manifest}, separators=(",", ":")),
+        encoding="utf-8",
+    )
+    os.replace(temp_path, path)
+
+
+class ManifestPoller:
+    """Detect changes in one project directory by diffing stat listings.
+
+    Args:
+        root: Project directory
+        manifest_path: Where the last listing is persisted
+        matcher: Ignore rules of the project, ignored directories are not listed
+    """
+
+    def __init__(
+        self,
+        root: str,
+        manifest_path: Path,
+        matcher: Optional[IgnoreMatcher] = None,
+        workers: int = SCAN_WORKERS,
+    ):
+        self.root = os.path.abspath(root)
+        self.manifest_path = manifest_path
+        self.matcher = matcher
+        self.workers = workers
+        self.manifest: Optional[Manifest] = None
+
+    async def poll(self) -> Set[FileChange]:
+        """List the project and return what changed since the previous poll.
+
+        The first poll compares with the persisted manifest. Without one it only
+        records the current listing and reports nothing.
+        """
+        if self.manifest is None:
+            self.manifest = await asyncio.to_thread(load_manifest, self.manifest_path)
+
+        current = await asyncio.to_thread(scan_tree, self.root, self.matcher, self.workers)
+        if self.manifest is None:
+            changes: Set[FileChange] = set()
+        else:
+            changes = diff_manifests(self.root, self.manifest, current)
+
+        if self.manifest is None or changes:
+            try:
+                await asyncio.to_thread(save_manifest, self.manifest_path, current)
+            except OSError as e:
+                logger.warning(f"Could not save watch manifest {self.manifest_path}: {e}")
+        self.manifest = current
+        return changes
+
+
+async def apoll(
+    pollers: Sequence[ManifestPoller],
+    interval: float,
+    watch_filter: Optional[Callable[[Change, str], bool]] = None,
+    stop_event: Optional[asyncio.Event] = None,
+) -> AsyncIterator[Set[FileChange]]:
+    """Poll the directories every interval seconds, like watchfiles.awatch().
+
+    Polling ends when stop_event is set.
+
+    Yields:
+        The changes of all directories found by one round of polling, when there are any
+    """
+    stop_event = stop_event or asyncio.Event()
+    while not stop_event.is_set():
+        results = await asyncio.gather(*(poller.poll() for poller in pollers))
+        changes = {
+            (change, path)
+            for poller_changes in results
+            for change, path in poller_changes
+            if watch_filter is None or watch_filter(change, path)
+        }
+        if changes:
+            yield changes
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
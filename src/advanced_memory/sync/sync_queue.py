@@ -0,0 +1,83 @@
+"""Queue of the files a running sync still has to write."""
+
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class SyncQueue:
+    """New and modified files of a running sync, in the order they will be synced.
+
+    The sync takes files from the front in chunks. A reader that needs a file
+    before its turn claims it, which removes it from the queue so the reader can
+    sync it right away, or waits for it if the sync has already taken it.
+    """
+
+    def __init__(self, changed: Iterable[Tuple[str, bool]]):
+        # path -> new
+        self._pending: OrderedDict[str, bool] = OrderedDict(changed)
+        # taken or claimed, not written yet
+        self._in_flight: Set[str] = set()
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending) + len(self._in_flight)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._pending or path in self._in_flight
+
+    def paths(self) -> List[str]:
+        """Paths not written yet: waiting in the queue, then taken or claimed."""
+        return [*self._pending, *self._in_flight]
+
+    def take(self, count: int) -> List[Tuple[str, bool]]:
+        """Take up to count files from the front of the queue."""
+        taken = []
+        while self._pending and len(taken) < count:
+            path, new = self._pending.popitem(last=False)
+            self._in_flight.add(path)
+            taken.append((path, new))
+        return taken
+
+    def claim(self, paths: Iterable[str]) -> Tuple[List[Tuple[str, bool]], List[str]]:
+        """Claim files out of turn.
+
+        Returns:
+            Tuple of (files removed from the queue for the caller to sync,
+            paths already taken that the caller should wait() for)
+        """
+        claimed: List[Tuple[str, bool]] = []
+        in_flight: List[str] = []
+        for path in dict.fromkeys(paths):
+            if path in self._pending:
+                claimed.append((path, self._pending.pop(path)))
+                self._in_flight.add(path)
+            elif path in self._in_flight:
+                in_flight.append(path)
+        return claimed, in_flight
+
+    def done(self, paths: Iterable[str]) -> None:
+        """Mark files as written and wake up anyone waiting for them."""
+        for path in paths:
+            self._in_flight.discard(path)
+            for waiter in self._waiters.pop(path, ()):
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def wait(self, paths: Iterable[str]) -> None:
+        """Wait until files that were taken are written."""
+        loop = asyncio.get_running_loop()
+        waiters = []
+        for path in paths:
+            if path in self._in_flight:
+                waiter = loop.create_future()
+                self._waiters.setdefault(path, []).append(waiter)
+                waiters.append(waiter)
+        if waiters:
+            await asyncio.gather(*waiters)
+
+    def close(self) -> None:
+        """Release all waiters, e.g. when the sync stops early."""
+        self._pending.clear()
+        self.done(list(self._in_flight))
+        self.done(list(self._waiters))
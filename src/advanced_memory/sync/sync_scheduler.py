@@ -0,0 +1,112 @@
+"""Background project syncs that readers can ask to sync specific files first."""
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Iterable, Tuple
+
+from loguru import logger
+
+from advanced_memory.services.sync_status_service import sync_status_tracker
+
+if TYPE_CHECKING:  # pragma: no cover
+    from advanced_memory.sync.sync_service import SyncReport, SyncService
+
+
+class SyncScheduler:
+    """Registry of the project syncs running in the background.
+
+    A project sync registered here does not block queries: the project counts
+    as ready while its files are synced, and readers call sync_now() with the
+    files they are about to read so those are synced ahead of the rest.
+
+    The sync may run on another thread's event loop (see the mcp command), so
+    requests are handed over to the loop the sync runs on.
+    """
+
+    def __init__(self):
+        self._syncs: Dict[str, Tuple["SyncService", asyncio.AbstractEventLoop]] = {}
+
+    def is_syncing(self, project_name: str) -> bool:
+        return project_name in self._syncs
+
+    async def sync(
+        self, project_name: str, sync_service: "SyncService", directory: Path
+    ) -> "SyncReport":
+        """Sync a project while serving reads of its pending files on demand."""
+        self._syncs[project_name] = (sync_service, asyncio.get_running_loop())
+        sync_status_tracker.start_background_sync(project_name)
+        try:
+            return await sync_service.sync(directory, project_name=project_name)
+        finally:
+            del self._syncs[project_name]
+            sync_status_tracker.end_background_sync(project_name)
+
+    async def sync_now(
+        self, project_name: str, paths: Iterable[str], timeout: float = 10.0
+    ) -> bool:
+        """Make sure files are synced before they are read, if the project is syncing.
+
+        Gives up after timeout seconds; the file is still synced in the
+        background, the reader just sees the previous state.
+
+        Returns:
+            True if any of the files was synced
+        """
+        paths = list(paths)
+        if not paths:
+            return False
+        return await self._request(
+            project_name, lambda sync_service: sync_service.sync_now(paths), timeout
+        )
+
+    async def sync_identifier(
+        self, project_name: str, identifier: str, timeout: float = 10.0
+    ) -> bool:
+        """Like sync_now(), for the files a path, permalink or title may refer to.
+
+        Returns:
+            True if any of the files was synced
+        """
+        return await self._request(
+            project_name,
+            lambda sync_service: sync_service.sync_identifier(identifier),
+            timeout,
+        )
+
+    async def _request(
+        self,
+        project_name: str,
+        request_for: Callable[["SyncService"], Coroutine[Any, Any, bool]],
+        timeout: float,
+    ) -> bool:
+        running = self._syncs.get(project_name)
+        if running is None:
+            return False
+        sync_service, loop = running
+
+        # shielded, so a reader giving up does not roll back files it claimed
+        if loop is asyncio.get_running_loop():
+            request = asyncio.shield(request_for(sync_service))
+        else:
+            future = asyncio.run_coroutine_threadsafe(request_for(sync_service), loop)
+            request = asyncio.shield(asyncio.wrap_future(future))
+
+        try:
+            return await asyncio.wait_for(request, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out syncing files on demand: project={project_name}")
+        except Exception as e:  # pragma: no cover
+            logger.warning(f"Failed to sync files on demand: project={project_name}: {e}")
+        return False
+
+
+def resource_paths(identifier: str) -> Iterable[str]:
+    """Files a resource identifier may literally name, see SyncService.sync_identifier."""
+    path = identifier.strip().strip("/")
+    if not path or "*" in path:
+        return []
+    return [path] if Path(path).suffix else [path, f"{path}.md"]
+
+
+# Global scheduler instance
+sync_scheduler = SyncScheduler()
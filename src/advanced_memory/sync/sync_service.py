@@ -1,23 +1,47 @@
 """Service for syncing files between filesystem and database."""
 
+import asyncio
 import os
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
 
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
 
+from advanced_memory import db
 from advanced_memory.config import AdvancedMemoryConfig
-from advanced_memory.file_utils import has_frontmatter, parse_frontmatter
+from advanced_memory.file_utils import (
+    FileStat,
+    ParseError,
+    apply_frontmatter_updates,
+    has_frontmatter,
+    parse_frontmatter,
+    write_file_atomic,
+)
 from advanced_memory.markdown import EntityParser
 from advanced_memory.models import Entity
-from advanced_memory.repository import EntityRepository, RelationRepository
+from advanced_memory.repository import (
+    EntityRepository,
+    RelationRepository,
+    SyncJournalRepository,
+)
 from advanced_memory.services import EntityService, FileService
 from advanced_memory.services.search_service import SearchService
 from advanced_memory.services.sync_status_service import sync_status_tracker, SyncStatus
+from advanced_memory.sync.file_pipeline import ContentBudget, SyncFile
+from advanced_memory.sync.ignore import IgnoreMatcher
+from advanced_memory.sync.sync_queue import SyncQueue
+from advanced_memory.sync.sync_scheduler import resource_paths
+from advanced_memory.sync.sync_workers import (
+    PARALLEL_PARSE_THRESHOLD,
+    SyncWorkerPool,
+    resolve_worker_count,
+)
+from advanced_memory.utils import generate_permalink
 
 
 def normalize_file_path(path: str) -> str:
@@ -36,22 +60,6 @@ def normalize_file_path(path: str) -> str:
         normalized = normalized[1:]
     return normalized
 
-# Common directories to ignore during file scanning and sync
-IGNORE_PATTERNS = {
-    # Node.js
-    "node_modules",
-    # Build outputs
-    "dist", "build", "target", "out", ".next", ".nuxt",
-    # Python
-    "__pycache__", ".pytest_cache", ".tox", "venv", ".venv",
-    # Other package managers / build tools
-    "vendor", ".gradle", ".cargo", "coverage",
-    # IDE and editor files
-    ".vscode", ".idea",
-    # OS files
-    ".DS_Store", "Thumbs.db"
-}
-
 
 @dataclass
 class SyncReport:
@@ -64,6 +72,8 @@ class SyncReport:
         deleted: Files that exist in database but not on disk
         moves: Files that have been moved from one location to another
         checksums: Current checksums for files on disk
+        stale_stats: Unchanged files whose recorded stat fingerprint is out of date
+        loaded: Files already read during the scan, reused when syncing new/modified paths
     """
 
     # We keep paths as strings in sets/dicts for easier serialization
@@ -72,12 +82,39 @@ class SyncReport:
     deleted: Set[str] = field(default_factory=set)
     moves: Dict[str, str] = field(default_factory=dict)  # old_path -> new_path
     checksums: Dict[str, str] = field(default_factory=dict)  # path -> checksum
+    stale_stats: Dict[str, FileStat] = field(default_factory=dict)  # path -> stat
+    loaded: Dict[str, SyncFile] = field(default_factory=dict, repr=False)  # path -> file
 
     @property
     def total(self) -> int:
         """Total number of changes."""
         return len(self.new) + len(self.modified) + len(self.deleted) + len(self.moves)
 
+    def merge(self, other: "SyncReport") -> None:
+        """Add the changes of another report, e.g. one resumed from the journal."""
+        self.new |= other.new
+        self.modified |= other.modified
+        self.deleted |= other.deleted
+        self.moves.update(other.moves)
+        self.checksums.update(other.checksums)
+
+
+def journal_entries(report: SyncReport) -> List[Dict[str, Optional[str]]]:
+    """Sync journal rows for the changes in a report."""
+    changes = [("new", path, None) for path in report.new]
+    changes += [("modified", path, None) for path in report.modified]
+    changes += [("deleted", path, None) for path in report.deleted]
+    changes += [("moved", old_path, new_path) for old_path, new_path in report.moves.items()]
+    return [
+        {
+            "action": action,
+            "file_path": path,
+            "new_path": new_path,
+            "checksum": report.checksums.get(new_path or path),
+        }
+        for action, path, new_path in changes
+    ]
+
 
 @dataclass
 class ScanResult:
@@ -92,6 +129,23 @@ class ScanResult:
     # file_path -> error message
     errors: Dict[str, str] = field(default_factory=dict)
 
+    # file_path -> stat fingerprint
+    stats: Dict[str, FileStat] = field(default_factory=dict)
+
+    # number of files that had to be read and hashed
+    hashed: int = 0
+
+    # file_path -> file read during the scan
+    loaded: Dict[str, SyncFile] = field(default_factory=dict, repr=False)
+
+
+@dataclass(slots=True)
+class DbFileState:
+    """File state recorded in the database, used for change detection."""
+
+    checksum: str
+    stat: Optional[FileStat] = None
+
 
 class SyncService:
     """Syncs documents and knowledge files with database."""
@@ -105,6 +159,7 @@ class SyncService:
         relation_repository: RelationRepository,
         search_service: SearchService,
         file_service: FileService,
+        journal_repository: SyncJournalRepository,
     ):
         self.app_config = app_config
         self.entity_service = entity_service
@@ -113,21 +168,139 @@ class SyncService:
         self.relation_repository = relation_repository
         self.search_service = search_service
         self.file_service = file_service
+        self.journal_repository = journal_repository
+
+        # state of a running sync, see sync_now()
+        self.scanning = False
+        self.sync_queue: Optional[SyncQueue] = None
+        # files the running sync read during its scan, and its queued files by
+        # the permalinks and titles their paths give them, see pending_paths()
+        self.sync_loaded: Dict[str, SyncFile] = {}
+        self._pending_by_name: Optional[Dict[str, List[str]]] = None
+        # serializes file writes between the sync, the watcher and readers syncing
+        # files out of turn
+        self.write_lock = asyncio.Lock()
+        # one full sync at a time, see sync()
+        self.sync_lock = asyncio.Lock()
+
+    async def sync(
+        self,
+        directory: Path,
+        project_name: Optional[str] = None,
+        verify_checksums: bool = False,
+    ) -> SyncReport:
+        """Sync all files with database.
 
-    async def sync(self, directory: Path, project_name: Optional[str] = None) -> SyncReport:
-        """Sync all files with database."""
+        The changes found by the scan are journaled before they are applied. If
+        a previous sync was interrupted, its pending changes are applied first,
+        without scanning for them again.
 
-        start_time = time.time()
-        logger.info(f"Sync operation started for directory: {directory}")
+        Args:
+            directory: Project directory to sync
+            project_name: Project name used for progress tracking
+            verify_checksums: Re-hash every file instead of trusting unchanged stats
+        """
 
-        # Start tracking sync for this project if project name provided
-        if project_name:
-            sync_status_tracker.start_project_sync(project_name)
+        # the startup sync and the watcher share a project's sync service, their
+        # full syncs run one after the other
+        async with self.sync_lock:
+            start_time = time.time()
+            logger.info(f"Sync operation started for directory: {directory}")
+
+            # Start tracking sync for this project if project name provided
+            if project_name:
+                sync_status_tracker.start_project_sync(project_name)
+
+            link_resolver = self.entity_service.link_resolver
+            async with SyncWorkerPool(resolve_worker_count(self.app_config.sync_workers)) as workers:
+                # finish what an interrupted sync left pending before looking for new changes
+                resumed = await self.load_journal(directory)
+                if resumed.total:
+                    logger.info(f"Resuming interrupted sync: pending_changes={resumed.total}")
+                    async with link_resolver.indexed():
+                        await self.apply_changes(resumed, workers, project_name)
+
+                # initial paths from db to sync
+                # path -> checksum
+                self.scanning = True
+                try:
+                    report = await self.scan(
+                        directory, verify_checksums=verify_checksums, workers=workers
+                    )
+                finally:
+                    self.scanning = False
+
+                # resolve links from memory while entities change
+                link_index = link_resolver.indexed() if report.total else nullcontext()
+                async with link_index:
+                    if report.total:
+                        await self.journal_repository.start(journal_entries(report))
+                    await self.apply_changes(report, workers, project_name)
+                    await self.resolve_relations()
+
+            # record fresh stats for files that were touched but not changed
+            await self.entity_repository.update_file_stats(report.stale_stats)
+
+            # every change is applied, nothing left to resume
+            if resumed.total or report.total:
+                await self.journal_repository.clear()
 
-        # initial paths from db to sync
-        # path -> checksum
-        report = await self.scan(directory)
+            # Mark sync as completed
+            if project_name:
+                sync_status_tracker.complete_project_sync(project_name)
+
+            report.merge(resumed)
+            duration_ms = int((time.time() - start_time) * 1000)
+            logger.info(
+                f"Sync operation completed: directory={directory}, total_changes={report.total}, duration_ms={duration_ms}"
+            )
+
+            return report
+
+    async def load_journal(self, directory: Path) -> SyncReport:
+        """Rebuild the pending changes of an interrupted sync from the journal.
+
+        Changes to files that no longer exist are dropped, the scan that
+        follows the resumed sync sees those files as they are now.
+        """
+        report = SyncReport()
+        for entry in await self.journal_repository.find_pending():
+            if entry.action == "deleted":
+                report.deleted.add(entry.file_path)
+                continue
+
+            current_path = entry.file_path
+            if entry.action == "moved":
+                if entry.new_path is None:  # pragma: no cover
+                    # moves are always journaled with their destination
+                    continue
+                current_path = entry.new_path
+            if not (Path(directory) / current_path).exists():
+                continue
+
+            if entry.action == "moved":
+                report.moves[entry.file_path] = current_path
+            elif entry.action == "new":
+                report.new.add(entry.file_path)
+            else:
+                report.modified.add(entry.file_path)
+            if entry.checksum:
+                report.checksums[current_path] = entry.checksum
+        return report
 
+    async def apply_changes(
+        self,
+        report: SyncReport,
+        workers: SyncWorkerPool,
+        project_name: Optional[str] = None,
+    ) -> None:
+        """Apply the changes in a report to the database, checkpointing the journal.
+
+        Args:
+            report: Changes found by scan() or loaded from the journal
+            workers: Worker pool to parse files with
+            project_name: Project name used for progress tracking
+        """
         # Update progress with file counts
         if project_name:
             sync_status_tracker.update_project_progress(
@@ -145,8 +318,11 @@ class SyncService:
         )
 
         files_processed = 0
+        batch_size = self.app_config.sync_batch_size
 
-        # sync moves first
+        # sync moves first, a batch per transaction
+        moved: List[str] = []
+        to_move: Dict[str, str] = {}
         for old_path, new_path in report.moves.items():
             # in the case where a file has been deleted and replaced by another file
             # it will show up in the move and modified lists, so handle it in modified
@@ -156,20 +332,41 @@ class SyncService:
                     f"File marked as moved and modified: old_path={old_path}, new_path={new_path}"
                 )
             else:
-                await self.handle_move(old_path, new_path)
-
-            files_processed += 1
-            if project_name:
-                sync_status_tracker.update_project_progress(  # pragma: no cover
-                    project_name=project_name,
-                    status=SyncStatus.SYNCING,
-                    message="Processing moves",
-                    files_processed=files_processed,
-                )
+                to_move[old_path] = new_path
+            moved.append(old_path)
+
+            if len(moved) >= batch_size:
+                async with self.write_lock:
+                    await self.handle_moves(to_move)
+                # moves are idempotent, so they are checkpointed after their batch
+                await self.journal_repository.mark_done("moved", moved)
+                files_processed += len(moved)
+                moved, to_move = [], {}
+                if project_name:
+                    sync_status_tracker.update_project_progress(  # pragma: no cover
+                        project_name=project_name,
+                        status=SyncStatus.SYNCING,
+                        message="Processing moves",
+                        files_processed=files_processed,
+                    )
+        async with self.write_lock:
+            await self.handle_moves(to_move)
+        await self.journal_repository.mark_done("moved", moved)
+        files_processed += len(moved)
 
         # deleted next
+        deleted: List[str] = []
         for path in report.deleted:
-            await self.handle_delete(path)
+            async with self.write_lock:
+                # created again since the scan, and synced by the watcher meanwhile
+                if not (self.file_service.base_path / path).exists():
+                    await self.handle_delete(path)
+
+            deleted.append(path)
+            if len(deleted) >= batch_size:
+                await self.journal_repository.mark_done("deleted", deleted)
+                deleted = []
+
             files_processed += 1
             if project_name:
                 sync_status_tracker.update_project_progress(  # pragma: no cover
@@ -178,51 +375,247 @@ class SyncService:
                     message="Processing deletions",
                     files_processed=files_processed,
                 )
+        await self.journal_repository.mark_done("deleted", deleted)
+
+        # then new and modified, several files per transaction. Readers can
+        # claim queued files through sync_now() to have them synced first.
+        changed = [(path, True) for path in report.new]
+        changed += [(path, False) for path in report.modified]
+        queue = self.sync_queue = SyncQueue(changed)
+        self.sync_loaded, self._pending_by_name = report.loaded, None
+        try:
+            batch: List[Tuple[str, bool, Optional[SyncFile]]] = []
+            async for path, new, loaded in self.iter_parsed(queue, workers, report.loaded):
+                batch.append((path, new, loaded))
+                if len(batch) >= batch_size:
+                    files_processed = await self.sync_batch(batch, project_name, files_processed)
+                    queue.done(path for path, _, _ in batch)
+                    batch = []
+            if batch:
+                await self.sync_batch(batch, project_name, files_processed)
+                queue.done(path for path, _, _ in batch)
+        finally:
+            self.sync_queue = None
+            self.sync_loaded, self._pending_by_name = {}, None
+            queue.close()
+
+    async def sync_now(self, paths: Iterable[str]) -> bool:
+        """Sync files a reader needs now, ahead of the rest of a running sync.
+
+        Files still queued are synced right away, files already taken by the
+        sync are waited for. While the directory is being scanned, and the
+        queue does not exist yet, files that differ from the database are
+        synced directly.
 
-        # then new and modified
-        for path in report.new:
-            await self.sync_file(path, new=True)
-            files_processed += 1
-            if project_name:
-                sync_status_tracker.update_project_progress(
-                    project_name=project_name,
-                    status=SyncStatus.SYNCING,
-                    message="Processing new files",
-                    files_processed=files_processed,
-                )
+        Returns:
+            True if any of the files was synced
+        """
+        queue = self.sync_queue
+        if queue is None:
+            return self.scanning and await self.sync_if_changed(paths)
 
-        for path in report.modified:
-            await self.sync_file(path, new=False)
-            files_processed += 1
-            if project_name:
-                sync_status_tracker.update_project_progress(  # pragma: no cover
-                    project_name=project_name,
-                    status=SyncStatus.SYNCING,
-                    message="Processing modified files",
-                    files_processed=files_processed,
-                )
+        claimed, in_flight = queue.claim(paths)
+        if claimed:
+            logger.debug(f"Syncing files ahead of their turn: {[path for path, _ in claimed]}")
+            try:
+                await self.sync_batch([(path, new, None) for path, new in claimed])
+            finally:
+                queue.done(path for path, _ in claimed)
+        await queue.wait(in_flight)
+        return bool(claimed or in_flight)
+
+    async def sync_if_changed(self, paths: Iterable[str]) -> bool:
+        """Sync files whose checksum differs from the database.
+
+        Returns:
+            True if any of the files was synced
+        """
+        changed = []
+        matcher = IgnoreMatcher(self.file_service.base_path)
+        for path in dict.fromkeys(paths):
+            if matcher.is_ignored(path):
+                continue
+            if not (self.file_service.base_path / path).is_file():
+                continue
+            checksum = await self.file_service.compute_checksum(path)
+            entity = await self.entity_repository.get_by_file_path(path)
+            if entity is None or entity.checksum != checksum:
+                changed.append((path, entity is None, None))
 
-        await self.resolve_relations()
+        if changed:
+            await self.sync_batch(changed)
+        return bool(changed)
+
+    async def sync_identifier(self, identifier: str) -> bool:
+        """Sync the files a resource identifier may refer to, ahead of a running sync.
+
+        The identifier is a path, or the permalink or title of a file. Files
+        the sync has yet to write are matched by pending_paths(), files the
+        database knows already by the link resolver.
+
+        Returns:
+            True if any of the files was synced
+        """
+        paths = list(resource_paths(identifier)) + self.pending_paths(identifier)
+        entity = await self.entity_service.link_resolver.resolve_link(identifier, use_search=False)
+        if entity is not None:
+            paths.append(entity.file_path)
+        return await self.sync_now(paths)
+
+    def pending_paths(self, identifier: str) -> List[str]:
+        """Files the running sync has yet to write that a permalink or title may refer to.
+
+        Files match by the permalink and title their path gives them, or by the
+        ones in their frontmatter if the scan kept their text.
+        """
+        queue = self.sync_queue
+        wanted = identifier.strip().strip("/")
+        if queue is None or not wanted:
+            return []
+
+        # built once per sync, the queue only ever shrinks
+        if self._pending_by_name is None:
+            self._pending_by_name = {}
+            for path in queue.paths():
+                for key in {generate_permalink(path), Path(path).stem}:
+                    self._pending_by_name.setdefault(key, []).append(path)
+
+        matches = [path for path in self._pending_by_name.get(wanted, ()) if path in queue]
+        for path in queue.paths():
+            loaded = self.sync_loaded.get(path)
+            text = loaded.text if loaded is not None else None
+            # cheap containment test first, most files don't mention the name at all
+            if text is None or wanted not in text or not has_frontmatter(text):
+                continue
+            try:
+                frontmatter = parse_frontmatter(text)
+            except ParseError:
+                continue
+            if frontmatter.get("permalink") == wanted or frontmatter.get("title") == wanted:
+                matches.append(path)
+        return matches
+
+    async def sync_batch(
+        self,
+        batch: List[Tuple[str, bool, Optional[SyncFile]]],
+        project_name: Optional[str] = None,
+        files_processed: int = 0,
+    ) -> int:
+        """Sync new/modified files in a single database transaction.
 
-        # Mark sync as completed
+        If any file fails, the whole transaction is rolled back and the batch is
+        synced again one file at a time, so a bad file only affects itself and
+        is reported the usual way.
+
+        Args:
+            batch: (path, new, loaded) tuples as yielded by iter_parsed
+            project_name: Project name used for progress tracking
+            files_processed: Files processed so far in this sync
+
+        Returns:
+            Files processed including this batch
+        """
+        async with self.write_lock:
+            if len(batch) == 1:
+                path, new, loaded = batch[0]
+                await self.sync_file(path, new=new, loaded=loaded)
+                await self.mark_synced(batch)
+            else:
+                try:
+                    async with db.batch_session(self.entity_repository.session_maker):
+                        for path, new, loaded in batch:
+                            await self.sync_file(path, new=new, loaded=loaded, raise_errors=True)
+                        # the checkpoint commits with the batch
+                        await self.mark_synced(batch)
+                except Exception as e:
+                    logger.warning(
+                        f"Batch sync failed, retrying {len(batch)} files individually: {e}"
+                    )
+                    # the batch was rolled back, sync each file in its own transactions
+                    await self.entity_service.link_resolver.refresh_index()
+                    for path, new, loaded in batch:
+                        await self.sync_file(path, new=new, loaded=loaded)
+                    await self.mark_synced(batch)
+
+        files_processed += len(batch)
         if project_name:
-            sync_status_tracker.complete_project_sync(project_name)
+            sync_status_tracker.update_project_progress(
+                project_name=project_name,
+                status=SyncStatus.SYNCING,
+                message="Processing new and modified files",
+                files_processed=files_processed,
+            )
+        return files_processed
 
-        duration_ms = int((time.time() - start_time) * 1000)
-        logger.info(
-            f"Sync operation completed: directory={directory}, total_changes={report.total}, duration_ms={duration_ms}"
+    async def mark_synced(self, batch: List[Tuple[str, bool, Optional[SyncFile]]]) -> None:
+        """Mark the journal entries of synced new/modified files as done."""
+        await self.journal_repository.mark_done("new", [path for path, new, _ in batch if new])
+        await self.journal_repository.mark_done(
+            "modified", [path for path, new, _ in batch if not new]
         )
 
-        return report
+    async def iter_parsed(
+        self,
+        queue: SyncQueue,
+        workers: SyncWorkerPool,
+        loaded: Dict[str, SyncFile],
+    ) -> AsyncIterator[Tuple[str, bool, Optional[SyncFile]]]:
+        """Yield queued files with what is already known about them, in order.
+
+        Files are taken from the queue and parsed in chunks by the worker pool,
+        reusing the text read during the scan. The next chunk is parsed while
+        the caller writes the current one to the database. Files that were not
+        parsed ahead of time are yielded with the SyncFile from the scan (or
+        None if not kept).
+        """
+        chunk_size = max(PARALLEL_PARSE_THRESHOLD, workers.workers * 32)
+
+        def parse(chunk: List[Tuple[str, bool]]) -> asyncio.Future:
+            files = {
+                path: loaded.get(path)
+                for path, _ in chunk
+                if self.file_service.is_markdown(path)
+            }
+            return asyncio.ensure_future(
+                workers.parse_files(self.entity_parser.base_path, files)
+            )
 
-    async def scan(self, directory):
-        """Scan directory for changes compared to database state."""
+        chunk = queue.take(chunk_size)
+        pending = parse(chunk) if chunk else None
+        # pending parses chunk, it is None once the queue is drained
+        while pending is not None:
+            parsed = await pending
+            next_chunk = queue.take(chunk_size)
+            pending = parse(next_chunk) if next_chunk else None
+            for path, new in chunk:
+                yield path, new, parsed.pop(path, None) or loaded.pop(path, None)
+            chunk = next_chunk
+
+    async def scan(
+        self,
+        directory,
+        verify_checksums: bool = False,
+        workers: Optional[SyncWorkerPool] = None,
+    ):
+        """Scan directory for changes compared to database state.
+
+        Args:
+            directory: Directory to scan
+            verify_checksums: Re-hash every file instead of trusting unchanged stats
+            workers: Worker pool to hash files with, created for this scan if omitted
+        """
 
-        db_paths = await self.get_db_file_state()
+        db_state = await self.get_db_file_state()
+        db_paths = {path: state.checksum for path, state in db_state.items()}
         logger.info(f"Scanning directory {directory}. Found {len(db_paths)} db paths")
 
+        # Only hash files whose stat changed, unless asked to verify everything
+        use_stat_fast_path = self.app_config.sync_stat_fast_path and not verify_checksums
+
         # Track potentially moved files by checksum
-        scan_result = await self.scan_directory(directory)
+        scan_result = await self.scan_directory(
+            directory, db_state=db_state if use_stat_fast_path else None, workers=workers
+        )
         report = SyncReport()
 
         # First find potential new files and record checksums
@@ -231,19 +624,29 @@ class SyncService:
             if file_path not in db_paths:
                 report.new.add(file_path)
                 report.checksums[file_path] = checksum
+                if file_path in scan_result.loaded:
+                    report.loaded[file_path] = scan_result.loaded[file_path]
 
         # Now detect moves and deletions
         for db_path, db_checksum in db_paths.items():
+            # file could not be read this time, leave it alone rather than treating it as deleted
+            if db_path in scan_result.errors:
+                continue
+
             local_checksum_for_db_path = scan_result.files.get(db_path)
 
-            # file not modified
+            # file not modified, but its stat may need refreshing so it is not hashed next time
             if db_checksum == local_checksum_for_db_path:
-                pass
+                local_stat = scan_result.stats.get(db_path)
+                if local_stat and local_stat != db_state[db_path].stat:
+                    report.stale_stats[db_path] = local_stat
 
             # if checksums don't match for the same path, its modified
             if local_checksum_for_db_path and db_checksum != local_checksum_for_db_path:
                 report.modified.add(db_path)
                 report.checksums[db_path] = local_checksum_for_db_path
+                if db_path in scan_result.loaded:
+                    report.loaded[db_path] = scan_result.loaded[db_path]
 
             # check if it's moved or deleted
             if not local_checksum_for_db_path:
@@ -255,6 +658,7 @@ class SyncService:
                     # Remove from new files if present
                     if new_path in report.new:
                         report.new.remove(new_path)
+                        report.loaded.pop(new_path, None)
 
                 # deleted
                 else:
@@ -262,26 +666,60 @@ class SyncService:
         logger.info(f"Completed scan for directory {directory}, found {report.total} changes.")
         return report
 
-    async def get_db_file_state(self) -> Dict[str, str]:
-        """Get file_path and checksums from database.
-        Args:
-            db_records: database records
+    async def get_db_file_state(self) -> Dict[str, DbFileState]:
+        """Get file_path, checksums and stat fingerprints from database.
+
+        Reads plain column rows rather than Entity models, so no observations
+        or relations are loaded.
+
         Returns:
-            Dict mapping file paths to FileState
-            :param db_records: the data from the db
+            Dict mapping file paths to DbFileState
+        """
+        db_state: Dict[str, DbFileState] = {}
+        async for r in self.entity_repository.stream_file_states():
+            db_state[r.file_path] = DbFileState(
+                checksum=r.checksum or "",
+                stat=FileStat(size=r.size, mtime_ns=r.mtime_ns, inode=r.inode)
+                if r.size is not None and r.mtime_ns is not None and r.inode is not None
+                else None,
+            )
+        logger.info(f"Found {len(db_state)} db records")
+        return db_state
+
+    def file_stat_columns(self, path: str) -> Dict[str, Optional[int]]:
+        """Get entity column values for the current stat of a file."""
+        return FileStat.from_stat(self.file_service.file_stats(path)).to_columns()
+
+    def load_file(self, path: str, loaded: Optional[SyncFile] = None) -> SyncFile:
+        """Get the pipeline object for a file, reading it only if it was not kept.
+
+        A file written since it was kept (say by the API while the sync ran) is
+        read again, so its old content never overwrites the new.
         """
-        db_records = await self.entity_repository.find_all()
-        logger.info(f"Found {len(db_records)} db records")
-        return {r.file_path: r.checksum or "" for r in db_records}
+        base_path = self.entity_parser.base_path
+        is_markdown = self.file_service.is_markdown(path)
+        if (
+            loaded is not None
+            and (loaded.text is not None or not is_markdown)
+            and loaded.is_current(base_path)
+        ):
+            return loaded
+        return SyncFile.read(base_path, path, is_markdown)
 
     async def sync_file(
-        self, path: str, new: bool = True
+        self,
+        path: str,
+        new: bool = True,
+        loaded: Optional[SyncFile] = None,
+        raise_errors: bool = False,
     ) -> Tuple[Optional[Entity], Optional[str]]:
         """Sync a single file.
 
         Args:
             path: Path to file to sync
             new: Whether this is a new file
+            loaded: File already read (and possibly parsed) earlier in the sync, read here if omitted
+            raise_errors: Raise errors instead of logging them, used by sync_batch
 
         Returns:
             Tuple of (entity, checksum) or (None, None) if sync fails
@@ -291,13 +729,17 @@ class SyncService:
                 f"Syncing file path={path} is_new={new} is_markdown={self.file_service.is_markdown(path)}"
             )
 
-            if self.file_service.is_markdown(path):
-                entity, checksum = await self.sync_markdown_file(path, new)
+            loaded = self.load_file(path, loaded)
+            if loaded.is_markdown:
+                entity, checksum = await self.sync_markdown_file(path, new, loaded=loaded)
             else:
-                entity, checksum = await self.sync_regular_file(path, new)
+                entity, checksum = await self.sync_regular_file(path, new, loaded=loaded)
 
             if entity is not None:
-                await self.search_service.index_entity(entity)
+                self.entity_service.link_resolver.index_entity(entity)
+                # index from the content already in memory instead of reading the file again
+                content = (loaded.markdown.content or "") if loaded.markdown else None
+                await self.search_service.index_entity(entity, content=content)
 
                 logger.debug(
                     f"File sync completed, path={path}, entity_id={entity.id}, checksum={checksum[:8]}"
@@ -305,6 +747,9 @@ class SyncService:
             return entity, checksum
 
         except Exception as e:  # pragma: no cover
+            if raise_errors:
+                raise
+
             error_msg = str(e)
             error_type = type(e).__name__
 
@@ -374,10 +819,7 @@ class SyncService:
             all_files = []
             # Get project path from entity parser's base path
             project_path = self.entity_parser.base_path
-            for root, dirs, files in os.walk(project_path):
-                # Skip ignored directories
-                dirs[:] = [d for d in dirs if d not in IGNORE_PATTERNS]
-
+            for root, files in IgnoreMatcher(Path(project_path)).walk():
                 for file in files:
                     if file.endswith('.md'):
                         rel_path = os.path.relpath(os.path.join(root, file), project_path)
@@ -392,12 +834,18 @@ class SyncService:
 
         return invalid_files
 
-    async def sync_markdown_file(self, path: str, new: bool = True) -> Tuple[Optional[Entity], str]:
+    async def sync_markdown_file(
+        self, path: str, new: bool = True, loaded: Optional[SyncFile] = None
+    ) -> Tuple[Optional[Entity], str]:
         """Sync a markdown file with full processing.
 
+        The file is read at most once: its text, checksum and parsed markdown are
+        carried on the SyncFile, and a permalink update is written from memory.
+
         Args:
             path: Path to markdown file
             new: Whether this is a new file
+            loaded: File already read (and possibly parsed), read here if omitted
 
         Returns:
             Tuple of (entity, checksum)
@@ -406,11 +854,14 @@ class SyncService:
         logger.debug(f"Parsing markdown file, path: {path}, new: {new}")
 
         file_path = self.entity_parser.base_path / path
-        file_content = file_path.read_text(encoding="utf-8")
-        file_contains_frontmatter = has_frontmatter(file_content)
+        loaded = self.load_file(path, loaded)
+        text = loaded.load_text(self.entity_parser.base_path)
+        file_contains_frontmatter = has_frontmatter(text)
 
         # entity markdown will always contain front matter, so it can be used up create/update the entity
-        entity_markdown = await self.entity_parser.parse_file(path)
+        if loaded.markdown is None:
+            loaded.markdown = await self.entity_parser.parse_file_content(file_path, text)
+        entity_markdown = loaded.markdown
 
         # if the file contains frontmatter, resolve a permalink
         if file_contains_frontmatter:
@@ -424,7 +875,9 @@ class SyncService:
                 )
 
                 entity_markdown.frontmatter.metadata["permalink"] = permalink
-                await self.file_service.update_frontmatter(path, {"permalink": permalink})
+                updated_content = apply_frontmatter_updates(text, {"permalink": permalink})
+                await write_file_atomic(file_path, updated_content, record=True)
+                loaded.replace_text(updated_content, FileStat.from_path(file_path))
 
         # if the file is new, create an entity
         if new:
@@ -440,13 +893,14 @@ class SyncService:
         # Update relations and search index
         entity = await self.entity_service.update_entity_relations(path, entity_markdown)
 
-        # After updating relations, we need to compute the checksum again
-        # This is necessary for files with wikilinks to ensure consistent checksums
-        # after relation processing is complete
-        final_checksum = await self.file_service.compute_checksum(path)
+        # The checksum tracks the content as read (or as rewritten with a new permalink)
+        final_checksum = loaded.checksum
 
-        # set checksum
-        await self.entity_repository.update(entity.id, {"checksum": final_checksum})
+        # set checksum and the stat it was computed for
+        stat_columns = loaded.stat.to_columns() if loaded.stat else self.file_stat_columns(path)
+        await self.entity_repository.update(
+            entity.id, {"checksum": final_checksum, **stat_columns}
+        )
 
         logger.debug(
             f"Markdown sync completed: path={path}, entity_id={entity.id}, "
@@ -457,17 +911,26 @@ class SyncService:
         # Return the final checksum to ensure everything is consistent
         return entity, final_checksum
 
-    async def sync_regular_file(self, path: str, new: bool = True) -> Tuple[Optional[Entity], str]:
+    async def sync_regular_file(
+        self, path: str, new: bool = True, loaded: Optional[SyncFile] = None
+    ) -> Tuple[Optional[Entity], str]:
         """Sync a non-markdown file with basic tracking.
 
         Args:
             path: Path to file
             new: Whether this is a new file
+            loaded: File already read and hashed during the scan, hashed here if omitted
 
         Returns:
             Tuple of (entity, checksum)
         """
-        checksum = await self.file_service.compute_checksum(path)
+        if loaded is not None:
+            checksum = loaded.checksum
+            stat_columns = loaded.stat.to_columns() if loaded.stat else self.file_stat_columns(path)
+        else:
+            checksum = await self.file_service.compute_checksum(path)
+            stat_columns = self.file_stat_columns(path)
+
         if new:
             # Generate permalink from path
             await self.entity_service.resolve_permalink(path)
@@ -492,6 +955,7 @@ class SyncService:
                         created_at=created,
                         updated_at=modified,
                         content_type=content_type,
+                        **stat_columns,
                     )
                 )
                 return entity, checksum
@@ -508,7 +972,8 @@ class SyncService:
                         raise ValueError(f"Entity not found after constraint violation: {path}")
 
                     updated = await self.entity_repository.update(
-                        entity.id, {"file_path": path, "checksum": checksum}
+                        entity.id,
+                        {"file_path": path, "checksum": checksum, **stat_columns},
                     )
 
                     if updated is None:  # pragma: no cover
@@ -528,7 +993,12 @@ class SyncService:
             normalized_path = normalize_file_path(path)
             try:
                 updated = await self.entity_repository.update(
-                    entity.id, {"file_path": normalized_path, "checksum": checksum}
+                    entity.id,
+                    {
+                        "file_path": normalized_path,
+                        "checksum": checksum,
+                        **stat_columns,
+                    },
                 )
 
                 if updated is None:  # pragma: no cover
@@ -568,6 +1038,7 @@ class SyncService:
 
             # Delete from db (this cascades to observations/relations)
             await self.entity_service.delete_entity_by_file_path(file_path)
+            self.entity_service.link_resolver.remove_from_index(entity.id)
 
             # Clean up search index
             permalinks = (
@@ -587,6 +1058,30 @@ class SyncService:
                 else:
                     await self.search_service.delete_by_entity_id(entity.id)
 
+    async def handle_moves(self, moves: Dict[str, str]) -> None:
+        """Apply many moves, e.g. the files of a moved directory, in a single transaction.
+
+        If any move fails, the transaction is rolled back and the moves are
+        applied again one at a time. Callers hold write_lock.
+
+        Args:
+            moves: Mapping of old path to new path
+        """
+        if len(moves) <= 1:
+            for old_path, new_path in moves.items():
+                await self.handle_move(old_path, new_path)
+            return
+
+        try:
+            async with db.batch_session(self.entity_repository.session_maker):
+                for old_path, new_path in moves.items():
+                    await self.handle_move(old_path, new_path)
+        except Exception as e:
+            logger.warning(f"Batch move failed, retrying {len(moves)} moves individually: {e}")
+            await self.entity_service.link_resolver.refresh_index()
+            for old_path, new_path in moves.items():
+                await self.handle_move(old_path, new_path)
+
     async def handle_move(self, old_path, new_path):
         logger.debug("Moving entity", old_path=old_path, new_path=new_path)
 
@@ -594,7 +1089,7 @@ class SyncService:
         if entity:
             # Update file_path in all cases (normalized)
             normalized_new_path = normalize_file_path(new_path)
-            updates = {"file_path": normalized_new_path}
+            updates: Dict[str, Any] = {"file_path": normalized_new_path}
 
             # If configured, also update permalink to match new path
             if self.app_config.update_permalinks_on_move and self.file_service.is_markdown(
@@ -605,7 +1100,7 @@ class SyncService:
 
                 # write to file and get new checksum
                 new_checksum = await self.file_service.update_frontmatter(
-                    new_path, {"permalink": new_permalink}
+                    new_path, {"permalink": new_permalink}, record=True
                 )
 
                 updates["permalink"] = new_permalink
@@ -617,6 +1112,9 @@ class SyncService:
                     f"new_checksum={new_checksum}"
                 )
 
+            # the inode usually survives a rename, but re-stat in case the file was rewritten
+            updates.update(self.file_stat_columns(new_path))
+
             try:
                 updated = await self.entity_repository.update(entity.id, updates)
 
@@ -648,61 +1146,75 @@ class SyncService:
                 f"new_path={new_path} "
             )
 
+            self.entity_service.link_resolver.index_entity(updated)
+
             # update search index
             await self.search_service.index_entity(updated)
 
     async def resolve_relations(self):
-        """Try to resolve any unresolved relations"""
+        """Try to resolve any unresolved relations.
+
+        Each distinct target name is resolved once, from the link index, and
+        all resolved relations are updated with a single statement.
+        """
 
-        unresolved_relations = await self.relation_repository.find_unresolved_relations()
+        unresolved_relations = await self.relation_repository.find_unresolved_relation_rows()
 
         logger.info("Resolving forward references", count=len(unresolved_relations))
+        if not unresolved_relations:
+            return
 
-        for relation in unresolved_relations:
-            logger.trace(
-                "Attempting to resolve relation "
-                f"relation_id={relation.id} "
-                f"from_id={relation.from_id} "
-                f"to_name={relation.to_name}"
-            )
+        link_resolver = self.entity_service.link_resolver
+        async with link_resolver.indexed():
+            targets = await link_resolver.resolve_links(r.to_name for r in unresolved_relations)
 
-            resolved_entity = await self.entity_service.link_resolver.resolve_link(relation.to_name)
+        updates = []
+        resolved_ids: Dict[int, None] = {}
+        for relation in unresolved_relations:
+            target = targets[relation.to_name]
 
             # ignore reference to self
-            if resolved_entity and resolved_entity.id != relation.from_id:
+            if target and target.id != relation.from_id:
                 logger.debug(
                     "Resolved forward reference "
                     f"relation_id={relation.id} "
                     f"from_id={relation.from_id} "
                     f"to_name={relation.to_name} "
-                    f"resolved_id={resolved_entity.id} "
-                    f"resolved_title={resolved_entity.title}",
+                    f"resolved_id={target.id} "
+                    f"resolved_title={target.title}",
                 )
-                try:
-                    await self.relation_repository.update(
-                        relation.id,
-                        {
-                            "to_id": resolved_entity.id,
-                            "to_name": resolved_entity.title,
-                        },
-                    )
-                except IntegrityError:  # pragma: no cover
-                    logger.debug(
-                        "Ignoring duplicate relation "
-                        f"relation_id={relation.id} "
-                        f"from_id={relation.from_id} "
-                        f"to_name={relation.to_name}"
-                    )
+                updates.append({"id": relation.id, "to_id": target.id, "to_name": target.title})
+                resolved_ids[target.id] = None
+
+        # duplicates of existing relations are skipped and stay unresolved
+        await self.relation_repository.update_targets(updates)
 
-                # update search index
-                await self.search_service.index_entity(resolved_entity)
+        # update search index
+        for entity in await self.entity_repository.find_by_ids(list(resolved_ids)):
+            await self.search_service.index_entity(entity)
 
-    async def scan_directory(self, directory: Path) -> ScanResult:
+    async def scan_directory(
+        self,
+        directory: Path,
+        db_state: Optional[Dict[str, DbFileState]] = None,
+        workers: Optional[SyncWorkerPool] = None,
+    ) -> ScanResult:
         """
         Scan directory for markdown files and their checksums.
 
+        When db_state is provided, files whose size, mtime and inode match the
+        recorded stat reuse the stored checksum instead of being read and hashed.
+        New files and files whose stat changed are always hashed, so move
+        detection still works.
+
+        Files that need hashing are read and hashed concurrently in the worker
+        pool. Their text is kept on the result (within SCAN_CONTENT_BUDGET) so
+        syncing them later does not read them again.
+
         Args:
             directory: Directory to scan
+            db_state: Optional recorded file state to enable the stat fast path
+            workers: Worker pool to hash files with, created for this scan if omitted
 
         Returns:
             ScanResult containing found files and any errors
@@ -711,29 +1223,66 @@ class SyncService:
 
         logger.debug(f"Scanning directory {directory}")
         result = ScanResult()
+        to_hash: List[str] = []
 
-        for root, dirnames, filenames in os.walk(str(directory)):
-            # Skip dot directories and common ignore patterns in-place
-            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in IGNORE_PATTERNS]
-
+        # ignored directories are pruned, so their files are never listed
+        for root, filenames in IgnoreMatcher(directory).walk():
             for filename in filenames:
-                # Skip dot files and files in ignore patterns
-                if filename.startswith(".") or filename in IGNORE_PATTERNS:
-                    continue
-
                 path = Path(root) / filename
                 rel_path = str(path.relative_to(directory))
-                checksum = await self.file_service.compute_checksum(rel_path)
-                result.files[rel_path] = checksum
-                result.checksums[checksum] = rel_path
 
-                logger.trace(f"Found file, path={rel_path}, checksum={checksum}")
+                try:
+                    stat = FileStat.from_path(path)
+                except OSError as e:  # pragma: no cover
+                    # file vanished between listing and stat
+                    result.errors[rel_path] = str(e)
+                    continue
+                result.stats[rel_path] = stat
+
+                known = db_state.get(rel_path) if db_state else None
+                if known and known.checksum and known.stat == stat:
+                    result.files[rel_path] = known.checksum
+                    result.checksums[known.checksum] = rel_path
+                else:
+                    to_hash.append(rel_path)
+
+        base_path = Path(directory)
+        budget = ContentBudget()
+        if workers is None:
+            async with SyncWorkerPool(
+                resolve_worker_count(self.app_config.sync_workers)
+            ) as scan_workers:
+                loaded = await scan_workers.read_files(
+                    base_path, to_hash, self.file_service.is_markdown, budget
+                )
+        else:
+            loaded = await workers.read_files(
+                base_path, to_hash, self.file_service.is_markdown, budget
+            )
+
+        for rel_path in to_hash:
+            sync_file = loaded[rel_path]
+            if isinstance(sync_file, BaseException):  # pragma: no cover
+                logger.warning(f"Failed to compute checksum, path={rel_path}, error={sync_file}")
+                result.errors[rel_path] = str(sync_file)
+                result.stats.pop(rel_path, None)
+                continue
+
+            checksum = sync_file.checksum
+            result.files[rel_path] = checksum
+            result.checksums[checksum] = rel_path
+            if sync_file.stat is not None:
+                result.stats[rel_path] = sync_file.stat
+            result.loaded[rel_path] = sync_file
+            result.hashed += 1
+            logger.trace(f"Found file, path={rel_path}, checksum={checksum}")
 
         duration_ms = int((time.time() - start_time) * 1000)
         logger.debug(
             f"{directory} scan completed "
             f"directory={str(directory)} "
             f"files_found={len(result.files)} "
+            f"files_hashed={result.hashed} "
             f"duration_ms={duration_ms}"
         )
 
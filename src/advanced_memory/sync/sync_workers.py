@@ -0,0 +1,142 @@
+"""Worker pools used to fan out the CPU and IO heavy stages of a sync.
+
+Reading and hashing run in a thread pool (file reads and hashlib release the GIL), markdown
+parsing runs in a process pool (markdown-it is pure Python). Results are handed
+back to the caller, so all database writes still happen on the single
+SyncService writer path.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from loguru import logger
+
+from advanced_memory.sync.file_pipeline import ContentBudget, SyncFile, parse_sync_file
+
+# Starting worker processes costs more than parsing a handful of files inline
+PARALLEL_PARSE_THRESHOLD = 64
+
+
+def resolve_worker_count(configured: int) -> int:
+    """Translate the sync_workers setting into a worker count (0 means one per CPU)."""
+    if configured > 0:
+        return configured
+    return os.cpu_count() or 1
+
+
+class SyncWorkerPool:
+    """Thread pool for reading/hashing and process pool for markdown parsing.
+
+    The process pool is created lazily, only once there is enough parsing work
+    to pay for starting it. Use as an async context manager so the pools are
+    shut down when the sync finishes.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def parallel(self) -> bool:
+        return self.workers > 1
+
+    async def __aenter__(self) -> "SyncWorkerPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # waiting for the workers to drain would block the event loop
+        await asyncio.to_thread(self.shutdown)
+
+    def _thread_pool(self) -> Executor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="sync-hash"
+            )
+        return self._threads
+
+    def _process_pool(self) -> Executor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.workers)
+        return self._processes
+
+    async def read_files(
+        self,
+        base_path: Path,
+        paths: Iterable[str],
+        is_markdown: Callable[[str], bool],
+        budget: Optional[ContentBudget] = None,
+    ) -> Dict[str, Union[SyncFile, BaseException]]:
+        """Read and hash files concurrently.
+
+        Returns:
+            Dict mapping each path to its SyncFile, or to the exception raised for it
+        """
+        paths = list(paths)
+        if not self.parallel:
+            results: Dict[str, Union[SyncFile, BaseException]] = {}
+            for path in paths:
+                try:
+                    results[path] = SyncFile.read(base_path, path, is_markdown(path), budget)
+                except Exception as e:
+                    results[path] = e
+            return results
+
+        loop = asyncio.get_running_loop()
+        pool = self._thread_pool()
+        files = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, SyncFile.read, base_path, p, is_markdown(p), budget)
+                for p in paths
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(paths, files, strict=True))
+
+    async def parse_files(
+        self, base_path: Path, files: Dict[str, Optional[SyncFile]]
+    ) -> Dict[str, SyncFile]:
+        """Parse markdown files in worker processes.
+
+        Text already read during the scan is sent along, so workers only read
+        files whose text was not kept. Parsing here is best effort: files that
+        fail (or all files, if the pool cannot be used) are left out of the
+        result and the caller parses them inline, which reports errors the usual way.
+
+        Returns:
+            Dict mapping path to a SyncFile with markdown set, for files parsed successfully
+        """
+        if not self.parallel or len(files) < PARALLEL_PARSE_THRESHOLD:
+            return {}
+
+        paths = list(files)
+        loop = asyncio.get_running_loop()
+        try:
+            pool = self._process_pool()
+            parsed = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, parse_sync_file, base_path, p, files[p])
+                    for p in paths
+                ),
+                return_exceptions=True,
+            )
+        except Exception as e:  # pragma: no cover
+            logger.warning(f"Parallel parse unavailable, parsing inline: {e}")
+            return {}
+
+        return {
+            path: sync_file
+            for path, sync_file in zip(paths, parsed, strict=True)
+            if isinstance(sync_file, SyncFile)
+        }
+
+    def shutdown(self) -> None:
+        if self._threads is not None:
+            self._threads.shutdown(wait=True)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=True, cancel_futures=True)
+            self._processes = None
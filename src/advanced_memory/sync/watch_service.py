@@ -2,35 +2,33 @@
 
 import asyncio
 import os
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import AsyncIterator, Deque, Dict, List, Optional, Sequence, Set, Tuple
 
-from advanced_memory.config import AdvancedMemoryConfig, WATCH_STATUS_JSON
+from advanced_memory.config import AdvancedMemoryConfig, DATA_DIR_NAME, WATCH_STATUS_JSON
+from advanced_memory.file_utils import compute_checksum_sync, recent_writes
 from advanced_memory.models import Project
 from advanced_memory.repository import ProjectRepository
+from advanced_memory.sync.change_queue import ChangeQueue
+from advanced_memory.sync.ignore import IGNORE_FILES, IgnoreMatcher, is_ignored_name
+from advanced_memory.sync.lease import ProjectLease, default_lease_dir
+from advanced_memory.sync.path_trie import PathTrie
+from advanced_memory.sync.poll_watcher import ManifestPoller, apoll
+from advanced_memory.sync.sync_service import SyncService
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from rich.console import Console
 from watchfiles import awatch
 from watchfiles.main import FileChange, Change
 
-# Common directories to ignore during file watching and sync
-IGNORE_PATTERNS = {
-    # Node.js
-    "node_modules",
-    # Build outputs
-    "dist", "build", "target", "out", ".next", ".nuxt",
-    # Python
-    "__pycache__", ".pytest_cache", ".tox", "venv", ".venv",
-    # Other package managers / build tools
-    "vendor", ".gradle", ".cargo", "coverage",
-    # IDE and editor files
-    ".vscode", ".idea",
-    # OS files
-    ".DS_Store", "Thumbs.db"
-}
+# Events kept in the watch status
+MAX_RECENT_EVENTS = 100
+
+# Minimum seconds between two writes of the status file
+STATUS_FLUSH_INTERVAL = 1.0
 
 
 class WatchEvent(BaseModel):
@@ -56,8 +54,19 @@ class WatchServiceState(BaseModel):
     # File counts
     synced_files: int = 0
 
-    # Recent activity
-    recent_events: List[WatchEvent] = []  # Use directly with Pydantic model
+    # Change queue
+    queue_depth: int = 0  # files with pending changes, over all projects
+    queue_lag_seconds: float = 0.0  # how long the oldest pending change has waited
+    full_syncs: int = 0  # full syncs run instead of syncing queued changes
+
+    # Projects this process watches, and those another process watches, see ProjectLease
+    owned_projects: List[str] = Field(default_factory=list)
+    read_only_projects: List[str] = Field(default_factory=list)
+
+    # Recent activity, newest first
+    recent_events: Deque[WatchEvent] = Field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_EVENTS)
+    )
 
     def add_event(
         self,
@@ -75,8 +84,8 @@ class WatchServiceState(BaseModel):
             checksum=checksum,
             error=error,
         )
-        self.recent_events.insert(0, event)
-        self.recent_events = self.recent_events[:100]  # Keep last 100
+        # the deque drops the oldest event once full
+        self.recent_events.appendleft(event)
         return event
 
     def record_error(self, error: str):
@@ -85,6 +94,15 @@ class WatchServiceState(BaseModel):
         self.last_error = datetime.now()
 
 
+# State of the watch service running in this process, see get_watch_state()
+_active_state: Optional[WatchServiceState] = None
+
+
+def get_watch_state() -> Optional[WatchServiceState]:
+    """Get the state of the watch service running in this process, if one was started."""
+    return _active_state
+
+
 class WatchService:
     def __init__(
         self,
@@ -95,8 +113,29 @@ class WatchService:
         self.app_config = app_config
         self.project_repository = project_repository
         self.state = WatchServiceState()
+        # project id -> sync service, kept for the lifetime of the watcher and
+        # shared with the startup sync (see initialization.sync_projects)
+        self.sync_services: Dict[int, SyncService] = {}
+        self._sync_services_lock = asyncio.Lock()
+        # project name -> changes waiting to be synced, filled in by run()
+        self.change_queues: Dict[str, ChangeQueue] = {}
+        # caps the projects whose changes are synced at the same time
+        self.sync_limit = asyncio.Semaphore(app_config.watch_concurrency)
+        # project roots and their ignore matchers (by project name), see set_projects()
+        self.project_routes: PathTrie[Project] = PathTrie()
+        self.ignore_matchers: Dict[str, IgnoreMatcher] = {}
         self.status_path = Path.home() / ".basic-memory" / WATCH_STATUS_JSON
         self.status_path.parent.mkdir(parents=True, exist_ok=True)
+        # file listings of the projects, used by the poll backend
+        self.manifest_dir = Path.home() / DATA_DIR_NAME / "watch-manifests"
+        # project name -> lease on watching it, shared with other processes
+        self.lease_dir = default_lease_dir()
+        self.leases: Dict[str, ProjectLease] = {}
+        # set when this process gains or loses a lease, restarts the watcher
+        self.leases_changed = asyncio.Event()
+        # status file writes are throttled, see write_status()
+        self._last_flush = float("-inf")
+        self._pending_flush: Optional[asyncio.Task] = None
 
         # quiet mode for mcp so it doesn't mess up stdout
         self.console = Console(quiet=quiet)
@@ -106,41 +145,58 @@ class WatchService:
 
         projects = await self.project_repository.get_active_projects()
         project_paths = [project.path for project in projects]
+        self.set_projects(projects)
 
         logger.info(
             "Watch service started",
             f"directories={project_paths}",
+            f"backend={self.app_config.watch_backend}",
             f"debounce_ms={self.app_config.sync_delay}",
             f"pid={os.getpid()}",
         )
 
+        global _active_state
+        _active_state = self.state
+
         self.state.running = True
         self.state.start_time = datetime.now()
-        await self.write_status()
+        await self.write_status(force=True)
+
+        # each project syncs its queued changes in its own task, so a slow
+        # batch never holds up the watcher or other projects
+        self.change_queues = {
+            project.name: ChangeQueue(self.app_config.watch_queue_limit) for project in projects
+        }
+        workers = [
+            asyncio.create_task(self.process_queue(project, self.change_queues[project.name]))
+            for project in projects
+        ]
+
+        # only watch the projects no other process is watching
+        await self.acquire_leases(projects)
+        heartbeat = asyncio.create_task(self.hold_leases(projects))
+        workers.append(heartbeat)
 
         try:
-            async for changes in awatch(
-                *project_paths,
-                debounce=self.app_config.sync_delay,
-                watch_filter=self.filter_changes,
-                recursive=True,
-            ):
-                # group changes by project
-                project_changes = defaultdict(list)
-                for change, path in changes:
-                    for project in projects:
-                        if self.is_project_path(project, path):
-                            project_changes[project].append((change, path))
-                            break
-
-                # create coroutines to handle changes
-                change_handlers = [
-                    self.handle_changes(project, changes)  # pyright: ignore
-                    for project, changes in project_changes.items()
-                ]
-
-                # process changes
-                await asyncio.gather(*change_handlers)
+            while True:
+                self.leases_changed.clear()
+                owned = [project for project in projects if self.leases[project.name].held]
+                if not owned:
+                    await self.leases_changed.wait()
+                    continue
+
+                # ends when a lease is gained or lost, to watch the new set of projects
+                async for changes in self.watch(owned, stop_event=self.leases_changed):
+                    # group changes by project
+                    project_changes = defaultdict(set)
+                    for change, path in changes:
+                        route = self.route(path)
+                        if route is not None and self.leases[route[0].name].held:
+                            project_changes[route[0].name].add((change, path))
+
+                    for project_name, changes_for_project in project_changes.items():
+                        self.change_queues[project_name].put(changes_for_project)
+                    self.update_queue_status()
 
         except Exception as e:
             logger.exception("Watch service error", error=str(e))
@@ -150,58 +206,330 @@ class WatchService:
             raise
 
         finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await asyncio.to_thread(self.release_leases)
+
             logger.info(
                 "Watch service stopped",
                 f"runtime_seconds={int((datetime.now() - self.state.start_time).total_seconds())}",
             )
 
             self.state.running = False
+            await self.write_status(force=True)
+
+    def watch(
+        self, projects: Sequence[Project], stop_event: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[Set[FileChange]]:
+        """Batches of changes in the projects, from the configured watch backend.
+
+        Watching ends when stop_event is set.
+        """
+        if self.app_config.watch_backend == "poll":
+            pollers = [
+                ManifestPoller(
+                    project.path,
+                    self.manifest_dir / f"{project.permalink}.json",
+                    self.ignore_matchers[project.name],
+                )
+                for project in projects
+            ]
+            return apoll(
+                pollers,
+                interval=self.app_config.watch_poll_interval,
+                watch_filter=self.filter_changes,
+                stop_event=stop_event,
+            )
+
+        return awatch(
+            *[project.path for project in projects],
+            debounce=self.app_config.sync_delay,
+            watch_filter=self.filter_changes,
+            stop_event=stop_event,
+            recursive=True,
+        )
+
+    async def acquire_leases(self, projects: Sequence[Project]) -> List[Project]:
+        """Take or renew the leases on watching the projects.
+
+        Returns:
+            The projects this process holds the lease of, and should watch and sync
+        """
+        owned = []
+        for project in projects:
+            lease = self.leases.get(project.name)
+            is_new = lease is None
+            if lease is None:
+                lease = ProjectLease(
+                    project.path, self.lease_dir, self.app_config.watch_lease_seconds
+                )
+                self.leases[project.name] = lease
+            was_held = lease.held
+
+            if await asyncio.to_thread(lease.acquire):
+                owned.append(project)
+                if not was_held and not is_new:
+                    logger.info(f"Took over watching project {project.name}")
+            elif was_held or is_new:
+                holder = await asyncio.to_thread(lease.read)
+                logger.info(
+                    f"Project {project.name} is watched by "
+                    f"{holder.describe() if holder else 'another process'}, serving it read-only"
+                )
+
+        self.state.owned_projects = [project.name for project in owned]
+        self.state.read_only_projects = [
+            project.name for project in projects if project not in owned
+        ]
+        return owned
+
+    async def hold_leases(self, projects: Sequence[Project]) -> None:  # pragma: no cover
+        """Renew the held leases and try to take the others, until cancelled."""
+        interval = self.app_config.watch_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            before = set(self.state.owned_projects)
+            after = {project.name for project in await self.acquire_leases(projects)}
+            if after == before:
+                continue
+
+            for name in after - before:
+                # whatever changed while another process watched it is unknown
+                self.change_queues[name].request_full_scan()
+            for name in before - after:
+                logger.warning(f"Lost the lease on watching project {name}")
+                self.change_queues[name].take()
+            self.update_queue_status()
             await self.write_status()
+            self.leases_changed.set()
 
-    def filter_changes(self, change: Change, path: str) -> bool:  # pragma: no cover
-        """Filter to only watch non-hidden files and directories, excluding common build/cache dirs.
+    def release_leases(self) -> None:
+        """Give up the held leases, so other processes take over right away."""
+        for lease in self.leases.values():
+            if lease.held:
+                lease.release()
+
+    def set_projects(self, projects: Sequence[Project]) -> None:
+        """Index the watched projects by root directory, to route changed paths to them.
+
+        Each project is registered under its path both as given and resolved,
+        so event paths can be matched without resolving them.
+        """
+        self.project_routes = PathTrie()
+        self.ignore_matchers = {}
+        for project in projects:
+            self.ignore_matchers[project.name] = IgnoreMatcher(Path(project.path))
+            for root in {os.path.abspath(project.path), os.path.realpath(project.path)}:
+                self.project_routes.add(root, project)
+
+    def route(self, path: str) -> Optional[Tuple[Project, str]]:
+        """Find the innermost watched project containing path.
 
         Returns:
-            True if the file should be watched, False if it should be ignored
+            (project, path relative to the project root), or None
         """
+        match = self.project_routes.match(path)
+        if match is None and len(self.project_routes):
+            # reached through a symlink the project paths don't go through
+            real_path = os.path.realpath(path)
+            if real_path != path:
+                path = real_path
+                match = self.project_routes.match(path)
+        if match is None:
+            return None
+        root, project = match
+        return project, path[len(root) + 1 :]
+
+    @staticmethod
+    def relative_path(project: Project, path: str) -> Optional[str]:
+        """Path of a changed file relative to the project root.
+
+        Like route(), the path is matched against the root both as given and
+        resolved, and resolved itself only if it is under neither.
 
-        # Skip hidden directories and files
-        path_parts = Path(path).parts
-        for part in path_parts:
-            if part.startswith("."):
-                return False
-            
-            # Skip common ignore patterns (node_modules, build dirs, etc.)
-            if part in IGNORE_PATTERNS:
-                return False
+        Returns:
+            The relative path, or None if the file is not in the project
+        """
+        roots = {os.path.abspath(project.path), os.path.realpath(project.path)}
+        for candidate in dict.fromkeys((path, os.path.realpath(path))):
+            for root in roots:
+                if candidate.startswith(root + os.sep):
+                    return candidate[len(root) + 1 :]
+        return None
 
+    def filter_changes(self, change: Change, path: str) -> bool:  # pragma: no cover
+        """Filter out ignored files: hidden files, common build/cache dirs and
+        anything matched by the project's .gitignore/.memoryignore files.
+
+        Returns:
+            True if the file should be watched, False if it should be ignored
+        """
         # Skip temp files used in atomic operations
         if path.endswith(".tmp"):
             return False
 
-        return True
+        route = self.route(path)
+        if route is not None:
+            project, rel_path = route
+            matcher = self.ignore_matchers[project.name]
+            if os.path.basename(rel_path) in IGNORE_FILES:
+                # the rules changed, decide again from the new ones
+                matcher.invalidate()
+                return False
+            return not matcher.is_ignored(rel_path)
+
+        # Outside any known project: skip hidden and common ignored names
+        return not any(is_ignored_name(part) for part in Path(path).parts)
 
-    async def write_status(self):
-        """Write current state to status file"""
-        self.status_path.write_text(WatchServiceState.model_dump_json(self.state, indent=2))
+    async def process_queue(self, project: Project, queue: ChangeQueue) -> None:
+        """Sync a project's queued changes until the queue is closed.
 
-    def is_project_path(self, project: Project, path):
+        Changes that arrive while a batch is being synced wait in the queue and
+        are coalesced into the next batch. When too many are pending, a full
+        sync of the project replaces them.
         """
-        Checks if path is a subdirectory or file within a project
+        while await queue.wait():
+            async with self.sync_limit:
+                changes, full_scan = queue.take()
+                self.update_queue_status()
+                try:
+                    if full_scan:
+                        await self.sync_project(project)
+                    else:
+                        await self.handle_changes(project, changes)
+                except Exception as e:
+                    logger.exception(f"Error syncing changes for project {project.name}: {e}")
+                    self.state.record_error(str(e))
+                    await self.write_status()
+
+    async def sync_project(self, project: Project) -> None:
+        """Fully sync a project, used instead of its queued changes when there are too many
+        or some may have been missed."""
+        logger.info(f"Running a full sync of project {project.name}")
+        sync_service = await self.get_sync_service(project)
+        report = await sync_service.sync(Path(project.path))
+
+        self.state.full_syncs += 1
+        self.state.last_scan = datetime.now()
+        self.state.synced_files += report.total
+        self.state.add_event(path=project.path, action="sync", status="success")
+        self.console.print(f"[blue]↻[/blue] full sync of {project.name}: {report.total} changes")
+        await self.write_status()
+
+    def update_queue_status(self) -> None:
+        """Record the depth and lag of the change queues in the state."""
+        queues = self.change_queues.values()
+        self.state.queue_depth = sum(
+            self.app_config.watch_queue_limit if queue.needs_full_scan else len(queue)
+            for queue in queues
+        )
+        self.state.queue_lag_seconds = round(max((queue.lag for queue in queues), default=0.0), 3)
+
+    async def write_status(self, force: bool = False):
+        """Write current state to the status file, at most once per STATUS_FLUSH_INTERVAL.
+
+        A write that comes too soon after the previous one is done later by a
+        single scheduled flush, which writes whatever the state is by then. The
+        file is written in a thread; in this process the state is also
+        available from get_watch_state() without reading the file.
+
+        Args:
+            force: Write now, e.g. when the service starts or stops
+        """
+        self.update_queue_status()
+        wait = self._last_flush + STATUS_FLUSH_INTERVAL - time.monotonic()
+        if force or wait <= 0:
+            if self._pending_flush is not None:
+                self._pending_flush.cancel()
+                self._pending_flush = None
+            await self.flush_status()
+        elif self._pending_flush is None:
+            self._pending_flush = asyncio.create_task(self._flush_later(wait))
+
+    async def _flush_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._pending_flush = None
+        await self.flush_status()
+
+    async def flush_status(self) -> None:
+        """Write the current state to the status file."""
+        self._last_flush = time.monotonic()
+        data = self.state.model_dump_json()
+        await asyncio.to_thread(self._write_status_file, data)
+
+    def _write_status_file(self, data: str) -> None:
+        # write and rename, so readers never see a partial file
+        temp_path = self.status_path.with_suffix(".tmp")
+        temp_path.write_text(data, encoding="utf-8")
+        temp_path.replace(self.status_path)
+
+    async def get_sync_service(self, project: Project) -> SyncService:
+        """Get the project's sync service, created on first use and kept for later batches.
+
+        Keeping it warm avoids rebuilding repositories and services for every
+        batch of changes, and lets its link index persist between batches.
         """
-        project_path = Path(project.path).resolve()
-        sub_path = Path(path).resolve()
-        return project_path in sub_path.parents
+        # the watcher and the startup sync may ask for a project's service at once
+        async with self._sync_services_lock:
+            sync_service = self.sync_services.get(project.id)
+            if sync_service is None or sync_service.file_service.base_path != Path(project.path):
+                # avoid circular imports
+                from advanced_memory.cli.commands.sync import get_sync_service
+
+                sync_service = await get_sync_service(project)
+                sync_service.entity_service.link_resolver.keep_index = True
+                self.sync_services[project.id] = sync_service
+            return sync_service
+
+    @staticmethod
+    def _unchanged_since_written(written: Dict[FileChange, str]) -> Set[FileChange]:
+        """The changes whose file still has the checksum it was written with."""
+        unchanged = set()
+        for (change, path), checksum in written.items():
+            try:
+                if compute_checksum_sync(Path(path).read_bytes()) == checksum:
+                    unchanged.add((change, path))
+            except OSError:
+                continue
+        return unchanged
 
-    async def handle_changes(self, project: Project, changes: Set[FileChange]) -> None:
-        """Process a batch of file changes"""
-        import time
-        from typing import List, Set
+    async def own_writes(self, changes: Set[FileChange]) -> Set[FileChange]:
+        """The changes caused by this process writing the file's current content.
 
-        # Lazily initialize sync service for project changes
-        from advanced_memory.cli.commands.sync import get_sync_service
+        Such files were synced by whoever wrote them, see file_utils.recent_writes.
+        They are hashed in a thread, so large notes don't stall the event loop.
+        """
+        written = {}
+        for change, path in changes:
+            if change == Change.deleted:
+                continue
+            checksum = recent_writes.get(path)
+            if checksum is not None:
+                written[(change, path)] = checksum
+        if not written:
+            return set()
+        return await asyncio.to_thread(self._unchanged_since_written, written)
 
-        sync_service = await get_sync_service(project)
+    async def handle_changes(self, project: Project, changes: Set[FileChange]) -> None:
+        """Process a batch of file changes"""
+        own_writes = await self.own_writes(changes)
+        if own_writes:
+            logger.debug(f"Ignoring {len(own_writes)} changes caused by our own writes")
+            changes = set(changes) - own_writes
+            if not changes:
+                return
+
+        sync_service = await self.get_sync_service(project)
+        # the startup sync may be applying its changes to the same files
+        async with sync_service.write_lock:
+            async with sync_service.entity_service.link_resolver.indexed():
+                await self.process_changes(project, sync_service, changes)
+
+    async def process_changes(
+        self, project: Project, sync_service: SyncService, changes: Set[FileChange]
+    ) -> None:
+        """Sync a batch of file changes of a project with its sync service"""
         file_service = sync_service.file_service
 
         start_time = time.time()
@@ -216,8 +544,10 @@ class WatchService:
         modifies: List[str] = []
 
         for change, path in changes:
-            # convert to relative path
-            relative_path = str(Path(path).relative_to(directory))
+            relative_path = self.relative_path(project, path)
+            if relative_path is None:
+                logger.warning(f"Skipping change outside project {project.name}, path={path}")
+                continue
 
             # Skip .tmp files - they're temporary and shouldn't be synced
             if relative_path.endswith(".tmp"):
@@ -235,17 +565,27 @@ class WatchService:
         )
 
         # because of our atomic writes on updates, an add may be an existing file
-        for added_path in adds:  # pragma: no cover TODO add test
-            entity = await sync_service.entity_repository.get_by_file_path(added_path)
-            if entity is not None:
-                logger.debug(f"Existing file will be processed as modified, path={added_path}")
-                adds.remove(added_path)
-                modifies.append(added_path)
+        existing = await sync_service.entity_repository.get_file_states(adds)
+        for added_path in existing:  # pragma: no cover TODO add test
+            logger.debug(f"Existing file will be processed as modified, path={added_path}")
+            adds.remove(added_path)
+            modifies.append(added_path)
+
+        # checksums recorded for deleted paths, to recognise them as moves
+        deleted_states = await sync_service.entity_repository.get_file_states(deletes)
+        deleted_by_checksum: Dict[str, List[str]] = defaultdict(list)
+        for deleted_path in deletes:
+            deleted_state = deleted_states.get(deleted_path)
+            # directories and unknown files have no entity and can't be the source of a move
+            if deleted_state is not None and deleted_state.checksum:
+                deleted_by_checksum[deleted_state.checksum].append(deleted_path)
 
         # Track processed files to avoid duplicates
         processed: Set[str] = set()
 
-        # First handle potential moves
+        # First handle potential moves: hash each added file once and look it up
+        # among the deleted files' checksums
+        moves: Dict[str, str] = {}
         for added_path in adds:
             if added_path in processed:
                 continue  # pragma: no cover
@@ -259,44 +599,38 @@ class WatchService:
                 processed.add(added_path)
                 continue
 
-            for deleted_path in deletes:
-                if deleted_path in processed:
-                    continue  # pragma: no cover
+            if not deleted_by_checksum:
+                continue
 
-                # Skip directories for deleted paths (based on entity type in db)
-                deleted_entity = await sync_service.entity_repository.get_by_file_path(deleted_path)
-                if deleted_entity is None:
-                    # If this was a directory, it wouldn't have an entity
-                    logger.debug("Skipping unknown path for move detection", path=deleted_path)
-                    continue
+            try:
+                added_checksum = await file_service.compute_checksum(added_path)
+            except Exception as e:  # pragma: no cover
+                logger.warning(f"Error checking for move, path={added_path}, error={str(e)}")
+                continue
+
+            candidates = [
+                path for path in deleted_by_checksum.get(added_checksum, ()) if path != added_path
+            ]
+            if not candidates:
+                continue
 
-                if added_path != deleted_path:
-                    # Compare checksums to detect moves
-                    try:
-                        added_checksum = await file_service.compute_checksum(added_path)
-
-                        if deleted_entity and deleted_entity.checksum == added_checksum:
-                            await sync_service.handle_move(deleted_path, added_path)
-                            self.state.add_event(
-                                path=f"{deleted_path} -> {added_path}",
-                                action="moved",
-                                status="success",
-                            )
-                            self.console.print(f"[blue]→[/blue] {deleted_path} → {added_path}")
-                            logger.info(f"move: {deleted_path} -> {added_path}")
-                            processed.add(added_path)
-                            processed.add(deleted_path)
-                            break
-                    except Exception as e:  # pragma: no cover
-                        logger.warning(
-                            "Error checking for move",
-                            f"old_path={deleted_path}",
-                            f"new_path={added_path}",
-                            f"error={str(e)}",
-                        )
+            # with identical copies, prefer the one with the same name, as in a directory move
+            name = Path(added_path).name
+            old_path = next((path for path in candidates if Path(path).name == name), candidates[0])
+            deleted_by_checksum[added_checksum].remove(old_path)
+            moves[old_path] = added_path
+            processed.add(added_path)
+            processed.add(old_path)
+
+        # a directory move is applied as one transaction
+        await sync_service.handle_moves(moves)
+        for old_path, new_path in moves.items():
+            self.state.add_event(path=f"{old_path} -> {new_path}", action="moved", status="success")
+            self.console.print(f"[blue]→[/blue] {old_path} → {new_path}")
+            logger.info(f"move: {old_path} -> {new_path}")
 
         # Handle remaining changes - group them by type for concise output
-        moved_count = len([p for p in processed if p in deletes or p in adds])
+        moved_count = len(moves)
         delete_count = 0
         add_count = 0
         modify_count = 0
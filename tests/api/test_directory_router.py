@@ -89,7 +89,7 @@ async def test_get_directory_tree_mocked(client, project_url):
 
     # Patch the directory service
     with patch(
-        "basic_memory.services.directory_service.DirectoryService.get_directory_tree",
+        "advanced_memory.services.directory_service.DirectoryService.get_directory_tree",
         return_value=mock_tree,
     ):
         # Call the endpoint
@@ -251,7 +251,7 @@ async def test_list_directory_endpoint_mocked(client, project_url):
 
     # Patch the directory service
     with patch(
-        "basic_memory.services.directory_service.DirectoryService.list_directory",
+        "advanced_memory.services.directory_service.DirectoryService.list_directory",
         return_value=mock_nodes,
     ):
         # Call the endpoint
@@ -7,6 +7,7 @@ from fastapi import FastAPI
 
 from advanced_memory.api.routers.management_router import (
     WatchStatusResponse,
+    get_watch_state,
     get_watch_status,
     start_watch_service,
     stop_watch_service,
@@ -96,8 +97,8 @@ async def test_start_watch_service_when_not_running(
 
     # Mock the create_background_sync_task function
     with (
-        patch("basic_memory.sync.WatchService") as mock_watch_service_class,
-        patch("basic_memory.sync.background_sync.create_background_sync_task") as mock_create_task,
+        patch("advanced_memory.sync.WatchService") as mock_watch_service_class,
+        patch("advanced_memory.sync.background_sync.create_background_sync_task") as mock_create_task,
     ):
         # Create a mock task
         mock_task = MagicMock()
@@ -136,7 +137,7 @@ async def test_start_watch_service_already_running(
     # Create mock request
     mock_request = MockRequest(mock_app)
 
-    with patch("basic_memory.sync.background_sync.create_background_sync_task") as mock_create_task:
+    with patch("advanced_memory.sync.background_sync.create_background_sync_task") as mock_create_task:
         # Call endpoint directly
         response = await start_watch_service(
             mock_request, mock_project_repository, mock_sync_service
@@ -209,3 +210,20 @@ async def test_stop_watch_service_already_done(mock_app):
     # Verify response
     assert isinstance(response, WatchStatusResponse)
     assert response.running is False
+
+
+@pytest.mark.asyncio
+async def test_get_watch_state(monkeypatch):
+    """The watch state is served from memory."""
+    from advanced_memory.sync import watch_service
+
+    monkeypatch.setattr(watch_service, "_active_state", None)
+    assert await get_watch_state() is None
+
+    state = watch_service.WatchServiceState(running=True, queue_depth=4)
+    monkeypatch.setattr(watch_service, "_active_state", state)
+    response = await get_watch_state()
+
+    assert response["running"] is True
+    assert response["queue_depth"] == 4
+    assert response["recent_events"] == []
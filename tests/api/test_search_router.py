@@ -6,7 +6,7 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import text
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.schemas import Entity as EntitySchema
 from advanced_memory.schemas.search import SearchItemType, SearchResponse
 
@@ -49,6 +49,48 @@ async def test_search_basic_pagination(client, indexed_entity, project_url):
     assert search_results.page_size == 1
 
 
+@pytest.mark.asyncio
+async def test_search_cursor_pagination(client, indexed_entity, project_url):
+    """Pages by next_cursor cover the same results as pages by number."""
+    response = await client.post(f"{project_url}/search/?page_size=10", json={"text": "search"})
+    everything = [r.permalink for r in SearchResponse.model_validate(response.json()).results]
+
+    paged = []
+    url = f"{project_url}/search/?page_size=1"
+    while True:
+        response = await client.post(url, json={"text": "search"})
+        assert response.status_code == 200
+        search_results = SearchResponse.model_validate(response.json())
+        paged += [r.permalink for r in search_results.results]
+        if not search_results.next_cursor:
+            break
+        url = f"{project_url}/search/?page_size=1&cursor={search_results.next_cursor}"
+
+    assert paged == everything
+
+    response = await client.post(
+        f"{project_url}/search/?cursor=not-a-cursor", json={"text": "search"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_include_counts(client, indexed_entity, project_url):
+    """Counts are only computed when asked for."""
+    response = await client.post(f"{project_url}/search/?page_size=1", json={"text": "search"})
+    search_results = SearchResponse.model_validate(response.json())
+    assert search_results.total is None and search_results.facets is None
+
+    response = await client.post(
+        f"{project_url}/search/?page_size=1&include_counts=true", json={"text": "search"}
+    )
+    search_results = SearchResponse.model_validate(response.json())
+    assert search_results.total == 3
+    assert sum(search_results.facets.item_types.values()) == 3
+    # only entity rows carry an entity_type
+    assert search_results.facets.entity_types == {"test": 1}
+
+
 @pytest.mark.asyncio
 async def test_search_with_entity_type_filter(client, indexed_entity, project_url):
     """Test search with type filter."""
@@ -416,7 +416,7 @@ def test_continue_conversation_no_results(cli_env):
     assert "The supplied query did not return any information" in result.stdout
 
 
-@patch("basic_memory.services.initialization.initialize_database")
+@patch("advanced_memory.services.initialization.initialize_database")
 def test_ensure_migrations_functionality(mock_initialize_database, project_config, monkeypatch):
     """Test the database initialization functionality."""
     from advanced_memory.services.initialization import ensure_initialization
@@ -428,7 +428,7 @@ def test_ensure_migrations_functionality(mock_initialize_database, project_confi
     mock_initialize_database.assert_called_once()
 
 
-@patch("basic_memory.services.initialization.initialize_database")
+@patch("advanced_memory.services.initialization.initialize_database")
 def test_ensure_migrations_handles_errors(mock_initialize_database, project_config, monkeypatch):
     """Test that initialization handles errors gracefully."""
     from advanced_memory.services.initialization import ensure_initialization
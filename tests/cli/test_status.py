@@ -21,7 +21,7 @@ def test_status_command():
     """Test CLI status command."""
     # Mock the async run_status function to avoid event loop issues
     with patch(
-        "basic_memory.cli.commands.status.run_status", new_callable=AsyncMock
+        "advanced_memory.cli.commands.status.run_status", new_callable=AsyncMock
     ) as mock_run_status:
         # Mock successful execution (no return value needed since it just prints)
         mock_run_status.return_value = None
@@ -38,7 +38,7 @@ def test_status_command_error():
     """Test CLI status command error handling."""
     # Mock the async run_status function to raise an exception
     with patch(
-        "basic_memory.cli.commands.status.run_status", new_callable=AsyncMock
+        "advanced_memory.cli.commands.status.run_status", new_callable=AsyncMock
     ) as mock_run_status:
         # Mock an error
         mock_run_status.side_effect = Exception("Database connection failed")
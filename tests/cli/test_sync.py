@@ -12,6 +12,7 @@ from advanced_memory.cli.commands.sync import (
     ValidationIssue,
 )
 from advanced_memory.config import get_project_config
+from advanced_memory.sync.lease import ProjectLease, default_lease_dir
 from advanced_memory.sync.sync_service import SyncReport
 
 # Set up CLI runner
@@ -90,12 +91,35 @@ Some content""")
     await run_sync(verbose=True)
 
 
+@pytest.mark.asyncio
+async def test_run_sync_skips_project_watched_elsewhere(
+    sync_service, project_config, test_project, entity_repository
+):
+    """A project another process holds the watch lease of is left to that process."""
+    config = get_project_config()
+    config.home = project_config.home
+    config.name = test_project.name
+
+    watcher = ProjectLease(test_project.path, default_lease_dir(), ttl=30)
+    assert watcher.acquire()
+    (project_config.home / "watched.md").write_text("# Watched\n")
+
+    await run_sync(verbose=True)
+    assert await entity_repository.get_by_file_path("watched.md") is None
+    assert watcher.held and watcher.acquire()
+
+    watcher.release()
+    await run_sync(verbose=True)
+    assert await entity_repository.get_by_file_path("watched.md") is not None
+    assert not watcher.path.exists()
+
+
 def test_sync_command():
     """Test the sync command."""
     from unittest.mock import patch, AsyncMock
 
     # Mock the async run_sync function to avoid event loop issues
-    with patch("basic_memory.cli.commands.sync.run_sync", new_callable=AsyncMock) as mock_run_sync:
+    with patch("advanced_memory.cli.commands.sync.run_sync", new_callable=AsyncMock) as mock_run_sync:
         # Mock successful execution (no return value needed since it just prints)
         mock_run_sync.return_value = None
 
@@ -107,7 +131,7 @@ def test_sync_command():
         assert "Syncing project: test-project" in result.stdout
 
         # Verify the function was called with verbose=True
-        mock_run_sync.assert_called_once_with(verbose=True)
+        mock_run_sync.assert_called_once_with(verbose=True, verify_checksums=False)
 
 
 def test_sync_command_error():
@@ -115,7 +139,7 @@ def test_sync_command_error():
     from unittest.mock import patch, AsyncMock
 
     # Mock the async run_sync function to raise an exception
-    with patch("basic_memory.cli.commands.sync.run_sync", new_callable=AsyncMock) as mock_run_sync:
+    with patch("advanced_memory.cli.commands.sync.run_sync", new_callable=AsyncMock) as mock_run_sync:
         # Mock an error
         mock_run_sync.side_effect = Exception("Sync failed")
 
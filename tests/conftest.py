@@ -24,6 +24,7 @@ from advanced_memory.repository.observation_repository import ObservationReposit
 from advanced_memory.repository.project_repository import ProjectRepository
 from advanced_memory.repository.relation_repository import RelationRepository
 from advanced_memory.repository.search_repository import SearchRepository
+from advanced_memory.repository.sync_journal_repository import SyncJournalRepository
 from advanced_memory.schemas.base import Entity as EntitySchema
 from advanced_memory.services import (
     EntityService,
@@ -32,6 +33,7 @@ from advanced_memory.services import (
 from advanced_memory.services.directory_service import DirectoryService
 from advanced_memory.services.file_service import FileService
 from advanced_memory.services.link_resolver import LinkResolver
+from advanced_memory.services.search_cache import search_cache
 from advanced_memory.services.search_service import SearchService
 from advanced_memory.sync.sync_service import SyncService
 from advanced_memory.sync.watch_service import WatchService
@@ -87,6 +89,14 @@ def config_manager(
     return config_manager
 
 
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Each test has its own database, don't serve searches cached by another."""
+    search_cache.clear()
+    yield
+    search_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def project_session(test_project: Project):
     # initialize the project session with the test project
@@ -171,6 +181,14 @@ async def relation_repository(
     return RelationRepository(session_maker, project_id=test_project.id)
 
 
+@pytest_asyncio.fixture(scope="function")
+async def sync_journal_repository(
+    session_maker: async_sessionmaker[AsyncSession], test_project: Project
+) -> SyncJournalRepository:
+    """Create a SyncJournalRepository instance with project context."""
+    return SyncJournalRepository(session_maker, project_id=test_project.id)
+
+
 @pytest_asyncio.fixture(scope="function")
 async def project_repository(
     session_maker: async_sessionmaker[AsyncSession],
@@ -253,6 +271,7 @@ async def sync_service(
     relation_repository: RelationRepository,
     search_service: SearchService,
     file_service: FileService,
+    sync_journal_repository: SyncJournalRepository,
 ) -> SyncService:
     """Create sync service for testing."""
     return SyncService(
@@ -263,6 +282,7 @@ async def sync_service(
         entity_parser=entity_parser,
         search_service=search_service,
         file_service=file_service,
+        journal_repository=sync_journal_repository,
     )
 
 
@@ -731,12 +731,12 @@ class TestMoveNoteErrorHandling:
     @pytest.mark.asyncio
     async def test_move_note_exception_handling(self):
         """Test exception handling in move_note."""
-        with patch("basic_memory.mcp.tools.move_note.get_active_project") as mock_get_project:
+        with patch("advanced_memory.mcp.tools.move_note.get_active_project") as mock_get_project:
             mock_get_project.return_value.project_url = "http://test"
             mock_get_project.return_value.name = "test-project"
 
             with patch(
-                "basic_memory.mcp.tools.move_note.call_post",
+                "advanced_memory.mcp.tools.move_note.call_post",
                 side_effect=Exception("entity not found"),
             ):
                 result = await move_note.fn("test-note", "target/file.md")
@@ -747,12 +747,12 @@ class TestMoveNoteErrorHandling:
     @pytest.mark.asyncio
     async def test_move_note_permission_error_handling(self):
         """Test permission error handling in move_note."""
-        with patch("basic_memory.mcp.tools.move_note.get_active_project") as mock_get_project:
+        with patch("advanced_memory.mcp.tools.move_note.get_active_project") as mock_get_project:
             mock_get_project.return_value.project_url = "http://test"
             mock_get_project.return_value.name = "test-project"
 
             with patch(
-                "basic_memory.mcp.tools.move_note.call_post",
+                "advanced_memory.mcp.tools.move_note.call_post",
                 side_effect=Exception("permission denied"),
             ):
                 result = await move_note.fn("test-note", "target/file.md")
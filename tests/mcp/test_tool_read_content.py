@@ -137,7 +137,7 @@ class TestReadContentSecurityValidation:
 
         for safe_path in safe_paths:
             # Mock the API call to simulate a successful response
-            with patch("basic_memory.mcp.tools.read_content.call_get") as mock_call_get:
+            with patch("advanced_memory.mcp.tools.read_content.call_get") as mock_call_get:
                 mock_response = MagicMock()
                 mock_response.headers = {
                     "content-type": "text/markdown",
@@ -187,7 +187,7 @@ class TestReadContentSecurityValidation:
     async def test_read_content_empty_path_security(self, client):
         """Test that empty path is handled securely."""
         # Mock the API call since empty path should be allowed (resolves to project root)
-        with patch("basic_memory.mcp.tools.read_content.call_get") as mock_call_get:
+        with patch("advanced_memory.mcp.tools.read_content.call_get") as mock_call_get:
             mock_response = MagicMock()
             mock_response.headers = {
                 "content-type": "text/markdown",
@@ -214,7 +214,7 @@ class TestReadContentSecurityValidation:
 
         for safe_path in safe_paths:
             # Mock the API call for these safe paths
-            with patch("basic_memory.mcp.tools.read_content.call_get") as mock_call_get:
+            with patch("advanced_memory.mcp.tools.read_content.call_get") as mock_call_get:
                 mock_response = MagicMock()
                 mock_response.headers = {
                     "content-type": "text/markdown",
@@ -244,7 +244,7 @@ class TestReadContentFunctionality:
         )
 
         # Mock the API call to simulate reading the file
-        with patch("basic_memory.mcp.tools.read_content.call_get") as mock_call_get:
+        with patch("advanced_memory.mcp.tools.read_content.call_get") as mock_call_get:
             mock_response = MagicMock()
             mock_response.headers = {
                 "content-type": "text/markdown",
@@ -265,7 +265,7 @@ class TestReadContentFunctionality:
     async def test_read_content_image_file_handling(self, client):
         """Test reading an image file with security validation."""
         # Mock the API call to simulate reading an image
-        with patch("basic_memory.mcp.tools.read_content.call_get") as mock_call_get:
+        with patch("advanced_memory.mcp.tools.read_content.call_get") as mock_call_get:
             # Create a simple fake image data
             fake_image_data = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\rIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xdb\x00\x00\x00\x00IEND\xaeB`\x82'
             
@@ -278,7 +278,7 @@ class TestReadContentFunctionality:
             mock_call_get.return_value = mock_response
             
             # Mock PIL Image processing
-            with patch("basic_memory.mcp.tools.read_content.PILImage") as mock_pil:
+            with patch("advanced_memory.mcp.tools.read_content.PILImage") as mock_pil:
                 mock_img = MagicMock()
                 mock_img.width = 100
                 mock_img.height = 100
@@ -286,7 +286,7 @@ class TestReadContentFunctionality:
                 mock_img.getbands.return_value = ["R", "G", "B"]
                 mock_pil.open.return_value = mock_img
                 
-                with patch("basic_memory.mcp.tools.read_content.optimize_image") as mock_optimize:
+                with patch("advanced_memory.mcp.tools.read_content.optimize_image") as mock_optimize:
                     mock_optimize.return_value = b"optimized_image_data"
                     
                     result = await read_content.fn(path="assets/safe-image.png")
@@ -301,8 +301,8 @@ class TestReadContentFunctionality:
     async def test_read_content_with_project_parameter(self, client):
         """Test reading content with explicit project parameter."""
         # Mock the API call and project configuration
-        with patch("basic_memory.mcp.tools.read_content.call_get") as mock_call_get:
-            with patch("basic_memory.mcp.tools.read_content.get_active_project") as mock_get_project:
+        with patch("advanced_memory.mcp.tools.read_content.call_get") as mock_call_get:
+            with patch("advanced_memory.mcp.tools.read_content.get_active_project") as mock_get_project:
                 # Mock project configuration
                 mock_project = MagicMock()
                 mock_project.project_url = "http://test"
@@ -330,7 +330,7 @@ class TestReadContentFunctionality:
     async def test_read_content_nonexistent_file_handling(self, client):
         """Test handling of nonexistent files (after security validation)."""
         # Mock API call to return 404
-        with patch("basic_memory.mcp.tools.read_content.call_get") as mock_call_get:
+        with patch("advanced_memory.mcp.tools.read_content.call_get") as mock_call_get:
             mock_call_get.side_effect = Exception("File not found")
             
             # This should pass security validation but fail on API call
@@ -346,7 +346,7 @@ class TestReadContentFunctionality:
     async def test_read_content_binary_file_handling(self, client):
         """Test reading binary files with security validation."""
         # Mock the API call to simulate reading a binary file
-        with patch("basic_memory.mcp.tools.read_content.call_get") as mock_call_get:
+        with patch("advanced_memory.mcp.tools.read_content.call_get") as mock_call_get:
             binary_data = b"Binary file content with special bytes: \x00\x01\x02\x03"
             
             mock_response = MagicMock()
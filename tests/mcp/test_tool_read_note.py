@@ -15,7 +15,7 @@ from advanced_memory.schemas.search import SearchResponse, SearchItemType
 @pytest_asyncio.fixture
 async def mock_call_get():
     """Mock for call_get to simulate different responses."""
-    with patch("basic_memory.mcp.tools.read_note.call_get") as mock:
+    with patch("advanced_memory.mcp.tools.read_note.call_get") as mock:
         # Default to 404 - not found
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -26,7 +26,7 @@ async def mock_call_get():
 @pytest_asyncio.fixture
 async def mock_search():
     """Mock for search tool."""
-    with patch("basic_memory.mcp.tools.read_note.search_notes.fn") as mock:
+    with patch("advanced_memory.mcp.tools.read_note.search_notes.fn") as mock:
         # Default to empty results
         mock.return_value = SearchResponse(results=[], current_page=1, page_size=1)
         yield mock
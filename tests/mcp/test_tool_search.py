@@ -262,11 +262,11 @@ class TestSearchToolErrorHandling:
     @pytest.mark.asyncio
     async def test_search_notes_exception_handling(self):
         """Test exception handling in search_notes."""
-        with patch("basic_memory.mcp.tools.search.get_active_project") as mock_get_project:
+        with patch("advanced_memory.mcp.tools.search.get_active_project") as mock_get_project:
             mock_get_project.return_value.project_url = "http://test"
 
             with patch(
-                "basic_memory.mcp.tools.search.call_post", side_effect=Exception("syntax error")
+                "advanced_memory.mcp.tools.search.call_post", side_effect=Exception("syntax error")
             ):
                 result = await search_notes.fn("test query")
 
@@ -276,11 +276,11 @@ class TestSearchToolErrorHandling:
     @pytest.mark.asyncio
     async def test_search_notes_permission_error(self):
         """Test search_notes with permission error."""
-        with patch("basic_memory.mcp.tools.search.get_active_project") as mock_get_project:
+        with patch("advanced_memory.mcp.tools.search.get_active_project") as mock_get_project:
             mock_get_project.return_value.project_url = "http://test"
 
             with patch(
-                "basic_memory.mcp.tools.search.call_post",
+                "advanced_memory.mcp.tools.search.call_post",
                 side_effect=Exception("permission denied"),
             ):
                 result = await search_notes.fn("test query")
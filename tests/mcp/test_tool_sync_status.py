@@ -20,7 +20,7 @@ async def test_sync_status_completed():
     mock_tracker.get_summary.return_value = "✅ All projects synced successfully"
     mock_tracker.get_all_projects.return_value = {}
 
-    with patch("basic_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
+    with patch("advanced_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
         result = await sync_status.fn()
 
     assert "Basic Memory Sync Status" in result
@@ -56,7 +56,7 @@ async def test_sync_status_in_progress():
 
     mock_tracker.get_all_projects.return_value = {"project1": project1, "project2": project2}
 
-    with patch("basic_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
+    with patch("advanced_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
         result = await sync_status.fn()
 
     assert "Basic Memory Sync Status" in result
@@ -86,7 +86,7 @@ async def test_sync_status_failed():
 
     mock_tracker.get_all_projects.return_value = {"project1": failed_project}
 
-    with patch("basic_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
+    with patch("advanced_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
         result = await sync_status.fn()
 
     assert "Basic Memory Sync Status" in result
@@ -106,7 +106,7 @@ async def test_sync_status_idle():
     mock_tracker.get_summary.return_value = "✅ System ready"
     mock_tracker.get_all_projects.return_value = {}
 
-    with patch("basic_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
+    with patch("advanced_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
         result = await sync_status.fn()
 
     assert "Basic Memory Sync Status" in result
@@ -132,7 +132,7 @@ async def test_sync_status_with_project():
     )
     mock_tracker.get_project_status.return_value = project_status
 
-    with patch("basic_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
+    with patch("advanced_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
         result = await sync_status.fn(project="test-project")
 
     # The function should use the original logic for project-specific queries
@@ -149,7 +149,7 @@ async def test_sync_status_pending():
     mock_tracker.get_summary.return_value = "✅ System ready"
     mock_tracker.get_all_projects.return_value = {}
 
-    with patch("basic_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
+    with patch("advanced_memory.services.sync_status_service.sync_status_tracker", mock_tracker):
         result = await sync_status.fn()
 
     assert "Basic Memory Sync Status" in result
@@ -161,7 +161,7 @@ async def test_sync_status_pending():
 async def test_sync_status_error_handling():
     """Test sync_status handles errors gracefully."""
     # Mock sync status tracker that raises an exception
-    with patch("basic_memory.services.sync_status_service.sync_status_tracker") as mock_tracker:
+    with patch("advanced_memory.services.sync_status_service.sync_status_tracker") as mock_tracker:
         mock_tracker.is_ready = True
         mock_tracker.get_summary.side_effect = Exception("Test error")
 
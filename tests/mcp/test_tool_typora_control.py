@@ -73,7 +73,7 @@ class TestTyporaControlOperations:
     @pytest.fixture
     def mock_client(self):
         """Mock the global typora_client."""
-        with patch('basic_memory.mcp.tools.typora_control.typora_client') as mock_client:
+        with patch('advanced_memory.mcp.tools.typora_control.typora_client') as mock_client:
             yield mock_client
 
     @pytest.mark.asyncio
@@ -197,7 +197,7 @@ class TestUtilityFunctions:
     @pytest.mark.asyncio
     async def test_check_typora_connection_success(self):
         """Test successful connection check."""
-        with patch('basic_memory.mcp.tools.typora_control.typora_client') as mock_client:
+        with patch('advanced_memory.mcp.tools.typora_control.typora_client') as mock_client:
             mock_client.call.return_value = {"success": True}
 
             result = await check_typora_connection()
@@ -206,7 +206,7 @@ class TestUtilityFunctions:
     @pytest.mark.asyncio
     async def test_check_typora_connection_failure(self):
         """Test failed connection check."""
-        with patch('basic_memory.mcp.tools.typora_control.typora_client') as mock_client:
+        with patch('advanced_memory.mcp.tools.typora_control.typora_client') as mock_client:
             mock_client.call.side_effect = Exception("Connection failed")
 
             result = await check_typora_connection()
@@ -215,8 +215,8 @@ class TestUtilityFunctions:
     @pytest.mark.asyncio
     async def test_get_typora_status_connected(self):
         """Test getting Typora status when connected."""
-        with patch('basic_memory.mcp.tools.typora_control.check_typora_connection', return_value=True), \
-             patch('basic_memory.mcp.tools.typora_control.typora_client') as mock_client:
+        with patch('advanced_memory.mcp.tools.typora_control.check_typora_connection', return_value=True), \
+             patch('advanced_memory.mcp.tools.typora_control.typora_client') as mock_client:
 
             mock_client.call.side_effect = [
                 {"success": True, "result": {"filePath": "/test/file.md", "title": "Test"}},  # metadata
@@ -232,7 +232,7 @@ class TestUtilityFunctions:
     @pytest.mark.asyncio
     async def test_get_typora_status_disconnected(self):
         """Test getting Typora status when disconnected."""
-        with patch('basic_memory.mcp.tools.typora_control.check_typora_connection', return_value=False):
+        with patch('advanced_memory.mcp.tools.typora_control.check_typora_connection', return_value=False):
             status = await get_typora_status()
 
             assert status["connection"] is False
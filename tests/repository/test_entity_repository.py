@@ -6,7 +6,7 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import select
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.models import Entity, Observation, Relation, Project
 from advanced_memory.repository.entity_repository import EntityRepository
 from advanced_memory.utils import generate_permalink
@@ -432,3 +432,39 @@ async def test_get_by_file_path(entity_repository: EntityRepository, session_mak
     # Test non-existent file_path
     found = await entity_repository.get_by_file_path("not/a/real/file.md")
     assert found is None
+
+
+@pytest.mark.asyncio
+async def test_stream_file_states(entity_repository: EntityRepository, test_entities):
+    """File state rows are plain column tuples, not Entity models."""
+    await entity_repository.update(test_entities[0].id, {"checksum": "abc", "size": 10})
+
+    rows = [row async for row in entity_repository.stream_file_states()]
+
+    assert {row.file_path for row in rows} == {e.file_path for e in test_entities}
+    assert not any(isinstance(row, Entity) for row in rows)
+    first = next(row for row in rows if row.file_path == "type1/entity1.md")
+    assert first.checksum == "abc"
+    assert first.size == 10
+    assert first.mtime_ns is None
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_is_project_scoped(
+    entity_repository: EntityRepository, session_maker, test_entities
+):
+    """Rows from other projects are not streamed."""
+    other_repository = EntityRepository(session_maker, project_id=entity_repository.project_id + 1)
+
+    assert [row async for row in other_repository.stream_rows(Entity.id)] == []
+    assert len([row async for row in entity_repository.stream_rows(Entity.id)]) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_file_states(entity_repository: EntityRepository, test_entities):
+    states = await entity_repository.get_file_states(
+        ["type1/entity1.md", "type2/entity3.md", "missing.md"]
+    )
+
+    assert set(states) == {"type1/entity1.md", "type2/entity3.md"}
+    assert await entity_repository.get_file_states([]) == {}
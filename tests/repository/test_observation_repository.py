@@ -7,7 +7,7 @@ import pytest_asyncio
 import sqlalchemy
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.models import Entity, Observation, Project
 from advanced_memory.repository.observation_repository import ObservationRepository
 
@@ -7,7 +7,7 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import select
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.models.project import Project
 from advanced_memory.repository.project_repository import ProjectRepository
 
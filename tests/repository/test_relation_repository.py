@@ -6,7 +6,7 @@ import pytest
 import pytest_asyncio
 import sqlalchemy
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.models import Entity, Relation, Project
 from advanced_memory.repository.relation_repository import RelationRepository
 
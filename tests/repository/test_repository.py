@@ -3,8 +3,10 @@
 from datetime import datetime
 import pytest
 from sqlalchemy import String, DateTime
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Mapped, mapped_column
 
+from advanced_memory import db
 from advanced_memory.models import Base
 from advanced_memory.repository.repository import Repository
 
@@ -183,3 +185,51 @@ async def test_count(repository):
     # Verify we can count in db
     count = await repository.count()
     assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_insert_many(repository):
+    """Test executemany insert without loading models back."""
+    await repository.insert_many([{"id": f"row_{i}", "name": f"Row {i}"} for i in range(3)])
+
+    found = await repository.find_by_ids(["row_0", "row_1", "row_2"])
+    assert len(found) == 3
+    assert all(m.created_at is not None for m in found)
+
+
+@pytest.mark.asyncio
+async def test_insert_many_ignore_conflicts(repository):
+    """Rows that violate a unique constraint are skipped when asked."""
+    await repository.insert_many([{"id": "dup", "name": "First"}])
+
+    with pytest.raises(IntegrityError):
+        await repository.insert_many([{"id": "dup", "name": "Second"}])
+
+    await repository.insert_many(
+        [{"id": "dup", "name": "Second"}, {"id": "other", "name": "Other"}],
+        ignore_conflicts=True,
+    )
+    assert (await repository.find_by_id("dup")).name == "First"
+    assert await repository.find_by_id("other") is not None
+
+
+@pytest.mark.asyncio
+async def test_batch_session_commits_once(repository, session_maker):
+    """Work done inside a batch is visible within it and committed at the end."""
+    async with db.batch_session(session_maker):
+        await repository.add(ModelTest(id="batch_1", name="Batch 1"))
+        await repository.insert_many([{"id": "batch_2", "name": "Batch 2"}])
+        assert len(await repository.find_by_ids(["batch_1", "batch_2"])) == 2
+
+    assert len(await repository.find_by_ids(["batch_1", "batch_2"])) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_session_rolls_back_on_error(repository, session_maker):
+    """An error anywhere in a batch rolls back everything written in it."""
+    with pytest.raises(RuntimeError):
+        async with db.batch_session(session_maker):
+            await repository.add(ModelTest(id="rolled_back", name="Rolled back"))
+            raise RuntimeError("boom")
+
+    assert await repository.find_by_id("rolled_back") is None
@@ -6,10 +6,15 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import text
 
-from basic_memory import db
+from advanced_memory import db
 from advanced_memory.models import Entity
 from advanced_memory.models.project import Project
-from advanced_memory.repository.search_repository import SearchRepository, SearchIndexRow
+from advanced_memory.repository.search_repository import (
+    SearchCursor,
+    SearchIndexRow,
+    SearchRepository,
+    index_generations,
+)
 from advanced_memory.schemas.search import SearchItemType
 
 
@@ -241,6 +246,258 @@ async def test_delete_by_entity_id(search_repository, search_entity):
     assert len(results_after) == 0
 
 
+@pytest.mark.asyncio
+async def test_index_items_replaces_entity_rows(search_repository, search_entity):
+    """Indexing with entity_id replaces all rows of the entity, stale ones included."""
+
+    def rows(observations):
+        entity_row = SearchIndexRow(
+            id=search_entity.id,
+            type=SearchItemType.ENTITY.value,
+            title=search_entity.title,
+            content_stems="replaced entity",
+            permalink=search_entity.permalink,
+            file_path=search_entity.file_path,
+            entity_id=search_entity.id,
+            created_at=search_entity.created_at,
+            updated_at=search_entity.updated_at,
+            project_id=search_repository.project_id,
+        )
+        return [entity_row] + [
+            SearchIndexRow(
+                id=1000 + i,
+                type=SearchItemType.OBSERVATION.value,
+                title=f"note: observation {i}",
+                content_stems=f"replaced observation {i}",
+                permalink=f"{search_entity.permalink}/observations/note/{i}",
+                file_path=search_entity.file_path,
+                category="note",
+                entity_id=search_entity.id,
+                created_at=search_entity.created_at,
+                updated_at=search_entity.updated_at,
+                project_id=search_repository.project_id,
+            )
+            for i in range(observations)
+        ]
+
+    async def entity_rows():
+        result = await search_repository.execute_query(
+            text("SELECT permalink FROM search_index WHERE entity_id = :entity_id"),
+            {"entity_id": search_entity.id},
+        )
+        return sorted(row[0] for row in result)
+
+    await search_repository.index_items(rows(3), entity_id=search_entity.id)
+    assert len(await entity_rows()) == 4
+
+    # the observations dropped from the note are removed from the index
+    await search_repository.index_items(rows(1), entity_id=search_entity.id)
+    assert await entity_rows() == [
+        search_entity.permalink,
+        f"{search_entity.permalink}/observations/note/0",
+    ]
+
+    await search_repository.index_items([], entity_id=search_entity.id)
+    assert await entity_rows() == []
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_fills_up_results(search_repository, search_entity):
+    """Substring matches from the trigram index come after word matches."""
+
+    def row(i, title):
+        return SearchIndexRow(
+            id=i,
+            type=SearchItemType.ENTITY.value,
+            title=title,
+            content_stems=title.lower(),
+            permalink=f"notes/{title.lower().replace(' ', '-')}",
+            file_path=f"notes/{title}.md",
+            entity_id=i,
+            created_at=search_entity.created_at,
+            updated_at=search_entity.updated_at,
+            project_id=search_repository.project_id,
+        )
+
+    await search_repository.index_items(
+        [row(1, "Search Service"), row(2, "Research Notes"), row(3, "Unrelated")]
+    )
+
+    results = await search_repository.search(search_text="search")
+    assert [r.title for r in results] == ["Search Service", "Research Notes"]
+    # fuzzy matches score worse than any word match
+    assert results[0].score < 0 < results[1].score
+
+    # pages continue from the word matches into the fuzzy matches
+    first = await search_repository.search(search_text="search", limit=1)
+    second = await search_repository.search(search_text="search", limit=1, offset=1)
+    assert [r.title for r in first + second] == ["Search Service", "Research Notes"]
+
+    # paths match too, and deleted rows leave the fuzzy index
+    results = await search_repository.search(search_text="arch-not")
+    assert [r.title for r in results] == ["Research Notes"]
+    await search_repository.delete_by_permalink("notes/research-notes")
+    assert await search_repository.search(search_text="arch-not") == []
+
+
+@pytest.mark.asyncio
+async def test_search_pages_by_cursor(search_repository, search_entity):
+    """Pages continued from a cursor match pages by offset, fuzzy matches included."""
+    rows = [
+        SearchIndexRow(
+            id=i,
+            type=SearchItemType.ENTITY.value,
+            title=title,
+            content_stems=title.lower(),
+            permalink=f"notes/{i}",
+            file_path=f"notes/{i}.md",
+            entity_id=i,
+            created_at=search_entity.created_at,
+            updated_at=search_entity.updated_at,
+            project_id=search_repository.project_id,
+        )
+        # equal scores are ordered by rowid
+        for i, title in enumerate(["Search", "Search", "Search Again", "Research", "Unrelated"])
+    ]
+    await search_repository.index_items(rows)
+
+    by_offset = [
+        (await search_repository.search(search_text="search", limit=1, offset=i))[0].permalink
+        for i in range(4)
+    ]
+
+    by_cursor = []
+    cursor = None
+    while True:
+        page = await search_repository.search(search_text="search", limit=1, cursor=cursor)
+        if not page:
+            break
+        by_cursor.append(page[0].permalink)
+        cursor = SearchCursor.decode(SearchCursor.after(page[0]).encode())
+
+    assert by_cursor == by_offset
+    assert sorted(by_cursor) == ["notes/0", "notes/1", "notes/2", "notes/3"]
+    assert by_cursor[-1] == "notes/3"  # the fuzzy match comes last
+
+    with pytest.raises(ValueError):
+        SearchCursor.decode("not a cursor")
+
+
+@pytest.mark.asyncio
+async def test_count(search_repository, search_entity):
+    """Counts cover word and fuzzy matches, per item type and entity type."""
+
+    def row(i, item_type, title, entity_type):
+        return SearchIndexRow(
+            id=i,
+            type=item_type,
+            title=title,
+            content_stems=title.lower(),
+            permalink=f"notes/{i}",
+            file_path=f"notes/{i}.md",
+            metadata={"entity_type": entity_type},
+            entity_id=i,
+            created_at=search_entity.created_at,
+            updated_at=search_entity.updated_at,
+            project_id=search_repository.project_id,
+        )
+
+    await search_repository.index_items(
+        [
+            row(1, SearchItemType.ENTITY.value, "Search Service", "note"),
+            row(2, SearchItemType.ENTITY.value, "Search People", "person"),
+            row(3, SearchItemType.OBSERVATION.value, "idea: search more", "note"),
+            row(4, SearchItemType.ENTITY.value, "Research", "note"),
+            row(5, SearchItemType.ENTITY.value, "Unrelated", "note"),
+        ]
+    )
+
+    counts = await search_repository.count(search_text="search")
+    assert counts.total == 4
+    assert counts.item_types == {"entity": 3, "observation": 1}
+    assert counts.entity_types == {"note": 3, "person": 1}
+
+    counts = await search_repository.count(search_text="search", types=["person"])
+    assert counts.total == 1
+
+
+@pytest.mark.asyncio
+async def test_structured_filters(search_repository, search_entity):
+    """entity_type, date and tag filters go through the indexed filter tables."""
+
+    def row(i, entity_type, created_at, tags):
+        return SearchIndexRow(
+            id=i,
+            type=SearchItemType.ENTITY.value,
+            title=f"Decision {i}",
+            content_stems=f"decision {i}",
+            permalink=f"decisions/{i}",
+            file_path=f"decisions/{i}.md",
+            metadata={"entity_type": entity_type, "tags": tags},
+            entity_id=i,
+            created_at=created_at,
+            updated_at=created_at,
+            project_id=search_repository.project_id,
+        )
+
+    old = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    recent = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    await search_repository.index_items(
+        [
+            row(1, "decision", old, ["db"]),
+            row(2, "decision", recent, ["db", "api"]),
+            row(3, "note", recent, []),
+        ]
+    )
+    after = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+    async def permalinks(**filters):
+        return sorted(r.permalink for r in await search_repository.search(**filters))
+
+    assert await permalinks(types=["decision"], after_date=after) == ["decisions/2"]
+    assert await permalinks(search_text="decision", types=["decision"]) == [
+        "decisions/1",
+        "decisions/2",
+    ]
+    assert await permalinks(tags=["api"]) == ["decisions/2"]
+    assert await permalinks(search_text="decision", tags=["db"], after_date=after) == [
+        "decisions/2"
+    ]
+
+    # filter-only searches look rows up from the filter table's index
+    result = await search_repository.execute_query(
+        text("""
+            EXPLAIN QUERY PLAN SELECT rowid FROM search_index WHERE search_index.rowid IN
+            (SELECT rowid FROM search_filter WHERE project_id = 1 AND entity_type = 'decision')
+        """),
+        {},
+    )
+    assert any("ix_search_filter_entity_type" in row[-1] for row in result)
+
+    # filter rows follow the search_index rows they belong to
+    await search_repository.delete_by_permalink("decisions/2")
+    assert await permalinks(tags=["api"]) == []
+    result = await search_repository.execute_query(
+        text("SELECT count(*) FROM search_filter WHERE project_id = :project_id"),
+        {"project_id": search_repository.project_id},
+    )
+    assert result.scalar() == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_bump_index_generation(search_repository, search_entity):
+    """A write starts a new generation, and another one when it is committed."""
+    project_id = search_repository.project_id
+    before = index_generations.get(project_id)
+
+    async with db.batch_session(search_repository.session_maker):
+        await search_repository.delete_by_entity_id(search_entity.id)
+        during = index_generations.get(project_id)
+        assert during != before
+
+    assert index_generations.get(project_id) not in (before, during)
+
+
 @pytest.mark.asyncio
 async def test_to_insert_includes_project_id(search_repository):
     """Test that the to_insert method includes project_id."""
@@ -469,7 +726,7 @@ class TestSearchTermPreparation:
         import unittest.mock
 
         # Mock the scoped_session to raise a non-FTS5 error
-        with unittest.mock.patch("basic_memory.db.scoped_session") as mock_scoped_session:
+        with unittest.mock.patch("advanced_memory.db.scoped_session") as mock_scoped_session:
             mock_session = unittest.mock.AsyncMock()
             mock_scoped_session.return_value.__aenter__.return_value = mock_session
 
@@ -0,0 +1,54 @@
+"""Tests for the SyncJournalRepository."""
+
+import pytest
+
+from advanced_memory.repository.sync_journal_repository import SyncJournalRepository
+
+
+@pytest.mark.asyncio
+async def test_start_replaces_journal(sync_journal_repository: SyncJournalRepository):
+    await sync_journal_repository.start([{"action": "new", "file_path": "old.md"}])
+    await sync_journal_repository.start(
+        [
+            {"action": "new", "file_path": "a.md", "checksum": "abc"},
+            {"action": "moved", "file_path": "b.md", "new_path": "c.md"},
+        ]
+    )
+
+    pending = await sync_journal_repository.find_pending()
+    assert [(e.action, e.file_path, e.new_path) for e in pending] == [
+        ("new", "a.md", None),
+        ("moved", "b.md", "c.md"),
+    ]
+    assert pending[0].checksum == "abc"
+
+
+@pytest.mark.asyncio
+async def test_mark_done(sync_journal_repository: SyncJournalRepository):
+    await sync_journal_repository.start(
+        [
+            {"action": "new", "file_path": "a.md"},
+            {"action": "new", "file_path": "b.md"},
+            {"action": "modified", "file_path": "a.md"},
+        ]
+    )
+
+    await sync_journal_repository.mark_done("new", ["a.md", "missing.md"])
+
+    pending = await sync_journal_repository.find_pending()
+    assert [(e.action, e.file_path) for e in pending] == [("new", "b.md"), ("modified", "a.md")]
+
+
+@pytest.mark.asyncio
+async def test_journal_is_per_project(
+    sync_journal_repository: SyncJournalRepository, session_maker, project_repository
+):
+    other_project = await project_repository.create({"name": "other", "path": "/other"})
+    other_journal = SyncJournalRepository(session_maker, project_id=other_project.id)
+    await sync_journal_repository.start([{"action": "new", "file_path": "a.md"}])
+    await other_journal.start([{"action": "deleted", "file_path": "b.md"}])
+
+    await sync_journal_repository.clear()
+
+    assert await sync_journal_repository.find_pending() == []
+    assert [e.file_path for e in await other_journal.find_pending()] == ["b.md"]
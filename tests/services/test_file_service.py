@@ -77,7 +77,7 @@ async def test_write_atomic(tmp_path: Path, file_service: FileService):
     temp_path = test_path.with_suffix(".tmp")
 
     # Mock write_file_atomic to raise an error
-    with patch("basic_memory.file_utils.write_file_atomic") as mock_write:
+    with patch("advanced_memory.file_utils.write_file_atomic") as mock_write:
         mock_write.side_effect = Exception("Write failed")
 
         # Attempt write that will fail
@@ -1,5 +1,6 @@
 """Tests for the initialization service."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
 
@@ -14,7 +15,7 @@ from advanced_memory.services.initialization import (
 
 
 @pytest.mark.asyncio
-@patch("basic_memory.services.initialization.db.get_or_create_db")
+@patch("advanced_memory.services.initialization.db.get_or_create_db")
 async def test_initialize_database(mock_get_or_create_db, app_config):
     """Test initializing the database."""
     mock_get_or_create_db.return_value = (MagicMock(), MagicMock())
@@ -23,7 +24,7 @@ async def test_initialize_database(mock_get_or_create_db, app_config):
 
 
 @pytest.mark.asyncio
-@patch("basic_memory.services.initialization.db.get_or_create_db")
+@patch("advanced_memory.services.initialization.db.get_or_create_db")
 async def test_initialize_database_error(mock_get_or_create_db, app_config):
     """Test handling errors during database initialization."""
     mock_get_or_create_db.side_effect = Exception("Test error")
@@ -31,7 +32,7 @@ async def test_initialize_database_error(mock_get_or_create_db, app_config):
     mock_get_or_create_db.assert_called_once_with(app_config.database_path)
 
 
-@patch("basic_memory.services.initialization.asyncio.run")
+@patch("advanced_memory.services.initialization.asyncio.run")
 def test_ensure_initialization(mock_run, project_config):
     """Test synchronous initialization wrapper."""
     ensure_initialization(project_config)
@@ -39,7 +40,7 @@ def test_ensure_initialization(mock_run, project_config):
 
 
 @pytest.mark.asyncio
-@patch("basic_memory.services.initialization.db.get_or_create_db")
+@patch("advanced_memory.services.initialization.db.get_or_create_db")
 async def test_reconcile_projects_with_config(mock_get_db, app_config):
     """Test reconciling projects from config with database using ProjectService."""
     # Setup mocks
@@ -52,9 +53,9 @@ async def test_reconcile_projects_with_config(mock_get_db, app_config):
 
     # Mock the repository and project service
     with (
-        patch("basic_memory.services.initialization.ProjectRepository") as mock_repo_class,
+        patch("advanced_memory.services.initialization.ProjectRepository") as mock_repo_class,
         patch(
-            "basic_memory.services.project_service.ProjectService",
+            "advanced_memory.services.project_service.ProjectService",
             return_value=mock_project_service,
         ),
     ):
@@ -78,7 +79,7 @@ async def test_reconcile_projects_with_config(mock_get_db, app_config):
 
 
 @pytest.mark.asyncio
-@patch("basic_memory.services.initialization.db.get_or_create_db")
+@patch("advanced_memory.services.initialization.db.get_or_create_db")
 async def test_reconcile_projects_with_error_handling(mock_get_db, app_config):
     """Test error handling during project synchronization."""
     # Setup mocks
@@ -93,12 +94,12 @@ async def test_reconcile_projects_with_error_handling(mock_get_db, app_config):
 
     # Mock the repository and project service
     with (
-        patch("basic_memory.services.initialization.ProjectRepository") as mock_repo_class,
+        patch("advanced_memory.services.initialization.ProjectRepository") as mock_repo_class,
         patch(
-            "basic_memory.services.project_service.ProjectService",
+            "advanced_memory.services.project_service.ProjectService",
             return_value=mock_project_service,
         ),
-        patch("basic_memory.services.initialization.logger") as mock_logger,
+        patch("advanced_memory.services.initialization.logger") as mock_logger,
     ):
         mock_repo_class.return_value = mock_repository
 
@@ -124,21 +125,14 @@ async def test_reconcile_projects_with_error_handling(mock_get_db, app_config):
 
 
 @pytest.mark.asyncio
-@patch("basic_memory.services.initialization.db.get_or_create_db")
-@patch("basic_memory.cli.commands.sync.get_sync_service")
-@patch("basic_memory.sync.WatchService")
-async def test_initialize_file_sync_sequential(
-    mock_watch_service_class, mock_get_sync_service, mock_get_db, app_config
-):
+@patch("advanced_memory.services.initialization.db.get_or_create_db")
+@patch("advanced_memory.sync.WatchService")
+async def test_initialize_file_sync_sequential(mock_watch_service_class, mock_get_db, app_config):
     """Test file sync initialization with sequential project processing."""
     # Setup mocks
     mock_session_maker = AsyncMock()
     mock_get_db.return_value = (None, mock_session_maker)
 
-    mock_watch_service = AsyncMock()
-    mock_watch_service.run = AsyncMock()
-    mock_watch_service_class.return_value = mock_watch_service
-
     mock_repository = AsyncMock()
     mock_project1 = MagicMock()
     mock_project1.name = "project1"
@@ -150,12 +144,27 @@ async def test_initialize_file_sync_sequential(
     mock_project2.path = "/path/to/project2"
     mock_project2.id = 2
 
+    synced = asyncio.Event()
+
+    async def sync(*args, **kwargs):
+        if mock_sync_service.sync.call_count == 2:
+            synced.set()
+
     mock_sync_service = AsyncMock()
-    mock_sync_service.sync = AsyncMock()
-    mock_get_sync_service.return_value = mock_sync_service
+    mock_sync_service.sync = AsyncMock(side_effect=sync)
+
+    # the watch service runs until the background sync is done
+    async def run():
+        await asyncio.wait_for(synced.wait(), 5)
+
+    mock_watch_service = AsyncMock()
+    mock_watch_service.run = AsyncMock(side_effect=run)
+    mock_watch_service.acquire_leases.return_value = [mock_project1, mock_project2]
+    mock_watch_service.get_sync_service.return_value = mock_sync_service
+    mock_watch_service_class.return_value = mock_watch_service
 
     # Mock the repository
-    with patch("basic_memory.services.initialization.ProjectRepository") as mock_repo_class:
+    with patch("advanced_memory.services.initialization.ProjectRepository") as mock_repo_class:
         mock_repo_class.return_value = mock_repository
         mock_repository.get_active_projects.return_value = [mock_project1, mock_project2]
 
@@ -165,10 +174,10 @@ async def test_initialize_file_sync_sequential(
         # Assertions
         mock_repository.get_active_projects.assert_called_once()
 
-        # Should call sync for each project sequentially
-        assert mock_get_sync_service.call_count == 2
-        mock_get_sync_service.assert_any_call(mock_project1)
-        mock_get_sync_service.assert_any_call(mock_project2)
+        # The sync uses the watcher's sync services, so they share their write locks
+        assert mock_watch_service.get_sync_service.call_count == 2
+        mock_watch_service.get_sync_service.assert_any_call(mock_project1)
+        mock_watch_service.get_sync_service.assert_any_call(mock_project2)
 
         # Should call sync on each project
         assert mock_sync_service.sync.call_count == 2
@@ -0,0 +1,63 @@
+"""Tests for the in-memory link index."""
+
+from advanced_memory.services.link_index import LinkIndex, LinkTarget
+
+
+def make_index(*targets: LinkTarget) -> LinkIndex:
+    index = LinkIndex()
+    for target in targets:
+        index.add(target)
+    return index
+
+
+def test_resolve_order():
+    by_title = LinkTarget(1, "notes/a", "other/permalink", "x.md")
+    by_permalink = LinkTarget(2, "A", "notes/a", "notes/a.md")
+    index = make_index(by_title, by_permalink)
+
+    # permalink wins over title
+    assert index.resolve("notes/a") == by_permalink
+    assert index.resolve("A") == by_permalink
+    assert index.resolve("x.md") == by_title
+    assert index.resolve("missing") is None
+
+
+def test_resolve_file_path_with_md_extension():
+    target = LinkTarget(1, "Auth Service", "components/auth-service", "components/Auth Service.md")
+    index = make_index(target)
+
+    assert index.resolve("components/Auth Service") == target
+    assert index.resolve("Components/auth service") == target
+
+
+def test_title_case_insensitive_unless_disabled():
+    target = LinkTarget(1, "Core Service", "core-service", "Core Service.md")
+    index = make_index(target)
+
+    assert index.resolve("core service") == target
+    assert index.resolve("core service", ignore_title_case=False) is None
+
+
+def test_lowest_id_wins_for_shared_keys():
+    first = LinkTarget(3, "Dup", "one/dup", "one/Dup.md")
+    second = LinkTarget(7, "Dup", "two/dup", "two/Dup.md")
+    index = make_index(second, first)
+
+    assert index.resolve("Dup") == first
+
+    index.remove(first.id)
+    assert index.resolve("Dup") == second
+
+    index.remove(second.id)
+    assert index.resolve("Dup") is None
+    assert not index.by_title
+
+
+def test_add_replaces_previous_entry():
+    index = make_index(LinkTarget(1, "Old", "old", "old.md"))
+
+    index.add(LinkTarget(1, "New", "new", "new.md"))
+
+    assert len(index) == 1
+    assert index.resolve("Old") is None
+    assert index.resolve("new").title == "New"
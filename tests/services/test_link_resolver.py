@@ -1,5 +1,7 @@
 """Tests for link resolution service."""
 
+import asyncio
+import contextvars
 from datetime import datetime, timezone
 
 import pytest
@@ -360,3 +362,146 @@ async def test_duplicate_title_handling_in_strict_mode(link_resolver, test_entit
     assert result is not None
     # Should return the first match (components/core-service based on test fixture order)
     assert result.permalink == "components/core-service"
+
+
+@pytest.mark.asyncio
+async def test_indexed_resolution_matches_queries(link_resolver, test_entities):
+    """The in-memory index resolves exact matches the same way as the queries."""
+    links = [
+        "components/core-service",
+        "Core Service",
+        "core service",
+        "config/service-config.md",
+        "components/Auth Service",
+        "COMPONENTS/AUTH SERVICE",
+        "Image.png",
+        "[[Core Features|features]]",
+        "Does Not Exist",
+    ]
+    expected = {
+        link: await link_resolver.resolve_link(link, use_search=False) for link in links
+    }
+
+    async with link_resolver.indexed() as index:
+        assert len(index) == len(test_entities)
+        for link in links:
+            resolved = await link_resolver.resolve_link(link, use_search=False)
+            assert (resolved and resolved.id) == (expected[link] and expected[link].id), link
+
+    assert link_resolver.link_index is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_links_resolves_each_link_once(link_resolver, test_entities):
+    async with link_resolver.indexed():
+        targets = await link_resolver.resolve_links(
+            ["Core Service", "Core Service", "specs/core-features", "Auth Serv"]
+        )
+
+    assert set(targets) == {"Core Service", "specs/core-features", "Auth Serv"}
+    assert targets["Core Service"].permalink == "components/core-service"
+    assert targets["specs/core-features"].title == "Core Features"
+    # not in the index, resolved through search
+    assert targets["Auth Serv"].permalink == "components/auth-service"
+
+
+@pytest.mark.asyncio
+async def test_index_tracks_entity_changes(link_resolver, test_entities):
+    core_service = test_entities[0]
+
+    async with link_resolver.indexed():
+        link_resolver.remove_from_index(core_service.id)
+        resolved = await link_resolver.resolve_link("components/core-service", use_search=False)
+        assert resolved is None
+
+        link_resolver.index_entity(core_service)
+        resolved = await link_resolver.resolve_link("components/core-service", use_search=False)
+        assert resolved.id == core_service.id
+
+
+@pytest.mark.asyncio
+async def test_kept_index_rebuilt_only_when_entities_change(
+    link_resolver, test_entities, entity_repository
+):
+    link_resolver.keep_index = True
+
+    async with link_resolver.indexed() as first:
+        pass
+    async with link_resolver.indexed() as second:
+        pass
+    assert second is first
+    assert link_resolver.link_index is None
+
+    # an entity created behind the resolver's back invalidates the kept index
+    await entity_repository.create(
+        {
+            "title": "Late Arrival",
+            "entity_type": "test",
+            "permalink": "late-arrival",
+            "file_path": "late-arrival.md",
+            "content_type": "text/markdown",
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }
+    )
+    async with link_resolver.indexed() as third:
+        assert third is not first
+        resolved = await link_resolver.resolve_link("late-arrival", use_search=False)
+        assert resolved.title == "Late Arrival"
+
+
+@pytest.mark.asyncio
+async def test_kept_index_rebuilt_after_move_elsewhere(
+    link_resolver, test_entities, entity_repository
+):
+    link_resolver.keep_index = True
+    core_service = test_entities[0]
+
+    async with link_resolver.indexed() as first:
+        pass
+
+    # a move leaves count, ids and updated_at alone, it still invalidates the index
+    await entity_repository.update(
+        core_service.id,
+        {"file_path": "moved/core-service.md", "permalink": "moved/core-service"},
+    )
+    async with link_resolver.indexed() as second:
+        assert second is not first
+        resolved = await link_resolver.resolve_link("moved/core-service", use_search=False)
+        assert resolved.id == core_service.id
+
+
+@pytest.mark.asyncio
+async def test_kept_index_follows_own_writes_only(link_resolver, test_entities, entity_repository):
+    link_resolver.keep_index = True
+    core_service = test_entities[0]
+
+    async with link_resolver.indexed() as first:
+        # a write made by the block itself, and passed to the index
+        updated = await entity_repository.update(core_service.id, {"title": "Core Renamed"})
+        link_resolver.index_entity(updated)
+    async with link_resolver.indexed() as second:
+        assert second is first
+
+    async with link_resolver.indexed() as third:
+        # a write made concurrently by a task outside the block is not in the index
+        await asyncio.create_task(
+            entity_repository.update(core_service.id, {"title": "Core Elsewhere"}),
+            context=contextvars.Context(),
+        )
+    async with link_resolver.indexed() as fourth:
+        assert fourth is not third
+        resolved = await link_resolver.resolve_link("Core Elsewhere", use_search=False)
+        assert resolved.id == core_service.id
+
+
+@pytest.mark.asyncio
+async def test_kept_index_dropped_after_error(link_resolver, test_entities):
+    link_resolver.keep_index = True
+
+    with pytest.raises(RuntimeError):
+        async with link_resolver.indexed() as first:
+            raise RuntimeError("sync failed")
+
+    async with link_resolver.indexed() as second:
+        assert second is not first
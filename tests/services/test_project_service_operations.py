@@ -132,3 +132,19 @@ async def test_system_status_with_watch(project_service: ProjectService):
         assert status.watch_status["running"] is True
         assert status.watch_status["pid"] == 7321
         assert status.watch_status["synced_files"] == 6
+
+
+@pytest.mark.asyncio
+async def test_system_status_with_watch_in_process(project_service: ProjectService, monkeypatch):
+    """A watch service running in this process is reported from memory, not the status file."""
+    from advanced_memory.sync import watch_service
+
+    state = watch_service.WatchServiceState(running=True, synced_files=3)
+    state.add_event(path="note.md", action="new", status="success")
+    monkeypatch.setattr(watch_service, "_active_state", state)
+
+    status = project_service.get_system_status()
+
+    assert status.watch_status["running"] is True
+    assert status.watch_status["synced_files"] == 3
+    assert status.watch_status["recent_events"][0]["path"] == "note.md"
@@ -0,0 +1,73 @@
+"""Tests for the search result cache."""
+
+import pytest
+
+from advanced_memory.schemas.search import SearchQuery
+from advanced_memory.services import search_cache as search_cache_module
+from advanced_memory.services.search_cache import SearchCache
+
+
+def test_entries_are_valid_for_their_generation():
+    cache = SearchCache()
+    cache.put("key", (0, 1), ["result"])
+
+    assert cache.get("key", (0, 1)) == ["result"]
+    assert cache.get("key", (0, 2)) is None
+    # a stale entry is dropped
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = SearchCache(max_entries=2)
+    cache.put("a", 1, "a")
+    cache.put("b", 1, "b")
+    cache.get("a", 1)
+    cache.put("c", 1, "c")
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == "a"
+    assert cache.get("c", 1) == "c"
+
+
+def test_entries_expire_and_large_results_are_skipped(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(search_cache_module.time, "monotonic", lambda: now[0])
+    cache = SearchCache(max_age=10)
+    cache.put("key", 1, "value")
+    cache.put("large", 1, "value", size=search_cache_module.MAX_CACHED_ROWS + 1)
+
+    assert cache.get("large", 1) is None
+    now[0] += 11
+    assert cache.get("key", 1) is None
+
+    disabled = SearchCache(max_entries=0)
+    disabled.put("key", 1, "value")
+    assert len(disabled) == 0
+
+
+@pytest.mark.asyncio
+async def test_search_is_cached_until_the_index_changes(search_service, test_graph, monkeypatch):
+    calls = []
+    search = search_service.repository.search
+
+    async def counting_search(**kwargs):
+        calls.append(kwargs)
+        return await search(**kwargs)
+
+    monkeypatch.setattr(search_service.repository, "search", counting_search)
+    query = SearchQuery(text="Root")
+
+    first = await search_service.search(query)
+    assert await search_service.search(SearchQuery(text=" Root ")) == first
+    assert len(calls) == 1
+
+    # other pages and queries are cached separately
+    await search_service.search(query, limit=5)
+    assert len(calls) == 2
+
+    # any write to the project's index invalidates its cached results
+    entity = test_graph["root"]
+    await search_service.index_entity(entity)
+    assert await search_service.search(query) == first
+    assert len(calls) == 3
@@ -5,8 +5,12 @@ from datetime import datetime
 import pytest
 from sqlalchemy import text
 
-from basic_memory import db
+from advanced_memory import db
+from advanced_memory.repository.search_repository import SearchIndexRow, SearchRepository
 from advanced_memory.schemas.search import SearchQuery, SearchItemType
+from advanced_memory.services.search_cache import search_cache
+from advanced_memory.services.search_service import _reindex_lock
+from advanced_memory.services.sync_status_service import SyncStatus, sync_status_tracker
 
 
 @pytest.mark.asyncio
@@ -109,6 +113,27 @@ async def test_text_search_content_word_match(search_service, test_graph):
     assert any(r.file_path == "test/Connected Entity 2.md" for r in results)
 
 
+@pytest.mark.asyncio
+async def test_text_search_substring_match(search_service, test_graph):
+    """Parts of words in titles are found through the trigram index."""
+    results = await search_service.search(
+        SearchQuery(text="eeper", entity_types=[SearchItemType.ENTITY])
+    )
+    assert [r.title for r in results] == ["Deeper Entity"]
+
+
+def test_generate_variants_has_no_trigrams(search_service):
+    variants = search_service._generate_variants("specs/Search Design")
+    assert variants == {
+        "specs/Search Design",
+        "specs/search design",
+        "specs",
+        "Search Design",
+        "specs/search",
+        "design",
+    }
+
+
 @pytest.mark.asyncio
 async def test_text_search_multiple_terms(search_service, test_graph):
     """Test text search functionality."""
@@ -176,6 +201,24 @@ async def test_after_date(search_service, test_graph):
     assert len(results) == 0
 
 
+@pytest.mark.asyncio
+async def test_relative_after_date_is_not_cached(search_service, test_graph):
+    """A relative date is parsed against the clock, so its results would never be hit again."""
+    relative = SearchQuery(text="entity", after_date="1 week")
+    absolute = SearchQuery(text="entity", after_date=datetime(2020, 1, 1).isoformat())
+    assert not search_service.is_cacheable(relative)
+    assert search_service.is_cacheable(absolute)
+
+    search_cache.clear()
+    await search_service.search(relative)
+    await search_service.count(relative)
+    assert len(search_cache) == 0
+
+    await search_service.search(absolute)
+    await search_service.count(absolute)
+    assert len(search_cache) == 2
+
+
 @pytest.mark.asyncio
 async def test_search_type(search_service, test_graph):
     """Test search filters."""
@@ -741,3 +784,242 @@ async def test_search_title_via_repository_direct(search_service, session_maker,
     # Should find the entity without throwing FTS5 syntax errors
     assert len(results) >= 1
     assert any(result.title == "Note (with parentheses)" for result in results)
+
+
+def _row(project_id: int, permalink: str, title: str) -> SearchIndexRow:
+    now = datetime.now()
+    return SearchIndexRow(
+        project_id=project_id,
+        id=1,
+        type=SearchItemType.ENTITY.value,
+        title=title,
+        permalink=permalink,
+        file_path=f"{permalink}.md",
+        metadata={"entity_type": "note"},
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def _count_rows(session_maker, project_id: int) -> int:
+    async with db.scoped_session(session_maker) as session:
+        result = await session.execute(
+            text("SELECT count(*) FROM search_index WHERE project_id = :project_id"),
+            {"project_id": project_id},
+        )
+        return result.scalar()
+
+
+@pytest.mark.asyncio
+async def test_reindex_all(search_service, test_graph, session_maker):
+    """Rebuilding the index restores this project's rows and keeps other projects' rows."""
+    project_id = search_service.repository.project_id
+    other = SearchRepository(session_maker, project_id=project_id + 1000)
+    await other.index_item(_row(other.project_id, "other/kept", "Kept Elsewhere"))
+    indexed_before = await _count_rows(session_maker, project_id)
+
+    async with db.scoped_session(session_maker) as session:
+        await session.execute(
+            text("DELETE FROM search_index WHERE project_id = :project_id"),
+            {"project_id": project_id},
+        )
+
+    assert await search_service.reindex_all(project_name="test", chunk_size=2)
+
+    assert await _count_rows(session_maker, project_id) == indexed_before
+    assert await _count_rows(session_maker, other.project_id) == 1
+    results = await search_service.search(SearchQuery(text="Root"))
+    assert any(r.permalink == "test/root" for r in results)
+    assert (await other.search(search_text="Elsewhere"))[0].permalink == "other/kept"
+
+    # the filter tables are rebuilt along with the index, indexes included
+    results = await search_service.search(SearchQuery(text="Root", types=["test"]))
+    assert any(r.permalink == "test/root" for r in results)
+    result = await search_service.repository.execute_query(
+        text("SELECT name FROM sqlite_master WHERE name = 'ix_search_filter_entity_type'"), {}
+    )
+    assert result.scalar() == "ix_search_filter_entity_type"
+
+    status = sync_status_tracker.get_reindex_status("test")
+    assert status.status == SyncStatus.COMPLETED
+    assert status.files_total > 0
+    assert status.files_processed == status.files_total
+
+
+@pytest.mark.asyncio
+async def test_reindex_all_keeps_writes_made_meanwhile(search_service, test_graph, monkeypatch):
+    """Rows written to the live index while the new one is built survive the swap."""
+    repository = search_service.repository
+    insert_shadow_rows = repository.insert_shadow_rows
+    calls = []
+
+    async def insert_and_write(rows):
+        await insert_shadow_rows(rows)
+        if not calls:
+            await repository.index_item(_row(repository.project_id, "late/note", "Late Note"))
+        calls.append(rows)
+
+    monkeypatch.setattr(repository, "insert_shadow_rows", insert_and_write)
+    assert await search_service.reindex_all(chunk_size=1)
+
+    assert len(calls) > 1
+    results = await search_service.search(SearchQuery(permalink="late/note"))
+    assert [r.title for r in results] == ["Late Note"]
+
+
+@pytest.mark.asyncio
+async def test_reindex_all_keeps_other_projects_writes(
+    search_service, test_graph, session_maker, monkeypatch
+):
+    """Another project's rows written after they were copied survive the swap."""
+    repository = search_service.repository
+    other = SearchRepository(session_maker, project_id=repository.project_id + 1000)
+    await other.index_item(_row(other.project_id, "other/note", "Old Title"))
+    copy_other_projects_to_shadow = repository.copy_other_projects_to_shadow
+
+    async def copy_and_write():
+        await copy_other_projects_to_shadow()
+        # as another process would: nothing but the database knows of these writes
+        await other.index_item(_row(other.project_id, "other/note", "New Title"))
+        await other.index_item(_row(other.project_id, "other/added", "Added Later"))
+
+    monkeypatch.setattr(repository, "copy_other_projects_to_shadow", copy_and_write)
+    assert await search_service.reindex_all(chunk_size=2)
+
+    assert [r.title for r in await other.search(permalink="other/note")] == ["New Title"]
+    assert [r.title for r in await other.search(permalink="other/added")] == ["Added Later"]
+    assert await _count_rows(session_maker, other.project_id) == 2
+    result = await repository.execute_query(text("SELECT count(*) FROM search_index_write"), {})
+    assert result.scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_reindex_all_failure_keeps_index(search_service, test_graph, monkeypatch):
+    """A failed rebuild leaves the current index in place and drops the shadow tables."""
+
+    async def fail(rows):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(search_service.repository, "insert_shadow_rows", fail)
+    with pytest.raises(RuntimeError):
+        await search_service.reindex_all(project_name="failing")
+
+    results = await search_service.search(SearchQuery(permalink="test/root"))
+    assert len(results) == 1
+    assert sync_status_tracker.get_reindex_status("failing").status == SyncStatus.FAILED
+    result = await search_service.repository.execute_query(
+        text("SELECT name FROM sqlite_master WHERE name LIKE '%shadow'"), {}
+    )
+    assert result.fetchall() == []
+
+
+@pytest.mark.asyncio
+async def test_reindex_all_runs_once_at_a_time(search_service):
+    async with _reindex_lock:
+        assert await search_service.reindex_all() is False
+
+
+@pytest.mark.asyncio
+async def test_search_snippet_around_match(search_service, session_maker, test_project):
+    """Snippets are the passage of the text around the match, cut at search time."""
+    from advanced_memory.repository import EntityRepository
+
+    entity_repo = EntityRepository(session_maker, project_id=test_project.id)
+    entity = await entity_repo.create(
+        {
+            "title": "Long Note",
+            "entity_type": "note",
+            "content_type": "text/markdown",
+            "file_path": "notes/long-note.md",
+            "permalink": "notes/long-note",
+            "project_id": test_project.id,
+            "created_at": datetime.now(),
+            "updated_at": datetime.now(),
+        }
+    )
+    filler = " ".join(f"filler{i}" for i in range(200))
+    content = f"Opening line. {filler} the zeppelin landed here {filler}"
+    await search_service.index_entity(entity, content=content)
+
+    results = await search_service.search(SearchQuery(text="zeppelin", snippet_tokens=8))
+    snippet = results[0].content_snippet
+    assert "zeppelin" in snippet and "Opening" not in snippet
+    assert len(snippet.split()) <= 8
+
+    results = await search_service.search(SearchQuery(text="zeppelin", highlight=True))
+    assert "**zeppelin**" in results[0].content_snippet
+
+    # the passage around the match is found when the title matches too
+    titled = await entity_repo.create(
+        {
+            "title": "Zeppelin Flights",
+            "entity_type": "note",
+            "content_type": "text/markdown",
+            "file_path": "notes/zeppelin-flights.md",
+            "permalink": "notes/zeppelin-flights",
+            "project_id": test_project.id,
+            "created_at": datetime.now(),
+            "updated_at": datetime.now(),
+        }
+    )
+    await search_service.index_entity(titled, content=f"Intro text. {filler} a zeppelin took off")
+    results = await search_service.search(
+        SearchQuery(text="zeppelin", highlight=True, entity_types=[SearchItemType.ENTITY])
+    )
+    snippets = {row.permalink: row.content_snippet for row in results}
+    assert "**zeppelin**" in snippets["notes/zeppelin-flights"]
+    assert "Intro text" not in snippets["notes/zeppelin-flights"]
+
+    # without a full-text condition the snippet is the start of the content
+    results = await search_service.search(
+        SearchQuery(permalink="notes/long-note", snippet_tokens=8)
+    )
+    assert (
+        results[0].content_snippet
+        == "Opening line. filler0 filler1 filler2 filler3 filler4 filler5..."
+    )
+
+    # the whole text is stored, snippets are cut from it
+    result = await search_service.repository.execute_query(
+        text("SELECT content_snippet FROM search_index WHERE permalink = 'notes/long-note'"), {}
+    )
+    assert result.scalar() == content
+
+
+@pytest.mark.asyncio
+async def test_search_snippet_only_shows_text(search_service, session_maker, test_project):
+    """Title and path variants and tags match, but never show in a snippet."""
+    from advanced_memory.repository import EntityRepository
+
+    entity_repo = EntityRepository(session_maker, project_id=test_project.id)
+
+    async def note(title: str, content: str):
+        entity = await entity_repo.create(
+            {
+                "title": title,
+                "entity_type": "note",
+                "entity_metadata": {"tags": ["aviation"]},
+                "content_type": "text/markdown",
+                "file_path": f"notes/{title}.md",
+                "permalink": f"notes/{title}",
+                "project_id": test_project.id,
+                "created_at": datetime.now(),
+                "updated_at": datetime.now(),
+            }
+        )
+        await search_service.index_entity(entity, content=content)
+
+    await note("blimp-hangar", "Short text.")
+    await note("blimp-empty", "")
+
+    results = await search_service.search(SearchQuery(text="blimp", highlight=True))
+    snippets = {row.permalink: row.content_snippet for row in results}
+    assert snippets["notes/blimp-hangar"] == "Short text."
+    assert snippets["notes/blimp-empty"] == ""
+
+    results = await search_service.search(SearchQuery(text="aviation"))
+    assert {row.content_snippet for row in results} == {"Short text.", ""}
+
+    # matches in the text are still highlighted
+    results = await search_service.search(SearchQuery(text="short", highlight=True))
+    assert [row.content_snippet for row in results] == ["**Short** text."]
@@ -260,3 +260,23 @@ def test_project_isolation_scenario(sync_tracker):
     assert not sync_tracker.is_project_ready("main")
 
     # This demonstrates the fix: project-specific checks allow isolation
+
+
+def test_background_sync_is_ready(sync_tracker):
+    """Projects syncing in the background serve queries unless the sync failed."""
+    sync_tracker.start_background_sync("background")
+    sync_tracker.start_project_sync("background")
+
+    assert sync_tracker.is_syncing
+    assert sync_tracker.is_project_ready("background")
+    assert sync_tracker.is_ready
+
+    sync_tracker.start_project_sync("blocking")
+    assert not sync_tracker.is_ready
+
+    sync_tracker.fail_project_sync("background", "Test error")
+    assert not sync_tracker.is_project_ready("background")
+
+    sync_tracker.end_background_sync("background")
+    sync_tracker.start_project_sync("background")
+    assert not sync_tracker.is_project_ready("background")
@@ -0,0 +1,84 @@
+"""Tests for the watch service's queue of pending changes."""
+
+import asyncio
+
+import pytest
+from watchfiles import Change
+
+from advanced_memory.sync.change_queue import ChangeQueue
+
+
+def test_changes_coalesce_per_path():
+    queue = ChangeQueue()
+    queue.put({(Change.added, "/p/a.md"), (Change.modified, "/p/b.md")})
+    queue.put({(Change.modified, "/p/a.md"), (Change.deleted, "/p/b.md")})
+    queue.put({(Change.modified, "/p/c.md")})
+    queue.put({(Change.modified, "/p/c.md")})
+
+    assert len(queue) == 3
+    changes, full_scan = queue.take()
+
+    # a new file that was then modified is still new
+    assert changes == {
+        (Change.added, "/p/a.md"),
+        (Change.deleted, "/p/b.md"),
+        (Change.modified, "/p/c.md"),
+    }
+    assert not full_scan
+    assert len(queue) == 0
+    assert queue.lag == 0.0
+
+
+def test_overflow_asks_for_full_scan():
+    queue = ChangeQueue(max_size=3)
+    queue.put({(Change.added, f"/p/{i}.md") for i in range(4)})
+
+    assert queue.needs_full_scan
+    assert len(queue) == 0
+    # further changes are covered by the pending full scan
+    queue.put({(Change.added, "/p/late.md")})
+    assert len(queue) == 0
+
+    changes, full_scan = queue.take()
+    assert changes == set()
+    assert full_scan
+    assert not queue.needs_full_scan
+
+
+def test_request_full_scan():
+    queue = ChangeQueue()
+    queue.put({(Change.modified, "/p/a.md")})
+
+    queue.request_full_scan()
+
+    assert queue.needs_full_scan
+    assert queue.take() == (set(), True)
+
+
+def test_lag_measures_oldest_pending_change(monkeypatch):
+    now = [10.0]
+    monkeypatch.setattr("advanced_memory.sync.change_queue.time.monotonic", lambda: now[0])
+    queue = ChangeQueue()
+
+    queue.put({(Change.added, "/p/a.md")})
+    now[0] = 12.5
+    queue.put({(Change.added, "/p/b.md")})
+    now[0] = 13.0
+
+    assert queue.lag == 3.0
+
+
+@pytest.mark.asyncio
+async def test_wait_until_changes_or_closed():
+    queue = ChangeQueue()
+
+    waiter = asyncio.create_task(queue.wait())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    queue.put({(Change.added, "/p/a.md")})
+    assert await waiter is True
+
+    queue.take()
+    queue.close()
+    assert await queue.wait() is False
@@ -0,0 +1,98 @@
+"""Tests for the single-read sync file pipeline."""
+
+from pathlib import Path
+from textwrap import dedent
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from advanced_memory.config import ProjectConfig
+from advanced_memory.services import FileService
+from advanced_memory.sync.file_pipeline import ContentBudget, SyncFile, parse_sync_file
+from advanced_memory.sync.sync_service import SyncService
+
+
+def test_read_checksum_matches_file_service_with_crlf(tmp_path: Path):
+    (tmp_path / "note.md").write_bytes(b"# Note\r\n\r\nline one\r\nline two\r\n")
+    file_service = FileService(tmp_path, markdown_processor=None)
+
+    sync_file = SyncFile.read(tmp_path, "note.md", is_markdown=True)
+
+    assert sync_file.text == "# Note\n\nline one\nline two\n"
+    assert sync_file.checksum == file_service.compute_checksum_sync("note.md")
+    assert sync_file.stat is not None
+
+
+def test_read_drops_text_past_budget(tmp_path: Path):
+    (tmp_path / "a.md").write_text("a" * 10)
+    (tmp_path / "b.md").write_text("b" * 10)
+    budget = ContentBudget(15)
+
+    first = SyncFile.read(tmp_path, "a.md", is_markdown=True, budget=budget)
+    second = SyncFile.read(tmp_path, "b.md", is_markdown=True, budget=budget)
+
+    assert first.text == "a" * 10
+    assert second.text is None
+    assert second.checksum
+
+
+def test_load_text_reads_when_not_kept(tmp_path: Path):
+    (tmp_path / "note.md").write_text("# Note\r\n")
+    sync_file = SyncFile.read(tmp_path, "note.md", is_markdown=True, budget=ContentBudget(0))
+    checksum = sync_file.checksum
+
+    assert sync_file.load_text(tmp_path) == "# Note\n"
+    assert sync_file.text == "# Note\n"
+    assert sync_file.checksum == checksum
+    assert sync_file.is_current(tmp_path)
+
+
+def test_parse_sync_file_reads_when_text_not_kept(tmp_path: Path):
+    (tmp_path / "note.md").write_text("# Note\n\n- [idea] Something\n")
+    sync_file = SyncFile.read(tmp_path, "note.md", is_markdown=True, budget=ContentBudget(0))
+
+    parsed = parse_sync_file(tmp_path, "note.md", sync_file)
+
+    assert parsed.markdown is not None
+    assert len(parsed.markdown.observations) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_reads_each_file_once(sync_service: SyncService, project_config: ProjectConfig):
+    """A new note is read once, even when its permalink is written back to the file."""
+    project_dir = project_config.home
+    note = project_dir / "notes/once.md"
+    note.parent.mkdir(parents=True)
+    note.write_text(
+        dedent("""
+        ---
+        title: Once
+        type: note
+        ---
+        # Once
+
+        searchable body text
+        """).strip()
+    )
+
+    file_service = sync_service.search_service.file_service
+    with (
+        patch.object(SyncFile, "read", wraps=SyncFile.read) as mock_read,
+        patch.object(file_service, "read_entity_content", AsyncMock()) as mock_content,
+    ):
+        await sync_service.sync(project_dir)
+
+    mock_read.assert_called_once()
+    mock_content.assert_not_called()
+
+    entity = await sync_service.entity_repository.get_by_file_path("notes/once.md")
+    assert entity.permalink == "notes/once"
+    assert "permalink: notes/once" in note.read_text()
+    assert entity.checksum == await sync_service.file_service.compute_checksum("notes/once.md")
+
+    results = await sync_service.search_service.repository.search(search_text="searchable")
+    assert any(r.entity_id == entity.id for r in results)
+
+    # the rewritten file is not seen as modified on the next scan
+    report = await sync_service.scan(project_dir, verify_checksums=True)
+    assert report.total == 0
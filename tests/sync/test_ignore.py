@@ -0,0 +1,136 @@
+"""Tests for ignore rules shared by sync and the watch service."""
+
+from pathlib import Path
+
+import pytest
+
+from advanced_memory.sync.ignore import IgnoreMatcher, compile_rule, is_ignored_name
+
+
+def write(path: Path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def rule_matches(line: str, path: str, is_dir: bool = False) -> bool:
+    rule = compile_rule(line)
+    assert rule is not None
+    return rule.matches(path, is_dir)
+
+
+def test_is_ignored_name():
+    assert is_ignored_name(".hidden.md")
+    assert is_ignored_name("node_modules")
+    assert not is_ignored_name("notes.md")
+
+
+@pytest.mark.parametrize(
+    "line, path, expected",
+    [
+        ("*.log", "debug.log", True),
+        ("*.log", "a/b/debug.log", True),
+        ("*.log", "debug.log.md", False),
+        ("/todo.md", "todo.md", True),
+        ("/todo.md", "a/todo.md", False),
+        ("docs/*.md", "docs/a.md", True),
+        ("docs/*.md", "docs/sub/a.md", False),
+        ("docs/*.md", "x/docs/a.md", False),
+        ("**/tmp", "a/b/tmp", True),
+        ("a/**/b.md", "a/b.md", True),
+        ("a/**/b.md", "a/x/y/b.md", True),
+        ("a/**", "a/x/y.md", True),
+        ("note?.md", "note1.md", True),
+        ("note[0-9].md", "note7.md", True),
+        ("note[!0-9].md", "note7.md", False),
+        ("\\#hash.md", "#hash.md", True),
+    ],
+)
+def test_glob_rules(line, path, expected):
+    assert rule_matches(line, path) is expected
+
+
+def test_comments_and_blanks_are_skipped():
+    assert compile_rule("# comment") is None
+    assert compile_rule("   ") is None
+    assert compile_rule("/") is None
+
+
+def test_dir_only_rule():
+    assert rule_matches("build/", "build", is_dir=True)
+    assert not rule_matches("build/", "build", is_dir=False)
+
+
+def test_negation_last_rule_wins(tmp_path):
+    write(tmp_path / ".gitignore", "*.md\n!keep.md\n")
+
+    matcher = IgnoreMatcher(tmp_path)
+
+    assert matcher.is_ignored("drop.md")
+    assert not matcher.is_ignored("keep.md")
+    assert not matcher.is_ignored("sub/keep.md")
+
+
+def test_nested_ignore_files(tmp_path):
+    write(tmp_path / ".gitignore", "*.bak\n")
+    write(tmp_path / "a" / ".memoryignore", "/local.md\n!important.bak\n")
+
+    matcher = IgnoreMatcher(tmp_path)
+
+    assert matcher.is_ignored("x.bak")
+    assert matcher.is_ignored("a/local.md")
+    assert not matcher.is_ignored("local.md")
+    assert not matcher.is_ignored("a/b/local.md")
+    assert not matcher.is_ignored("a/important.bak")
+    assert matcher.is_ignored("important.bak")
+
+
+def test_files_in_ignored_directories(tmp_path):
+    write(tmp_path / ".gitignore", "private/\n")
+
+    matcher = IgnoreMatcher(tmp_path)
+
+    assert matcher.is_ignored("private", is_dir=True)
+    assert matcher.is_ignored("private/deep/note.md")
+    assert matcher.is_ignored(".obsidian/workspace.json")
+    assert matcher.is_ignored("node_modules/pkg/readme.md")
+    assert not matcher.is_ignored("public/note.md")
+
+
+def test_walk_prunes_ignored_directories(tmp_path, monkeypatch):
+    write(tmp_path / ".gitignore", "archive/\n*.draft.md\n")
+    write(tmp_path / "note.md")
+    write(tmp_path / "idea.draft.md")
+    write(tmp_path / "archive" / "old.md")
+    write(tmp_path / "node_modules" / "pkg" / "readme.md")
+    write(tmp_path / "sub" / "keep.md")
+
+    matcher = IgnoreMatcher(tmp_path)
+    # reading rules for a pruned directory would mean it was walked
+    seen = []
+    rules_for = matcher.rules_for
+    monkeypatch.setattr(
+        matcher, "rules_for", lambda rel_dir, *args: seen.append(rel_dir) or rules_for(rel_dir, *args)
+    )
+
+    files = {
+        str(Path(dirpath, name).relative_to(tmp_path).as_posix())
+        for dirpath, names in matcher.walk()
+        for name in names
+    }
+
+    assert files == {"note.md", "sub/keep.md"}
+    assert "archive" not in seen
+    assert "node_modules" not in seen
+
+
+def test_rules_are_cached_until_invalidated(tmp_path):
+    write(tmp_path / ".gitignore", "a.md\n")
+    matcher = IgnoreMatcher(tmp_path)
+    assert matcher.is_ignored("a.md")
+
+    write(tmp_path / ".gitignore", "b.md\n")
+    assert matcher.is_ignored("a.md")
+
+    matcher.invalidate()
+    assert not matcher.is_ignored("a.md")
+    assert matcher.is_ignored("b.md")
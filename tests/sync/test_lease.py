@@ -0,0 +1,130 @@
+"""Tests for the leases on watching a project."""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from advanced_memory.sync.lease import ProjectLease
+
+
+def test_only_one_process_holds_a_lease(tmp_path):
+    first = ProjectLease(str(tmp_path / "project"), tmp_path / "leases", ttl=30)
+    second = ProjectLease(str(tmp_path / "project"), tmp_path / "leases", ttl=30)
+    other_project = ProjectLease(str(tmp_path / "other"), tmp_path / "leases", ttl=30)
+
+    assert first.acquire()
+    assert not second.acquire()
+    assert other_project.acquire()
+    assert second.read().owner == first.owner
+
+    # renewing moves the expiry forward
+    expires_at = first.read().expires_at
+    time.sleep(0.01)
+    assert first.acquire()
+    assert first.read().expires_at > expires_at
+
+    first.release()
+    assert not first.path.exists()
+    assert second.acquire()
+    assert not first.acquire()
+
+
+def test_release_leaves_other_holders_lease(tmp_path):
+    holder = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=30)
+    other = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=30)
+    assert holder.acquire()
+
+    other.release()
+    assert holder.path.exists()
+    assert holder.acquire()
+
+
+def test_expired_lease_is_taken_over(tmp_path):
+    holder = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=0.05)
+    other = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=30)
+    assert holder.acquire()
+    assert not other.acquire()
+
+    time.sleep(0.1)
+    assert other.acquire()
+    # the previous holder notices on its next renewal
+    assert not holder.acquire()
+    assert not holder.held
+
+
+def test_lease_of_dead_process_is_taken_over(tmp_path):
+    lease = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=30)
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    lease.path.parent.mkdir(parents=True)
+    lease.path.write_text(
+        json.dumps(
+            {
+                "owner": "gone",
+                "pid": process.pid,
+                "host": lease.host,
+                "expires_at": time.time() + 30,
+            }
+        )
+    )
+
+    assert lease.acquire()
+    assert lease.read().pid == os.getpid()
+
+
+def test_unreadable_lease_counts_as_held_until_old(tmp_path):
+    lease = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=30)
+    lease.path.parent.mkdir(parents=True)
+    lease.path.write_text("")
+    assert not lease.acquire()
+
+    old = time.time() - 60
+    os.utime(lease.path, (old, old))
+    assert lease.acquire()
+
+
+def test_stale_lease_is_taken_over_once(tmp_path):
+    def take(barrier, lease):
+        barrier.wait()
+        return lease.acquire()
+
+    stale = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=0.01)
+    for _ in range(20):
+        assert stale.acquire()
+        time.sleep(0.02)
+        contenders = [ProjectLease(str(tmp_path), tmp_path / "leases", ttl=30) for _ in range(8)]
+        barrier = threading.Barrier(len(contenders))
+
+        with ThreadPoolExecutor(len(contenders)) as pool:
+            taken = list(pool.map(partial(take, barrier), contenders))
+
+        assert taken.count(True) == 1
+        assert [lease.held for lease in contenders].count(True) == 1
+        contenders[taken.index(True)].release()
+        assert not list(stale.path.parent.glob("*.claim"))
+
+
+def test_claimed_takeover_is_left_to_the_claimant(tmp_path):
+    holder = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=0.05)
+    other = ProjectLease(str(tmp_path), tmp_path / "leases", ttl=0.05)
+    assert holder.acquire()
+    time.sleep(0.1)
+    record = holder.read()
+    assert record is not None
+    digest = hashlib.sha1(f"{record.owner}:{record.expires_at}".encode()).hexdigest()
+    claim_path = holder.path.with_name(f"{holder.path.stem}.{digest[:16]}.claim")
+    claim_path.write_text("")
+
+    assert not other.acquire()
+    assert other.read() == record
+
+    # the claimant died: its claim expires too
+    time.sleep(0.1)
+    assert not other.acquire()
+    assert other.acquire()
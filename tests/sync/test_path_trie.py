@@ -0,0 +1,44 @@
+"""Tests for longest-prefix lookup of directories."""
+
+import os
+
+from advanced_memory.sync.path_trie import PathTrie
+
+
+def p(*parts: str) -> str:
+    return os.sep + os.sep.join(parts)
+
+
+def test_match_innermost_directory():
+    trie = PathTrie()
+    trie.add(p("home", "notes"), "notes")
+    trie.add(p("home", "notes", "work"), "work")
+    trie.add(p("home", "other"), "other")
+
+    assert len(trie) == 3
+    assert trie.match(p("home", "notes", "a.md")) == (p("home", "notes"), "notes")
+    assert trie.match(p("home", "notes", "work", "sub", "b.md")) == (
+        p("home", "notes", "work"),
+        "work",
+    )
+    assert trie.match(p("home", "other", "c.md")) == (p("home", "other"), "other")
+
+
+def test_no_match_outside_or_for_the_directory_itself():
+    trie = PathTrie()
+    trie.add(p("home", "notes"), "notes")
+
+    assert trie.match(p("home", "notes")) is None
+    assert trie.match(p("home", "notes-archive", "a.md")) is None
+    assert trie.match(p("home", "a.md")) is None
+    assert trie.match(p("srv", "notes", "a.md")) is None
+
+
+def test_paths_are_normalized():
+    trie = PathTrie()
+    trie.add(p("home", "notes") + os.sep, "notes")
+
+    assert len(trie) == 1
+    trie.add(p("home", "x", "..", "notes"), "replaced")
+    assert len(trie) == 1
+    assert trie.match(p("home", "notes", ".", "a.md")) == (p("home", "notes"), "replaced")
@@ -0,0 +1,107 @@
+"""Tests for the polling watch backend."""
+
+import os
+
+import pytest
+from watchfiles import Change
+
+from advanced_memory.sync.ignore import IgnoreMatcher
+from advanced_memory.sync.poll_watcher import (
+    ManifestPoller,
+    apoll,
+    diff_manifests,
+    load_manifest,
+    scan_tree,
+)
+
+
+def write(path, content="content"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_scan_tree_skips_ignored(tmp_path):
+    write(tmp_path / "a.md")
+    write(tmp_path / "sub" / "deeper" / "b.md")
+    write(tmp_path / ".git" / "config")
+    write(tmp_path / "build" / "c.md")
+    write(tmp_path / ".gitignore", "build/\n")
+
+    manifest = scan_tree(str(tmp_path), IgnoreMatcher(tmp_path), workers=2)
+
+    assert set(manifest) == {"a.md", "sub/deeper/b.md"}
+    assert manifest["a.md"].size == len("content")
+    assert set(scan_tree(str(tmp_path))) >= {"build/c.md", ".gitignore"}
+
+
+def test_diff_manifests(tmp_path):
+    write(tmp_path / "same.md")
+    write(tmp_path / "changed.md")
+    write(tmp_path / "removed.md")
+    old = scan_tree(str(tmp_path))
+
+    write(tmp_path / "changed.md", "more content")
+    (tmp_path / "removed.md").unlink()
+    write(tmp_path / "new" / "added.md")
+    new = scan_tree(str(tmp_path))
+
+    assert diff_manifests(str(tmp_path), old, new) == {
+        (Change.modified, str(tmp_path / "changed.md")),
+        (Change.deleted, str(tmp_path / "removed.md")),
+        (Change.added, str(tmp_path / "new" / "added.md")),
+    }
+    assert diff_manifests(str(tmp_path), new, new) == set()
+
+
+@pytest.mark.asyncio
+async def test_poller_persists_manifest(tmp_path):
+    project = tmp_path / "project"
+    manifest_path = tmp_path / "manifests" / "project.json"
+    write(project / "a.md")
+    write(project / "b.md")
+
+    poller = ManifestPoller(str(project), manifest_path)
+    # no manifest yet: the first poll only records the listing
+    assert await poller.poll() == set()
+    assert set(load_manifest(manifest_path)) == {"a.md", "b.md"}
+    assert await poller.poll() == set()
+
+    # changes made while no poller runs are found from the saved manifest
+    (project / "b.md").rename(project / "c.md")
+    poller = ManifestPoller(str(project), manifest_path)
+    assert await poller.poll() == {
+        (Change.deleted, str(project / "b.md")),
+        (Change.added, str(project / "c.md")),
+    }
+    assert set(load_manifest(manifest_path)) == {"a.md", "c.md"}
+
+
+def test_load_manifest_rejects_bad_files(tmp_path):
+    path = tmp_path / "manifest.json"
+    assert load_manifest(path) is None
+    path.write_text("not json")
+    assert load_manifest(path) is None
+    path.write_text('{"version": 0, "files": {}}')
+    assert load_manifest(path) is None
+
+
+@pytest.mark.asyncio
+async def test_apoll_yields_filtered_batches(tmp_path):
+    write(tmp_path / "a.md")
+    poller = ManifestPoller(str(tmp_path), tmp_path.parent / f"{tmp_path.name}.json")
+    await poller.poll()
+
+    write(tmp_path / "b.md")
+    write(tmp_path / "b.md.tmp")
+    os.utime(tmp_path / "a.md", ns=(0, 0))
+
+    batches = apoll(
+        [poller], interval=0.01, watch_filter=lambda change, path: not path.endswith(".tmp")
+    )
+    changes = await anext(batches)
+    await batches.aclose()
+
+    assert changes == {
+        (Change.added, str(tmp_path / "b.md")),
+        (Change.modified, str(tmp_path / "a.md")),
+    }
@@ -0,0 +1,61 @@
+"""Tests for the sync benchmark harness."""
+
+import json
+
+import pytest
+
+from advanced_memory.sync.benchmark import (
+    SCENARIOS,
+    VaultSpec,
+    generate_vault,
+    modify_notes,
+    run_benchmark,
+)
+
+
+def test_generate_vault_is_reproducible(tmp_path):
+    spec = VaultSpec(notes=20, folders=4, attachment_ratio=0.5, seed=7)
+
+    paths = generate_vault(tmp_path / "a", spec)
+    generate_vault(tmp_path / "b", spec)
+
+    assert len(paths) == 20
+    assert len({path.split("/")[0] for path in paths}) == 4
+    files_a = sorted(p.relative_to(tmp_path / "a") for p in (tmp_path / "a").rglob("*.*"))
+    files_b = sorted(p.relative_to(tmp_path / "b") for p in (tmp_path / "b").rglob("*.*"))
+    assert files_a == files_b
+    assert any(path.suffix == ".png" for path in files_a)
+    assert (tmp_path / "a" / paths[0]).read_text() == (tmp_path / "b" / paths[0]).read_text()
+
+
+def test_generated_notes_have_links_and_observations(tmp_path):
+    spec = VaultSpec(notes=5, observations=2, links=1, frontmatter_fields=2)
+    paths = generate_vault(tmp_path, spec)
+
+    text = (tmp_path / paths[0]).read_text()
+    assert text.startswith("---\ntitle: Note 000000\n")
+    assert "field_1:" in text
+    assert text.count("\n- [") == 2
+    assert text.count("[[Note ") == 1
+
+    assert modify_notes(tmp_path, spec, fraction=0.5) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark(tmp_path, app_config):
+    spec = VaultSpec(notes=12, folders=3, links=1.5, attachment_ratio=0.2)
+
+    results = await run_benchmark(tmp_path, spec, engines=["memory"], app_config=app_config)
+
+    # machine-readable
+    json.dumps(results)
+    assert results["spec"]["notes"] == 12
+    by_scenario = {result["scenario"]: result for result in results["results"]}
+    assert list(by_scenario) == list(SCENARIOS)
+    assert all(result["engine"] == "memory" for result in results["results"])
+
+    assert by_scenario["cold"]["new"] >= 12
+    assert by_scenario["noop"]["changes"] == 0
+    assert by_scenario["modified"]["modified"] == 1
+    assert by_scenario["move"]["moves"] >= 4
+    assert by_scenario["delete"]["deleted"] >= 4
@@ -0,0 +1,57 @@
+"""Tests for the queue of files a running sync still has to write."""
+
+import asyncio
+
+import pytest
+
+from advanced_memory.sync.sync_queue import SyncQueue
+
+
+def test_take_in_order():
+    queue = SyncQueue([("a.md", True), ("b.md", False), ("c.md", True)])
+
+    assert queue.take(2) == [("a.md", True), ("b.md", False)]
+    assert len(queue) == 3
+    assert "a.md" in queue
+    assert queue.take(2) == [("c.md", True)]
+    assert queue.take(2) == []
+
+
+def test_claim_removes_pending_files():
+    queue = SyncQueue([("a.md", True), ("b.md", False), ("c.md", True)])
+    queue.take(1)
+
+    claimed, in_flight = queue.claim(["c.md", "a.md", "missing.md", "c.md"])
+
+    assert claimed == [("c.md", True)]
+    assert in_flight == ["a.md"]
+    assert queue.take(5) == [("b.md", False)]
+
+
+@pytest.mark.asyncio
+async def test_wait_until_done():
+    queue = SyncQueue([("a.md", True), ("b.md", True)])
+    queue.take(2)
+
+    waiter = asyncio.create_task(queue.wait(["a.md", "b.md"]))
+    await asyncio.sleep(0)
+    queue.done(["a.md"])
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    queue.done(["b.md"])
+    await asyncio.wait_for(waiter, 1)
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_close_releases_waiters():
+    queue = SyncQueue([("a.md", True), ("b.md", True)])
+    queue.take(1)
+
+    waiter = asyncio.create_task(queue.wait(["a.md"]))
+    await asyncio.sleep(0)
+    queue.close()
+
+    await asyncio.wait_for(waiter, 1)
+    assert len(queue) == 0
@@ -0,0 +1,196 @@
+"""Tests for background syncs that serve reads on demand."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from advanced_memory.config import ProjectConfig
+from advanced_memory.services.sync_status_service import sync_status_tracker
+from advanced_memory.sync.sync_scheduler import SyncScheduler, resource_paths
+from advanced_memory.sync import sync_service as sync_service_module
+from advanced_memory.sync.file_pipeline import SyncFile
+from advanced_memory.sync.sync_queue import SyncQueue
+from advanced_memory.sync.sync_service import SyncService
+
+
+def test_resource_paths():
+    assert resource_paths("notes/idea") == ["notes/idea", "notes/idea.md"]
+    assert resource_paths("/notes/idea.md") == ["notes/idea.md"]
+    assert resource_paths("notes/*") == []
+
+
+@pytest.mark.asyncio
+async def test_sync_now_without_running_sync(sync_service: SyncService):
+    scheduler = SyncScheduler()
+
+    assert not scheduler.is_syncing("nothing")
+    assert await scheduler.sync_now("nothing", ["a.md"]) is False
+
+
+@pytest.mark.asyncio
+async def test_requested_file_is_synced_ahead_of_the_queue(
+    sync_service: SyncService, project_config: ProjectConfig, monkeypatch
+):
+    project_dir = project_config.home
+    # parse chunks of 32 files, so the sync has taken 64 files ahead of the writer
+    monkeypatch.setattr(sync_service_module, "PARALLEL_PARSE_THRESHOLD", 1)
+    sync_service.app_config.sync_workers = 1
+    sync_service.app_config.sync_batch_size = 10
+    for i in range(80):
+        path = Path(project_dir) / f"vault/note_{i:02d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# Note {i}\n")
+
+    synced = []
+    gate = asyncio.Event()
+    sync_file = sync_service.sync_file
+
+    async def gated_sync_file(path, *args, **kwargs):
+        synced.append(path)
+        if len(synced) == 1:
+            await gate.wait()
+        return await sync_file(path, *args, **kwargs)
+
+    sync_service.sync_file = gated_sync_file
+    scheduler = SyncScheduler()
+    project_name = "background-sync-project"
+    sync_task = asyncio.create_task(scheduler.sync(project_name, sync_service, project_dir))
+
+    while not synced:
+        await asyncio.sleep(0.01)
+
+    # the project answers queries while it syncs
+    assert scheduler.is_syncing(project_name)
+    assert sync_status_tracker.is_project_ready(project_name)
+
+    # a file at the back of the queue
+    queue = sync_service.sync_queue
+    assert queue is not None
+    target = list(queue._pending)[-1]
+    reader = asyncio.create_task(scheduler.sync_now(project_name, [target]))
+    # claimed while the first batch is being written
+    while target in queue._pending:
+        await asyncio.sleep(0.01)
+    gate.set()
+
+    assert await asyncio.wait_for(reader, 60) is True
+    assert await sync_service.entity_repository.get_by_file_path(target) is not None
+    assert not sync_task.done()
+
+    # synced right after the batch that was being written
+    assert synced.index(target) == 10
+
+    report = await asyncio.wait_for(sync_task, 120)
+    assert len(report.new) == 80
+    assert synced.count(target) == 1
+    assert not scheduler.is_syncing(project_name)
+
+
+@pytest.mark.asyncio
+async def test_sync_now_while_scanning_syncs_changed_files(
+    sync_service: SyncService, project_config: ProjectConfig
+):
+    project_dir = Path(project_config.home)
+    (project_dir / "unchanged.md").write_text("# Unchanged\n")
+    await sync_service.sync(project_dir)
+    (project_dir / "fresh.md").write_text("# Fresh\n")
+
+    sync_service.scanning = True
+    try:
+        assert await sync_service.sync_now(["fresh.md", "unchanged.md", "missing.md"]) is True
+        assert await sync_service.sync_now(["unchanged.md", ".hidden.md"]) is False
+    finally:
+        sync_service.scanning = False
+
+    assert await sync_service.entity_repository.get_by_file_path("fresh.md") is not None
+
+
+def test_pending_paths_by_permalink_or_title(sync_service: SyncService, tmp_path: Path):
+    """Files the sync has yet to write are found by the names they will be synced under."""
+    (tmp_path / "drafts").mkdir()
+    idea = tmp_path / "drafts/Big Idea.md"
+    idea.write_text("---\ntitle: The Big One\npermalink: ideas/the-big-one\n---\n# The Big One\n")
+    (tmp_path / "drafts/Side Note.md").write_text("# Side Note\n")
+
+    sync_service.sync_queue = SyncQueue(
+        [("drafts/Big Idea.md", True), ("drafts/Side Note.md", True), ("done.md", True)]
+    )
+    sync_service.sync_loaded = {
+        path: SyncFile.read(tmp_path, path, True)
+        for path in ("drafts/Big Idea.md", "drafts/Side Note.md")
+    }
+    sync_service.sync_queue.take(1)
+    sync_service.sync_queue.claim(["done.md"])
+    sync_service.sync_queue.done(["done.md"])
+    try:
+        # by the permalink and title in its frontmatter, taken but not written yet
+        assert sync_service.pending_paths("ideas/the-big-one") == ["drafts/Big Idea.md"]
+        assert sync_service.pending_paths("The Big One") == ["drafts/Big Idea.md"]
+        # by the permalink and title of its path
+        assert sync_service.pending_paths("drafts/side-note") == ["drafts/Side Note.md"]
+        assert sync_service.pending_paths("Side Note") == ["drafts/Side Note.md"]
+        # written already
+        assert sync_service.pending_paths("done") == []
+    finally:
+        sync_service.sync_queue = None
+        sync_service.sync_loaded = {}
+
+
+@pytest.mark.asyncio
+async def test_file_requested_by_permalink_is_synced_ahead(
+    sync_service: SyncService, project_config: ProjectConfig, monkeypatch
+):
+    """A file is synced ahead of the queue when asked for by a permalink its path doesn't give."""
+    project_dir = Path(project_config.home)
+    idea = project_dir / "drafts/Big Idea.md"
+    idea.parent.mkdir(parents=True)
+    idea.write_text("---\ntitle: Big Idea\npermalink: ideas/old-name\n---\n# Big Idea\n")
+    await sync_service.sync(project_dir)
+
+    # parse chunks of 32 files, new files are queued before the modified one
+    monkeypatch.setattr(sync_service_module, "PARALLEL_PARSE_THRESHOLD", 1)
+    sync_service.app_config.sync_workers = 1
+    sync_service.app_config.sync_batch_size = 10
+    for i in range(80):
+        (project_dir / f"vault/note_{i:02d}.md").parent.mkdir(exist_ok=True)
+        (project_dir / f"vault/note_{i:02d}.md").write_text(f"# Note {i}\n")
+    idea.write_text("---\ntitle: Big Idea\npermalink: ideas/the-big-one\n---\n# Big Idea\n")
+
+    synced = []
+    gate = asyncio.Event()
+    sync_file = sync_service.sync_file
+
+    async def gated_sync_file(path, *args, **kwargs):
+        synced.append(path)
+        if len(synced) == 1:
+            await gate.wait()
+        return await sync_file(path, *args, **kwargs)
+
+    sync_service.sync_file = gated_sync_file
+    scheduler = SyncScheduler()
+    project_name = "identifier-sync-project"
+    sync_task = asyncio.create_task(scheduler.sync(project_name, sync_service, project_dir))
+    while not synced:
+        await asyncio.sleep(0.01)
+
+    # neither a path nor known to the database yet
+    queue = sync_service.sync_queue
+    assert queue is not None
+    reader = asyncio.create_task(scheduler.sync_identifier(project_name, "ideas/the-big-one"))
+    # claimed while the first batch is being written
+    while "drafts/Big Idea.md" in queue._pending:
+        await asyncio.sleep(0.01)
+    gate.set()
+
+    assert await asyncio.wait_for(reader, 60) is True
+    entity = await sync_service.entity_repository.get_by_permalink("ideas/the-big-one")
+    assert entity is not None
+    assert entity.file_path == "drafts/Big Idea.md"
+    assert not sync_task.done()
+
+    # synced right after the batch that was being written
+    assert synced.index("drafts/Big Idea.md") == 10
+
+    await asyncio.wait_for(sync_task, 120)
+    assert synced.count("drafts/Big Idea.md") == 1
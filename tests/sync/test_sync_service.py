@@ -1,18 +1,23 @@
 """Test general sync behavior."""
 
 import asyncio
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
 
+from advanced_memory import db
 from advanced_memory.config import ProjectConfig, AdvancedMemoryConfig
 from advanced_memory.models import Entity
 from advanced_memory.repository import EntityRepository
 from advanced_memory.schemas.search import SearchQuery
 from advanced_memory.services import EntityService, FileService
+from advanced_memory.services.link_index import LinkIndex
 from advanced_memory.services.search_service import SearchService
+from advanced_memory.sync.file_pipeline import SyncFile
 from advanced_memory.sync.sync_service import SyncService
 
 
@@ -74,6 +79,42 @@ Target content
     assert source.relations[0].to_name == target.title
 
 
+@pytest.mark.asyncio
+async def test_forward_references_resolved_in_one_pass(
+    sync_service: SyncService,
+    project_config: ProjectConfig,
+    entity_service: EntityService,
+):
+    """Forward references are resolved from one link index and one bulk update."""
+    project_dir = project_config.home
+    for i in range(3):
+        await create_test_file(
+            project_dir / f"source-{i}.md",
+            f"# Source {i}\n\n## Relations\n- depends_on [[Shared Target]]\n",
+        )
+    await sync_service.sync(project_dir)
+
+    await create_test_file(project_dir / "shared.md", "---\ntitle: Shared Target\n---\nshared\n")
+
+    relation_repository = sync_service.relation_repository
+    with (
+        patch.object(LinkIndex, "build", wraps=LinkIndex.build) as mock_build,
+        patch.object(
+            relation_repository, "update_targets", wraps=relation_repository.update_targets
+        ) as mock_update,
+    ):
+        await sync_service.sync(project_dir)
+
+    mock_build.assert_called_once()
+    mock_update.assert_called_once()
+
+    target = await sync_service.entity_repository.get_by_file_path("shared.md")
+    for i in range(3):
+        source = await sync_service.entity_repository.get_by_file_path(f"source-{i}.md")
+        assert source.relations[0].to_id == target.id
+        assert source.relations[0].to_name == "Shared Target"
+
+
 @pytest.mark.asyncio
 async def test_sync(
     sync_service: SyncService, project_config: ProjectConfig, entity_service: EntityService
@@ -154,6 +195,27 @@ async def test_sync_hidden_file(
     assert len(entities) == 0
 
 
+@pytest.mark.asyncio
+async def test_sync_honors_gitignore(
+    sync_service: SyncService, project_config: ProjectConfig, entity_service: EntityService
+):
+    """Files matched by .gitignore/.memoryignore are not synced."""
+    project_dir = project_config.home
+
+    await create_test_file(project_dir / ".gitignore", "drafts/\n*.tmp.md\n")
+    await create_test_file(project_dir / "notes/.memoryignore", "private-*\n")
+    await create_test_file(project_dir / "drafts/draft.md", "draft")
+    await create_test_file(project_dir / "notes/scratch.tmp.md", "scratch")
+    await create_test_file(project_dir / "notes/private-diary.md", "diary")
+    await create_test_file(project_dir / "notes/public.md", "public")
+
+    report = await sync_service.sync(project_config.home)
+
+    assert report.new == {"notes/public.md"}
+    entities = await entity_service.repository.find_all()
+    assert [entity.file_path for entity in entities] == ["notes/public.md"]
+
+
 @pytest.mark.asyncio
 async def test_sync_entity_with_nonexistent_relations(
     sync_service: SyncService, project_config: ProjectConfig
@@ -1311,3 +1373,216 @@ This is a test file for update failure after constraint violation.
             await sync_service.sync_regular_file(
                 str(test_file.relative_to(project_config.home)), new=True
             )
+
+
+def age_file(path: Path, seconds: int = 60) -> None:
+    """Push a file's mtime into the past so its stat is outside the racy window."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.mark.asyncio
+async def test_scan_skips_hashing_unchanged_files(
+    sync_service: SyncService, project_config: ProjectConfig
+):
+    """Files whose stat matches the db are not re-hashed on the next scan."""
+    project_dir = project_config.home
+    await create_test_file(project_dir / "unchanged.md", "# Unchanged\n")
+    age_file(project_dir / "unchanged.md")
+
+    await sync_service.sync(project_dir)
+
+    with patch.object(SyncFile, "read", wraps=SyncFile.read) as mock_read:
+        report = await sync_service.scan(project_dir)
+
+    assert report.total == 0
+    mock_read.assert_not_called()
+
+    # verify mode hashes everything
+    with patch.object(SyncFile, "read", wraps=SyncFile.read) as mock_read:
+        report = await sync_service.scan(project_dir, verify_checksums=True)
+
+    assert report.total == 0
+    mock_read.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_scan_detects_change_with_same_size(
+    sync_service: SyncService, project_config: ProjectConfig
+):
+    """A content change that keeps the size is still detected through mtime."""
+    project_dir = project_config.home
+    test_file = project_dir / "same_size.md"
+    await create_test_file(test_file, "# Note\ncontent aaaa\n")
+    age_file(test_file)
+    await sync_service.sync(project_dir)
+
+    test_file.write_text("# Note\ncontent bbbb\n")
+
+    report = await sync_service.scan(project_dir)
+    assert report.modified == {"same_size.md"}
+
+
+@pytest.mark.asyncio
+async def test_sync_refreshes_stale_stats(
+    sync_service: SyncService, project_config: ProjectConfig, entity_repository: EntityRepository
+):
+    """Touching a file without changing content refreshes its recorded stat."""
+    project_dir = project_config.home
+    test_file = project_dir / "touched.md"
+    await create_test_file(test_file, "# Touched\n")
+    age_file(test_file, seconds=120)
+    await sync_service.sync(project_dir)
+
+    age_file(test_file, seconds=-60)  # newer mtime, same content
+    report = await sync_service.sync(project_dir)
+    assert report.total == 0
+    assert "touched.md" in report.stale_stats
+
+    entity = await entity_repository.get_by_file_path("touched.md")
+    assert entity.mtime_ns == test_file.stat().st_mtime_ns
+    assert entity.size == test_file.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_sync_writes_files_in_batches(
+    sync_service: SyncService, project_config: ProjectConfig
+):
+    """New files are written several per transaction."""
+    project_dir = project_config.home
+    sync_service.app_config.sync_batch_size = 2
+    for i in range(5):
+        await create_test_file(project_dir / f"batch/note_{i}.md", f"# Note {i}\n\n- [idea] Idea {i}\n")
+
+    with patch.object(db, "batch_session", wraps=db.batch_session) as mock_batch:
+        await sync_service.sync(project_dir)
+
+    # the journal, then two full batches, the last single file is written on its own
+    assert mock_batch.call_count == 3
+    for i in range(5):
+        entity = await sync_service.entity_repository.get_by_file_path(f"batch/note_{i}.md")
+        assert entity.checksum is not None
+        assert len(entity.observations) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_batch_failure_retries_files_individually(
+    sync_service: SyncService, project_config: ProjectConfig
+):
+    """A file failing inside a batch rolls the batch back, the other files still sync."""
+    project_dir = project_config.home
+    for name in ["a", "bad", "c"]:
+        await create_test_file(project_dir / f"{name}.md", f"# {name}\n\n- [note] {name}\n")
+
+    sync_markdown_file = sync_service.sync_markdown_file
+
+    async def fail_on_bad(path, *args, **kwargs):
+        if path == "bad.md":
+            raise ValueError("cannot sync bad.md")
+        return await sync_markdown_file(path, *args, **kwargs)
+
+    with patch.object(sync_service, "sync_markdown_file", side_effect=fail_on_bad):
+        await sync_service.sync(project_dir)
+
+    assert await sync_service.entity_repository.get_by_file_path("bad.md") is None
+    for name in ["a", "c"]:
+        entity = await sync_service.entity_repository.get_by_file_path(f"{name}.md")
+        assert entity is not None
+        assert entity.checksum is not None
+
+
+@pytest.mark.asyncio
+async def test_sync_resumes_from_journal(sync_service: SyncService, project_config: ProjectConfig):
+    """An interrupted sync only redoes the files that were not committed."""
+    project_dir = project_config.home
+    sync_service.app_config.sync_batch_size = 2
+    for i in range(5):
+        await create_test_file(project_dir / f"journal/note_{i}.md", f"# Note {i}\n")
+    paths = sorted(f"journal/note_{i}.md" for i in range(5))
+
+    sync_file = sync_service.sync_file
+    synced = []
+
+    async def crash_on_third_file(path, *args, **kwargs):
+        if len(synced) == 2:
+            raise asyncio.CancelledError()
+        synced.append(path)
+        return await sync_file(path, *args, **kwargs)
+
+    with patch.object(sync_service, "sync_file", side_effect=crash_on_third_file):
+        with pytest.raises(asyncio.CancelledError):
+            await sync_service.sync(project_dir)
+
+    # the first batch was committed with its checkpoint
+    pending = await sync_service.journal_repository.find_pending()
+    assert sorted(e.file_path for e in pending) == sorted(set(paths) - set(synced))
+
+    resumed = []
+
+    async def record(path, *args, **kwargs):
+        resumed.append(path)
+        return await sync_file(path, *args, **kwargs)
+
+    with (
+        patch.object(sync_service, "sync_file", side_effect=record),
+        patch.object(sync_service, "scan", wraps=sync_service.scan) as mock_scan,
+    ):
+        report = await sync_service.sync(project_dir)
+
+    assert sorted(resumed) == sorted(set(paths) - set(synced))
+    assert report.new == set(resumed)
+    mock_scan.assert_called_once()
+    assert await sync_service.journal_repository.find_pending() == []
+    for path in paths:
+        assert await sync_service.entity_repository.get_by_file_path(path) is not None
+
+
+@pytest.mark.asyncio
+async def test_sync_resume_skips_vanished_files(
+    sync_service: SyncService, project_config: ProjectConfig
+):
+    project_dir = project_config.home
+    await create_test_file(project_dir / "kept.md", "# Kept\n")
+    await sync_service.journal_repository.start(
+        [
+            {"action": "new", "file_path": "kept.md"},
+            {"action": "new", "file_path": "gone.md"},
+        ]
+    )
+
+    report = await sync_service.sync(project_dir)
+
+    assert report.new == {"kept.md"}
+    assert await sync_service.entity_repository.get_by_file_path("kept.md") is not None
+    assert await sync_service.journal_repository.find_pending() == []
+
+
+@pytest.mark.asyncio
+async def test_sync_rereads_file_edited_after_scan(
+    sync_service: SyncService, project_config: ProjectConfig
+):
+    """A file edited between the scan and the apply is synced from its new content."""
+    project_dir = project_config.home
+    doc_path = project_dir / "edited.md"
+    await create_test_file(doc_path, "---\ntitle: Edited\n---\n# Edited\n\nfirst draft\n")
+    scan = sync_service.scan
+
+    async def scan_then_edit(*args, **kwargs):
+        report = await scan(*args, **kwargs)
+        # the scan kept the first draft in memory
+        assert report.loaded["edited.md"].text is not None
+        doc_path.write_text("---\ntitle: Edited\n---\n# Edited\n\nthe second, longer draft\n")
+        return report
+
+    with patch.object(sync_service, "scan", scan_then_edit):
+        await sync_service.sync(project_dir)
+
+    # the permalink was written into the new content, not the kept one
+    content = doc_path.read_text()
+    assert "the second, longer draft" in content
+    assert "permalink: edited" in content
+    entity = await sync_service.entity_repository.get_by_file_path("edited.md")
+    assert entity is not None
+    assert entity.checksum == await sync_service.file_service.compute_checksum("edited.md")
+    results = await sync_service.search_service.search(SearchQuery(text="longer"))
+    assert [r.permalink for r in results] == ["edited"]
@@ -0,0 +1,104 @@
+"""Tests for the sync worker pools."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from advanced_memory.config import ProjectConfig
+from advanced_memory.services import FileService
+from advanced_memory.sync.sync_service import SyncService
+from advanced_memory.sync.sync_workers import (
+    PARALLEL_PARSE_THRESHOLD,
+    SyncWorkerPool,
+    resolve_worker_count,
+)
+
+
+def write_notes(directory: Path, count: int) -> list[str]:
+    paths = []
+    for i in range(count):
+        path = directory / f"notes/note_{i}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# Note {i}\n\n- [idea] Observation {i}\n- links_to [[Note {i + 1}]]\n")
+        paths.append(f"notes/note_{i}.md")
+    return paths
+
+
+def test_resolve_worker_count():
+    assert resolve_worker_count(3) == 3
+    assert resolve_worker_count(0) >= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("workers", [1, 4])
+async def test_read_files_matches_file_service(
+    workers: int, file_service: FileService, project_config: ProjectConfig
+):
+    paths = write_notes(project_config.home, 5)
+
+    async with SyncWorkerPool(workers) as pool:
+        files = await pool.read_files(
+            project_config.home, paths + ["missing.md"], file_service.is_markdown
+        )
+
+    for path in paths:
+        assert files[path].checksum == await file_service.compute_checksum(path)
+        assert files[path].text is not None
+    assert isinstance(files["missing.md"], Exception)
+
+
+@pytest.mark.asyncio
+async def test_parse_files_below_threshold_parses_inline(project_config: ProjectConfig):
+    paths = write_notes(project_config.home, 3)
+
+    async with SyncWorkerPool(4) as pool:
+        assert await pool.parse_files(project_config.home, dict.fromkeys(paths)) == {}
+
+
+@pytest.mark.asyncio
+async def test_parse_files_in_processes(project_config: ProjectConfig):
+    paths = write_notes(project_config.home, PARALLEL_PARSE_THRESHOLD)
+
+    async with SyncWorkerPool(2) as pool:
+        parsed = await pool.parse_files(project_config.home, dict.fromkeys(paths))
+
+    assert set(parsed) == set(paths)
+    markdown = parsed["notes/note_0.md"].markdown
+    assert markdown.frontmatter.title == "note_0"
+    assert len(markdown.observations) == 1
+    assert markdown.relations[0].target == "Note 1"
+
+
+@pytest.mark.asyncio
+async def test_shutdown_does_not_block_the_event_loop():
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    async with SyncWorkerPool(2) as pool:
+        pool._thread_pool().submit(time.sleep, 0.3)
+        ticks = 0
+    ticker.cancel()
+
+    # the loop kept running while the pool waited for the sleeping worker
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_sync_with_parallel_workers(sync_service: SyncService, project_config: ProjectConfig):
+    sync_service.app_config.sync_workers = 2
+    paths = write_notes(project_config.home, PARALLEL_PARSE_THRESHOLD + 5)
+
+    report = await sync_service.sync(project_config.home)
+
+    assert report.new == set(paths)
+    entity = await sync_service.entity_repository.get_by_file_path("notes/note_1.md")
+    assert len(entity.observations) == 1
+    assert len(entity.outgoing_relations) == 1
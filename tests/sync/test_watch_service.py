@@ -2,12 +2,21 @@
 
 import asyncio
 import json
+import threading
 from pathlib import Path
 
+from unittest.mock import patch
+
 import pytest
 from watchfiles import Change
 
+from advanced_memory import db, file_utils
+from advanced_memory.markdown.schemas import EntityFrontmatter, EntityMarkdown
 from advanced_memory.models.project import Project
+from advanced_memory.services.file_service import FileService
+from advanced_memory.sync.change_queue import ChangeQueue
+from advanced_memory.sync import watch_service as watch_service_module
+from advanced_memory.sync.poll_watcher import ManifestPoller
 from advanced_memory.sync.watch_service import WatchService, WatchServiceState
 
 
@@ -18,9 +27,9 @@ async def create_test_file(path: Path, content: str = "test content") -> None:
 
 
 @pytest.fixture
-def watch_service(sync_service, file_service, project_config):
+def watch_service(app_config, project_repository):
     """Create watch service instance."""
-    return WatchService(sync_service, file_service, project_config)
+    return WatchService(app_config=app_config, project_repository=project_repository)
 
 
 def test_watch_service_init(watch_service, project_config):
@@ -69,6 +78,140 @@ async def test_write_status(watch_service):
     assert data["error_count"] == 0
 
 
+@pytest.mark.asyncio
+async def test_write_status_is_throttled(watch_service, monkeypatch):
+    """Status writes within the flush interval are folded into one later write."""
+    monkeypatch.setattr("advanced_memory.sync.watch_service.STATUS_FLUSH_INTERVAL", 0.05)
+    writes = []
+    monkeypatch.setattr(watch_service, "_write_status_file", writes.append)
+
+    await watch_service.write_status()
+    watch_service.state.synced_files = 1
+    await watch_service.write_status()
+    watch_service.state.synced_files = 2
+    await watch_service.write_status()
+    assert len(writes) == 1
+
+    # the delayed flush writes the latest state
+    await asyncio.sleep(0.1)
+    assert len(writes) == 2
+    assert json.loads(writes[-1])["synced_files"] == 2
+
+    # forced writes are not throttled
+    await watch_service.write_status(force=True)
+    assert len(writes) == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_service_kept_between_batches(watch_service, project_config, test_project):
+    """Batches of changes reuse the project's sync service and its link index."""
+    project_dir = project_config.home
+
+    first = project_dir / "first.md"
+    await create_test_file(first, "# First\n\n- links_to [[Second]]\n")
+    await watch_service.handle_changes(test_project, {(Change.added, str(first))})
+    sync_service = watch_service.sync_services[test_project.id]
+    link_resolver = sync_service.entity_service.link_resolver
+    kept_index = link_resolver._kept_index
+    assert kept_index is not None
+
+    second = project_dir / "second.md"
+    await create_test_file(second, "# Second\n")
+    await watch_service.handle_changes(test_project, {(Change.added, str(second))})
+
+    assert watch_service.sync_services[test_project.id] is sync_service
+    # the index followed the new entity instead of being rebuilt
+    assert link_resolver._kept_index is kept_index
+    assert kept_index.resolve("Second") is not None
+
+
+@pytest.mark.asyncio
+async def test_own_writes_are_not_synced_again(
+    watch_service, project_config, test_project, file_service, monkeypatch
+):
+    """Events for files the server just wrote are dropped without syncing."""
+    project_dir = project_config.home
+    written = project_dir / "written.md"
+    await file_service.write_file("written.md", "# Written\n", record=True)
+    changes = {(Change.added, str(written)), (Change.modified, str(written))}
+
+    hashed_in = []
+
+    def compute_checksum_sync(data):
+        hashed_in.append(threading.current_thread())
+        return file_utils.compute_checksum_sync(data)
+
+    monkeypatch.setattr(watch_service_module, "compute_checksum_sync", compute_checksum_sync)
+    await watch_service.handle_changes(test_project, changes)
+
+    # dropped before the sync service was even needed
+    assert test_project.id not in watch_service.sync_services
+    assert not watch_service.state.recent_events
+    # the files were hashed off the event loop
+    assert hashed_in and threading.main_thread() not in hashed_in
+
+    # once the file is edited by someone else, it is synced
+    written.write_text("# Written\n\nedited by hand\n")
+    await watch_service.handle_changes(test_project, {(Change.modified, str(written))})
+
+    assert [event.path for event in watch_service.state.recent_events] == ["written.md"]
+
+
+@pytest.mark.asyncio
+async def test_imported_files_are_synced(
+    watch_service, project_config, test_project, markdown_processor, entity_repository
+):
+    """Files written without updating the database, like imports, are synced by the watcher."""
+    imported = project_config.home / "imported" / "conversation.md"
+    imported.parent.mkdir(parents=True, exist_ok=True)
+    # as Importer.write_entity does
+    markdown = EntityMarkdown(
+        frontmatter=EntityFrontmatter(metadata={"title": "Conversation", "type": "conversation"}),
+        content="# Conversation\n\nimported text\n",
+    )
+    await markdown_processor.write_file(imported, markdown)
+
+    await watch_service.handle_changes(test_project, {(Change.added, str(imported))})
+
+    entity = await entity_repository.get_by_file_path("imported/conversation.md")
+    assert entity is not None
+    assert entity.title == "Conversation"
+
+
+@pytest.mark.asyncio
+async def test_process_queue(watch_service, project_config, test_project, entity_repository):
+    """Queued changes are synced in coalesced batches, an overflow runs a full sync."""
+    project_dir = project_config.home
+    queue = ChangeQueue(max_size=2)
+
+    first = project_dir / "first.md"
+    await create_test_file(first, "# First\n")
+    queue.put({(Change.added, str(first))})
+    queue.put({(Change.modified, str(first))})
+    queue.close()
+    await watch_service.process_queue(test_project, queue)
+
+    assert await entity_repository.get_by_file_path("first.md") is not None
+    assert [event.action for event in watch_service.state.recent_events] == ["new"]
+
+    # more pending files than the queue holds
+    queue = ChangeQueue(max_size=2)
+    for i in range(3):
+        await create_test_file(project_dir / f"flood-{i}.md", f"# Flood {i}\n")
+    queue.put({(Change.added, str(project_dir / f"flood-{i}.md")) for i in range(3)})
+    watch_service.change_queues = {test_project.name: queue}
+    watch_service.update_queue_status()
+    assert watch_service.state.queue_depth == watch_service.app_config.watch_queue_limit
+
+    queue.close()
+    await watch_service.process_queue(test_project, queue)
+
+    assert watch_service.state.full_syncs == 1
+    assert watch_service.state.queue_depth == 0
+    for i in range(3):
+        assert await entity_repository.get_by_file_path(f"flood-{i}.md") is not None
+
+
 @pytest.mark.asyncio
 async def test_handle_file_add(watch_service, project_config, test_project, entity_repository):
     """Test handling new file creation."""
@@ -287,6 +430,51 @@ async def test_handle_concurrent_changes(watch_service, project_config, test_pro
     assert "modified" not in actions  # only process file once
 
 
+@pytest.mark.asyncio
+async def test_handle_directory_move(watch_service, project_config, test_project, sync_service):
+    """All files of a moved directory are matched by checksum and moved in one transaction."""
+    project_dir = project_config.home
+
+    old_dir = project_dir / "old"
+    for i in range(5):
+        await create_test_file(old_dir / f"note-{i}.md", f"# Note {i}\n\ncontent {i}\n")
+    # identical copies are matched by name
+    await create_test_file(old_dir / "copy-a.md", "same content\n")
+    await create_test_file(old_dir / "copy-b.md", "same content\n")
+    await sync_service.sync(project_dir)
+    before = {
+        path: (await sync_service.entity_repository.get_by_file_path(f"old/{path}")).id
+        for path in ["note-0.md", "copy-a.md", "copy-b.md"]
+    }
+
+    new_dir = project_dir / "new"
+    old_dir.rename(new_dir)
+    names = sorted(path.name for path in new_dir.iterdir())
+    changes = {(Change.deleted, str(old_dir / name)) for name in names}
+    changes |= {(Change.added, str(new_dir / name)) for name in names}
+
+    with (
+        patch.object(db, "batch_session", wraps=db.batch_session) as mock_batch,
+        patch.object(
+            FileService, "compute_checksum", autospec=True, side_effect=FileService.compute_checksum
+        ) as mock_checksum,
+    ):
+        await watch_service.handle_changes(test_project, changes)
+
+    # one transaction, each added file hashed once
+    assert mock_batch.call_count == 1
+    assert mock_checksum.call_count == len(names)
+
+    for path, entity_id in before.items():
+        moved = await sync_service.entity_repository.get_by_file_path(f"new/{path}")
+        assert moved.id == entity_id
+    assert await sync_service.entity_repository.get_by_file_path("old/note-1.md") is None
+
+    events = [e for e in watch_service.state.recent_events if e.action == "moved"]
+    assert len(events) == len(names)
+    assert not [e for e in watch_service.state.recent_events if e.action in ("new", "deleted")]
+
+
 @pytest.mark.asyncio
 async def test_handle_rapid_move(watch_service, project_config, test_project, sync_service):
     """Test handling rapid move operations."""
@@ -421,8 +609,8 @@ This is a test file in a directory
     assert old_entity is not None
 
 
-def test_is_project_path(watch_service, tmp_path):
-    """Test the is_project_path method to ensure it correctly identifies paths within a project."""
+def test_route_project_path(watch_service, tmp_path):
+    """Only paths inside a project are routed to it."""
     # Create a project at a specific path
     project_path = tmp_path / "project"
     project_path.mkdir(parents=True, exist_ok=True)
@@ -439,12 +627,111 @@ def test_is_project_path(watch_service, tmp_path):
 
     # Create Project object with our path
     project = Project(id=1, name="test", path=str(project_path), permalink="test")
+    watch_service.set_projects([project])
 
     # Test a file inside the project
-    assert watch_service.is_project_path(project, file_in_project) is True
+    assert watch_service.route(str(file_in_project)) == (project, "subdirectory/file.md")
 
     # Test a file outside the project
-    assert watch_service.is_project_path(project, file_outside_project) is False
+    assert watch_service.route(str(file_outside_project)) is None
 
     # Test the project path itself
-    assert watch_service.is_project_path(project, project_path) is False
+    assert watch_service.route(str(project_path)) is None
+
+
+def test_route_to_innermost_project(watch_service, tmp_path):
+    """Changed paths are routed to the innermost project containing them."""
+    outer = Project(id=1, name="outer", path=str(tmp_path / "outer"), permalink="outer")
+    inner = Project(id=2, name="inner", path=str(tmp_path / "outer" / "inner"), permalink="inner")
+    (tmp_path / "outer" / "inner").mkdir(parents=True)
+    (tmp_path / "link").symlink_to(tmp_path / "outer")
+    watch_service.set_projects([outer, inner])
+
+    assert watch_service.route(str(tmp_path / "outer" / "a" / "note.md")) == (outer, "a/note.md")
+    assert watch_service.route(str(tmp_path / "outer" / "inner" / "note.md")) == (
+        inner,
+        "note.md",
+    )
+    assert watch_service.route(str(tmp_path / "elsewhere" / "note.md")) is None
+    assert watch_service.route(str(tmp_path / "outer")) is None
+    # a path through a symlink is resolved when it matches nothing as given
+    assert watch_service.route(str(tmp_path / "link" / "note.md")) == (outer, "note.md")
+
+
+def test_relative_path_through_symlinks(tmp_path):
+    """Paths are made relative to the project root as given or resolved."""
+    (tmp_path / "real" / "notes").mkdir(parents=True)
+    (tmp_path / "root").symlink_to(tmp_path / "real")
+    (tmp_path / "other").symlink_to(tmp_path / "real" / "notes")
+    project = Project(id=1, name="linked", path=str(tmp_path / "root"), permalink="linked")
+
+    assert WatchService.relative_path(project, str(tmp_path / "root" / "a.md")) == "a.md"
+    assert WatchService.relative_path(project, str(tmp_path / "real" / "a.md")) == "a.md"
+    assert WatchService.relative_path(project, str(tmp_path / "other" / "b.md")) == "notes/b.md"
+    assert WatchService.relative_path(project, str(tmp_path / "elsewhere" / "a.md")) is None
+
+
+@pytest.mark.asyncio
+async def test_changes_under_symlinked_project_root(
+    watch_service, project_config, test_project, sync_service, entity_repository, tmp_path_factory
+):
+    """Events reported under a symlinked project root are synced, not rejected."""
+    outside = tmp_path_factory.mktemp("outside")
+    link = outside / "linked-project"
+    link.symlink_to(project_config.home)
+    project = Project(
+        id=test_project.id, name=test_project.name, path=str(link), permalink="linked-project"
+    )
+    await create_test_file(link / "linked.md", "# Linked\n")
+    await create_test_file(project_config.home / "direct.md", "# Direct\n")
+    changes = {
+        (Change.added, str(link / "linked.md")),
+        (Change.added, str(project_config.home / "direct.md")),
+        (Change.added, str(outside / "elsewhere.md")),
+    }
+
+    await watch_service.process_changes(project, sync_service, changes)
+
+    assert await entity_repository.get_by_file_path("linked.md") is not None
+    assert await entity_repository.get_by_file_path("direct.md") is not None
+
+
+@pytest.mark.asyncio
+async def test_watch_with_poll_backend(watch_service, app_config, tmp_path):
+    """The poll backend reports changes like native events, without ignored files."""
+    project_dir = tmp_path / "polled"
+    project_dir.mkdir()
+    (project_dir / "note.md").write_text("# Note")
+    project = Project(id=1, name="polled", path=str(project_dir), permalink="polled")
+    app_config.watch_backend = "poll"
+    app_config.watch_poll_interval = 0.01
+    watch_service.manifest_dir = tmp_path / "manifests"
+    watch_service.set_projects([project])
+
+    # record the listing the watcher starts from
+    await ManifestPoller(str(project_dir), tmp_path / "manifests" / "polled.json").poll()
+    (project_dir / "new.md").write_text("# New")
+    (project_dir / ".hidden.md").write_text("# Hidden")
+
+    batches = watch_service.watch([project])
+    changes = await asyncio.wait_for(anext(batches), timeout=5)
+    await batches.aclose()
+
+    assert changes == {(Change.added, str(project_dir / "new.md"))}
+
+
+@pytest.mark.asyncio
+async def test_acquire_leases(app_config, project_repository, tmp_path):
+    """Only one watch service at a time watches a project, the other serves it read-only."""
+    project = Project(id=1, name="shared", path=str(tmp_path / "shared"), permalink="shared")
+    first = WatchService(app_config=app_config, project_repository=project_repository)
+    second = WatchService(app_config=app_config, project_repository=project_repository)
+
+    assert await first.acquire_leases([project]) == [project]
+    assert await second.acquire_leases([project]) == []
+    assert first.state.owned_projects == ["shared"]
+    assert second.state.read_only_projects == ["shared"]
+
+    first.release_leases()
+    assert await second.acquire_leases([project]) == [project]
+    assert second.state.owned_projects == ["shared"]
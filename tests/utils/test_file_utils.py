@@ -8,11 +8,13 @@ from advanced_memory.file_utils import (
     FileError,
     FileWriteError,
     ParseError,
+    WriteRegistry,
     compute_checksum,
     ensure_directory,
     has_frontmatter,
     parse_frontmatter,
     remove_frontmatter,
+    recent_writes,
     update_frontmatter,
     write_file_atomic,
 )
@@ -58,6 +60,44 @@ async def test_write_file_atomic(tmp_path: Path):
     assert not test_file.with_suffix(".tmp").exists()
 
 
+@pytest.mark.asyncio
+async def test_write_file_atomic_records_write(tmp_path: Path):
+    """Atomic writes asked to be recorded are, with the checksum of what was written."""
+    test_file = tmp_path / "recorded.md"
+
+    await write_file_atomic(test_file, "recorded content", record=True)
+
+    assert recent_writes.get(test_file) == await compute_checksum("recorded content")
+    assert recent_writes.get(str(tmp_path / "sub" / ".." / "recorded.md")) is not None
+
+    # writers that leave the database to the watcher are not recorded
+    unrecorded = tmp_path / "unrecorded.md"
+    await write_file_atomic(unrecorded, "unrecorded content")
+    assert recent_writes.get(unrecorded) is None
+
+
+def test_write_registry_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("advanced_memory.file_utils.time.monotonic", lambda: now[0])
+    registry = WriteRegistry(ttl=10)
+
+    registry.record("/notes/a.md", "aaa")
+    now[0] = 105.0
+    registry.record("/notes/b.md", "bbb")
+    now[0] = 108.0
+    registry.record("/notes/a.md", "ccc")
+    assert registry.get("/notes/a.md") == "ccc"
+
+    now[0] = 116.0
+    # the rewrite of a.md extended its lifetime, b.md expired
+    assert registry.get("/notes/b.md") is None
+    assert registry.get("/notes/a.md") == "ccc"
+
+    now[0] = 119.0
+    assert registry.get("/notes/a.md") is None
+    assert registry.get("/notes/missing.md") is None
+
+
 @pytest.mark.asyncio
 async def test_write_file_atomic_error(tmp_path: Path):
     """Test atomic write error handling."""
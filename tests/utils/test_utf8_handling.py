@@ -2,7 +2,7 @@
 
 import pytest
 
-from basic_memory import file_utils
+from advanced_memory import file_utils
 from advanced_memory.file_utils import compute_checksum, write_file_atomic
 
 